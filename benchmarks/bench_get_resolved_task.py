@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for SourceManager.get_resolved_task
+
+Compares the proto-native resolution path against the legacy proto -> dict -> proto round trip
+for a Grafana PromQL task with a configurable number of global variables.
+
+Usage:
+    python benchmarks/bench_get_resolved_task.py [--variables 50] [--iterations 2000]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "drdroid_debug_toolkit"))
+
+from google.protobuf.struct_pb2 import Struct
+from google.protobuf.wrappers_pb2 import StringValue
+
+from core.integrations.source_manager import SourceManager
+from core.integrations.utils.executor_utils import resolve_global_variables
+from core.protos.base_pb2 import Source
+from core.protos.literal_pb2 import LiteralType
+from core.protos.playbooks.playbook_commons_pb2 import PlaybookTaskResultType
+from core.protos.playbooks.playbook_pb2 import PlaybookTask
+from core.protos.playbooks.source_task_definitions.grafana_task_pb2 import Grafana
+from core.protos.ui_definition_pb2 import FormField
+from core.utils.proto_utils import proto_to_dict, dict_to_proto
+
+
+class BenchmarkGrafanaSourceManager(SourceManager):
+    def __init__(self):
+        self.source = Source.GRAFANA
+        self.task_proto = Grafana
+        self.task_type_callable_map = {
+            Grafana.TaskType.PROMQL_METRIC_EXECUTION: {
+                'executor': None,
+                'result_type': PlaybookTaskResultType.TIMESERIES,
+                'form_fields': [
+                    FormField(key_name=StringValue(value="datasource_uid"), data_type=LiteralType.STRING),
+                    FormField(key_name=StringValue(value="promql_expression"), data_type=LiteralType.STRING),
+                    FormField(key_name=StringValue(value="promql_label_option_values"), is_composite=True,
+                              composite_fields=[
+                                  FormField(key_name=StringValue(value="name"), data_type=LiteralType.STRING),
+                                  FormField(key_name=StringValue(value="value"), data_type=LiteralType.STRING),
+                              ]),
+                ]
+            },
+        }
+
+
+def legacy_get_resolved_task(manager, global_variable_set, input_task):
+    """The pre-optimisation dict round trip, kept here as the baseline."""
+    source_str = Source.Name(input_task.source).lower()
+    task_dict = proto_to_dict(input_task)
+    source_task_dict = task_dict.get(source_str, {})
+    source_task_proto = dict_to_proto(source_task_dict, manager.task_proto)
+    task_type = source_task_proto.type
+    task_type_name = manager.task_proto.TaskType.Name(task_type).lower()
+    source_task_type_dict = source_task_dict.get(task_type_name, {})
+    form_fields = manager.task_type_callable_map[task_type]['form_fields']
+    resolved_source_task_type_dict, task_local_variable_map = resolve_global_variables(form_fields,
+                                                                                       global_variable_set,
+                                                                                       source_task_type_dict)
+    if input_task.execution_configuration.timeseries_offsets:
+        resolved_source_task_type_dict['timeseries_offsets'] = list(
+            input_task.execution_configuration.timeseries_offsets)
+    source_task_dict[task_type_name] = resolved_source_task_type_dict
+    resolved_source_task_proto = dict_to_proto(source_task_dict, manager.task_proto)
+    task_dict[source_str] = source_task_dict
+    resolved_task = dict_to_proto(task_dict, PlaybookTask)
+    return resolved_task, resolved_source_task_proto, task_local_variable_map
+
+
+def build_inputs(variable_count):
+    global_variable_set = Struct()
+    global_variable_set.update({f"$label_{i}": f"value-{i}" for i in range(variable_count)})
+
+    task = PlaybookTask(source=Source.GRAFANA)
+    task.execution_configuration.timeseries_offsets.extend([3600, 86400])
+    task.grafana.type = Grafana.TaskType.PROMQL_METRIC_EXECUTION
+    promql_task = task.grafana.promql_metric_execution
+    promql_task.datasource_uid.value = "$label_0"
+    promql_task.promql_expression.value = ('sum(rate(http_requests_total{service="$label_1",env="$label_2",'
+                                           'pod=~"$label_3.*"}[5m])) by (route)')
+    for i in range(min(variable_count, 10)):
+        label_value = promql_task.promql_label_option_values.add()
+        label_value.name.value = f"label_{i}"
+        label_value.value.value = f"$label_{i}"
+    return global_variable_set, task
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--variables", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    manager = BenchmarkGrafanaSourceManager()
+    global_variable_set, task = build_inputs(args.variables)
+
+    proto_result = manager.get_resolved_task(global_variable_set, task)
+    legacy_result = legacy_get_resolved_task(manager, global_variable_set, task)
+    assert proto_result[0] == legacy_result[0], "Resolved task mismatch between proto and dict paths"
+    # The dict path misses variables used inside composite fields, so it only ever records a subset
+    assert legacy_result[2].items() <= proto_result[2].items(), "Task local variable map mismatch"
+
+    proto_seconds = timeit.timeit(lambda: manager.get_resolved_task(global_variable_set, task),
+                                  number=args.iterations)
+    legacy_seconds = timeit.timeit(lambda: legacy_get_resolved_task(manager, global_variable_set, task),
+                                   number=args.iterations)
+
+    print(f"variables={args.variables} iterations={args.iterations}")
+    print(f"proto path : {proto_seconds / args.iterations * 1e6:10.1f} us/task")
+    print(f"dict path  : {legacy_seconds / args.iterations * 1e6:10.1f} us/task")
+    print(f"speedup    : {legacy_seconds / proto_seconds:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
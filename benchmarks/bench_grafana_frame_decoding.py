@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for Grafana frame decoding
+
+Compares GrafanaSourceManager._parse_single_panel_frame (NumPy grouping and bulk datapoint encoding) against
+the legacy per-point loop, on a node-exporter style response: one frame per series (Prometheus datasource)
+and the same points as a single long frame with label columns (SQL-style datasources).
+
+Usage:
+    python benchmarks/bench_grafana_frame_decoding.py [--series 500] [--points 1400] [--iterations 3]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "drdroid_debug_toolkit"))
+
+from django.conf import settings
+
+settings.configure(IS_PROD_ENV=False)
+
+from google.protobuf.wrappers_pb2 import DoubleValue, StringValue
+
+from core.integrations.source_managers.grafana_source_manager import GrafanaSourceManager
+from core.protos.playbooks.playbook_commons_pb2 import LabelValuePair, TimeseriesResult
+
+PANEL_INFO = {"panel_id": 7, "panel_title": "CPU usage", "original_expr": 'rate(node_cpu_seconds_total[5m])'}
+
+
+def legacy_parse_frame(frame, panel_info, ref_id):
+    """The per-point implementation _parse_single_panel_frame used before vectorization."""
+    schema, data = frame["schema"], frame["data"]
+    time_idx, value_idx, label_indices, field_names = -1, -1, [], []
+    for i, field in enumerate(schema["fields"]):
+        field_names.append(field.get("name"))
+        if field.get("type") == "time":
+            time_idx = i
+        elif field.get("type") == "number" and value_idx == -1:
+            value_idx = i
+        else:
+            label_indices.append(i)
+    timestamps, values = data["values"][time_idx], data["values"][value_idx]
+    frame_labels = [
+        LabelValuePair(name=StringValue(value="panel_id"), value=StringValue(value=str(panel_info["panel_id"]))),
+        LabelValuePair(name=StringValue(value="panel_title"), value=StringValue(value=panel_info["panel_title"])),
+        LabelValuePair(name=StringValue(value="ref_id"), value=StringValue(value=ref_id)),
+        LabelValuePair(name=StringValue(value="original_expr"), value=StringValue(value=panel_info["original_expr"])),
+    ]
+    if schema.get("name"):
+        frame_labels.append(LabelValuePair(name=StringValue(value="series_name"), value=StringValue(value=schema["name"])))
+    label_data = {field_names[idx]: data["values"][idx] for idx in label_indices}
+    label_field_names = [field_names[idx] for idx in label_indices]
+    series_map = {}
+    for i in range(len(timestamps)):
+        if values[i] is None:
+            continue
+        point_label_values = tuple(label_data[name][i] for name in label_field_names)
+        series_map.setdefault(point_label_values, []).append((timestamps[i], float(values[i])))
+    parsed_timeseries = []
+    for label_tuple, points in series_map.items():
+        metric_labels = list(frame_labels)
+        for j, label_value in enumerate(label_tuple):
+            metric_labels.append(LabelValuePair(name=StringValue(value=label_field_names[j]),
+                                                value=StringValue(value=str(label_value))))
+        datapoints = [TimeseriesResult.LabeledMetricTimeseries.Datapoint(timestamp=int(ts), value=DoubleValue(value=val))
+                      for ts, val in sorted(points)]
+        parsed_timeseries.append(TimeseriesResult.LabeledMetricTimeseries(metric_label_values=metric_labels,
+                                                                          datapoints=datapoints))
+    return parsed_timeseries
+
+
+def make_frames(series_count, point_count, null_ratio=0.01):
+    rng = random.Random(42)
+    start_ms = 1_700_000_000_000
+    timestamps = [start_ms + i * 60_000 for i in range(point_count)]
+    wide_frames = []
+    long_columns = [[], [], [], []]
+    for s in range(series_count):
+        instance, cpu = f"node-{s // 8}:9100", str(s % 8)
+        values = [None if rng.random() < null_ratio else rng.random() * 100 for _ in range(point_count)]
+        wide_frames.append({
+            "schema": {"name": f"{{cpu=\"{cpu}\", instance=\"{instance}\"}}", "fields": [
+                {"name": "Time", "type": "time"},
+                {"name": "Value", "type": "number", "labels": {"cpu": cpu, "instance": instance}},
+            ]},
+            "data": {"values": [timestamps, values]},
+        })
+        for column, column_values in zip(long_columns, (timestamps, values, [instance] * point_count,
+                                                        [cpu] * point_count)):
+            column.extend(column_values)
+    long_frame = {
+        "schema": {"fields": [{"name": "time", "type": "time"}, {"name": "value", "type": "number"},
+                              {"name": "instance", "type": "string"}, {"name": "cpu", "type": "string"}]},
+        "data": {"values": long_columns},
+    }
+    return wide_frames, [long_frame]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--series", type=int, default=500)
+    parser.add_argument("--points", type=int, default=1400)
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    manager = GrafanaSourceManager.__new__(GrafanaSourceManager)
+    wide_frames, long_frames = make_frames(args.series, args.points)
+
+    for shape, frames in (("frame per series", wide_frames), ("long frame", long_frames)):
+        def run_vectorized():
+            return [ts for frame in frames for ts in manager._parse_single_panel_frame(frame, PANEL_INFO, "A")]
+
+        def run_legacy():
+            return [ts for frame in frames for ts in legacy_parse_frame(frame, PANEL_INFO, "A")]
+
+        assert run_vectorized() == run_legacy(), f"{shape}: vectorized and legacy decoding disagree"
+
+        vectorized_seconds = timeit.timeit(run_vectorized, number=args.iterations)
+        legacy_seconds = timeit.timeit(run_legacy, number=args.iterations)
+
+        print(f"{shape}: series={args.series} points={args.points} iterations={args.iterations}")
+        print(f"  vectorized : {vectorized_seconds / args.iterations * 1e3:10.1f} ms/response")
+        print(f"  legacy     : {legacy_seconds / args.iterations * 1e3:10.1f} ms/response")
+        print(f"  speedup    : {legacy_seconds / vectorized_seconds:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
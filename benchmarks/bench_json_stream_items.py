@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for streamed JSON list parsing
+
+Compares iter_json_array_items over a chunked kubectl-style list document against json.loads of the whole
+document. Before timing, every two-way split of a small document holding numbers, literals and nested values is
+checked to parse the same as json.loads, so values cut at a chunk boundary (e.g. '1.' + '5') stay intact.
+
+Usage:
+    python benchmarks/bench_json_stream_items.py [--items 5000] [--chunk-size 65536] [--iterations 5]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "drdroid_debug_toolkit"))
+
+from core.utils.json_stream_utils import iter_json_array_items
+
+SPLIT_CHECK_DOCUMENT = ('{"metadata": {"resourceVersion": "12"}, "items": [1.5, 2, -3e-2, 4E+10, 0.5e1, true, null, '
+                        '"a,b]", {"spec": {"replicas": 3, "ratio": 0.25}}]}')
+
+
+def check_chunk_splits():
+    expected = json.loads(SPLIT_CHECK_DOCUMENT)
+    for split in range(1, len(SPLIT_CHECK_DOCUMENT)):
+        chunks = [SPLIT_CHECK_DOCUMENT[:split], SPLIT_CHECK_DOCUMENT[split:]]
+        top_level = {}
+        items = list(iter_json_array_items(iter(chunks), top_level=top_level))
+        assert items == expected["items"], f"Items differ when split at offset {split}: {chunks}"
+        assert top_level == {"metadata": expected["metadata"]}, f"Top-level fields differ at offset {split}"
+    assert list(iter_json_array_items(iter(["[1e", "3]"]), key=None)) == [1e3], "Exponent split at a chunk boundary"
+
+
+def make_document(items):
+    return json.dumps({
+        "apiVersion": "v1",
+        "kind": "List",
+        "metadata": {"resourceVersion": "123456"},
+        "items": [{"metadata": {"name": f"pod-{i}", "namespace": f"ns-{i % 20}", "labels": {"app": f"app-{i % 50}"}},
+                   "spec": {"containers": [{"name": "main", "image": "registry/app:1.2.3",
+                                            "resources": {"limits": {"cpu": 0.5, "memory": "512Mi"}}}]},
+                   "status": {"phase": "Running", "restartCount": i % 7}} for i in range(items)],
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    check_chunk_splits()
+
+    document = make_document(args.items)
+    chunks = [document[i:i + args.chunk_size] for i in range(0, len(document), args.chunk_size)]
+
+    def run_streamed():
+        return list(iter_json_array_items(iter(chunks)))
+
+    def run_whole():
+        return json.loads("".join(chunks))["items"]
+
+    assert run_streamed() == run_whole(), "Streamed and whole-document parsing disagree"
+
+    streamed_seconds = timeit.timeit(run_streamed, number=args.iterations)
+    whole_seconds = timeit.timeit(run_whole, number=args.iterations)
+
+    print(f"items={args.items} bytes={len(document)} chunks={len(chunks)} iterations={args.iterations}")
+    print(f"streamed : {streamed_seconds / args.iterations * 1e3:10.1f} ms/list")
+    print(f"whole    : {whole_seconds / args.iterations * 1e3:10.1f} ms/list")
+
+
+if __name__ == "__main__":
+    main()
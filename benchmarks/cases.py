@@ -0,0 +1,448 @@
+"""
+Benchmark cases for source manager executors.
+
+Each case knows how to build its source manager, connector and task, and how to synthesize a
+deterministic fixture shaped like the backend's real response when no recorded fixture exists under
+``benchmarks/fixtures``. Synthetic sizes are picked to resemble a busy production query, not a worst case.
+"""
+import json
+import random
+
+from harness import setup_environment
+
+setup_environment()
+
+from core.protos.base_pb2 import TimeRange  # noqa: E402
+from core.protos.playbooks.playbook_commons_pb2 import PlaybookTaskResultType  # noqa: E402
+from core.protos.playbooks.playbook_pb2 import PlaybookTask  # noqa: E402
+from core.utils.credentilal_utils import credential_yaml_to_connector_proto  # noqa: E402
+from core.utils.proto_utils import dict_to_proto  # noqa: E402
+
+DEFAULT_TIME_RANGE = {"time_geq": 1700000000, "time_lt": 1700003600}
+
+
+class BenchmarkCase:
+    name = None
+    mode = "processor"
+    connector_yaml = None
+    expected_result_types = ()
+
+    def build_manager(self):
+        raise NotImplementedError
+
+    def default_task(self) -> dict:
+        raise NotImplementedError
+
+    def synthesize_fixture(self) -> dict:
+        raise NotImplementedError
+
+    def build_connector(self):
+        return credential_yaml_to_connector_proto(f"benchmark-{self.name}", self.connector_yaml, 1)
+
+    def build_task(self, fixture: dict) -> PlaybookTask:
+        task = dict_to_proto(fixture.get("task") or self.default_task(), PlaybookTask)
+        if not task.task_connector_sources:
+            connector_source = task.task_connector_sources.add()
+            connector_source.id.value = 1
+            connector_source.source = task.source
+            connector_source.name.value = f"benchmark-{self.name}"
+        return task
+
+    def build_time_range(self, fixture: dict) -> TimeRange:
+        return TimeRange(**(fixture.get("time_range") or DEFAULT_TIME_RANGE))
+
+    def validate_result(self, result):
+        results = result if isinstance(result, list) else [result]
+        for task_result in results:
+            if task_result.type not in self.expected_result_types:
+                raise Exception(f"{self.name}:: Unexpected result type "
+                                f"{PlaybookTaskResultType.Name(task_result.type)}: {str(task_result)[:500]}")
+
+
+class GrafanaExecuteAllDashboardPanelsCase(BenchmarkCase):
+    name = "grafana_execute_all_dashboard_panels"
+    connector_yaml = {"type": "GRAFANA", "grafana_host": "https://grafana.example.com", "grafana_api_key": "key"}
+    expected_result_types = (PlaybookTaskResultType.TIMESERIES,)
+
+    panels = 12
+    targets_per_panel = 3
+    series_per_target = 4
+    step_seconds = 10
+
+    def build_manager(self):
+        from core.integrations.source_managers.grafana_source_manager import GrafanaSourceManager
+        return GrafanaSourceManager()
+
+    def default_task(self):
+        return {
+            "source": "GRAFANA",
+            "grafana": {
+                "type": "EXECUTE_ALL_DASHBOARD_PANELS",
+                "execute_all_dashboard_panels": {"dashboard_uid": "benchmark-dashboard", "interval": 60},
+            },
+        }
+
+    def synthesize_fixture(self):
+        rng = random.Random(29)
+        datasource = {"type": "prometheus", "uid": "prom-main"}
+        panels, results = [], {}
+        letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+        ref_index = 0
+        timestamps = list(range(DEFAULT_TIME_RANGE["time_geq"] * 1000, DEFAULT_TIME_RANGE["time_lt"] * 1000,
+                                self.step_seconds * 1000))
+        for panel_id in range(1, self.panels + 1):
+            targets = []
+            for target_idx in range(self.targets_per_panel):
+                expr = (f'sum by (instance) (rate(http_requests_total{{job="$job",instance=~"$instance",'
+                        f'route="/api/v{target_idx}"}}[$__rate_interval]))')
+                targets.append({"expr": expr, "refId": chr(ord('A') + target_idx), "datasource": datasource})
+                frames = []
+                for series_idx in range(self.series_per_target):
+                    instance = f"10.0.{panel_id}.{series_idx}:9100"
+                    frames.append({
+                        "schema": {
+                            "name": f'{{instance="{instance}"}}',
+                            "refId": letters[ref_index],
+                            "fields": [
+                                {"name": "Time", "type": "time", "typeInfo": {"frame": "time.Time"}},
+                                {"name": "Value", "type": "number", "typeInfo": {"frame": "float64"},
+                                 "labels": {"instance": instance}},
+                            ],
+                        },
+                        "data": {"values": [timestamps, [round(rng.uniform(0, 500), 6) for _ in timestamps]]},
+                    })
+                results[letters[ref_index]] = {"status": 200, "frames": frames}
+                ref_index += 1
+            panels.append({"id": panel_id, "title": f"Panel {panel_id}", "type": "timeseries",
+                           "datasource": datasource, "targets": targets})
+        dashboard = {
+            "dashboard": {
+                "uid": "benchmark-dashboard",
+                "title": "Benchmark",
+                "panels": panels,
+                "templating": {"list": [
+                    {"name": "job", "current": {"value": "api"}},
+                    {"name": "instance", "current": {"value": "$__all"}},
+                ]},
+            }
+        }
+        return {
+            "case": self.name,
+            "mode": "processor",
+            "calls": {
+                "fetch_dashboard_details": [dashboard],
+                "fetch_data_sources": [[{"name": "Prometheus", "uid": "prom-main", "type": "prometheus",
+                                         "isDefault": True}]],
+                "panel_query_datasource_api": [{"results": results}],
+            },
+        }
+
+
+class SignozClickhouseQueryCase(BenchmarkCase):
+    name = "signoz_clickhouse_query"
+    connector_yaml = {"type": "SIGNOZ", "signoz_api_url": "https://signoz.example.com", "signoz_api_token": "token"}
+    expected_result_types = (PlaybookTaskResultType.API_RESPONSE,)
+
+    rows = 2000
+
+    def build_manager(self):
+        from core.integrations.source_managers.signoz_source_manager import SignozSourceManager
+        return SignozSourceManager()
+
+    def default_task(self):
+        return {
+            "source": "SIGNOZ",
+            "signoz": {
+                "type": "CLICKHOUSE_QUERY",
+                "clickhouse_query": {
+                    "query": "SELECT timestamp, trace_id, span_id, name, duration_nano FROM signoz_traces.distributed_signoz_index_v3 LIMIT 2000",
+                    "request_type": "traces",
+                },
+            },
+        }
+
+    def synthesize_fixture(self):
+        rng = random.Random(29)
+        rows = []
+        for i in range(self.rows):
+            rows.append({
+                "timestamp": f"2023-11-14T22:{(i // 60) % 60:02d}:{i % 60:02d}.{i % 1000:03d}Z",
+                "data": {
+                    "trace_id": f"{rng.getrandbits(128):032x}",
+                    "span_id": f"{rng.getrandbits(64):016x}",
+                    "name": rng.choice(["GET /api/orders", "POST /api/checkout", "SELECT orders", "redis GET"]),
+                    "service.name": rng.choice(["frontend", "orders", "payments", "inventory"]),
+                    "duration_nano": rng.randint(10 ** 5, 10 ** 9),
+                    "status_code": rng.choice([0, 1, 2]),
+                    "http.status_code": rng.choice(["200", "201", "404", "500"]),
+                    "k8s.pod.name": f"orders-{rng.randint(0, 9)}-{rng.getrandbits(20):05x}",
+                },
+            })
+        response = {"status": "success", "data": {"type": "raw", "data": {"results": [
+            {"queryName": "A", "nextCursor": "", "rows": rows}]}, "meta": {"rowsScanned": self.rows * 40}}}
+        return {"case": self.name, "mode": "processor", "calls": {"signoz_query_clickhouse": [response]}}
+
+
+class DatadogGenericQueryCase(BenchmarkCase):
+    name = "datadog_generic_query"
+    connector_yaml = {"type": "DATADOG", "dd_api_key": "api", "dd_app_key": "app", "dd_api_domain": "datadoghq.com"}
+    expected_result_types = (PlaybookTaskResultType.TIMESERIES,)
+
+    series = 20
+    step_seconds = 5
+
+    def build_manager(self):
+        from core.integrations.source_managers.datadog_source_manager import DatadogSourceManager
+        return DatadogSourceManager()
+
+    def default_task(self):
+        return {
+            "source": "DATADOG",
+            "datadog": {
+                "type": "GENERIC_QUERY",
+                "generic_query": {"query": "avg:system.cpu.user{env:prod} by {host}", "interval": 300},
+            },
+        }
+
+    def synthesize_fixture(self):
+        rng = random.Random(29)
+        start_ms, end_ms = DEFAULT_TIME_RANGE["time_geq"] * 1000, DEFAULT_TIME_RANGE["time_lt"] * 1000
+        series = []
+        for i in range(self.series):
+            series.append({
+                "metric": "system.cpu.user",
+                "display_name": "system.cpu.user",
+                "scope": f"env:prod,host:web-{i:02d}",
+                "expression": f"avg:system.cpu.user{{env:prod,host:web-{i:02d}}}",
+                "unit": [{"family": "percentage", "short_name": "%", "name": "percent"}, None],
+                "pointlist": [[float(ts), None if rng.random() < 0.01 else round(rng.uniform(0, 100), 4)]
+                              for ts in range(start_ms, end_ms, self.step_seconds * 1000)],
+            })
+        response = {"status": "ok", "res_type": "time_series", "query": "avg:system.cpu.user{env:prod} by {host}",
+                    "from_date": start_ms, "to_date": end_ms, "series": series}
+        return {"case": self.name, "mode": "processor", "calls": {"execute_raw_query": [response]}}
+
+
+class NewRelicNrqlMetricExecutionCase(BenchmarkCase):
+    name = "newrelic_nrql_metric_execution"
+    connector_yaml = {"type": "NEW_RELIC", "api_key": "key", "app_id": "1", "api_domain": "api.newrelic.com"}
+    expected_result_types = (PlaybookTaskResultType.TIMESERIES,)
+
+    facets = 25
+    buckets = 120
+
+    def build_manager(self):
+        from core.integrations.source_managers.newrelic_source_manager import NewRelicSourceManager
+        return NewRelicSourceManager()
+
+    def default_task(self):
+        return {
+            "source": "NEW_RELIC",
+            "new_relic": {
+                "type": "NRQL_METRIC_EXECUTION",
+                "nrql_metric_execution": {
+                    "metric_name": "Transaction duration",
+                    "nrql_expression": "SELECT average(duration) FROM Transaction FACET name TIMESERIES 30 seconds",
+                    "unit": "s",
+                },
+            },
+        }
+
+    def synthesize_fixture(self):
+        rng = random.Random(29)
+        step = (DEFAULT_TIME_RANGE["time_lt"] - DEFAULT_TIME_RANGE["time_geq"]) // self.buckets
+        facets = []
+        for i in range(self.facets):
+            time_series = []
+            for b in range(self.buckets):
+                begin = DEFAULT_TIME_RANGE["time_geq"] + b * step
+                time_series.append({"beginTimeSeconds": begin, "endTimeSeconds": begin + step,
+                                    "inspectedCount": rng.randint(0, 5000),
+                                    "results": [{"average": round(rng.uniform(0.001, 2.5), 6)}]})
+            facets.append({"name": f"WebTransaction/Controller/orders/{i}", "timeSeries": time_series})
+        response = {
+            "results": [],
+            "rawResponse": {
+                "facets": facets,
+                "metadata": {"contents": {"timeSeries": {"contents": [{"function": "average", "attribute": "duration"}]}}},
+            },
+        }
+        return {"case": self.name, "mode": "processor", "calls": {"execute_nrql_query": [response]}}
+
+
+class CoralogixFetchLogsCase(BenchmarkCase):
+    name = "coralogix_fetch_logs"
+    mode = "http"
+    connector_yaml = {"type": "CORALOGIX", "api_key": "key", "endpoint": "https://api.coralogix.example.com",
+                      "domain": "example.coralogix.com"}
+    expected_result_types = (PlaybookTaskResultType.API_RESPONSE,)
+
+    logs = 1000
+    logs_per_line = 100
+
+    def build_manager(self):
+        from core.integrations.source_managers.coralogix_source_manager import CoralogixSourceManager
+        return CoralogixSourceManager()
+
+    def default_task(self):
+        return {
+            "source": "CORALOGIX",
+            "coralogix": {
+                "type": "FETCH_LOGS",
+                "fetch_logs": {"query": "severity:ERROR", "from_time": "now-1h", "to_time": "now",
+                               "limit": self.logs},
+            },
+        }
+
+    def synthesize_fixture(self):
+        rng = random.Random(29)
+        lines = [json.dumps({"queryId": {"queryId": "5f0e8d6c-bench"}})]
+        batch = []
+        for i in range(self.logs):
+            user_data = {
+                "message": f"request failed: upstream timeout after {rng.randint(100, 30000)}ms",
+                "level": "error",
+                "trace_id": f"{rng.getrandbits(128):032x}",
+                "http": {"method": rng.choice(["GET", "POST"]), "path": f"/api/orders/{rng.randint(1, 10 ** 6)}",
+                         "status": rng.choice([500, 502, 504])},
+            }
+            batch.append({
+                "metadata": [{"key": "timestamp", "value": f"2023-11-14T22:13:{i % 60:02d}.{i % 1000:03d}Z"},
+                             {"key": "severity", "value": "Error"},
+                             {"key": "logid", "value": f"{rng.getrandbits(64):016x}"}],
+                "labels": [{"key": "applicationname", "value": "production"},
+                           {"key": "subsystemname", "value": rng.choice(["orders", "payments", "gateway"])}],
+                "userData": json.dumps(user_data),
+            })
+            if len(batch) == self.logs_per_line:
+                lines.append(json.dumps({"result": {"results": batch}}))
+                batch = []
+        if batch:
+            lines.append(json.dumps({"result": {"results": batch}}))
+        return {
+            "case": self.name,
+            "mode": "http",
+            "http": [{"status_code": 200, "headers": {"Content-Type": "application/x-ndjson"},
+                      "body": "\n".join(lines) + "\n"}],
+        }
+
+
+class ElasticSearchQueryLogsCase(BenchmarkCase):
+    name = "elastic_search_query_logs"
+    connector_yaml = {"type": "ELASTIC_SEARCH", "host": "es.example.com", "protocol": "https", "port": "9200",
+                      "api_key_id": "id", "api_key": "key", "kibana_host": "https://kibana.example.com"}
+    expected_result_types = (PlaybookTaskResultType.LOGS,)
+
+    hits = 2000
+
+    def build_manager(self):
+        from core.integrations.source_managers.elastic_search_source_manager import ElasticSearchSourceManager
+        return ElasticSearchSourceManager()
+
+    def default_task(self):
+        return {
+            "source": "ELASTIC_SEARCH",
+            "elastic_search": {
+                "type": "QUERY_LOGS",
+                "query_logs": {"index": "logs-app-*", "lucene_query": "level:error", "limit": self.hits,
+                               "timestamp_field": "@timestamp"},
+            },
+        }
+
+    def synthesize_fixture(self):
+        rng = random.Random(29)
+        hits = []
+        for i in range(self.hits):
+            hits.append({
+                "_index": f"logs-app-2023.11.{14 + i % 2}",
+                "_id": f"{rng.getrandbits(80):020x}",
+                "_score": None,
+                "_source": {
+                    "@timestamp": f"2023-11-14T22:{(i // 60) % 60:02d}:{i % 60:02d}.{i % 1000:03d}Z",
+                    "level": "error",
+                    "message": f"payment authorisation failed for order {rng.randint(1, 10 ** 7)}: gateway timeout",
+                    "service": rng.choice(["payments", "orders", "gateway"]),
+                    "host": {"name": f"ip-10-0-{rng.randint(0, 255)}-{rng.randint(0, 255)}"},
+                    "kubernetes": {"namespace": "prod", "pod": {"name": f"payments-{rng.getrandbits(24):06x}"}},
+                    "trace": {"id": f"{rng.getrandbits(128):032x}"},
+                    "http": {"response": {"status_code": rng.choice([500, 502, 504])}},
+                    "duration_ms": rng.randint(1, 30000),
+                },
+                "sort": [DEFAULT_TIME_RANGE["time_lt"] * 1000 - i * 1000],
+            })
+        response = {"took": 41, "timed_out": False,
+                    "hits": {"total": {"value": 10000, "relation": "gte"}, "max_score": None, "hits": hits}}
+        return {"case": self.name, "mode": "processor", "calls": {"query": [response]}}
+
+
+class OpenSearchQueryLogsCase(BenchmarkCase):
+    name = "open_search_query_logs"
+    mode = "http"
+    connector_yaml = {"type": "OPEN_SEARCH", "host": "opensearch.example.com", "protocol": "https", "port": "9200",
+                      "username": "admin", "password": "admin"}
+    expected_result_types = (PlaybookTaskResultType.LOGS,)
+
+    hits = 5000
+    page_size = 2000
+
+    def build_manager(self):
+        from core.integrations.source_managers.open_search_source_manager import OpenSearchSourceManager
+        return OpenSearchSourceManager()
+
+    def default_task(self):
+        return {
+            "source": "OPEN_SEARCH",
+            "open_search": {
+                "type": "QUERY_LOGS",
+                "query_logs": {"index": "logs-app-*", "query_dsl": json.dumps({"query": {"match": {"level": "error"}}}),
+                               "limit": self.hits, "timestamp_field": "@timestamp"},
+            },
+        }
+
+    def synthesize_fixture(self):
+        # Replayed in request order: point in time creation, every page, point in time deletion
+        rng = random.Random(31)
+        pages = []
+        for page_start in range(0, self.hits, self.page_size):
+            hits = []
+            for i in range(page_start, min(page_start + self.page_size, self.hits)):
+                timestamp_ms = DEFAULT_TIME_RANGE["time_lt"] * 1000 - i * 700
+                hits.append({
+                    "_index": f"logs-app-2023.11.{14 + i % 2}",
+                    "_id": f"{rng.getrandbits(80):020x}",
+                    "_score": 0.2876821,
+                    "_source": {
+                        "@timestamp": timestamp_ms,
+                        "level": "error",
+                        "message": f"payment authorisation failed for order {rng.randint(1, 10 ** 7)}: gateway timeout",
+                        "service": rng.choice(["payments", "orders", "gateway"]),
+                        "host": f"ip-10-0-{rng.randint(0, 255)}-{rng.randint(0, 255)}",
+                        "pod": f"payments-{rng.getrandbits(24):06x}",
+                        "trace_id": f"{rng.getrandbits(128):032x}",
+                        "status_code": rng.choice([500, 502, 504]),
+                        "duration_ms": rng.randint(1, 30000),
+                    },
+                    # Sort values end with the _shard_doc tiebreaker added under a point in time
+                    "sort": [timestamp_ms, 0.2876821, i],
+                })
+            pages.append({"took": 37, "timed_out": False,
+                          "hits": {"total": {"value": 10000, "relation": "gte"}, "max_score": None, "hits": hits}})
+
+        def recorded(body):
+            return {"status_code": 200, "headers": {"Content-Type": "application/json"}, "body": json.dumps(body)}
+
+        http = [recorded({"pit_id": "o463QQEKbG9ncy1hcHAtKhZ5", "creation_time": 1700003600000})]
+        http.extend(recorded(page) for page in pages)
+        http.append(recorded({"pits": [{"pit_id": "o463QQEKbG9ncy1hcHAtKhZ5", "successful": True}]}))
+        return {"case": self.name, "mode": "http", "http": http}
+
+
+CASES = {case.name: case for case in (
+    GrafanaExecuteAllDashboardPanelsCase(),
+    SignozClickhouseQueryCase(),
+    DatadogGenericQueryCase(),
+    NewRelicNrqlMetricExecutionCase(),
+    CoralogixFetchLogsCase(),
+    ElasticSearchQueryLogsCase(),
+    OpenSearchQueryLogsCase(),
+)}
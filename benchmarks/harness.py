@@ -0,0 +1,334 @@
+"""
+Offline replay harness for source manager benchmarks.
+
+A benchmark case runs a real source manager task end to end (`SourceManager.execute_task`) while the
+backend is replaced by a recorded fixture, so the numbers only reflect the toolkit's own parsing and
+proto building. Two replay modes are supported:
+
+* ``processor`` - the manager's API processor is swapped for a `ReplayProcessor` that returns the
+  recorded return value of each processor method, in call order.
+* ``http`` - the real API processor runs and `requests` transport calls are answered from recorded
+  HTTP responses, so the processor's own response parsing is part of the measurement.
+
+Fixtures are JSON files under ``benchmarks/fixtures/<case>.json``:
+
+    {
+        "case": "grafana_execute_all_dashboard_panels",
+        "mode": "processor",
+        "time_range": {"time_geq": 1700000000, "time_lt": 1700003600},
+        "task": {...PlaybookTask as dict, optional...},
+        "calls": {"fetch_dashboard_details": [{...}], ...},
+        "http": [{"status_code": 200, "headers": {...}, "body": "..."}]
+    }
+
+No network access happens during replay: any processor method or HTTP request without a recorded
+response raises.
+"""
+import gc
+import io
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, redirect_stdout
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCHMARKS_DIR)
+PACKAGE_DIR = os.path.join(REPO_ROOT, "drdroid_debug_toolkit")
+FIXTURES_DIR = os.path.join(BENCHMARKS_DIR, "fixtures")
+
+
+def setup_environment():
+    """Make both `core.*` and `drdroid_debug_toolkit.*` importable and configure Django for standalone use."""
+    for path in (PACKAGE_DIR, REPO_ROOT):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    from django.conf import settings
+    if not settings.configured:
+        settings.configure(IS_PROD_ENV=False)
+
+    logging.disable(logging.CRITICAL)
+
+
+class ReplayProcessor:
+    """
+    Stand-in for an API processor that answers every method call with the next recorded return value
+    for that method. Responses are replayed in order and wrap around when a method is called more often
+    than it was recorded.
+    """
+
+    def __init__(self, calls: dict):
+        self._calls = calls or {}
+        self._call_counts = {}
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        responses = self._calls.get(name)
+        if not responses:
+            raise Exception(f"ReplayProcessor:: No recorded response for processor method: {name}")
+
+        def replay(*args, **kwargs):
+            index = self._call_counts.get(name, 0)
+            self._call_counts[name] = index + 1
+            return responses[index % len(responses)]
+
+        return replay
+
+    @property
+    def call_counts(self):
+        return dict(self._call_counts)
+
+
+class RecordingProcessor:
+    """Wraps a live API processor and records the return value of every method call."""
+
+    def __init__(self, processor):
+        self._processor = processor
+        self.calls = {}
+
+    def __getattr__(self, name):
+        attr = getattr(self._processor, name)
+        if not callable(attr) or name.startswith('_'):
+            return attr
+
+        def record(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            self.calls.setdefault(name, []).append(json.loads(json.dumps(result, default=str)))
+            return result
+
+        return record
+
+
+def _build_response(request, recorded: dict):
+    import requests
+    from requests.structures import CaseInsensitiveDict
+
+    response = requests.Response()
+    response.status_code = recorded.get("status_code", 200)
+    response.headers = CaseInsensitiveDict(recorded.get("headers") or {})
+    body = recorded.get("body", "")
+    # Served through `raw` so streamed reads (iter_lines / iter_content) behave like a live connection
+    response.raw = io.BytesIO(body.encode("utf-8") if isinstance(body, str) else json.dumps(body).encode("utf-8"))
+    response.encoding = "utf-8"
+    response.url = request.url
+    response.request = request
+    response.reason = "OK" if response.status_code < 400 else "Error"
+    return response
+
+
+@contextmanager
+def replay_http(recorded_responses: list):
+    """Answer every `requests` transport call with the next recorded response (wrapping around)."""
+    from requests.adapters import HTTPAdapter
+
+    if not recorded_responses:
+        raise Exception("replay_http:: No recorded HTTP responses in fixture")
+    original_send = HTTPAdapter.send
+    state = {'index': 0}
+
+    def send(adapter, request, **kwargs):
+        recorded = recorded_responses[state['index'] % len(recorded_responses)]
+        state['index'] += 1
+        response = _build_response(request, recorded)
+        for hook in request.hooks.get('response', []):
+            hook(response, **kwargs)
+        return response
+
+    HTTPAdapter.send = send
+    try:
+        yield
+    finally:
+        HTTPAdapter.send = original_send
+
+
+@contextmanager
+def record_http(recorded_responses: list):
+    """Let `requests` calls through and append each response to recorded_responses."""
+    from requests.adapters import HTTPAdapter
+
+    original_send = HTTPAdapter.send
+
+    def send(adapter, request, **kwargs):
+        response = original_send(adapter, request, **kwargs)
+        recorded_responses.append({
+            "status_code": response.status_code,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() == 'content-type'},
+            "body": response.text,
+        })
+        return response
+
+    HTTPAdapter.send = send
+    try:
+        yield
+    finally:
+        HTTPAdapter.send = original_send
+
+
+def fixture_path(case_name: str) -> str:
+    return os.path.join(FIXTURES_DIR, f"{case_name}.json")
+
+
+def load_fixture(case):
+    """Loads the recorded fixture for case, falling back to the case's deterministic synthetic fixture."""
+    path = fixture_path(case.name)
+    if os.path.exists(path):
+        with open(path) as f:
+            fixture = json.load(f)
+        fixture.setdefault("source", "recorded")
+        return fixture
+    fixture = case.synthesize_fixture()
+    fixture["source"] = "synthetic"
+    return fixture
+
+
+def save_fixture(case_name: str, fixture: dict):
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    with open(fixture_path(case_name), "w") as f:
+        json.dump(fixture, f, indent=1, sort_keys=True)
+
+
+@contextmanager
+def _patched_manager(manager, connector, fixture):
+    """Routes connector lookup and processor creation of manager to the fixture."""
+    replay_processor = None
+    manager.get_active_connectors = lambda *args, **kwargs: connector
+    if fixture.get("mode", "processor") == "processor":
+        replay_processor = ReplayProcessor(fixture.get("calls"))
+        manager.get_connector_processor = lambda *args, **kwargs: replay_processor
+        yield replay_processor
+    else:
+        with replay_http(fixture.get("http")):
+            yield None
+
+
+def _result_bytes(task_result) -> int:
+    if isinstance(task_result, list):
+        return sum(r.ByteSize() for r in task_result)
+    return task_result.ByteSize()
+
+
+def run_case_once(case, fixture, manager=None):
+    """Executes case once against fixture and returns the task result(s)."""
+    from google.protobuf.struct_pb2 import Struct
+
+    manager = manager or case.build_manager()
+    connector = case.build_connector()
+    task = case.build_task(fixture)
+    time_range = case.build_time_range(fixture)
+    with _patched_manager(manager, connector, fixture), open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        return manager.execute_task(time_range, Struct(), task)
+
+
+def measure_case(case, repeat: int = 5, warmup: int = 1) -> dict:
+    """
+    Measures CPU time, wall time, peak traced allocations and result proto size for case.
+    Timing runs and the allocation run are separate so tracemalloc overhead does not skew CPU time.
+    """
+    fixture = load_fixture(case)
+    manager = case.build_manager()
+
+    result = None
+    for _ in range(warmup):
+        result = run_case_once(case, fixture, manager)
+
+    cpu_times, wall_times = [], []
+    gc_was_enabled = gc.isenabled()
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            cpu_start, wall_start = time.process_time(), time.perf_counter()
+            result = run_case_once(case, fixture, manager)
+            cpu_times.append(time.process_time() - cpu_start)
+            wall_times.append(time.perf_counter() - wall_start)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        result = run_case_once(case, fixture, manager)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        allocated_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    finally:
+        tracemalloc.stop()
+
+    case.validate_result(result)
+    return {
+        "fixture": fixture["source"],
+        "cpu_ms": round(statistics.median(cpu_times) * 1000, 3),
+        "cpu_ms_min": round(min(cpu_times) * 1000, 3),
+        "wall_ms": round(statistics.median(wall_times) * 1000, 3),
+        "peak_alloc_bytes": peak_bytes,
+        "live_alloc_blocks": allocated_blocks,
+        "result_bytes": _result_bytes(result),
+    }
+
+
+def record_case(case, connector, task_fixture: dict = None) -> dict:
+    """Runs case once against a live backend using connector and returns a fixture of what was observed."""
+    from google.protobuf.struct_pb2 import Struct
+    from core.utils.proto_utils import proto_to_dict
+
+    fixture = dict(task_fixture or {})
+    fixture.update({"case": case.name, "mode": case.mode})
+    manager = case.build_manager()
+    task = case.build_task(fixture)
+    time_range = case.build_time_range(fixture)
+    manager.get_active_connectors = lambda *args, **kwargs: connector
+
+    if case.mode == "processor":
+        live_get_connector_processor = manager.get_connector_processor
+        recorders = []
+
+        def get_recording_processor(*args, **kwargs):
+            recorder = RecordingProcessor(live_get_connector_processor(*args, **kwargs))
+            recorders.append(recorder)
+            return recorder
+
+        manager.get_connector_processor = get_recording_processor
+        manager.execute_task(time_range, Struct(), task)
+        calls = {}
+        for recorder in recorders:
+            for method, responses in recorder.calls.items():
+                calls.setdefault(method, []).extend(responses)
+        fixture["calls"] = calls
+    else:
+        recorded_responses = []
+        with record_http(recorded_responses):
+            manager.execute_task(time_range, Struct(), task)
+        fixture["http"] = recorded_responses
+
+    fixture["task"] = proto_to_dict(task)
+    fixture["time_range"] = {"time_geq": time_range.time_geq, "time_lt": time_range.time_lt}
+    return fixture
+
+
+def compare_to_baseline(results: dict, baseline: dict, threshold: float, metrics=("cpu_ms", "peak_alloc_bytes")):
+    """
+    Returns a list of (case, metric, baseline_value, current_value, ratio) for every metric that grew by
+    more than threshold (a fraction, e.g. 0.2 for +20%) relative to baseline. Result size changes are
+    always reported since they indicate a behaviour change rather than noise.
+    """
+    regressions = []
+    for case_name, current in results.items():
+        previous = baseline.get(case_name)
+        if not previous:
+            continue
+        for metric in metrics:
+            if not previous.get(metric):
+                continue
+            ratio = current[metric] / previous[metric]
+            if ratio > 1 + threshold:
+                regressions.append((case_name, metric, previous[metric], current[metric], ratio))
+        if previous.get("result_bytes") is not None and previous["result_bytes"] != current["result_bytes"]:
+            regressions.append((case_name, "result_bytes", previous["result_bytes"], current["result_bytes"],
+                                current["result_bytes"] / max(previous["result_bytes"], 1)))
+    return regressions
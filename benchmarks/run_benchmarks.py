@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Source manager benchmark suite
+
+Runs Grafana, Signoz, Datadog, NewRelic, Coralogix, ElasticSearch and OpenSearch executors end to end against
+recorded backend fixtures (no network) and reports CPU time, peak allocations and result proto size.
+Results can be stored per version in a baseline file and compared against on later runs; the script
+exits non-zero when a metric regresses past the threshold.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--cases grafana_execute_all_dashboard_panels ...] [--repeat 5]
+    python benchmarks/run_benchmarks.py --save-baseline 1.0.0
+    python benchmarks/run_benchmarks.py --compare-to 1.0.0 --threshold 0.2
+
+Recording fresh fixtures from live backends (credentials in the same yaml format as the toolkit):
+    python benchmarks/run_benchmarks.py --record --credentials credentials.yaml --cases signoz_clickhouse_query
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from harness import BENCHMARKS_DIR, fixture_path, measure_case, record_case, save_fixture, compare_to_baseline
+from cases import CASES
+
+DEFAULT_BASELINE_FILE = os.path.join(BENCHMARKS_DIR, "baseline.json")
+
+
+def load_baseline(path: str) -> dict:
+    if not os.path.exists(path):
+        return {"versions": {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def record(case_names, credentials_path):
+    import yaml
+    from core.utils.credentilal_utils import credential_yaml_to_connector_proto
+
+    with open(credentials_path) as f:
+        credentials = yaml.safe_load(f) or {}
+    for case_name in case_names:
+        case = CASES[case_name]
+        connector_name = next((name for name, creds in credentials.items()
+                               if creds.get("type") == case.connector_yaml["type"]), None)
+        if not connector_name:
+            print(f"{case_name}: skipped, no {case.connector_yaml['type']} connector in {credentials_path}")
+            continue
+        existing = {}
+        if os.path.exists(fixture_path(case_name)):
+            with open(fixture_path(case_name)) as f:
+                existing = {k: v for k, v in json.load(f).items() if k in ("task", "time_range")}
+        connector = credential_yaml_to_connector_proto(connector_name, credentials[connector_name], 1)
+        save_fixture(case_name, record_case(case, connector, existing))
+        print(f"{case_name}: recorded to {fixture_path(case_name)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=sorted(CASES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline-file", default=DEFAULT_BASELINE_FILE)
+    parser.add_argument("--save-baseline", metavar="VERSION", help="Store results under VERSION in the baseline file")
+    parser.add_argument("--compare-to", metavar="VERSION",
+                        help="Compare against VERSION from the baseline file (default: most recently saved)")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed relative growth of cpu_ms / peak_alloc_bytes before failing")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--record", action="store_true", help="Record fixtures from live backends")
+    parser.add_argument("--credentials", help="Connector credentials yaml used with --record")
+    args = parser.parse_args()
+
+    if args.record:
+        if not args.credentials:
+            parser.error("--record requires --credentials")
+        record(args.cases, args.credentials)
+        return 0
+
+    results = {}
+    for case_name in args.cases:
+        results[case_name] = measure_case(CASES[case_name], repeat=args.repeat)
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+    else:
+        print(f"{'case':40s} {'fixture':9s} {'cpu_ms':>10s} {'wall_ms':>10s} {'peak_alloc_kb':>14s} "
+              f"{'result_kb':>10s}")
+        for case_name, r in results.items():
+            print(f"{case_name:40s} {r['fixture']:9s} {r['cpu_ms']:10.2f} {r['wall_ms']:10.2f} "
+                  f"{r['peak_alloc_bytes'] / 1024:14.1f} {r['result_bytes'] / 1024:10.1f}")
+
+    baseline = load_baseline(args.baseline_file)
+    versions = baseline["versions"]
+    exit_code = 0
+    compare_version = args.compare_to or (baseline.get("latest") if baseline.get("latest") in versions else None)
+    if compare_version:
+        if compare_version not in versions:
+            print(f"No baseline stored for version {compare_version} in {args.baseline_file}")
+            return 2
+        regressions = compare_to_baseline(results, versions[compare_version], args.threshold)
+        for case_name, metric, previous, current, ratio in regressions:
+            print(f"REGRESSION {case_name} {metric}: {previous} -> {current} ({ratio:.2f}x) vs {compare_version}")
+        if regressions:
+            exit_code = 1
+        else:
+            print(f"No regressions vs {compare_version} (threshold {args.threshold:.0%})")
+
+    if args.save_baseline:
+        versions.setdefault(args.save_baseline, {}).update(results)
+        baseline["latest"] = args.save_baseline
+        with open(args.baseline_file, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"Saved baseline {args.save_baseline} to {args.baseline_file}")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,20 @@
+import inspect
+
+from core.utils.instrumentation_utils import instrument_processor_call
+
+
 class Processor:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Time every public processor call (outbound HTTP / SDK request) through the active instrumentation.
+        # Generator methods are skipped: their requests run while the caller iterates, after the call returned.
+        for name, attr in list(vars(cls).items()):
+            if name.startswith('_') or not inspect.isfunction(attr) or getattr(attr, '__instrumented__', False):
+                continue
+            if inspect.isgeneratorfunction(attr):
+                continue
+            setattr(cls, name, instrument_processor_call(attr))
+
     def get_connection(self):
         pass
 
@@ -16,8 +16,10 @@ from core.integrations.processor import Processor
 from core.integrations.utils.azure_rest_client import (
     AzureRESTClient,
     AzureAuthError,
-    AzureAPIError
+    AzureAPIError,
+    METRICS_BATCH_MAX_RESOURCES
 )
+from core.utils.instrumentation_utils import ContextThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -154,6 +156,35 @@ class AzureApiProcessor(Processor):
             logger.error(f"Failed to query log analytics with error: {e}")
             return None
 
+    @staticmethod
+    def _granularity_to_interval(granularity: int) -> str:
+        """Convert granularity in seconds to an ISO 8601 duration."""
+        if granularity < 60:
+            return f"PT{granularity}S"
+        elif granularity < 3600:
+            return f"PT{granularity // 60}M"
+        else:
+            return f"PT{granularity // 3600}H"
+
+    @staticmethod
+    def _parse_metric_values(metrics_data: List[Dict[str, Any]], aggregation: str) -> Dict[str, List[Dict[str, Any]]]:
+        """{metric name: [{"timestamp", "value"}]} from the `value` list of a metrics response."""
+        results = {}
+        agg_key = aggregation.lower()
+        for metric in metrics_data:
+            metric_name = metric.get("name", {}).get("value", "Unknown")
+            timeseries = metric.get("timeseries", [])
+            if timeseries:
+                data_points = timeseries[0].get("data", [])
+                results[metric_name] = [
+                    {
+                        "timestamp": dp.get("timeStamp"),
+                        "value": dp.get("total") if aggregation == "Total" else dp.get(agg_key)
+                    }
+                    for dp in data_points
+                ]
+        return results
+
     def query_metrics(self, resource_id: str, time_range, metric_names="Percentage CPU",
                       aggregation="Average", granularity=300) -> Optional[Dict[str, Any]]:
         """Fetch metrics from Azure Monitor."""
@@ -168,44 +199,20 @@ class AzureApiProcessor(Processor):
             else:
                 metric_names_list = metric_names
 
-            # Convert granularity to ISO 8601 duration
-            if granularity < 60:
-                interval = f"PT{granularity}S"
-            elif granularity < 3600:
-                interval = f"PT{granularity // 60}M"
-            else:
-                interval = f"PT{granularity // 3600}H"
-
             result = self._rest_client.monitor_query_metrics(
                 resource_id=resource_id,
                 metric_names=metric_names_list,
                 start_time=from_tr.isoformat(),
                 end_time=to_tr.isoformat(),
                 aggregation=aggregation,
-                interval=interval
+                interval=self._granularity_to_interval(granularity)
             )
 
             if not result:
                 return None
 
             # Convert to expected format
-            results = {}
-            metrics_data = result.get("value", [])
-            for metric in metrics_data:
-                metric_name = metric.get("name", {}).get("value", "Unknown")
-                timeseries = metric.get("timeseries", [])
-                if timeseries:
-                    data_points = timeseries[0].get("data", [])
-                    agg_key = aggregation.lower()
-                    results[metric_name] = [
-                        {
-                            "timestamp": dp.get("timeStamp"),
-                            "value": dp.get("total") if aggregation == "Total" else dp.get(agg_key)
-                        }
-                        for dp in data_points
-                    ]
-
-            return results
+            return self._parse_metric_values(result.get("value", []), aggregation)
         except AzureAPIError as e:
             logger.error(f"Failed to fetch metrics: {e.message}")
             return None
@@ -213,6 +220,142 @@ class AzureApiProcessor(Processor):
             logger.error(f"Failed to fetch metrics with error: {e}")
             return None
 
+    def query_metrics_batch(self, resource_ids: List[str], time_range, metric_names="Percentage CPU",
+                            aggregation="Average", granularity=300,
+                            max_workers: int = 4) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """
+        Fetch the same metrics for many resources through the Azure Monitor metrics batch endpoint.
+
+        Resources are grouped by region (looked up in one Resource Graph query) and metric namespace (the
+        resource type in the ID), split into batches of METRICS_BATCH_MAX_RESOURCES and the batches are
+        dispatched concurrently. Resources whose region is unknown, or whose batch fails, are queried one
+        by one through query_metrics.
+
+        Returns {resource_id: {metric name: [{"timestamp", "value"}]}} in the format of query_metrics.
+        """
+        if isinstance(metric_names, str):
+            metric_names_list = [m.strip() for m in metric_names.split(",")]
+        else:
+            metric_names_list = metric_names
+        from_tr = datetime.fromtimestamp(time_range.time_geq, tz=timezone.utc)
+        to_tr = datetime.fromtimestamp(time_range.time_lt, tz=timezone.utc)
+        interval = self._granularity_to_interval(granularity)
+
+        locations = self.resource_graph_get_locations(resource_ids)
+        groups, unbatched = {}, []
+        for resource_id in resource_ids:
+            location = locations.get(resource_id.lower())
+            metric_namespace = self._metric_namespace_from_resource_id(resource_id)
+            if not location or not metric_namespace:
+                unbatched.append(resource_id)
+                continue
+            groups.setdefault((location, metric_namespace), []).append(resource_id)
+
+        batches = []
+        for (location, metric_namespace), ids in groups.items():
+            for i in range(0, len(ids), METRICS_BATCH_MAX_RESOURCES):
+                batches.append((location, metric_namespace, ids[i:i + METRICS_BATCH_MAX_RESOURCES]))
+
+        def fetch_batch(batch):
+            location, metric_namespace, ids = batch
+            try:
+                return ids, self._rest_client.monitor_query_metrics_batch(
+                    region=location,
+                    metric_namespace=metric_namespace,
+                    resource_ids=ids,
+                    metric_names=metric_names_list,
+                    start_time=from_tr.isoformat(),
+                    end_time=to_tr.isoformat(),
+                    aggregation=aggregation,
+                    interval=interval
+                )
+            except AzureAPIError as e:
+                logger.error(f"Failed to fetch metrics batch for {len(ids)} resources in {location}: {e.message}")
+            except Exception as e:
+                logger.error(f"Failed to fetch metrics batch for {len(ids)} resources in {location}: {e}")
+            return ids, None
+
+        results = {}
+        if batches:
+            with ContextThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+                for ids, values in executor.map(fetch_batch, batches):
+                    if values is None:
+                        unbatched.extend(ids)
+                        continue
+                    requested = {resource_id.lower(): resource_id for resource_id in ids}
+                    for value in values:
+                        resource_id = requested.get((value.get("resourceid") or "").lower(), value.get("resourceid"))
+                        results[resource_id] = self._parse_metric_values(value.get("value", []), aggregation)
+
+        for resource_id in unbatched:
+            response = self.query_metrics(resource_id, time_range, metric_names=metric_names_list,
+                                          aggregation=aggregation, granularity=granularity)
+            if response is not None:
+                results[resource_id] = response
+        return results
+
+    @staticmethod
+    def _metric_namespace_from_resource_id(resource_id: str) -> Optional[str]:
+        """Metric namespace (resource type) of a resource ID, e.g. `Microsoft.Compute/virtualMachines`."""
+        parts = resource_id.strip('/').split('/')
+        lower_parts = [part.lower() for part in parts]
+        if 'providers' not in lower_parts:
+            return None
+        provider_index = len(lower_parts) - 1 - lower_parts[::-1].index('providers')
+        type_parts = parts[provider_index + 1:]
+        if len(type_parts) < 3:
+            return None
+        # provider namespace, then alternating type / name segments
+        return '/'.join([type_parts[0]] + type_parts[1::2])
+
+    # ==================== Azure Resource Graph Methods ====================
+
+    def resource_graph_list_resources(self, resource_types: List[str]) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """
+        List every resource of the given ARM types in one paged Resource Graph query, grouped by lower-cased
+        type. Rows have the same shape as the per-service REST list responses (id, name, location, kind, sku,
+        tags, properties, ...); AKS clusters are transformed like aks_list_clusters. Returns None if the query
+        fails, e.g. when the service principal cannot use Resource Graph.
+        """
+        type_list = ", ".join(f"'{resource_type.lower()}'" for resource_type in resource_types)
+        query = (
+            f"Resources | where type in~ ({type_list}) "
+            f"| project id, name, type, location, resourceGroup, kind, sku, tags, properties, identity, zones, "
+            f"managedBy | order by id asc"
+        )
+        try:
+            rows = self._rest_client.resource_graph_query(query)
+        except AzureAPIError as e:
+            logger.error(f"Failed to query Resource Graph: {e.message}")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to query Resource Graph: {e}")
+            return None
+
+        resources = {resource_type.lower(): [] for resource_type in resource_types}
+        for row in rows:
+            resource_type = (row.get("type") or "").lower()
+            if resource_type == "microsoft.containerservice/managedclusters":
+                row = self._transform_aks_cluster(row)
+            resources.setdefault(resource_type, []).append(row)
+        return resources
+
+    def resource_graph_get_locations(self, resource_ids: List[str]) -> Dict[str, str]:
+        """{lower-cased resource ID: region} for the given resources in one Resource Graph query; {} on failure."""
+        if not resource_ids:
+            return {}
+        id_list = ", ".join(f"'{resource_id.lower()}'" for resource_id in resource_ids)
+        try:
+            rows = self._rest_client.resource_graph_query(
+                f"Resources | where tolower(id) in ({id_list}) | project id, location")
+        except AzureAPIError as e:
+            logger.error(f"Failed to look up resource locations: {e.message}")
+            return {}
+        except Exception as e:
+            logger.error(f"Failed to look up resource locations: {e}")
+            return {}
+        return {row.get("id", "").lower(): row.get("location") for row in rows if row.get("location")}
+
     # ==================== AKS (Azure Kubernetes Service) Methods ====================
 
     def aks_list_clusters(self) -> Optional[List[Dict[str, Any]]]:
@@ -289,18 +432,26 @@ class AzureApiProcessor(Processor):
                 f.write(kubeconfig_bytes)
                 kubeconfig_path = f.name
 
-            # Load config and create client
-            k8s_config.load_kube_config(config_file=kubeconfig_path)
-            api_client = k8s_client.ApiClient()
-
-            # Clean up temp file
-            os.unlink(kubeconfig_path)
+            # Build a client with its own configuration; load_kube_config would overwrite the process-wide default
+            # and race with clients for other clusters
+            try:
+                api_client = k8s_config.new_client_from_config(config_file=kubeconfig_path)
+            finally:
+                # Clean up temp file
+                os.unlink(kubeconfig_path)
 
             return api_client
         except Exception as e:
             logger.error(f"Error creating K8s client: {e}")
             return None
 
+    def aks_get_api_client(self, resource_group: str, cluster_name: str):
+        """Authenticated Kubernetes ApiClient for an AKS cluster, or None."""
+        kubeconfig = self.aks_get_credentials(resource_group, cluster_name)
+        if not kubeconfig:
+            return None
+        return self._get_k8s_client(kubeconfig)
+
     def aks_list_namespaces(self, resource_group: str, cluster_name: str) -> Optional[List[Dict[str, Any]]]:
         """List namespaces in an AKS cluster."""
         try:
@@ -4,6 +4,7 @@ import json
 import subprocess
 from datetime import datetime, timedelta
 from core.integrations.processor import Processor
+from core.utils.http_utils import iter_ndjson, read_error_body
 
 logger = logging.getLogger(__name__)
 
@@ -173,9 +174,6 @@ class CoralogixApiProcessor(Processor):
             start_time_rfc3339 = self._parse_time_to_rfc3339(from_time)
             end_time_rfc3339 = self._parse_time_to_rfc3339(to_time)
             
-            # Use the direct query API endpoint
-            url = f'{self.__endpoint}/api/v1/dataprime/query'
-            
             # Direct query payload structure with proper format
             payload = {
                 "query": query,
@@ -188,41 +186,18 @@ class CoralogixApiProcessor(Processor):
                     "limit": limit
                 }
             }
-            print(url, payload)
-            
-            response = requests.post(
-                url, 
-                headers=self.headers, 
-                json=payload, 
-                verify=self.__ssl_verify, 
-                timeout=60
-            )
-            print(f"response: {response.text.strip()}")
-            if response.status_code == 200:
-                # Parse NDJSON response format
-                try:
-                    lines = response.text.strip().split('\n')
-                    results = []
-                    
-                    for line in lines:
-                        if line.strip():
-                            line_data = json.loads(line)
-                            
-                            # Check for results in different possible structures
-                            if "result" in line_data and "results" in line_data["result"]:
-                                # Regular query results format
-                                results.extend(line_data["result"]["results"])
-                            elif "results" in line_data:
-                                # Direct results format
-                                results.extend(line_data["results"])
-                    
-                    return {"results": results, "count": len(results)}
-                        
-                except Exception as e:
-                    # Return the raw response as text if parsing fails
-                    return {"raw_response": response.text, "status": "success", "error": str(e)}
-            else:
-                raise Exception(f"Direct query endpoint failed with status {response.status_code}: {response.text}")
+            logger.debug(f"Coralogix fetch_logs query: {query}, from: {start_time_rfc3339}, "
+                         f"to: {end_time_rfc3339}, limit: {limit}")
+
+            # Parse the NDJSON response as it streams in and stop reading once limit results are in
+            response = self._post_dataprime_query(payload)
+            other_lines = []
+            results = list(self._iter_dataprime_results(response, limit=limit, other_lines=other_lines))
+            if not results and other_lines:
+                # No result lines but an error or unexpected body: return it instead of an empty success
+                return {"raw_response": "\n".join(other_lines), "status": "success",
+                        "error": "No results found in direct query response"}
+            return {"results": results, "count": len(results)}
                 
         except Exception as e:
             logger.error(f"Exception occurred while fetching logs: {e}")
@@ -423,8 +398,6 @@ class CoralogixApiProcessor(Processor):
             start_time_rfc3339 = self._parse_time_to_rfc3339(from_time or "now-1h")
             end_time_rfc3339 = self._parse_time_to_rfc3339(to_time or "now")
             
-            url = f'{self.__endpoint}/api/v1/dataprime/query'
-            
             payload = {
                 "query": query,
                 "metadata": {
@@ -435,33 +408,10 @@ class CoralogixApiProcessor(Processor):
                     "defaultSource": source_type
                 }
             }
-            
-            response = requests.post(
-                url, 
-                headers=self.headers, 
-                json=payload,
-                verify=self.__ssl_verify, 
-                timeout=60
-            )
-            
-            if response.status_code == 200:
-                # Parse NDJSON response format
-                lines = response.text.strip().split('\n')
-                results = []
-                
-                for line in lines:
-                    if line.strip():
-                        line_data = json.loads(line)
-                        
-                        # Check for results in different possible structures
-                        if "result" in line_data and "results" in line_data["result"]:
-                            results.extend(line_data["result"]["results"])
-                        elif "results" in line_data:
-                            results.extend(line_data["results"])
-                
-                return {"results": results, "count": len(results)}
-            else:
-                raise Exception(f"Direct query failed with status {response.status_code}: {response.text}")
+
+            response = self._post_dataprime_query(payload)
+            results = list(self._iter_dataprime_results(response))
+            return {"results": results, "count": len(results)}
                 
         except Exception as e:
             logger.error(f"Error executing Lucene query: {e}")
@@ -543,7 +493,6 @@ class CoralogixApiProcessor(Processor):
             start_time_rfc3339 = self._parse_time_to_rfc3339(from_time or "now-1h")
             end_time_rfc3339 = self._parse_time_to_rfc3339(to_time or "now")
 
-            url = f'{self.__endpoint}/api/v1/dataprime/query'
             payload = {
                 "query": dataprime_query,
                 "metadata": {
@@ -555,31 +504,8 @@ class CoralogixApiProcessor(Processor):
                 },
             }
 
-            response = requests.post(
-                url, headers=self.headers, json=payload,
-                verify=self.__ssl_verify, timeout=60
-            )
-
-            if response.status_code != 200:
-                raise Exception(f"DataPrime spans query failed with status {response.status_code}: {response.text}")
-
-            results = []
-            for line in response.text.strip().split('\n'):
-                if not line.strip():
-                    continue
-                try:
-                    line_data = json.loads(line)
-                    if "result" in line_data and "results" in line_data["result"]:
-                        for r in line_data["result"]["results"]:
-                            if isinstance(r, dict):
-                                results.append(r)
-                    elif "results" in line_data:
-                        for r in line_data["results"]:
-                            if isinstance(r, dict):
-                                results.append(r)
-                except Exception as parse_err:
-                    logger.warning(f"Could not parse DataPrime line: {parse_err}")
-
+            response = self._post_dataprime_query(payload)
+            results = list(self._iter_dataprime_results(response, dicts_only=True))
             return {"results": results, "count": len(results)}
 
         except Exception as e:
@@ -775,6 +701,57 @@ class CoralogixApiProcessor(Processor):
             logger.error(f"Exception occurred while fetching index mappings for pattern '{index_pattern}': {e}")
             raise e
 
+    def _post_dataprime_query(self, payload: dict):
+        """
+        POST a query to the direct query (DataPrime) API with a streamed body.
+        Raises with a truncated error body on non-200 responses.
+        """
+        response = requests.post(
+            f'{self.__endpoint}/api/v1/dataprime/query',
+            headers=self.headers,
+            json=payload,
+            verify=self.__ssl_verify,
+            timeout=60,
+            stream=True
+        )
+        if response.status_code != 200:
+            try:
+                error_body = read_error_body(response)
+            finally:
+                response.close()
+            raise Exception(f"Direct query failed with status {response.status_code}: {error_body}")
+        return response
+
+    @staticmethod
+    def _iter_dataprime_results(response, limit: int = None, dicts_only: bool = False, other_lines: list = None):
+        """
+        Yield result rows from a streamed NDJSON direct query response. Each line is either
+        {"result": {"results": [...]}} or {"results": [...]}; other lines (e.g. queryId) are ignored, or,
+        when other_lines is a list, appended to it as text unless they only carry the queryId.
+        Stops reading once limit rows were yielded and always closes the response.
+        """
+        count = 0
+        try:
+            for line_data in iter_ndjson(response, invalid_lines=other_lines):
+                if isinstance(line_data, dict) and isinstance(line_data.get("result"), dict) \
+                        and "results" in line_data["result"]:
+                    rows = line_data["result"]["results"]
+                elif isinstance(line_data, dict) and "results" in line_data:
+                    rows = line_data["results"]
+                else:
+                    if other_lines is not None and not (isinstance(line_data, dict) and set(line_data) <= {"queryId"}):
+                        other_lines.append(json.dumps(line_data))
+                    continue
+                for row in rows:
+                    if dicts_only and not isinstance(row, dict):
+                        continue
+                    yield row
+                    count += 1
+                    if limit and count >= limit:
+                        return
+        finally:
+            response.close()
+
     def _parse_time_to_rfc3339(self, time_str: str) -> str:
         """
         Convert time string to RFC3339 format for Prometheus API.
@@ -863,26 +840,6 @@ class CoralogixApiProcessor(Processor):
         # Accumulate by service_name; later strategies can enrich earlier entries.
         merged: dict[str, dict] = {}
 
-        def _parse_dataprime_results(response_text: str) -> list[dict]:
-            """Parse NDJSON DataPrime response; skip any non-dict rows."""
-            results = []
-            for line in response_text.strip().split('\n'):
-                if not line.strip():
-                    continue
-                try:
-                    line_data = json.loads(line)
-                    candidates = []
-                    if "result" in line_data and "results" in line_data["result"]:
-                        candidates = line_data["result"]["results"]
-                    elif "results" in line_data:
-                        candidates = line_data["results"]
-                    for r in candidates:
-                        if isinstance(r, dict):
-                            results.append(r)
-                except Exception as parse_err:
-                    logger.warning(f"Could not parse DataPrime line: {parse_err}")
-            return results
-
         def _kv_list_to_dict(field) -> dict:
             """
             DataPrime returns metadata/labels as a list of {key, value} objects.
@@ -907,9 +864,9 @@ class CoralogixApiProcessor(Processor):
                 "metadata": {**base_metadata, "defaultSource": "spans"},
             }
             response = requests.post(url, headers=self.headers, json=payload,
-                                     verify=self.__ssl_verify, timeout=60)
+                                     verify=self.__ssl_verify, timeout=60, stream=True)
             if response.status_code == 200:
-                results = _parse_dataprime_results(response.text)
+                results = list(self._iter_dataprime_results(response, dicts_only=True))
                 for r in results:
                     labels = _kv_list_to_dict(r.get("labels"))
 
@@ -930,7 +887,7 @@ class CoralogixApiProcessor(Processor):
                 logger.info(f"Strategy 1 (spans): parsed {len(results)} rows, found {len(merged)} services so far")
             else:
                 logger.warning(
-                    f"Spans DataPrime query returned {response.status_code}: {response.text[:200]}"
+                    f"Spans DataPrime query returned {response.status_code}: {read_error_body(response, 200)}"
                 )
         except Exception as e:
             logger.warning(f"Strategy 1 (spans DataPrime) failed: {e}")
@@ -943,9 +900,9 @@ class CoralogixApiProcessor(Processor):
                 "metadata": {**base_metadata, "defaultSource": "logs"},
             }
             response = requests.post(url, headers=self.headers, json=payload,
-                                     verify=self.__ssl_verify, timeout=60)
+                                     verify=self.__ssl_verify, timeout=60, stream=True)
             if response.status_code == 200:
-                results = _parse_dataprime_results(response.text)
+                results = list(self._iter_dataprime_results(response, dicts_only=True))
                 for r in results:
                     labels = _kv_list_to_dict(r.get("labels"))
 
@@ -964,7 +921,7 @@ class CoralogixApiProcessor(Processor):
                 logger.info(f"Strategy 2 (logs): parsed {len(results)} rows, found {len(merged)} services so far")
             else:
                 logger.warning(
-                    f"Logs DataPrime query returned {response.status_code}: {response.text[:200]}"
+                    f"Logs DataPrime query returned {response.status_code}: {read_error_body(response, 200)}"
                 )
         except Exception as e:
             logger.warning(f"Strategy 2 (logs DataPrime) failed: {e}")
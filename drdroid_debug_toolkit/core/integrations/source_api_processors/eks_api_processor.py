@@ -8,6 +8,7 @@ import kubernetes
 from awscli.customizations.eks.get_token import TokenGenerator, TOKEN_EXPIRATION_MINS, STSClientFactory
 
 from core.integrations.processor import Processor
+from core.integrations.utils.k8s_cluster_utils import get_k8s_api_instance
 
 logger = logging.getLogger(__name__)
 
@@ -85,7 +86,8 @@ class EKSApiProcessor(Processor):
             logger.error(f"Exception occurred while fetching EKS cluster details for: {cluster_name} with error: {e}")
             raise e
 
-    def eks_get_api_instance(self, cluster_name, client='api'):
+    def eks_get_api_client(self, cluster_name):
+        """Authenticated kubernetes ApiClient for cluster_name, shared by all typed API instances of the cluster."""
         eks_details = self.eks_describe_cluster(cluster_name)
 
         fp = tempfile.NamedTemporaryFile(delete=False)
@@ -107,16 +109,10 @@ class EKSApiProcessor(Processor):
         conf.api_key['authorization'] = token
         conf.api_key_prefix['authorization'] = 'Bearer'
         conf.ssl_ca_cert = ca_filename
-        with kubernetes.client.ApiClient(conf) as api_client:
-            if client == 'api':
-                api_instance = kubernetes.client.CoreV1Api(api_client)
-                return api_instance
-            elif client == 'app':
-                app_instance = kubernetes.client.AppsV1Api(api_client)
-                return app_instance
-            elif client == 'networking':
-                networking_instance = kubernetes.client.NetworkingV1Api(api_client)
-                return networking_instance
-            elif client == 'autoscaling':
-                autoscaling_instance = kubernetes.client.AutoscalingV1Api(api_client)
-                return autoscaling_instance
+        return kubernetes.client.ApiClient(conf)
+
+    def eks_get_api_instance(self, cluster_name, client='api'):
+        api_client = self.eks_get_api_client(cluster_name)
+        if not api_client:
+            return None
+        return get_k8s_api_instance(api_client, client)
@@ -1,11 +1,14 @@
 import json
 import logging
+import threading
+from collections import deque
 
 from google.auth.transport.requests import Request
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 
 from core.integrations.processor import Processor
+from core.utils.instrumentation_utils import ContextThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +30,23 @@ class GcmApiProcessor(Processor):
         self.__service_account_json = service_account_json
         self.__project_id = project_id
         self.__credentials = get_gcm_credentials(self.__service_account_json)
+        self.__thread_local = threading.local()
+
+    def _logging_service(self):
+        # googleapiclient services are not thread-safe, so every thread builds (once) its own
+        service = getattr(self.__thread_local, 'logging_service', None)
+        if service is None:
+            service = build('logging', 'v2', credentials=self.__credentials)
+            self.__thread_local.logging_service = service
+        return service
+
+    @staticmethod
+    def _log_fields_mask(fields):
+        """Partial response mask for entries.list from comma-separated LogEntry fields ("a.b" paths allowed)."""
+        if not fields:
+            return None
+        paths = [field.strip().replace('.', '/') for field in fields.split(',') if field.strip()]
+        return f"nextPageToken,entries({','.join(paths)})" if paths else None
 
     def test_connection(self):
         try:
@@ -67,9 +87,10 @@ class GcmApiProcessor(Processor):
             logger.error(f"Exception occurred while fetching metric descriptors: {e}")
             raise e
 
-    def fetch_logs(self, filter_str, order_by="timestamp desc", page_size=2000, page_token=None, resource_names=None):
+    def fetch_logs(self, filter_str, order_by="timestamp desc", page_size=2000, page_token=None, resource_names=None,
+                   fields=None):
         try:
-            service = build('logging', 'v2', credentials=self.__credentials)
+            service = self._logging_service()
             resource_names = resource_names or [f"projects/{self.__project_id}"]
             body = {
                 "resourceNames": resource_names,
@@ -82,7 +103,9 @@ class GcmApiProcessor(Processor):
 
             logger.debug(f"Fetching logs with body: {body}")
 
-            request = service.entries().list(body=body)
+            fields_mask = self._log_fields_mask(fields)
+            request = service.entries().list(body=body, fields=fields_mask) if fields_mask else \
+                service.entries().list(body=body)
             response = request.execute()
 
             logger.debug(f"Received response: {response}")
@@ -92,6 +115,89 @@ class GcmApiProcessor(Processor):
             logger.error(f"Exception occurred while fetching logs: {e}")
             raise e
 
+    def _fetch_logs_interval(self, filter_str, order_by, resource_names, page_size, max_entries, fields_mask, stop):
+        """Follows nextPageToken for one sub-interval until it is exhausted, max_entries were read or stop is set."""
+        body = {"resourceNames": resource_names, "filter": filter_str, "orderBy": order_by, "pageSize": page_size}
+        entries, pages, exhausted = [], 0, False
+        while True:
+            request = self._logging_service().entries().list(body=body, fields=fields_mask) if fields_mask else \
+                self._logging_service().entries().list(body=body)
+            response = request.execute()
+            pages += 1
+            entries.extend(response.get('entries', []))
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                exhausted = True
+                break
+            if (max_entries is not None and len(entries) >= max_entries) or stop.is_set():
+                break
+            body = {**body, "pageToken": page_token}
+        if max_entries is not None and len(entries) > max_entries:
+            entries, exhausted = entries[:max_entries], False
+        return entries, pages, exhausted
+
+    def fetch_logs_concurrently(self, filter_str, start_time, end_time, order_by="timestamp desc", resource_names=None,
+                                page_size=1000, max_entries=None, fields=None, interval_count=4, max_workers=4,
+                                stats=None):
+        """
+        Reads the entries matching filter_str between start_time and end_time (UTC datetimes) as interval_count
+        sub-intervals fetched max_workers at a time, each following its own page tokens, and returns them merged
+        in timestamp order (order_by "timestamp desc" or "timestamp asc").
+
+        Sub-intervals are consumed newest first for descending order (oldest first otherwise), so once the
+        completed leading ones hold max_entries entries the rest cannot contribute: they are not issued and
+        running ones stop after their current page. fields (comma-separated LogEntry fields) limits the
+        returned payload. When a dict is passed as stats it receives entries, pages, intervals,
+        intervals_fetched and truncated (whether max_entries cut the result short).
+        """
+        try:
+            resource_names = resource_names or [f"projects/{self.__project_id}"]
+            descending = 'desc' in (order_by or '').lower()
+            fields_mask = self._log_fields_mask(fields)
+            interval_count = max(1, interval_count)
+            step = (end_time - start_time) / interval_count
+            intervals = []
+            for i in range(interval_count):
+                interval_start = start_time + step * i
+                interval_end = end_time if i == interval_count - 1 else start_time + step * (i + 1)
+                # Sub-intervals are half-open except the last, which keeps the inclusive end of the window
+                end_operator = '<=' if i == interval_count - 1 else '<'
+                intervals.append(
+                    f'({filter_str}) AND timestamp >= "{interval_start.strftime("%Y-%m-%dT%H:%M:%S.%fZ")}" AND '
+                    f'timestamp {end_operator} "{interval_end.strftime("%Y-%m-%dT%H:%M:%S.%fZ")}"')
+            if descending:
+                intervals.reverse()
+
+            if stats is None:
+                stats = {}
+            stats.update(entries=0, pages=0, intervals=len(intervals), intervals_fetched=0, truncated=False)
+            stop = threading.Event()
+            merged = []
+            with ContextThreadPoolExecutor(max_workers=max(1, min(max_workers, len(intervals)))) as executor:
+                pending, next_interval = deque(), 0
+                while next_interval < len(intervals) or pending:
+                    while next_interval < len(intervals) and len(pending) < max_workers:
+                        pending.append(executor.submit(self._fetch_logs_interval, intervals[next_interval], order_by,
+                                                       resource_names, page_size, max_entries, fields_mask, stop))
+                        next_interval += 1
+                    entries, pages, exhausted = pending.popleft().result()
+                    merged.extend(entries)
+                    stats['pages'] += pages
+                    stats['intervals_fetched'] += 1
+                    if max_entries is not None and len(merged) >= max_entries:
+                        stats['truncated'] = len(merged) > max_entries or not exhausted or bool(pending) or \
+                            next_interval < len(intervals)
+                        stop.set()
+                        for future in pending:
+                            future.cancel()
+                        break
+            merged = merged[:max_entries] if max_entries is not None else merged
+            stats['entries'] = len(merged)
+            return merged
+        except Exception as e:
+            logger.error(f"Exception occurred while fetching logs concurrently: {e}")
+            raise e
+
     def execute_mql(self, query, project_id):
         try:
             service = build('monitoring', 'v3', credentials=self.__credentials)
@@ -6,26 +6,74 @@ import binascii
 from datetime import datetime, timezone
 
 from core.integrations.processor import Processor
+from core.integrations.utils.github_rest_client import get_github_rest_client
 from core.settings import EXTERNAL_CALL_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
 main_branches = ['master', 'main']
 
+readme_file_names = ['README.md', 'README', 'README.txt', 'README.rst', 'readme.md', 'readme']
+
+# One page of org repositories with README blobs (one alias per candidate file name, resolved against the
+# default branch), languages and recent activity.
+REPOSITORIES_GRAPHQL_QUERY = """
+query($org: String!, $pageSize: Int!, $cursor: String, $historySize: Int!) {
+  organization(login: $org) {
+    repositories(first: $pageSize, after: $cursor, orderBy: {field: NAME, direction: ASC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        databaseId
+        name
+        nameWithOwner
+        description
+        url
+        isPrivate
+        isFork
+        isArchived
+        createdAt
+        updatedAt
+        pushedAt
+        stargazerCount
+        forkCount
+        primaryLanguage { name }
+        languages(first: 10, orderBy: {field: SIZE, direction: DESC}) { edges { size node { name } } }
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+        defaultBranchRef {
+          name
+          target {
+            ... on Commit {
+              history(first: $historySize) {
+                nodes { oid messageHeadline committedDate author { name email user { login } } }
+              }
+            }
+          }
+        }
+        %s
+      }
+    }
+  }
+}
+""" % '\n        '.join(
+    f'readme{i}: object(expression: "HEAD:{name}") {{ ... on Blob {{ text isTruncated isBinary }} }}'
+    for i, name in enumerate(readme_file_names))
+
 
 class GithubAPIProcessor(Processor):
     def __init__(self, api_key, org):
         self.__api_key = api_key
         self.org = org
         self.base_url = 'https://api.github.com'
+        # Shared per token: GETs are revalidated with ETags and paced against the rate limit
+        self._client = get_github_rest_client(api_key)
 
     def _get_commit_before_timestamp(self, repo, file_path, timestamp):
         """Find the latest commit affecting the file before the given timestamp."""
         try:
-            headers = {'Authorization': f'Bearer {self.__api_key}'}
-            commits_url = f"https://api.github.com/repos/{self.org}/{repo}/commits?path={file_path}"
-            response = requests.get(commits_url, headers=headers, timeout=EXTERNAL_CALL_TIMEOUT)
-            response.raise_for_status()
+            commits_url = f"https://api.github.com/repos/{self.org}/{repo}/commits"
+            response = self._client.get(commits_url, params={'path': file_path})
+            if response.status_code != 200:
+                raise Exception(f"Commits request failed with status_code: {response.status_code}")
             commits = response.json()
             commit_search_datetime = datetime.fromtimestamp(timestamp, tz=timezone.utc)
             for commit in commits:
@@ -182,13 +230,11 @@ class GithubAPIProcessor(Processor):
 
     def get_file_commits(self, repo, file_path, branch='main'):
         try:
-            commits_url = f'https://api.github.com/repos/{self.org}/{repo}/commits?path={file_path}&per_page=100&sha={branch}'
-            headers = {
-                'Authorization': f'Bearer {self.__api_key}'
-            }
+            commits_url = f'https://api.github.com/repos/{self.org}/{repo}/commits'
+            params = {'path': file_path, 'per_page': 100, 'sha': branch}
 
             # Fetch the latest commits for the file
-            response = requests.request("GET", commits_url, headers=headers, timeout=EXTERNAL_CALL_TIMEOUT)
+            response = self._client.get(commits_url, params=params)
             if response:
                 if response.status_code == 200:
                     return response.json()
@@ -203,27 +249,14 @@ class GithubAPIProcessor(Processor):
 
     def list_all_repos(self):
         try:
-            page = 1
             repo_url = f'https://api.github.com/orgs/{self.org}/repos'
-            headers = {
-                'Authorization': f'Bearer {self.__api_key}'
-            }
-            all_repos = []
-            while True:
-                data = {'page': page, 'per_page': 100}
-                response = requests.request("GET", repo_url, headers=headers, params=data)
-                if response:
-                    if response.status_code == 200:
-                        if len(response.json()) > 0:
-                            all_repos.extend(response.json())
-                            page += 1
-                            continue
-                    else:
-                        logger.error(f"GithubAPIProcessor.list_all_repos:: Error occurred while fetching github repos "
-                                     f"in {self.org} with status_code: {response.status_code} and response: "
-                                     f"{response.text}")
-                break
-            return all_repos
+            response = self._client.get_paginated(repo_url, per_page=100)
+            if response.status_code != 200:
+                logger.error(f"GithubAPIProcessor.list_all_repos:: Error occurred while fetching github repos "
+                             f"in {self.org} with status_code: {response.status_code} and response: "
+                             f"{response.text}")
+                return []
+            return response.json()
         except Exception as e:
             logger.error(f"GithubAPIProcessor.list_all_repos:: Exception occurred while fetching github repos "
                          f"in {self.org} with error: {e}")
@@ -232,11 +265,7 @@ class GithubAPIProcessor(Processor):
     def get_commit_sha(self, repo, commit_sha):
         try:
             commit_url = f'https://api.github.com/repos/{self.org}/{repo}/commits/{commit_sha}'
-            payload = {}
-            headers = {
-                'Authorization': f'Bearer {self.__api_key}'
-            }
-            response = requests.request("GET", commit_url, headers=headers, data=payload, timeout=EXTERNAL_CALL_TIMEOUT)
+            response = self._client.get(commit_url)
             if response:
                 if response.status_code == 200:
                     return response.json()
@@ -251,16 +280,15 @@ class GithubAPIProcessor(Processor):
 
     def fetch_file(self, repo, file_path, timestamp=None):
         try:
-            payload = {}
-            headers = {'Authorization': f'Bearer {self.__api_key}'}
             # if timestamp is passed, fetch from that timestamp else fetch latest file version
             # Worst case always fall to latest file version
             file_url = f'https://api.github.com/repos/{self.org}/{repo}/contents/{file_path}'
+            params = None
             if timestamp:
                 commit_sha = self._get_commit_before_timestamp(repo, file_path, timestamp)
                 if commit_sha:
-                    file_url = f'https://api.github.com/repos/{self.org}/{repo}/contents/{file_path}?ref={commit_sha}'
-            response = requests.request("GET", file_url, headers=headers, data=payload, timeout=EXTERNAL_CALL_TIMEOUT)
+                    params = {'ref': commit_sha}
+            response = self._client.get(file_url, params=params)
             if response:
                 if response.status_code == 200:
                     return response.json()
@@ -279,8 +307,6 @@ class GithubAPIProcessor(Processor):
         Tries common README file names in order of preference.
         Returns the decoded content as a string, or None if not found.
         """
-        readme_file_names = ['README.md', 'README', 'README.txt', 'README.rst', 'readme.md', 'readme']
-        
         for readme_file in readme_file_names:
             try:
                 file_data = self.fetch_file(repo, readme_file)
@@ -302,6 +328,97 @@ class GithubAPIProcessor(Processor):
         
         return None
 
+    @staticmethod
+    def _graphql_repo_to_rest(node):
+        """Maps a GraphQL repository node onto the REST repository keys used by metadata consumers."""
+        default_branch = node.get('defaultBranchRef') or {}
+        history = ((default_branch.get('target') or {}).get('history') or {}).get('nodes') or []
+        repo = {
+            'id': node.get('databaseId'),
+            'name': node.get('name'),
+            'full_name': node.get('nameWithOwner'),
+            'description': node.get('description'),
+            'html_url': node.get('url'),
+            'private': node.get('isPrivate'),
+            'fork': node.get('isFork'),
+            'archived': node.get('isArchived'),
+            'created_at': node.get('createdAt'),
+            'updated_at': node.get('updatedAt'),
+            'pushed_at': node.get('pushedAt'),
+            'stargazers_count': node.get('stargazerCount'),
+            'forks_count': node.get('forkCount'),
+            'language': (node.get('primaryLanguage') or {}).get('name'),
+            'languages': {edge['node']['name']: edge['size'] for edge in
+                          (node.get('languages') or {}).get('edges') or []},
+            'topics': [topic['topic']['name'] for topic in (node.get('repositoryTopics') or {}).get('nodes') or []],
+            'default_branch': default_branch.get('name'),
+            'recent_commits': [{
+                'sha': commit.get('oid'),
+                'message': commit.get('messageHeadline'),
+                'date': commit.get('committedDate'),
+                'author': (commit.get('author') or {}).get('name'),
+                'author_email': (commit.get('author') or {}).get('email'),
+                'author_login': ((commit.get('author') or {}).get('user') or {}).get('login'),
+            } for commit in history],
+        }
+        for i, readme_file in enumerate(readme_file_names):
+            blob = node.get(f'readme{i}')
+            if not blob:
+                continue
+            if blob.get('isBinary'):
+                continue
+            if blob.get('isTruncated') or blob.get('text') is None:
+                # Blob too large for GraphQL; the REST contents API returns it in full
+                repo['readme_needs_rest'] = True
+                break
+            repo['readme'] = blob['text']
+            break
+        return repo
+
+    def list_all_repos_graphql(self, page_size=50, history_size=5):
+        """
+        List org repositories with README content, default branch, languages and recent commits through the
+        GraphQL API, `page_size` (max 100) repositories per request.
+
+        Returns:
+            list: Repository dicts under the REST keys GraphQL provides (a subset of the REST repository fields)
+                  plus README, languages and recent commits. Repositories whose README could not be read through
+                  GraphQL are marked with 'readme_needs_rest'. None if the GraphQL API is unavailable for this
+                  token/org.
+        """
+        try:
+            all_repos = []
+            cursor = None
+            while True:
+                variables = {'org': self.org, 'pageSize': min(page_size, 100), 'cursor': cursor,
+                             'historySize': history_size}
+                response = self._client.graphql(REPOSITORIES_GRAPHQL_QUERY, variables)
+                if response.status_code != 200:
+                    logger.error(f"GithubAPIProcessor.list_all_repos_graphql:: Error occurred while fetching github "
+                                 f"repos in {self.org} with status_code: {response.status_code} and response: "
+                                 f"{response.text}")
+                    return None
+                body = response.json() or {}
+                repositories = ((body.get('data') or {}).get('organization') or {}).get('repositories')
+                if repositories is None:
+                    logger.error(f"GithubAPIProcessor.list_all_repos_graphql:: GraphQL query for {self.org} returned "
+                                 f"no repositories with errors: {body.get('errors')}")
+                    return None
+                if body.get('errors'):
+                    # Partial data, e.g. a repository the token cannot fully read
+                    logger.warning(f"GithubAPIProcessor.list_all_repos_graphql:: GraphQL query for {self.org} returned "
+                                   f"errors: {body['errors']}")
+                all_repos.extend(self._graphql_repo_to_rest(node) for node in repositories.get('nodes') or [] if node)
+                page_info = repositories.get('pageInfo') or {}
+                if not page_info.get('hasNextPage'):
+                    break
+                cursor = page_info.get('endCursor')
+            return all_repos
+        except Exception as e:
+            logger.error(f"GithubAPIProcessor.list_all_repos_graphql:: Exception occurred while fetching github repos "
+                         f"in {self.org} with error: {e}")
+        return None
+
     def update_file(self, repo, file_path, sha, content, committer_name, committer_email, branch_name=None):
         try:
             file_url = f'https://api.github.com/repos/{self.org}/{repo}/contents/{file_path}'
@@ -328,29 +445,16 @@ class GithubAPIProcessor(Processor):
         return None
 
     def list_all_branch(self, repo, protected=False):
-        page = 1
         try:
             branch_url = f'https://api.github.com/repos/{self.org}/{repo}/branches'
-            headers = {
-                'Authorization': f'Bearer {self.__api_key}',
-            }
-            all_branches = []
-            while True:
-                data = {'page': page, 'per_page': 100, 'protected': 'false'}
-                if protected:
-                    data = {'page': page, 'per_page': 100, 'protected': 'true'}
-                response = requests.request("GET", branch_url, headers=headers, params=data, timeout=EXTERNAL_CALL_TIMEOUT)
-                if response.status_code == 200:
-                    if len(response.json()) > 0:
-                        all_branches.extend(response.json())
-                        page += 1
-                        continue
-                else:
-                    logger.error(f"GithubAPIProcessor.get_branch:: Error occurred while getting all github branches "
-                                 f"in {self.org}/{repo} with status_code: {response.status_code} "
-                                 f"and response: {response.text}")
-                break
-            return all_branches
+            params = {'protected': 'true' if protected else 'false'}
+            response = self._client.get_paginated(branch_url, params=params, per_page=100)
+            if response.status_code != 200:
+                logger.error(f"GithubAPIProcessor.get_branch:: Error occurred while getting all github branches "
+                             f"in {self.org}/{repo} with status_code: {response.status_code} "
+                             f"and response: {response.text}")
+                return []
+            return response.json()
         except Exception as e:
             logger.error(f"GithubAPIProcessor.get_branch:: Exception occurred while getting all github branches "
                          f"in {self.org}/{repo} with error: {e}")
@@ -467,10 +571,7 @@ class GithubAPIProcessor(Processor):
     def get_branch(self, repo, branch_name):
         try:
             branch_url = f'https://api.github.com/repos/{self.org}/{repo}/branches/{branch_name}'
-            headers = {
-                'Authorization': f'Bearer {self.__api_key}',
-            }
-            response = requests.request("GET", branch_url, headers=headers, timeout=EXTERNAL_CALL_TIMEOUT)
+            response = self._client.get(branch_url)
             if response.status_code == 200:
                 return response.json()
             else:
@@ -524,21 +625,17 @@ class GithubAPIProcessor(Processor):
 
     def get_branch_commits(self, repo, branch='main', time_since=None, time_until=None, author=None):
         try:
-            query_params = f'sha={branch}&per_page=100'
+            params = {'sha': branch, 'per_page': 100}
             if time_since:
-                query_params += f'&since={time_since}'
+                params['since'] = time_since
             if time_until:
-                query_params += f'&until={time_until}'
+                params['until'] = time_until
             if author:
-                query_params += f'&author={author}'
-            recent_commits_url = f'https://api.github.com/repos/{self.org}/{repo}/commits?{query_params}'
-            print("url::", recent_commits_url)
-            headers = {
-                'Authorization': f'Bearer {self.__api_key}'
-            }
+                params['author'] = author
+            recent_commits_url = f'https://api.github.com/repos/{self.org}/{repo}/commits'
 
             # Fetch the latest commits for the file
-            response = requests.request("GET", recent_commits_url, headers=headers, timeout=EXTERNAL_CALL_TIMEOUT)
+            response = self._client.get(recent_commits_url, params=params)
             if response:
                 if response.status_code == 200:
                     return response.json()
@@ -554,13 +651,11 @@ class GithubAPIProcessor(Processor):
 
     def get_recent_merges(self, repo, branch='main'):
         try:
-            recent_pulls_url = f'https://api.github.com/repos/{self.org}/{repo}/pulls?base={branch}&per_page=100&sort=updated&direction=desc&state=closed'
-            headers = {
-                'Authorization': f'Bearer {self.__api_key}'
-            }
+            recent_pulls_url = f'https://api.github.com/repos/{self.org}/{repo}/pulls'
+            params = {'base': branch, 'per_page': 100, 'sort': 'updated', 'direction': 'desc', 'state': 'closed'}
 
             # Fetch the latest commits for the file
-            response = requests.request("GET", recent_pulls_url, headers=headers, timeout=EXTERNAL_CALL_TIMEOUT)
+            response = self._client.get(recent_pulls_url, params=params)
             if response:
                 if response.status_code == 200:
                     recent_merges = response.json()
@@ -580,28 +675,15 @@ class GithubAPIProcessor(Processor):
 
     def list_all_members(self):
         try:
-            page = 1
             repo_url = f'https://api.github.com/orgs/{self.org}/members'
-            headers = {
-                'Authorization': f'Bearer {self.__api_key}'
-            }
-            all_members = []
-            while True:
-                data = {'page': page, 'per_page': 100}
-                response = requests.request("GET", repo_url, headers=headers, params=data)
-                if response:
-                    if response.status_code == 200:
-                        if len(response.json()) > 0:
-                            all_members.extend(response.json())
-                            page += 1
-                            continue
-                    else:
-                        logger.error(
-                            f"GithubAPIProcessor.list_all_members:: Error occurred while fetching github members "
-                            f"in {self.org} with status_code: {response.status_code} and response: "
-                            f"{response.text}")
-                break
-            return all_members
+            response = self._client.get_paginated(repo_url, per_page=100)
+            if response.status_code != 200:
+                logger.error(
+                    f"GithubAPIProcessor.list_all_members:: Error occurred while fetching github members "
+                    f"in {self.org} with status_code: {response.status_code} and response: "
+                    f"{response.text}")
+                return []
+            return response.json()
         except Exception as e:
             logger.error(f"GithubAPIProcessor.list_all_members:: Exception occurred while fetching github repos "
                          f"in {self.org} with error: {e}")
@@ -645,33 +727,19 @@ class GithubAPIProcessor(Processor):
             list: List of commit objects with metadata
         """
         try:
-            all_commits = []
-            page = 1
-            headers = {'Authorization': f'Bearer {self.__api_key}'}
-
-            while True:
-                commits_url = f'{self.base_url}/repos/{self.org}/{repo}/commits'
-                params = {'page': page, 'per_page': per_page}
-                if since:
-                    params['since'] = since
-                if until:
-                    params['until'] = until
-
-                response = requests.get(commits_url, headers=headers, params=params, timeout=EXTERNAL_CALL_TIMEOUT)
-                if response.status_code == 200:
-                    commits = response.json()
-                    if not commits:
-                        break
-                    all_commits.extend(commits)
-                    if len(commits) < per_page:
-                        break
-                    page += 1
-                else:
-                    logger.info(f"GithubAPIProcessor.list_recent_commits:: Non-200 response fetching commits for {self.org}/{repo} "
-                                f"with status_code: {response.status_code}")
-                    break
-
-            return all_commits
+            commits_url = f'{self.base_url}/repos/{self.org}/{repo}/commits'
+            params = {}
+            if since:
+                params['since'] = since
+            if until:
+                params['until'] = until
+
+            response = self._client.get_paginated(commits_url, params=params, per_page=per_page)
+            if response.status_code != 200:
+                logger.info(f"GithubAPIProcessor.list_recent_commits:: Non-200 response fetching commits for {self.org}/{repo} "
+                            f"with status_code: {response.status_code}")
+                return []
+            return response.json()
         except Exception as e:
             logger.error(f"GithubAPIProcessor.list_recent_commits:: Exception occurred for {self.org}/{repo}: {e}")
             return []
@@ -691,35 +759,19 @@ class GithubAPIProcessor(Processor):
             list: List of pull request objects with metadata
         """
         try:
-            all_prs = []
-            page = 1
-            headers = {'Authorization': f'Bearer {self.__api_key}'}
-
-            while True:
-                prs_url = f'{self.base_url}/repos/{self.org}/{repo}/pulls'
-                params = {
-                    'state': state,
-                    'sort': sort,
-                    'direction': direction,
-                    'page': page,
-                    'per_page': per_page
-                }
-
-                response = requests.get(prs_url, headers=headers, params=params, timeout=EXTERNAL_CALL_TIMEOUT)
-                if response.status_code == 200:
-                    prs = response.json()
-                    if not prs:
-                        break
-                    all_prs.extend(prs)
-                    if len(prs) < per_page:
-                        break
-                    page += 1
-                else:
-                    logger.info(f"GithubAPIProcessor.list_pull_requests:: Non-200 response fetching PRs for {self.org}/{repo} "
-                                f"with status_code: {response.status_code}")
-                    break
+            prs_url = f'{self.base_url}/repos/{self.org}/{repo}/pulls'
+            params = {
+                'state': state,
+                'sort': sort,
+                'direction': direction
+            }
 
-            return all_prs
+            response = self._client.get_paginated(prs_url, params=params, per_page=per_page)
+            if response.status_code != 200:
+                logger.info(f"GithubAPIProcessor.list_pull_requests:: Non-200 response fetching PRs for {self.org}/{repo} "
+                            f"with status_code: {response.status_code}")
+                return []
+            return response.json()
         except Exception as e:
             logger.error(f"GithubAPIProcessor.list_pull_requests:: Exception occurred for {self.org}/{repo}: {e}")
             return []
@@ -736,10 +788,9 @@ class GithubAPIProcessor(Processor):
             dict: Pull request object with metadata, or None if not found
         """
         try:
-            headers = {'Authorization': f'Bearer {self.__api_key}'}
             pr_url = f'{self.base_url}/repos/{self.org}/{repo}/pulls/{pr_number}'
 
-            response = requests.get(pr_url, headers=headers, timeout=EXTERNAL_CALL_TIMEOUT)
+            response = self._client.get(pr_url)
             if response.status_code == 200:
                 return response.json()
             else:
@@ -762,29 +813,14 @@ class GithubAPIProcessor(Processor):
             list: List of release objects with metadata
         """
         try:
-            all_releases = []
-            page = 1
-            headers = {'Authorization': f'Bearer {self.__api_key}'}
-
-            while True:
-                releases_url = f'{self.base_url}/repos/{self.org}/{repo}/releases'
-                params = {'page': page, 'per_page': per_page}
+            releases_url = f'{self.base_url}/repos/{self.org}/{repo}/releases'
 
-                response = requests.get(releases_url, headers=headers, params=params, timeout=EXTERNAL_CALL_TIMEOUT)
-                if response.status_code == 200:
-                    releases = response.json()
-                    if not releases:
-                        break
-                    all_releases.extend(releases)
-                    if len(releases) < per_page:
-                        break
-                    page += 1
-                else:
-                    logger.info(f"GithubAPIProcessor.list_releases:: Non-200 response fetching releases for {self.org}/{repo} "
-                                f"with status_code: {response.status_code}")
-                    break
-
-            return all_releases
+            response = self._client.get_paginated(releases_url, per_page=per_page)
+            if response.status_code != 200:
+                logger.info(f"GithubAPIProcessor.list_releases:: Non-200 response fetching releases for {self.org}/{repo} "
+                            f"with status_code: {response.status_code}")
+                return []
+            return response.json()
         except Exception as e:
             logger.error(f"GithubAPIProcessor.list_releases:: Exception occurred for {self.org}/{repo}: {e}")
             return []
@@ -801,10 +837,9 @@ class GithubAPIProcessor(Processor):
             dict: Release object with metadata, or None if not found
         """
         try:
-            headers = {'Authorization': f'Bearer {self.__api_key}'}
             release_url = f'{self.base_url}/repos/{self.org}/{repo}/releases/{release_id}'
 
-            response = requests.get(release_url, headers=headers, timeout=EXTERNAL_CALL_TIMEOUT)
+            response = self._client.get(release_url)
             if response.status_code == 200:
                 return response.json()
             else:
@@ -826,10 +861,9 @@ class GithubAPIProcessor(Processor):
             dict: Repository object with metadata, or None if not found
         """
         try:
-            headers = {'Authorization': f'Bearer {self.__api_key}'}
             repo_url = f'{self.base_url}/repos/{self.org}/{repo}'
 
-            response = requests.get(repo_url, headers=headers, timeout=EXTERNAL_CALL_TIMEOUT)
+            response = self._client.get(repo_url)
             if response.status_code == 200:
                 return response.json()
             else:
@@ -853,10 +887,9 @@ class GithubAPIProcessor(Processor):
                   where change is 'added', 'deleted', or 'modified'
         """
         try:
-            headers = {'Authorization': f'Bearer {self.__api_key}'}
             commit_url = f'{self.base_url}/repos/{self.org}/{repo}/commits/{commit_sha}'
 
-            response = requests.get(commit_url, headers=headers, timeout=EXTERNAL_CALL_TIMEOUT)
+            response = self._client.get(commit_url)
             if response.status_code == 200:
                 commit_data = response.json()
                 files = []
@@ -894,10 +927,9 @@ class GithubAPIProcessor(Processor):
             list: List of comment objects with {'timestamp': str, 'author': str, 'markdown': str}
         """
         try:
-            headers = {'Authorization': f'Bearer {self.__api_key}'}
             comments_url = f'{self.base_url}/repos/{self.org}/{repo}/commits/{commit_sha}/comments'
 
-            response = requests.get(comments_url, headers=headers, timeout=EXTERNAL_CALL_TIMEOUT)
+            response = self._client.get(comments_url)
             if response.status_code == 200:
                 raw_comments = response.json()
                 comments = []
@@ -929,38 +961,26 @@ class GithubAPIProcessor(Processor):
                   where change is 'added', 'deleted', or 'modified'
         """
         try:
-            headers = {'Authorization': f'Bearer {self.__api_key}'}
             files_url = f'{self.base_url}/repos/{self.org}/{repo}/pulls/{pr_number}/files'
-            all_files = []
-            page = 1
 
-            while True:
-                params = {'page': page, 'per_page': 100}
-                response = requests.get(files_url, headers=headers, params=params, timeout=EXTERNAL_CALL_TIMEOUT)
-                if response.status_code == 200:
-                    raw_files = response.json()
-                    if not raw_files:
-                        break
-                    for file in raw_files:
-                        status = file.get('status', 'modified')
-                        if status == 'added':
-                            change = 'added'
-                        elif status == 'removed':
-                            change = 'deleted'
-                        else:
-                            change = 'modified'
-                        all_files.append({
-                            'path': file.get('filename', ''),
-                            'change': change
-                        })
-                    if len(raw_files) < 100:
-                        break
-                    page += 1
+            response = self._client.get_paginated(files_url, per_page=100)
+            if response.status_code != 200:
+                logger.info(f"GithubAPIProcessor.get_pr_files:: Non-200 response fetching files for PR #{pr_number} "
+                            f"in {self.org}/{repo} with status_code: {response.status_code}")
+                return []
+            all_files = []
+            for file in response.json():
+                status = file.get('status', 'modified')
+                if status == 'added':
+                    change = 'added'
+                elif status == 'removed':
+                    change = 'deleted'
                 else:
-                    logger.info(f"GithubAPIProcessor.get_pr_files:: Non-200 response fetching files for PR #{pr_number} "
-                                f"in {self.org}/{repo} with status_code: {response.status_code}")
-                    break
-
+                    change = 'modified'
+                all_files.append({
+                    'path': file.get('filename', ''),
+                    'change': change
+                })
             return all_files
         except Exception as e:
             logger.error(f"GithubAPIProcessor.get_pr_files:: Exception occurred for {self.org}/{repo}: {e}")
@@ -978,56 +998,25 @@ class GithubAPIProcessor(Processor):
             list: List of comment objects with {'timestamp': str, 'author': str, 'markdown': str}
         """
         try:
-            headers = {'Authorization': f'Bearer {self.__api_key}'}
             all_comments = []
-
-            # Get issue comments (general PR comments)
-            issue_comments_url = f'{self.base_url}/repos/{self.org}/{repo}/issues/{pr_number}/comments'
-            page = 1
-            while True:
-                params = {'page': page, 'per_page': 100}
-                response = requests.get(issue_comments_url, headers=headers, params=params, timeout=EXTERNAL_CALL_TIMEOUT)
-                if response.status_code == 200:
-                    raw_comments = response.json()
-                    if not raw_comments:
-                        break
-                    for comment in raw_comments:
-                        all_comments.append({
-                            'timestamp': comment.get('created_at', ''),
-                            'author': comment.get('user', {}).get('login', ''),
-                            'markdown': comment.get('body', '')
-                        })
-                    if len(raw_comments) < 100:
-                        break
-                    page += 1
-                else:
-                    logger.info(f"GithubAPIProcessor.get_pr_comments:: Non-200 response fetching issue comments for PR #{pr_number} "
-                                f"in {self.org}/{repo} with status_code: {response.status_code}")
-                    break
-
-            # Get review comments (code-specific comments)
-            review_comments_url = f'{self.base_url}/repos/{self.org}/{repo}/pulls/{pr_number}/comments'
-            page = 1
-            while True:
-                params = {'page': page, 'per_page': 100}
-                response = requests.get(review_comments_url, headers=headers, params=params, timeout=EXTERNAL_CALL_TIMEOUT)
-                if response.status_code == 200:
-                    raw_comments = response.json()
-                    if not raw_comments:
-                        break
-                    for comment in raw_comments:
-                        all_comments.append({
-                            'timestamp': comment.get('created_at', ''),
-                            'author': comment.get('user', {}).get('login', ''),
-                            'markdown': comment.get('body', '')
-                        })
-                    if len(raw_comments) < 100:
-                        break
-                    page += 1
-                else:
-                    logger.info(f"GithubAPIProcessor.get_pr_comments:: Non-200 response fetching review comments for PR #{pr_number} "
-                                f"in {self.org}/{repo} with status_code: {response.status_code}")
-                    break
+            comment_sources = [
+                # Issue comments (general PR comments)
+                ('issue', f'{self.base_url}/repos/{self.org}/{repo}/issues/{pr_number}/comments'),
+                # Review comments (code-specific comments)
+                ('review', f'{self.base_url}/repos/{self.org}/{repo}/pulls/{pr_number}/comments'),
+            ]
+            for comment_type, comments_url in comment_sources:
+                response = self._client.get_paginated(comments_url, per_page=100)
+                if response.status_code != 200:
+                    logger.info(f"GithubAPIProcessor.get_pr_comments:: Non-200 response fetching {comment_type} comments "
+                                f"for PR #{pr_number} in {self.org}/{repo} with status_code: {response.status_code}")
+                    continue
+                for comment in response.json():
+                    all_comments.append({
+                        'timestamp': comment.get('created_at', ''),
+                        'author': comment.get('user', {}).get('login', ''),
+                        'markdown': comment.get('body', '')
+                    })
 
             # Sort by timestamp
             all_comments.sort(key=lambda x: x.get('timestamp', ''))
@@ -9,6 +9,7 @@ from google.oauth2 import service_account
 from googleapiclient.discovery import build
 
 from core.integrations.processor import Processor
+from core.integrations.utils.k8s_cluster_utils import get_k8s_api_instance
 from core.settings import EXTERNAL_CALL_TIMEOUT
 
 logger = logging.getLogger(__name__)
@@ -61,7 +62,8 @@ class GkeApiProcessor(Processor):
             logger.error(f"Exception occurred while fetching grafana data sources with error: {e}")
             raise e
 
-    def get_api_instance(self, zone, cluster_name, client='api'):
+    def get_api_client(self, zone, cluster_name):
+        """Authenticated kubernetes ApiClient for the cluster, shared by all typed API instances of the cluster."""
         try:
             credentials = get_gke_credentials(self.__service_account_json)
             cluster_url = f"https://container.googleapis.com/v1/projects/{self.__project_id}/locations/{zone}/clusters/{cluster_name}"
@@ -85,23 +87,14 @@ class GkeApiProcessor(Processor):
             conf.api_key_prefix['authorization'] = 'Bearer'
             conf.ssl_ca_cert = ca_filename
             conf.verify_ssl = True
-            with kubernetes.client.ApiClient(conf) as api_client:
-                if client == 'api':
-                    api_instance = kubernetes.client.CoreV1Api(api_client)
-                    return api_instance
-                elif client == 'app':
-                    app_instance = kubernetes.client.AppsV1Api(api_client)
-                    return app_instance
-                elif client == 'networking':
-                    networking_instance = kubernetes.client.NetworkingV1Api(api_client)
-                    return networking_instance
-                elif client == 'autoscaling':
-                    autoscaling_instance = kubernetes.client.AutoscalingV1Api(api_client)
-                    return autoscaling_instance
+            return kubernetes.client.ApiClient(conf)
         except Exception as e:
             logger.error(f"Exception occurred while configuring kubernetes client with error: {e}")
             raise e
 
+    def get_api_instance(self, zone, cluster_name, client='api'):
+        return get_k8s_api_instance(self.get_api_client(zone, cluster_name), client)
+
     def list_clusters(self):
         # Load service account credentials from JSON file
         credentials = get_gke_credentials(self.__service_account_json)
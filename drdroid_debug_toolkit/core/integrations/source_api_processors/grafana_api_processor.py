@@ -1,4 +1,5 @@
 import datetime
+import hashlib
 import logging
 import re
 
@@ -76,6 +77,12 @@ class GrafanaApiProcessor(Processor):
             'Content-Type': 'application/json'
         }
 
+    @property
+    def connection_key(self):
+        """Identifies the Grafana host and credentials, e.g. for keying cached query results."""
+        api_key_digest = hashlib.sha256((self.__api_key or '').encode()).hexdigest()[:16]
+        return self.__host, api_key_digest
+
     def test_connection(self):
         try:
             url = '{}/api/datasources'.format(self.__host)
@@ -1033,7 +1040,7 @@ class GrafanaApiProcessor(Processor):
             logger.error(f"Exception occurred while fetching triggered alerts: {e}")
             raise e
 
-    def panel_query_datasource_api(self, tr: TimeRange, queries, interval_ms=300000):
+    def panel_query_datasource_api(self, tr: TimeRange, queries, interval_ms=300000, timeout=None):
         try:
             if not queries or len(queries) == 0:
                 raise ValueError("No queries provided.")
@@ -1052,7 +1059,7 @@ class GrafanaApiProcessor(Processor):
                 "to": str(to_tr)
             }
 
-            response = requests.post(url, headers=self.headers, json=payload)
+            response = requests.post(url, headers=self.headers, json=payload, timeout=timeout)
 
             if response.status_code == 429:
                 logger.info("Grafana query API responded with 429 (rate limited). Headers: %s", response.headers)
@@ -33,7 +33,7 @@ class GrafanaLokiApiProcessor(Processor):
             logger.error(f"Exception occurred while fetching grafana data sources with error: {e}")
             raise e
 
-    def query(self, query, start, end, limit=1000):
+    def query(self, query, start, end, limit=1000, direction=None):
         try:
             url = '{}/loki/api/v1/query_range'.format(f"{self.__protocol}://{self.__host}:{self.__port}")
             params = {
@@ -42,6 +42,8 @@ class GrafanaLokiApiProcessor(Processor):
                 'end': end,
                 'limit': limit
             }
+            if direction:
+                params['direction'] = direction
             response = requests.get(url, headers=self.__headers, verify=self.__ssl_verify, params=params, timeout=EXTERNAL_CALL_TIMEOUT)
             if response and response.status_code == 200:
                 return response.json()
@@ -1,6 +1,7 @@
 import base64
 import json
 import logging
+import re
 import subprocess
 import tempfile
 
@@ -8,9 +9,43 @@ from django.conf import settings
 
 from core.integrations.processor import Processor
 from core.settings import EXTERNAL_CALL_TIMEOUT
+from core.utils.json_stream_utils import iter_json_array_items
 
 logger = logging.getLogger(__name__)
 
+# HTTP status of the Kubernetes API status reasons kubectl reports as "Error from server (<reason>): ..."
+_STATUS_REASON_CODES = {
+    'BadRequest': 400,
+    'Unauthorized': 401,
+    'Forbidden': 403,
+    'NotFound': 404,
+    'MethodNotAllowed': 405,
+    'NotAcceptable': 406,
+    'AlreadyExists': 409,
+    'Conflict': 409,
+    'Gone': 410,
+    'Expired': 410,
+    'RequestEntityTooLarge': 413,
+    'UnsupportedMediaType': 415,
+    'Invalid': 422,
+    'TooManyRequests': 429,
+    'InternalError': 500,
+    'ServiceUnavailable': 503,
+    'Timeout': 504,
+}
+_SERVER_ERROR_PATTERN = re.compile(r"Error from server \((\w+)\)")
+
+
+class KubectlCommandError(Exception):
+    """A kubectl command exited non-zero; status is the apiserver's HTTP status when kubectl reported one."""
+
+    def __init__(self, returncode, stderr):
+        super().__init__(f"kubectl command failed (exit code {returncode}): {stderr}")
+        self.returncode = returncode
+        self.stderr = stderr
+        match = _SERVER_ERROR_PATTERN.search(stderr or '')
+        self.status = _STATUS_REASON_CODES.get(match.group(1)) if match else None
+
 
 class KubectlApiProcessor(Processor):
     client = None
@@ -70,7 +105,25 @@ class KubectlApiProcessor(Processor):
             logger.error(f"Exception occurred while executing kubectl command with error: {e}")
             raise
 
-    def execute_command(self, command):
+    def _build_kubectl_command(self, command):
+        if self.native_connection_mode:
+            return ["kubectl"] + command.split()
+        elif self.__ca_cert:
+            return [
+                       "kubectl",
+                       f"--server={self.__api_server}",
+                       f"--token={self.__token}",
+                       f"--certificate-authority={self.__ca_cert}"
+                   ] + command.split()
+        else:
+            return [
+                       "kubectl",
+                       f"--server={self.__api_server}",
+                       f"--token={self.__token}",
+                       f"--insecure-skip-tls-verify=true"
+                   ] + command.split()
+
+    def execute_command(self, command, quiet=False):
         command = command.strip()
         if 'kubectl' in command:
             command = command.replace('kubectl', '')
@@ -78,22 +131,7 @@ class KubectlApiProcessor(Processor):
             commands = [cmd.strip() for cmd in command.split('|')]
         else:
             commands = [command]
-        if self.native_connection_mode:
-            kubectl_command = ["kubectl"] + commands[0].split()
-        elif self.__ca_cert:
-            kubectl_command = [
-                                  "kubectl",
-                                  f"--server={self.__api_server}",
-                                  f"--token={self.__token}",
-                                  f"--certificate-authority={self.__ca_cert}"
-                              ] + commands[0].split()
-        else:
-            kubectl_command = [
-                                  "kubectl",
-                                  f"--server={self.__api_server}",
-                                  f"--token={self.__token}",
-                                  f"--insecure-skip-tls-verify=true"
-                              ] + commands[0].split()
+        kubectl_command = self._build_kubectl_command(commands[0])
         try:
             process = subprocess.Popen(kubectl_command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
             stdout, stderr = process.communicate()
@@ -103,14 +141,46 @@ class KubectlApiProcessor(Processor):
                                                stderr=subprocess.PIPE, text=True, shell=True)
                     stdout, stderr = process.communicate(input=stdout)
             if process.returncode == 0:
-                print("Command Output:", stdout)
+                if not quiet:
+                    print("Command Output:", stdout)
                 return stdout
             else:
-                raise Exception(f"kubectl command failed (exit code {process.returncode}): {stderr}")
+                raise KubectlCommandError(process.returncode, stderr)
         except Exception as e:
             logger.error(f"Exception occurred while executing kubectl command with error: {e}")
             raise
 
+    def stream_command_json_items(self, command, key='items', top_level=None, chunk_size=64 * 1024):
+        """
+        Runs a kubectl command printing one JSON document (e.g. `get deployments --all-namespaces -o json`) and
+        yields the entries of its `key` array as they are parsed from the stdout pipe, so a large listing is
+        never held in memory as a whole. Other top-level fields are stored into top_level when given. Piped
+        commands are not supported. Raises if kubectl exits non-zero; closing the generator early stops kubectl.
+        """
+        command = command.strip()
+        if 'kubectl' in command:
+            command = command.replace('kubectl', '')
+        if '|' in command:
+            raise ValueError("KubectlApiProcessor.stream_command_json_items:: Piped commands are not supported")
+        with tempfile.TemporaryFile(mode='w+') as stderr_file:
+            process = subprocess.Popen(self._build_kubectl_command(command), stdout=subprocess.PIPE,
+                                       stderr=stderr_file, text=True)
+            try:
+                chunks = iter(lambda: process.stdout.read(chunk_size), '')
+                yield from iter_json_array_items(chunks, key=key, top_level=top_level)
+            except ValueError:
+                # Unparseable (usually empty) output: report the kubectl failure instead when there is one
+                if process.wait() == 0:
+                    raise
+            finally:
+                if process.poll() is None:
+                    process.kill()
+                process.stdout.close()
+                process.wait()
+            if process.returncode != 0:
+                stderr_file.seek(0)
+                raise KubectlCommandError(process.returncode, stderr_file.read().strip())
+
     def execute_non_kubectl_command(self, command_args):
         """
         Execute a non-kubectl command directly using subprocess.
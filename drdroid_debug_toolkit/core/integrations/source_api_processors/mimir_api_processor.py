@@ -2,6 +2,8 @@ import logging
 import requests
 
 from core.integrations.processor import Processor
+from core.integrations.utils.promql_result_cache import get_promql_result_cache, parse_prometheus_duration, \
+    parse_prometheus_time, PromQLResultNotCacheable
 from core.settings import EXTERNAL_CALL_TIMEOUT
 
 logger = logging.getLogger(__name__)
@@ -12,6 +14,7 @@ class MimirApiProcessor(Processor):
 
     def __init__(self, mimir_host, x_scope_org_id='anonymous', ssl_verify='true'):
         self.__host = mimir_host
+        self.__x_scope_org_id = x_scope_org_id
         self.__ssl_verify = False if ssl_verify and ssl_verify.lower() == 'false' else True
         self.headers = {'X-Scope-OrgID': x_scope_org_id}
 
@@ -54,10 +57,48 @@ class MimirApiProcessor(Processor):
             raise e
 
     def fetch_promql_metric_timeseries(self, query, start, end, step):
+        """
+        Range query through the process-wide PromQL result cache: only the part of [start, end] not already
+        cached for (host, org, query, step) is fetched from Mimir.
+        """
+        cache = get_promql_result_cache()
+        start_seconds, end_seconds = parse_prometheus_time(start), parse_prometheus_time(end)
+        step_seconds = parse_prometheus_duration(step)
+        if cache is None or start_seconds is None or end_seconds is None or not step_seconds or \
+                step_seconds != int(step_seconds):
+            return self._query_range(query, start, end, step)
+
+        def fetch(range_start, range_end):
+            response = self._query_range(query, range_start, range_end, int(step_seconds))
+            if not response or response.get('status') != 'success':
+                return None
+            data = response.get('data', {})
+            if data.get('resultType') != 'matrix':
+                raise PromQLResultNotCacheable(f"resultType {data.get('resultType')}")
+            return {tuple(sorted(item.get('metric', {}).items())): (item.get('metric', {}), item.get('values', []))
+                    for item in data.get('result', [])}
+
+        key = cache.make_key((self.__host, self.__x_scope_org_id), None, query, int(step_seconds))
         try:
-            url = '{}/prometheus/api/v1/query_range?query={}&start={}&end={}&step={}'.format(
-                self.__host, query, start, end, step)
-            response = requests.get(url, headers=self.headers, verify=self.__ssl_verify, timeout=EXTERNAL_CALL_TIMEOUT)
+            series = cache.query_range(key, start_seconds, end_seconds, step_seconds, fetch)
+        except PromQLResultNotCacheable:
+            return self._query_range(query, start, end, step)
+        if series is None:
+            return None
+        return {
+            'status': 'success',
+            'data': {
+                'resultType': 'matrix',
+                'result': [{'metric': meta, 'values': [[t, v] for t, v in points]} for meta, points in series.values()]
+            }
+        }
+
+    def _query_range(self, query, start, end, step):
+        try:
+            url = '{}/prometheus/api/v1/query_range'.format(self.__host)
+            params = {'query': query, 'start': start, 'end': end, 'step': step}
+            response = requests.get(url, headers=self.headers, params=params, verify=self.__ssl_verify,
+                                    timeout=EXTERNAL_CALL_TIMEOUT)
             if response and response.status_code == 200:
                 return response.json()
         except Exception as e:
@@ -1,9 +1,13 @@
+import json
 import logging
+from typing import Any, Dict, Iterator, Optional
+
 import requests
 from requests.auth import HTTPBasicAuth
 
 from core.integrations.processor import Processor
 from core.settings import EXTERNAL_CALL_TIMEOUT
+from core.utils.http_utils import get_shared_session
 
 logger = logging.getLogger(__name__)
 
@@ -17,12 +21,19 @@ class OpenSearchApiProcessor(Processor):
         self.auth = HTTPBasicAuth(username, password)
         self.verify_certs = verify_certs
 
-    def _make_request(self, method, endpoint, data=None, params=None):
+    def _send(self, method, endpoint, data=None, params=None, body=None, headers=None):
+        # Requests go through the process-wide session of this cluster, so keep-alive connections are reused
+        # across tasks instead of paying a TCP/TLS handshake per call
         url = f"{self.base_url}/{endpoint}"
+        session = get_shared_session(url, ssl_verify=self.verify_certs)
+        response = session.request(method, url, auth=self.auth, verify=self.verify_certs, json=data, data=body,
+                                   params=params, headers=headers, timeout=EXTERNAL_CALL_TIMEOUT)
+        response.raise_for_status()
+        return response
+
+    def _make_request(self, method, endpoint, data=None, params=None):
         try:
-            response = requests.request(method, url, auth=self.auth, verify=self.verify_certs, json=data, params=params, timeout=EXTERNAL_CALL_TIMEOUT)
-            response.raise_for_status()
-            return response.json()
+            return self._send(method, endpoint, data=data, params=params).json()
         except requests.RequestException as e:
             logger.error(f"OpenSearchApiProcessor._make_request:: Error making request to OpenSearch: {e}")
             raise
@@ -51,6 +62,108 @@ class OpenSearchApiProcessor(Processor):
                          f"index: {index} for host: {self.base_url} with error: {e}")
             raise e
 
+    def msearch(self, searches):
+        """
+        Runs several searches in one _msearch round trip. searches is a list of (index, query) pairs; returns the
+        list of per-search responses in the same order (a failed search has an "error" key instead of "hits").
+        """
+        try:
+            lines = []
+            for index, query in searches:
+                lines.append(json.dumps({"index": index}))
+                lines.append(json.dumps(query))
+            response = self._send("POST", "_msearch", body="\n".join(lines) + "\n",
+                                  headers={"Content-Type": "application/x-ndjson"})
+            return response.json().get("responses", [])
+        except Exception as e:
+            logger.error(f"OpenSearchApiProcessor.msearch:: Exception occurred while executing {len(searches)} "
+                         f"searches for host: {self.base_url} with error: {e}")
+            raise e
+
+    def _create_point_in_time(self, index, keep_alive):
+        try:
+            return self._send("POST", f"{index}/_search/point_in_time", params={"keep_alive": keep_alive}).json()["pit_id"]
+        except (requests.RequestException, ValueError, KeyError) as e:
+            # Point in time needs OpenSearch 2.4+; older clusters page with search_after on the index instead
+            logger.info(f"OpenSearchApiProcessor._create_point_in_time:: Point in time not available on index: "
+                        f"{index} for host: {self.base_url}, paging without it: {e}")
+            return None
+
+    def _delete_point_in_time(self, pit_id):
+        try:
+            self._send("DELETE", "_search/point_in_time", data={"pit_id": [pit_id]})
+        except requests.RequestException as e:
+            logger.warning(f"OpenSearchApiProcessor._delete_point_in_time:: Failed to delete point in time for host: "
+                           f"{self.base_url}: {e}")
+
+    @staticmethod
+    def _with_tiebreaker(sort, tiebreaker):
+        """sort with a unique tiebreaker appended, so search_after never skips hits that share sort values."""
+        sort = list(sort) if isinstance(sort, list) else ([sort] if sort else [])
+        if not any(tiebreaker in (clause if isinstance(clause, dict) else {clause: None}) for clause in sort):
+            sort.append({tiebreaker: "asc"})
+        return sort
+
+    def iter_search_hits(self, index, query, *, limit: int, offset: int = 0, page_size: int = 1000,
+                         max_bytes: Optional[int] = None, keep_alive: str = "1m",
+                         stats: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yields up to limit hits of query (which must have a sort) page by page, starting offset hits in.
+
+        A limit within one page is a single plain from/size search, as before. Larger limits open a point in
+        time of the index before the first page, so every page comes from the same consistent view, and follow
+        search_after from there; the sort gets a unique tiebreaker (_shard_doc under the point in time, else _id)
+        so hits sharing sort values at a page boundary are not skipped. Paging stops after max_bytes of response
+        bodies. When a dict is passed as stats it receives total (hits.total of the query), hits, bytes, pages and
+        truncated (whether max_bytes cut the result short).
+        """
+        if stats is None:
+            stats = {}
+        stats.update(total=0, hits=0, bytes=0, pages=0, truncated=False)
+        pit_id = None
+        search_after = None
+        try:
+            if limit > page_size:
+                pit_id = self._create_point_in_time(index, keep_alive)
+                query = {**query, "sort": self._with_tiebreaker(query.get("sort"), "_shard_doc" if pit_id else "_id")}
+            while stats["hits"] < limit:
+                size = min(page_size, limit - stats["hits"])
+                page_query = {**query, "size": size}
+                if search_after is None:
+                    page_query["from"] = offset
+                else:
+                    page_query.pop("from", None)
+                    page_query["search_after"] = search_after
+                if pit_id:
+                    page_query["pit"] = {"id": pit_id, "keep_alive": keep_alive}
+                    endpoint = "_search"
+                else:
+                    endpoint = f"{index}/_search"
+                response = self._send("POST", endpoint, data=page_query)
+                stats["pages"] += 1
+                stats["bytes"] += len(response.content)
+                hits_section = response.json().get("hits", {})
+                if stats["pages"] == 1:
+                    total = hits_section.get("total", 0)
+                    stats["total"] = total.get("value", 0) if isinstance(total, dict) else total
+                hits = hits_section.get("hits", [])
+                for hit in hits:
+                    stats["hits"] += 1
+                    yield hit
+                if len(hits) < size or stats["hits"] >= limit or not hits[-1].get("sort"):
+                    return
+                if max_bytes is not None and stats["bytes"] >= max_bytes:
+                    stats["truncated"] = True
+                    return
+                search_after = hits[-1]["sort"]
+        except requests.RequestException as e:
+            logger.error(f"OpenSearchApiProcessor.iter_search_hits:: Exception occurred while executing query: "
+                         f"{query} on index: {index} for host: {self.base_url} with error: {e}")
+            raise e
+        finally:
+            if pit_id:
+                self._delete_point_in_time(pit_id)
+
     def get_document(self, index, doc_id):
         try:
             result = self._make_request("GET", f"{index}/_doc/{doc_id}", params={"preference": "_primary_first"})
@@ -1,10 +1,12 @@
 import json
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Iterator, Optional, List
 
 import requests
 
+from core.integrations.processor import Processor
 
-class VictoriaLogsApiProcessor:
+
+class VictoriaLogsApiProcessor(Processor):
 
     def __init__(self, **kwargs):
         # VictoriaLogs-specific connector keys
@@ -47,25 +49,41 @@ class VictoriaLogsApiProcessor:
             # Some endpoints return plain text; wrap it
             return {'text': resp.text}
 
-    def _http_post_form(self, path: str, data: Dict[str, Any]) -> requests.Response:
+    def _http_post_form(self, path: str, data: Dict[str, Any], stream: bool = False) -> requests.Response:
         """
         Send application/x-www-form-urlencoded POST and return raw response.
+        With stream=True the body is left unread; the caller must close the response.
         """
         url = f"{self._base_url}{path}"
         headers = {**self._headers}  # requests sets proper form content-type for dict data
 
-        resp = requests.post(url, data=data, headers=headers, timeout=60, verify=self._ssl_verify)
+        resp = requests.post(url, data=data, headers=headers, timeout=60, verify=self._ssl_verify, stream=stream)
 
-        resp.raise_for_status()
+        try:
+            resp.raise_for_status()
+        except Exception:
+            resp.close()
+            raise
         return resp
 
-    def query_logsql(self, query: str, *, limit: Optional[int] = None, start: Optional[str] = None,
-                     end: Optional[str] = None, timeout: Optional[str] = None) -> Dict[str, Any]:
+    @staticmethod
+    def _parse_json_line(line: bytes) -> Dict[str, Any]:
+        try:
+            obj = json.loads(line)
+        except Exception:
+            # Non-JSON line; include as text for visibility
+            return {"text": line.decode('utf-8', errors='replace')}
+        return obj if isinstance(obj, dict) else {"value": obj}
+
+    def iter_logsql(self, query: str, *, limit: Optional[int] = None, start: Optional[str] = None,
+                    end: Optional[str] = None, timeout: Optional[str] = None, max_rows: Optional[int] = None,
+                    max_bytes: Optional[int] = None, stats: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
         """
-        Execute a LogsQL query via /select/logsql/query, returning a normalized dict:
-        {"data": [ {field: value, ...}, ... ]}
+        Execute a LogsQL query via /select/logsql/query and yield one dict per JSON line as it arrives.
 
-        The endpoint streams JSON Lines; we parse all lines into a list.
+        Reading stops, and the connection is closed without draining the rest of the stream, after max_rows
+        rows or max_bytes bytes of lines. When a dict is passed as stats it receives rows, bytes and
+        truncated (whether a budget cut the stream short).
         """
         payload: Dict[str, Any] = {"query": query}
         if limit is not None:
@@ -77,21 +95,35 @@ class VictoriaLogsApiProcessor:
         if timeout is not None:
             payload["timeout"] = timeout
 
-        resp = self._http_post_form('/select/logsql/query', payload)
-        lines = resp.text.splitlines()
-        items: List[Dict[str, Any]] = []
-        for line in lines:
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-                if isinstance(obj, dict):
-                    items.append(obj)
-                else:
-                    items.append({"value": obj})
-            except Exception:
-                # Non-JSON line; include as text for visibility
-                items.append({"text": line})
+        if stats is None:
+            stats = {}
+        stats.update(rows=0, bytes=0, truncated=False)
+        resp = self._http_post_form('/select/logsql/query', payload, stream=True)
+        try:
+            for line in resp.iter_lines(chunk_size=64 * 1024):
+                if not line:
+                    continue
+                if (max_rows is not None and stats["rows"] >= max_rows) or \
+                        (max_bytes is not None and stats["bytes"] + len(line) > max_bytes):
+                    stats["truncated"] = True
+                    return
+                stats["rows"] += 1
+                stats["bytes"] += len(line) + 1
+                yield self._parse_json_line(line)
+        finally:
+            resp.close()
+
+    def query_logsql(self, query: str, *, limit: Optional[int] = None, start: Optional[str] = None,
+                     end: Optional[str] = None, timeout: Optional[str] = None, max_rows: Optional[int] = None,
+                     max_bytes: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Execute a LogsQL query via /select/logsql/query, returning a normalized dict:
+        {"data": [ {field: value, ...}, ... ]}
+
+        The endpoint streams JSON Lines; lines are parsed as they arrive (see iter_logsql for the budgets).
+        """
+        items: List[Dict[str, Any]] = list(self.iter_logsql(query, limit=limit, start=start, end=end, timeout=timeout,
+                                                             max_rows=max_rows, max_bytes=max_bytes))
         return {"data": items}
 
     def fetch_field_values(self, field_name: str, time_filter: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
@@ -2,7 +2,9 @@ import logging
 
 from google.protobuf.struct_pb2 import Struct
 
-from core.integrations.utils.executor_utils import apply_result_transformer, resolve_global_variables
+from core.integrations.utils.executor_utils import apply_result_transformer, resolve_global_variables_in_proto
+from core.integrations.utils.log_table_utils import expand_log_task_result
+from core.integrations.utils.timeseries_downsampling import downsample_timeseries_result
 from core.utils.credentilal_utils import credential_yaml_to_connector_proto
 from core.utils.static_mappings import integrations_connector_type_connector_keys_map
 from core.integrations.processor import Processor
@@ -12,6 +14,7 @@ from core.protos.connectors.connector_pb2 import Connector as ConnectorProto, Co
 from core.protos.playbooks.playbook_commons_pb2 import PlaybookTaskResult, PlaybookTaskResultType, \
     PlaybookExecutionStatusType
 from core.protos.playbooks.playbook_pb2 import PlaybookTask
+from core.utils.instrumentation_utils import get_instrumentation, record_task_result
 from core.utils.proto_utils import proto_to_dict, dict_to_proto
 from core.integrations.utils.executor_utils import check_multiple_task_results
 from typing import Dict
@@ -71,6 +74,10 @@ class _DefaultSourceManager:
     source: Source = Source.UNKNOWN
     task_proto = None
     task_type_callable_map = {}
+    # Default point budgets for timeseries results (None = full resolution); a task's execution configuration
+    # overrides them
+    timeseries_max_points_per_series = None
+    timeseries_max_points = None
 
     @staticmethod
     def validate_connector(connector: ConnectorProto) -> bool:
@@ -98,6 +105,20 @@ class _DefaultSourceManager:
                 result_transformer_lambda_function_variable_set_proto)
         return task_result
 
+    def apply_timeseries_point_budget(self, task: PlaybookTask, task_result: PlaybookTaskResult):
+        execution_configuration = task.execution_configuration
+        max_points_per_series = execution_configuration.timeseries_max_points_per_series.value \
+            if execution_configuration.HasField('timeseries_max_points_per_series') \
+            else self.timeseries_max_points_per_series
+        max_points = execution_configuration.timeseries_max_points.value \
+            if execution_configuration.HasField('timeseries_max_points') else self.timeseries_max_points
+        if task_result.type != PlaybookTaskResultType.TIMESERIES or not (max_points_per_series or max_points):
+            return task_result
+        downsampling = downsample_timeseries_result(task_result.timeseries, max_points_per_series, max_points)
+        if downsampling:
+            task_result.metadata.update({'downsampling': downsampling})
+        return task_result
+
     def get_connector_processor(self, connector: ConnectorProto, **kwargs):
         return NoOpProcessor()
 
@@ -125,83 +146,113 @@ class _DefaultSourceManager:
         return connector_proto
 
     def get_resolved_task(self, global_variable_set: Struct, input_task: PlaybookTask):
+        """
+        Resolves global variables in the task definition directly on the proto messages.
+        The input task is copied only when resolution changes it; otherwise the returned protos alias
+        input_task and must be treated as read-only.
+        """
         source = input_task.source
         if not source or source == Source.UNKNOWN or source != self.source:
             raise Exception("PlaybookSourceManager.resolve_source_task_proto:: Applicable Source not found for task")
         source_str = Source.Name(source).lower()
 
-        task_dict = proto_to_dict(input_task)
-        source_task_dict = task_dict.get(source_str, {})
-        if not source_task_dict:
+        if source_str not in input_task.DESCRIPTOR.fields_by_name or not getattr(input_task, source_str).ListFields():
             raise Exception(f"PlaybookSourceManager.get_source_task:: No task definition found for: {source_str}")
+        source_task_proto = getattr(input_task, source_str)
 
-        source_task_proto = dict_to_proto(source_task_dict, self.task_proto)
         task_type = source_task_proto.type
         if task_type not in self.task_type_callable_map:
             raise Exception(f"PlaybookSourceManager.get_source_task:: Task type {task_type} not supported for "
                             f"source: {source_str}")
 
         task_type_name = self.task_proto.TaskType.Name(task_type).lower()
-        source_task_type_dict = source_task_dict.get(task_type_name, {})
+        has_task_type_field = task_type_name in source_task_proto.DESCRIPTOR.fields_by_name
+        source_task_type_proto = getattr(source_task_proto, task_type_name) if has_task_type_field else None
         if 'form_fields' not in self.task_type_callable_map[task_type]:
             raise Exception(f"PlaybookSourceManager.get_source_task:: Form fields not found for task type: "
                             f"{task_type_name} in {source_str} source manager")
 
-        if not source_task_type_dict and self.task_type_callable_map[task_type]['form_fields']:
+        if (source_task_type_proto is None or not source_task_type_proto.ListFields()) and \
+                self.task_type_callable_map[task_type]['form_fields']:
             raise Exception(f"PlaybookSourceManager.get_source_task:: No definition for task type: {task_type_name} "
                             f"found in task")
 
-        # Resolve global variables in source_type_task_def
-        form_fields = self.task_type_callable_map[task_type]['form_fields']
-        resolved_source_task_type_dict, task_local_variable_map = resolve_global_variables(form_fields,
-                                                                                           global_variable_set,
-                                                                                           source_task_type_dict)
-
-        # Add timeseries offsets to resolved_source_type_task_def if present in timeseries task
         if 'result_type' not in self.task_type_callable_map[task_type]:
             raise Exception(f"PlaybookSourceManager.get_source_task:: Result type not found for task type: "
                             f"{task_type_name} in {source_str} source manager")
+
+        if source_task_type_proto is None:
+            return input_task, source_task_proto, {}
+
+        # Resolve global variables on a copy of the task type definition only
+        form_fields = self.task_type_callable_map[task_type]['form_fields']
+        resolved_source_task_type_proto = type(source_task_type_proto)()
+        resolved_source_task_type_proto.CopyFrom(source_task_type_proto)
+        is_changed, task_local_variable_map = resolve_global_variables_in_proto(form_fields, global_variable_set,
+                                                                                resolved_source_task_type_proto)
+
+        # Add timeseries offsets to resolved source task type definition if present in timeseries task
         if self.task_type_callable_map[task_type]['result_type'] == PlaybookTaskResultType.TIMESERIES and \
-                input_task.execution_configuration and input_task.execution_configuration.timeseries_offsets:
-            resolved_source_task_type_dict['timeseries_offsets'] = list(
+                input_task.execution_configuration.timeseries_offsets and \
+                'timeseries_offsets' in resolved_source_task_type_proto.DESCRIPTOR.fields_by_name:
+            del resolved_source_task_type_proto.timeseries_offsets[:]
+            resolved_source_task_type_proto.timeseries_offsets.extend(
                 input_task.execution_configuration.timeseries_offsets)
+            is_changed = True
 
-        source_task_dict[task_type_name] = resolved_source_task_type_dict
-        resolved_source_task_proto = dict_to_proto(source_task_dict, self.task_proto)
+        if not is_changed:
+            return input_task, source_task_proto, task_local_variable_map
 
-        task_dict[source_str] = source_task_dict
-        resolved_task: PlaybookTask = dict_to_proto(task_dict, PlaybookTask)
+        resolved_task = PlaybookTask()
+        resolved_task.CopyFrom(input_task)
+        resolved_source_task_proto = getattr(resolved_task, source_str)
+        getattr(resolved_source_task_proto, task_type_name).CopyFrom(resolved_source_task_type_proto)
 
         return resolved_task, resolved_source_task_proto, task_local_variable_map
 
     def execute_task(self, time_range: TimeRange, global_variable_set, task: PlaybookTask):
+        instrumentation = get_instrumentation()
         try:
-            source_connector_proto = None
-            if task.task_connector_sources and len(task.task_connector_sources) > 0:
-                # TODO: Handle multiple connectors within task in future
-                task_connector_source = task.task_connector_sources[0]
-                if not task_connector_source.name or not task_connector_source.name.value:
-                    raise Exception("Connector name not found in task")
-                connector_name = task_connector_source.name.value
-                connector_id = task_connector_source.id.value
-                active_connector = self.get_active_connectors(connector_name, connector_id)
-                source_connector_proto = active_connector
-            resolved_task, resolved_source_task, task_local_variable_map = self.get_resolved_task(global_variable_set,
-                                                                                                  task)
-            try:
-                # Execute task
+            source_str = Source.Name(task.source).lower() if instrumentation.enabled else None
+            with instrumentation.span('task.execute', source=source_str) as task_span:
+                source_connector_proto = None
+                if task.task_connector_sources and len(task.task_connector_sources) > 0:
+                    # TODO: Handle multiple connectors within task in future
+                    task_connector_source = task.task_connector_sources[0]
+                    if not task_connector_source.name or not task_connector_source.name.value:
+                        raise Exception("Connector name not found in task")
+                    connector_name = task_connector_source.name.value
+                    connector_id = task_connector_source.id.value
+                    with instrumentation.span('task.connector_lookup', source=source_str):
+                        active_connector = self.get_active_connectors(connector_name, connector_id)
+                    source_connector_proto = active_connector
+                with instrumentation.span('task.get_resolved_task', source=source_str):
+                    resolved_task, resolved_source_task, task_local_variable_map = self.get_resolved_task(
+                        global_variable_set, task)
                 task_type = resolved_source_task.type
-                playbook_task_result = self.task_type_callable_map[task_type]['executor'](
-                    time_range, resolved_source_task, source_connector_proto)
-                if check_multiple_task_results(playbook_task_result):
-                    task_results = []
-                    for result in playbook_task_result:
-                        task_results.append(self.postprocess_task_result(result, resolved_task, task_local_variable_map))
-                    return task_results
-                return self.postprocess_task_result(playbook_task_result, resolved_task, task_local_variable_map)
-            except Exception as e:
-                source_str = Source.Name(resolved_task.source).lower()
-                raise Exception(f"Error while executing task for source: {source_str} with error: {e}")
+                task_type_name = self.task_proto.TaskType.Name(task_type).lower() if instrumentation.enabled else None
+                task_span.set_attribute('task_type', task_type_name)
+                try:
+                    # Execute task
+                    with instrumentation.span('task.executor', source=source_str, task_type=task_type_name) as span:
+                        playbook_task_result = self.task_type_callable_map[task_type]['executor'](
+                            time_range, resolved_source_task, source_connector_proto)
+                        if instrumentation.enabled:
+                            for result in (playbook_task_result if check_multiple_task_results(playbook_task_result)
+                                           else [playbook_task_result]):
+                                record_task_result(span, result)
+                    with instrumentation.span('task.postprocess', source=source_str, task_type=task_type_name):
+                        if check_multiple_task_results(playbook_task_result):
+                            task_results = []
+                            for result in playbook_task_result:
+                                task_results.append(
+                                    self.postprocess_task_result(result, resolved_task, task_local_variable_map))
+                            return task_results
+                        return self.postprocess_task_result(playbook_task_result, resolved_task,
+                                                            task_local_variable_map)
+                except Exception as e:
+                    source_str = Source.Name(resolved_task.source).lower()
+                    raise Exception(f"Error while executing task for source: {source_str} with error: {e}")
         except Exception as e:
             raise Exception(f"Error while executing task: {e}")
 
@@ -211,8 +262,15 @@ class _DefaultSourceManager:
         playbook_task_result.task_local_variable_set.CopyFrom(task_local_variable_map_proto)
         playbook_task_result.status = PlaybookExecutionStatusType.FINISHED
 
+        # Downsample timeseries over the configured point budget
+        playbook_task_result = self.apply_timeseries_point_budget(resolved_task, playbook_task_result)
+
         # Apply result transformer
-        playbook_task_result = self.apply_task_result_transformer(resolved_task, playbook_task_result)
+        if resolved_task.execution_configuration.is_result_transformer_enabled.value:
+            # Transformers expect flat log rows
+            playbook_task_result = expand_log_task_result(playbook_task_result)
+            with get_instrumentation().span('task.result_transformer', source=Source.Name(resolved_task.source).lower()):
+                playbook_task_result = self.apply_task_result_transformer(resolved_task, playbook_task_result)
         return playbook_task_result
 
     def get_required_connector_key_types(self, **kwargs):
@@ -12,7 +12,9 @@ from core.protos.playbooks.playbook_commons_pb2 import PlaybookTaskResult, ApiRe
 from core.protos.playbooks.source_task_definitions.api_task_pb2 import Api
 from core.protos.ui_definition_pb2 import FormField, FormFieldType
 from core.utils.credentilal_utils import DISPLAY_NAME, CATEGORY, WEB
-from core.utils.http_utils import make_secure_session
+from core.utils.http_utils import get_shared_session
+from core.utils.json_path_utils import parse_json_path, project_json
+from core.utils.json_stream_utils import salvage_json_array_items
 from core.utils.proto_utils import proto_to_dict
 
 method_proto_string_mapping = {
@@ -25,6 +27,9 @@ method_proto_string_mapping = {
 
 
 class ApiSourceManager(SourceManager):
+    # Response bodies are read up to this many bytes unless the task sets max_response_bytes
+    max_response_bytes = 10 * 1024 * 1024
+    response_chunk_size = 64 * 1024
 
     def __init__(self):
         self.source = Source.API
@@ -77,6 +82,19 @@ class ApiSourceManager(SourceManager):
                               data_type=LiteralType.BOOLEAN,
                               default_value=Literal(type=LiteralType.BOOLEAN, boolean=BoolValue(value=True)),
                               form_field_type=FormFieldType.CHECKBOX_FT),
+                    FormField(key_name=StringValue(value="max_response_bytes"),
+                              display_name=StringValue(value="Max Response Size (in bytes)"),
+                              description=StringValue(value='Response bodies beyond this size are truncated'),
+                              data_type=LiteralType.LONG,
+                              is_optional=True,
+                              form_field_type=FormFieldType.TEXT_FT),
+                    FormField(key_name=StringValue(value="response_fields"),
+                              display_name=StringValue(value="Response Fields (JSONPath)"),
+                              description=StringValue(value='Comma separated JSONPaths to keep from a JSON response, '
+                                                            'e.g. $.items[*].name'),
+                              data_type=LiteralType.STRING,
+                              is_optional=True,
+                              form_field_type=FormFieldType.TEXT_FT),
                 ]
             },
         }
@@ -135,29 +153,56 @@ class ApiSourceManager(SourceManager):
             else:
                 raise Exception(f"Unsupported api method: {request_method}")
 
+            max_response_bytes = http_request.max_response_bytes.value \
+                if http_request.HasField('max_response_bytes') else self.max_response_bytes
+            response_fields = [field.strip() for field in http_request.response_fields.value.split(',')
+                               if field.strip()]
+            for field in response_fields:
+                parse_json_path(field)
+
             try:
-                # Use a session with TLS 1.2 minimum and an SSLContext whose
-                # verification posture matches `ssl_verify`. Session is local
-                # to this call (no reuse benefit for one-shot requests); the
-                # cost is negligible relative to the network round-trip.
-                session = make_secure_session(ssl_verify=ssl_verify)
-                response = session.request(**request_arguments)
+                # Sessions (and their keep-alive connections) are shared per host and ssl_verify; the body is
+                # streamed so it can be cut off at max_response_bytes without reading the rest
+                session = get_shared_session(url, ssl_verify=ssl_verify)
+                response = session.request(stream=True, **request_arguments)
+                try:
+                    body, truncated = self._read_response_body(response, max_response_bytes)
+                finally:
+                    response.close()
                 response_headers = response.headers
                 response_headers_struct = Struct()
                 response_headers_struct.update(response_headers)
 
                 content_type = response.headers.get('Content-Type', '')
+                metadata = {}
                 if 'application/json' in content_type:
-                    try:
-                        response_data = response.json()
-                        print("Response JSON:", response_data)
-                    except json.JSONDecodeError:
-                        print("Error: Response content is not valid JSON")
-                        raise Exception("Error: Response content is not valid JSON")
+                    if not truncated:
+                        try:
+                            response_data = json.loads(body)
+                        except json.JSONDecodeError:
+                            print("Error: Response content is not valid JSON")
+                            raise Exception("Error: Response content is not valid JSON")
+                    else:
+                        response_data = salvage_json_array_items(body.decode('utf-8', errors='ignore'))
+                        if response_data is not None:
+                            metadata['salvaged_items'] = len(response_data)
+                    if response_data is None:
+                        # A truncated JSON object cannot be parsed, so return the raw prefix instead
+                        response_data = {'truncated_response_text': body.decode('utf-8', errors='ignore')}
+                    elif response_fields:
+                        response_data = project_json(response_data, response_fields)
+                        metadata['response_fields'] = response_fields
                 elif 'text' in content_type:
-                    response_data = {'response_text': response.text}
+                    response_data = {'response_text': self._decode_text(response, body)}
                 else:
-                    response_data = {'raw_response': response.text}
+                    response_data = {'raw_response': self._decode_text(response, body)}
+
+                if truncated:
+                    metadata.update({'truncated': True, 'max_response_bytes': max_response_bytes})
+                    content_length = response.headers.get('Content-Length')
+                    if content_length and content_length.isdigit():
+                        metadata['content_length'] = int(content_length)
+                metadata['response_bytes'] = len(body)
 
                 response_struct = Struct()
                 if isinstance(response_data, list):
@@ -173,12 +218,32 @@ class ApiSourceManager(SourceManager):
                     response_headers=response_headers_struct,
                     response_body=response_struct
                 )
-                return PlaybookTaskResult(
+                task_result = PlaybookTaskResult(
                     source=self.source,
                     type=PlaybookTaskResultType.API_RESPONSE,
                     api_response=api_response,
                 )
+                if truncated or response_fields:
+                    task_result.metadata.update(metadata)
+                return task_result
             except Exception as e:
                 raise Exception(f"Error while executing API call task: {e}")
         except Exception as e:
             raise Exception(f"Error while executing API call task: {e}")
+
+    def _read_response_body(self, response, max_response_bytes):
+        """Reads a streamed response body up to max_response_bytes; returns (body, truncated)."""
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=self.response_chunk_size):
+            if max_response_bytes and size + len(chunk) > max_response_bytes:
+                chunks.append(chunk[:max_response_bytes - size])
+                return b''.join(chunks), True
+            chunks.append(chunk)
+            size += len(chunk)
+        return b''.join(chunks), False
+
+    @staticmethod
+    def _decode_text(response, body):
+        encoding = response.encoding or response.apparent_encoding or 'utf-8'
+        return body.decode(encoding, errors='replace')
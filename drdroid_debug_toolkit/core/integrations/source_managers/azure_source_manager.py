@@ -9,7 +9,8 @@ from core.integrations.source_manager import SourceManager
 from core.protos.base_pb2 import TimeRange, Source, SourceModelType, SourceKeyType
 from core.protos.connectors.connector_pb2 import Connector as ConnectorProto
 from core.protos.literal_pb2 import LiteralType, Literal
-from core.protos.playbooks.playbook_commons_pb2 import PlaybookTaskResult, PlaybookTaskResultType, TableResult, TimeseriesResult, TextResult
+from core.protos.playbooks.playbook_commons_pb2 import PlaybookTaskResult, PlaybookTaskResultType, TableResult, TimeseriesResult, TextResult, \
+    LabelValuePair
 from core.protos.playbooks.source_task_definitions.azure_task_pb2 import Azure
 from core.protos.ui_definition_pb2 import FormField, FormFieldType
 from core.utils.credentilal_utils import generate_credentials_dict, get_connector_key_type_string, DISPLAY_NAME, CATEGORY, CLOUD_MANAGED_SERVICES
@@ -56,7 +57,7 @@ class AzureSourceManager(SourceManager):
                 'form_fields': [
                     FormField(key_name=StringValue(value="resource_id"),
                               display_name=StringValue(value="Azure Resource"),
-                              description=StringValue(value='Select Azure Resource'),
+                              description=StringValue(value='Select Azure Resource (comma separated IDs fetch several in batches)'),
                               data_type=LiteralType.STRING,
                               form_field_type=FormFieldType.TYPING_DROPDOWN_FT),
                     FormField(key_name=StringValue(value="metric_names"),
@@ -189,6 +190,33 @@ class AzureSourceManager(SourceManager):
         except Exception as e:
             raise Exception(f"Error while executing Azure task: {e}")
 
+    @staticmethod
+    def _to_datapoints(data_points):
+        metric_datapoints = []
+        for data in data_points:
+            if not isinstance(data, dict):
+                logger.error(f"Unexpected metric data format: {data}")
+                continue
+            # Convert timestamp to Unix Epoch (milliseconds)
+            timestamp_iso = str(data.get("timestamp", ""))
+            if timestamp_iso:
+                timestamp_ms = int(
+                    datetime.fromisoformat(timestamp_iso).replace(tzinfo=pytz.UTC).timestamp() * 1000)
+            else:
+                timestamp_ms = 0  # Handle missing timestamp case
+
+            metric_value = data.get("value")
+            if metric_value is None:
+                metric_value = 0.0  # Defaulting to 0.0 if missing
+            # Create TimeSeries Datapoint object
+            metric_datapoints.append(
+                TimeseriesResult.LabeledMetricTimeseries.Datapoint(
+                    timestamp=timestamp_ms,
+                    value=DoubleValue(value=metric_value)
+                )
+            )
+        return metric_datapoints
+
     def fetch_metrics(self, time_range: TimeRange, azure_task: Azure,
                       azure_connector: ConnectorProto):
         try:
@@ -212,48 +240,43 @@ class AzureSourceManager(SourceManager):
             }
             granularity = map_of_granularity_to_seconds[granularity_string]
 
+            # Several resources (comma or newline separated IDs) are fetched through the metrics batch endpoint
+            resource_ids = [r.strip() for r in resource_id.replace('\n', ',').split(',') if r.strip()]
+
             logger.info(
                 f"Fetching metrics from Azure Monitor for resource_id: {resource_id} and metric_names: {metric_names}")
 
-            response = azure_api_processor.query_metrics(resource_id, time_range=time_range, metric_names=metric_names,
-                                                         aggregation=aggregation, granularity=granularity)  # can pass metric_name as well, for now fethcing all metrics in api processor
-            if not response:
+            if len(resource_ids) > 1:
+                responses = azure_api_processor.query_metrics_batch(resource_ids, time_range=time_range,
+                                                                    metric_names=metric_names,
+                                                                    aggregation=aggregation, granularity=granularity)
+            else:
+                response = azure_api_processor.query_metrics(resource_id, time_range=time_range, metric_names=metric_names,
+                                                             aggregation=aggregation, granularity=granularity)  # can pass metric_name as well, for now fethcing all metrics in api processor
+                responses = {resource_id: response} if response else {}
+            if not responses:
                 return PlaybookTaskResult(type=PlaybookTaskResultType.TEXT, text=TextResult(output=StringValue(
                     value=f"No data returned from Azure for resource_id: {resource_id} and metric_names: {metric_names}")),
                                           source=self.source)
             # Convert Azure response into Time Series format
             time_series_data = []
-            for metric_name, data_points in response.items():
-                if not data_points:
-                    continue  # Skip empty metric results
-                metric_datapoints = []
-                for data in data_points:
-                    if not isinstance(data, dict):
-                        logger.error(f"Unexpected metric data format: {data}")
-                        continue
-                    # Convert timestamp to Unix Epoch (milliseconds)
-                    timestamp_iso = str(data.get("timestamp", ""))
-                    if timestamp_iso:
-                        timestamp_ms = int(
-                            datetime.fromisoformat(timestamp_iso).replace(tzinfo=pytz.UTC).timestamp() * 1000)
-                    else:
-                        timestamp_ms = 0  # Handle missing timestamp case
-
-                    metric_value = data.get("value")
-                    if metric_value is None:
-                        metric_value = 0.0  # Defaulting to 0.0 if missing
-                    # Create TimeSeries Datapoint object
-                    metric_datapoints.append(
-                        TimeseriesResult.LabeledMetricTimeseries.Datapoint(
-                            timestamp=timestamp_ms,
-                            value=DoubleValue(value=metric_value)
+            for response_resource_id, response in responses.items():
+                for metric_name, data_points in response.items():
+                    if not data_points:
+                        continue  # Skip empty metric results
+                    metric_label_values = []
+                    if len(resource_ids) > 1:
+                        metric_label_values = [
+                            LabelValuePair(name=StringValue(value='resource_id'),
+                                           value=StringValue(value=response_resource_id)),
+                            LabelValuePair(name=StringValue(value='metric_name'), value=StringValue(value=metric_name)),
+                        ]
+                    time_series_data.append(
+                        TimeseriesResult.LabeledMetricTimeseries(
+                            metric_label_values=metric_label_values,
+                            datapoints=self._to_datapoints(data_points)
                         )
                     )
-                time_series_data.append(
-                    TimeseriesResult.LabeledMetricTimeseries(
-                        datapoints=metric_datapoints
-                    )
-                )
             # Constructing TimeSeriesResult instead of TableResult
             result = TimeseriesResult(
                 metric_name=StringValue(value=metric_names),
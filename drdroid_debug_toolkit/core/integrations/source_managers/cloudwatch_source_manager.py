@@ -507,62 +507,6 @@ class CloudwatchSourceManager(SourceManager):
             CATEGORY: CLOUD_MANAGED_SERVICES,
         }
 
-    def get_resolved_task(self, global_variable_set, input_task):
-        """Override to preprocess repeated fields that might come as strings."""
-        from core.protos.playbooks.playbook_pb2 import PlaybookTask
-        from core.utils.proto_utils import proto_to_dict, dict_to_proto
-        from core.integrations.utils.executor_utils import resolve_global_variables
-        from core.protos.playbooks.playbook_commons_pb2 import PlaybookTaskResultType
-        
-        source = input_task.source
-        if not source or source == Source.UNKNOWN or source != self.source:
-            raise Exception("PlaybookSourceManager.resolve_source_task_proto:: Applicable Source not found for task")
-        source_str = Source.Name(source).lower()
-
-        task_dict = proto_to_dict(input_task)
-        source_task_dict = task_dict.get(source_str, {})
-        if not source_task_dict:
-            raise Exception(f"PlaybookSourceManager.get_source_task:: No task definition found for: {source_str}")
-
-        source_task_proto = dict_to_proto(source_task_dict, self.task_proto)
-        task_type = source_task_proto.type
-        if task_type not in self.task_type_callable_map:
-            raise Exception(f"PlaybookSourceManager.get_source_task:: Task type {task_type} not supported for "
-                            f"source: {source_str}")
-
-        task_type_name = self.task_proto.TaskType.Name(task_type).lower()
-        source_task_type_dict = source_task_dict.get(task_type_name, {})
-        if 'form_fields' not in self.task_type_callable_map[task_type]:
-            raise Exception(f"PlaybookSourceManager.get_source_task:: Form fields not found for task type: "
-                            f"{task_type_name} in {source_str} source manager")
-
-        if not source_task_type_dict and self.task_type_callable_map[task_type]['form_fields']:
-            raise Exception(f"PlaybookSourceManager.get_source_task:: No definition for task type: {task_type_name} "
-                            f"found in task")
-
-        # Resolve global variables in source_type_task_def
-        form_fields = self.task_type_callable_map[task_type]['form_fields']
-        resolved_source_task_type_dict, task_local_variable_map = resolve_global_variables(form_fields,
-                                                                                           global_variable_set,
-                                                                                           source_task_type_dict)
-
-        # Add timeseries offsets to resolved_source_type_task_def if present in timeseries task
-        if 'result_type' not in self.task_type_callable_map[task_type]:
-            raise Exception(f"PlaybookSourceManager.get_source_task:: Result type not found for task type: "
-                            f"{task_type_name} in {source_str} source manager")
-        if self.task_type_callable_map[task_type]['result_type'] == PlaybookTaskResultType.TIMESERIES and \
-                input_task.execution_configuration and input_task.execution_configuration.timeseries_offsets:
-            resolved_source_task_type_dict['timeseries_offsets'] = list(
-                input_task.execution_configuration.timeseries_offsets)
-
-        source_task_dict[task_type_name] = resolved_source_task_type_dict
-        resolved_source_task_proto = dict_to_proto(source_task_dict, self.task_proto)
-
-        task_dict[source_str] = source_task_dict
-        resolved_task: PlaybookTask = dict_to_proto(task_dict, PlaybookTask)
-
-        return resolved_task, resolved_source_task_proto, task_local_variable_map
-
     def get_connector_processor(self, cloudwatch_connector, **kwargs):
         generated_credentials = generate_credentials_dict(cloudwatch_connector.type, cloudwatch_connector.keys)
         generated_credentials['client_type'] = kwargs.get('client_type', 'cloudwatch')
@@ -506,22 +506,25 @@ class CoralogixSourceManager(SourceManager):
                     return {"results": results, "count": len(results)}
 
         if isinstance(response, str):
-            obj = None
+            # Parse the text once; the decode error tells apart NDJSON (a valid first document followed by
+            # more data) from a Python repr, so the payload is never re-parsed three different ways.
+            text = response.strip()
             try:
-                obj = json.loads(response)
-            except Exception:
-                try:
-                    obj = ast.literal_eval(response)
-                except Exception:
-                    obj = None
+                obj = json.loads(text)
+            except json.JSONDecodeError as e:
+                obj = None
+                if e.msg == "Extra data":
+                    parsed = self._parse_ndjson_results(text)
+                    return {"results": parsed, "count": len(parsed)} if parsed else None
+                if text[:1] in ("{", "[") and "'" in text:
+                    try:
+                        obj = ast.literal_eval(text)
+                    except Exception:
+                        obj = None
 
             if obj is not None:
                 return self._normalize_logs_response(obj)
 
-            parsed = self._parse_ndjson_results(response)
-            if parsed:
-                return {"results": parsed, "count": len(parsed)}
-
         return None
 
     @staticmethod
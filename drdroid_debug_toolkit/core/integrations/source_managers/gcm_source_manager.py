@@ -68,6 +68,12 @@ def get_project_id(gcm_connector: ConnectorProto) -> str:
     return generated_credentials['project_id']
 
 class GcmSourceManager(SourceManager):
+    # Log windows are read as up to max_log_fetch_intervals sub-intervals of at least
+    # min_log_fetch_interval_seconds, log_fetch_workers at a time, log_page_size entries per request
+    max_log_fetch_intervals = 8
+    min_log_fetch_interval_seconds = 5 * 60
+    log_fetch_workers = 4
+    log_page_size = 1000
 
     def __init__(self):
         self.source = Source.GCM
@@ -119,6 +125,19 @@ class GcmSourceManager(SourceManager):
                               data_type=LiteralType.LONG,
                               default_value=Literal(type=LiteralType.LONG, long=Int64Value(value=2000)),
                               form_field_type=FormFieldType.MULTILINE_FT),
+                    FormField(key_name=StringValue(value="max_entries"),
+                              display_name=StringValue(value="Max Entries"),
+                              description=StringValue(value='Entries to return in total, defaults to the page size'),
+                              data_type=LiteralType.LONG,
+                              is_optional=True,
+                              form_field_type=FormFieldType.TEXT_FT),
+                    FormField(key_name=StringValue(value="fields"),
+                              display_name=StringValue(value="Fields"),
+                              description=StringValue(value='e.g. "timestamp,severity,jsonPayload.message"'),
+                              helper_text=StringValue(value="Comma-separated log entry fields to return, all if empty"),
+                              data_type=LiteralType.STRING,
+                              is_optional=True,
+                              form_field_type=FormFieldType.TEXT_FT),
                 ]
             },
             Gcm.TaskType.DASHBOARD_VIEW: {
@@ -351,6 +370,8 @@ class GcmSourceManager(SourceManager):
             page_size = log_task.page_size.value if log_task.page_size else 2000
             page_token = log_task.page_token.value if log_task.page_token else None
             resource_names = [r.value for r in log_task.resource_names] if log_task.resource_names else None
+            max_entries = log_task.max_entries.value or page_size or 2000
+            fields = log_task.fields.value.strip() or None
 
             timestamp_gte_match = re.search(r'timestamp\s*>=\s*"([^"]+)"', filter_query)
             timestamp_gt_match = re.search(r'timestamp\s*>\s*"([^"]+)"', filter_query)
@@ -391,8 +412,21 @@ class GcmSourceManager(SourceManager):
                 "{}, Start_Time -> {}, End_Time -> {}".format("GCM_Logs", gcm_connector.account_id.value,
                                                               filter_query, start_time, end_time))
 
-            response = logs_api_processor.fetch_logs(filter_query, order_by=order_by, page_size=page_size,
-                                                     page_token=page_token, resource_names=resource_names)
+            stats = {}
+            if page_token:
+                # A page token belongs to the exact filter it was issued for, so continue that single listing
+                response = logs_api_processor.fetch_logs(filter_query, order_by=order_by, page_size=page_size,
+                                                         page_token=page_token, resource_names=resource_names,
+                                                         fields=fields)
+            else:
+                interval_count = int(min(self.max_log_fetch_intervals,
+                                         max(1, (end_time - start_time).total_seconds() //
+                                             self.min_log_fetch_interval_seconds)))
+                response = logs_api_processor.fetch_logs_concurrently(
+                    filter_query, start_time, end_time, order_by=order_by or "timestamp asc",
+                    resource_names=resource_names, page_size=min(self.log_page_size, max_entries),
+                    max_entries=max_entries, fields=fields, interval_count=interval_count,
+                    max_workers=self.log_fetch_workers, stats=stats)
             if not response:
                 return PlaybookTaskResult(type=PlaybookTaskResultType.TEXT, text=TextResult(output=StringValue(
                     value=f"No data returned from GCM Logs for query: {filter_query}")), source=self.source)
@@ -419,6 +453,9 @@ class GcmSourceManager(SourceManager):
             )
 
             task_result = PlaybookTaskResult(type=PlaybookTaskResultType.TABLE, table=result, source=self.source)
+            if stats.get('truncated'):
+                task_result.metadata.update({'truncated': True, 'returned_rows': stats['entries'],
+                                             'max_entries': max_entries})
             return task_result
         except Exception as e:
             logger.error(f"Error while executing GCM task: {e}")
@@ -1,24 +1,36 @@
+import heapq
 import logging
 import re
+from collections import deque
 from datetime import datetime, timedelta
 
-from google.protobuf.wrappers_pb2 import StringValue, UInt64Value, Int64Value, BoolValue
+from google.protobuf.wrappers_pb2 import StringValue, Int64Value, BoolValue
 
 from core.integrations.source_api_processors.grafana_loki_api_processor import GrafanaLokiApiProcessor
+from core.utils.instrumentation_utils import ContextThreadPoolExecutor
 from core.utils.logql_utils import cleanup_logql_query, LogQLValidationError
 
 logger = logging.getLogger(__name__)
 from core.integrations.source_manager import SourceManager
+from core.integrations.utils.log_table_utils import LogTableBuilder
 from core.protos.base_pb2 import TimeRange, Source, SourceKeyType
 from core.protos.connectors.connector_pb2 import Connector as ConnectorProto
 from core.protos.literal_pb2 import LiteralType, Literal
-from core.protos.playbooks.playbook_commons_pb2 import PlaybookTaskResult, PlaybookTaskResultType, TableResult, TextResult
+from core.protos.playbooks.playbook_commons_pb2 import PlaybookTaskResult, PlaybookTaskResultType, TextResult
 from core.protos.playbooks.source_task_definitions.grafana_loki_task_pb2 import GrafanaLoki
 from core.protos.ui_definition_pb2 import FormField, FormFieldType
 from core.utils.credentilal_utils import generate_credentials_dict, get_connector_key_type_string, CATEGORY, DISPLAY_NAME, APPLICATION_MONITORING
 
 
 class GrafanaLokiSourceManager(SourceManager):
+    # Log queries over wide windows are split into at most max_query_shards time shards of at least
+    # min_query_shard_seconds, run query_shard_workers at a time
+    max_query_shards = 8
+    min_query_shard_seconds = 15 * 60
+    query_shard_workers = 4
+    # Store each stream's labels once per result instead of on every log row (see log_table_utils); changes the
+    # row shape seen by callers, so hosts opt in
+    compact_log_tables = False
 
     def __init__(self):
         self.source = Source.GRAFANA_LOKI
@@ -189,6 +201,89 @@ class GrafanaLokiSourceManager(SourceManager):
             # Still return the cleaned query without validation
             return cleanup_logql_query(query, validate=False)
 
+    def _plan_query_shards(self, start_ns, end_ns, direction='backward'):
+        """[(shard start ns, shard end ns)] covering [start_ns, end_ns), in the order entries are wanted."""
+        if end_ns <= start_ns:
+            return [(start_ns, end_ns)]
+        min_shard_ns = self.min_query_shard_seconds * 1_000_000_000
+        shard_count = max(1, min(self.max_query_shards, (end_ns - start_ns) // min_shard_ns))
+        shard_ns = -(-(end_ns - start_ns) // shard_count)
+        shards = [(shard_start, min(shard_start + shard_ns, end_ns))
+                  for shard_start in range(start_ns, end_ns, shard_ns)]
+        return shards[::-1] if direction == 'backward' else shards
+
+    def _execute_sharded_log_query(self, grafana_loki_api_processor, query, start_ns, end_ns, limit,
+                                   direction='backward'):
+        """
+        Runs a log query as concurrent time shards and merges them into one query_range style response holding
+        the `limit` entries Loki would return for the whole window. Shards are consumed in `direction` order, so
+        once the completed leading shards hold `limit` entries the remaining ones cannot contribute and are
+        not issued. The (start ns, end ns) ranges of shards that got no response or raised are listed under
+        `failed_shards`. Returns None when every issued shard failed.
+        """
+        shards = self._plan_query_shards(start_ns, end_ns, direction)
+        shard_results, entry_count, failed_shards = [], 0, []
+        with ContextThreadPoolExecutor(max_workers=min(self.query_shard_workers, len(shards))) as executor:
+            pending, next_shard = deque(), 0
+            while next_shard < len(shards) or pending:
+                while next_shard < len(shards) and len(pending) < self.query_shard_workers:
+                    shard_start, shard_end = shards[next_shard]
+                    pending.append((shards[next_shard],
+                                    executor.submit(grafana_loki_api_processor.query, query, shard_start, shard_end,
+                                                    limit, direction)))
+                    next_shard += 1
+                shard, future = pending.popleft()
+                try:
+                    response = future.result()
+                except Exception as e:
+                    logger.error(f"GrafanaLokiSourceManager._execute_sharded_log_query:: Shard {shard} failed "
+                                 f"with error: {e}")
+                    response = None
+                if response is None:
+                    failed_shards.append(shard)
+                streams = (response or {}).get('data', {}).get('result', [])
+                shard_results.append(streams)
+                entry_count += sum(len(stream.get('values', [])) for stream in streams)
+                if entry_count >= limit:
+                    for _, future in pending:
+                        future.cancel()
+                    break
+        if len(failed_shards) == len(shard_results):
+            return None
+        if len(shard_results) < len(shards):
+            logger.info(f"Loki query satisfied limit {limit} after {len(shard_results)} of {len(shards)} shards")
+        if failed_shards:
+            logger.warning(f"Loki query got no response for {len(failed_shards)} of {len(shard_results)} shards, "
+                           f"result is missing their time ranges")
+        return {'data': {'resultType': 'streams', 'result': self._merge_log_streams(shard_results, limit, direction)},
+                'failed_shards': failed_shards}
+
+    @staticmethod
+    def _merge_log_streams(shard_results, limit, direction='backward'):
+        """Merges per-shard stream results: the `limit` newest (backward) or oldest (forward) entries across all
+        streams, deduplicated, grouped back per stream with values in direction order."""
+        streams, entries = {}, []
+        seen = set()
+        for shard_streams in shard_results:
+            for stream in shard_streams:
+                labels = stream.get('stream', {})
+                stream_key = tuple(sorted(labels.items()))
+                streams.setdefault(stream_key, labels)
+                for value in stream.get('values', []):
+                    entry_key = (stream_key, value[0], value[1] if len(value) > 1 else None)
+                    if entry_key in seen:
+                        continue
+                    seen.add(entry_key)
+                    entries.append((int(value[0]), stream_key, value))
+        if direction == 'backward':
+            selected = heapq.nlargest(limit, entries, key=lambda entry: entry[0])
+        else:
+            selected = heapq.nsmallest(limit, entries, key=lambda entry: entry[0])
+        merged = {}
+        for _, stream_key, value in selected:
+            merged.setdefault(stream_key, []).append(value)
+        return [{'stream': streams[stream_key], 'values': values} for stream_key, values in merged.items()]
+
     def execute_query_logs(self, time_range: TimeRange, grafana_loki_task: GrafanaLoki,
                            grafana_loki_connector: ConnectorProto):
         try:
@@ -222,39 +317,37 @@ class GrafanaLokiSourceManager(SourceManager):
                 "-> {}, End_Time -> {}".format("Grafana", grafana_loki_connector.account_id.value, query, start_time,
                                                end_time), flush=True)
 
-            response = grafana_loki_api_processor.query(query, start_time, end_time, limit)
+            if query.startswith('{'):
+                # Log query: split into time shards; metric queries keep Loki's own step and run whole
+                start_ns = int((evaluation_time - datetime(1970, 1, 1)).total_seconds()) * 1_000_000_000
+                end_ns = int((current_datetime - datetime(1970, 1, 1)).total_seconds()) * 1_000_000_000
+                response = self._execute_sharded_log_query(grafana_loki_api_processor, query, start_ns, end_ns,
+                                                           limit)
+            else:
+                response = grafana_loki_api_processor.query(query, start_time, end_time, limit)
             if not response:
                 return PlaybookTaskResult(type=PlaybookTaskResultType.TEXT, text=TextResult(output=StringValue(
                     value=f"No data returned from Grafana Loki for query: {query}")), source=self.source)
 
             result = response.get('data', {}).get('result', [])
-            table_rows: [TableResult.TableRow] = []
+            builder = LogTableBuilder(compact=self.compact_log_tables)
             for r in result:
-                table_meta_columns = []
-                data_rows = []
-                for key, value in r.items():
-                    if key == 'stream' or key == 'metric':
-                        for k, v in value.items():
-                            table_meta_columns.append(TableResult.TableColumn(name=StringValue(value=str(k)),
-                                                                              value=StringValue(value=str(v))))
-                    elif key == 'values':
-                        for v in value:
-                            table_columns = []
-                            for i, val in enumerate(v):
-                                if i == 0:
-                                    key = 'timestamp'
-                                else:
-                                    key = 'log'
-                                table_columns.append(TableResult.TableColumn(name=StringValue(value=key),
-                                                                             value=StringValue(value=str(val))))
-                            data_rows.append(table_columns)
-                for dc in data_rows:
-                    update_columns = table_meta_columns + dc
-                    table_row = TableResult.TableRow(columns=update_columns)
-                    table_rows.append(table_row)
-            table = TableResult(raw_query=StringValue(value=f"Execute ```{query}```"),
-                                total_count=UInt64Value(value=len(result)),
-                                rows=table_rows)
-            return PlaybookTaskResult(type=PlaybookTaskResultType.LOGS, logs=table, source=self.source)
+                values = r.get('values') or []
+                if not values:
+                    continue
+                stream_ref = builder.add_stream([(k, v) for key in ('stream', 'metric') for k, v in
+                                                 (r.get(key) or {}).items()])
+                for v in values:
+                    builder.add_row(stream_ref, trailing_columns=[('timestamp' if i == 0 else 'log', str(val))
+                                                                  for i, val in enumerate(v)])
+            table = builder.build(f"Execute ```{query}```", len(result))
+            task_result = PlaybookTaskResult(type=PlaybookTaskResultType.LOGS, logs=table, source=self.source)
+            if response.get('failed_shards'):
+                # Partial result: entries of these time ranges are missing
+                task_result.metadata.update({'partial_result': True, 'failed_time_ranges': [
+                    {'start': datetime.utcfromtimestamp(shard_start / 1e9).isoformat() + "Z",
+                     'end': datetime.utcfromtimestamp(shard_end / 1e9).isoformat() + "Z"}
+                    for shard_start, shard_end in response['failed_shards']]})
+            return task_result
         except Exception as e:
             raise Exception(f"Error while executing Grafana task: {e}")
@@ -1,10 +1,10 @@
 import json
 import logging
-import re
 import string
 import requests
 import ast
 import urllib.parse
+from concurrent.futures import wait
 from typing import Optional, Union
 
 from google.protobuf.struct_pb2 import Struct
@@ -13,6 +13,10 @@ from google.protobuf.wrappers_pb2 import DoubleValue, StringValue, Int64Value, U
 from core.integrations.source_api_processors.grafana_api_processor import GrafanaApiProcessor
 from core.integrations.source_manager import SourceManager
 from core.integrations.source_metadata_extractors.grafana_metadata_extractor import GrafanaSourceMetadataExtractor
+from core.integrations.utils.grafana_frame_decoder import build_labeled_timeseries, group_frame_points
+from core.integrations.utils.grafana_template_variables import TemplateVariableResolver
+from core.integrations.utils.log_table_utils import LogTableBuilder
+from core.integrations.utils.promql_result_cache import get_promql_result_cache, PromQLResultNotCacheable
 from core.protos.base_pb2 import Source, SourceModelType, TimeRange
 from core.protos.connectors.connector_pb2 import Connector as ConnectorProto
 from core.protos.literal_pb2 import Literal, LiteralType
@@ -29,6 +33,7 @@ from core.protos.playbooks.source_task_definitions.grafana_task_pb2 import Grafa
 from core.protos.ui_definition_pb2 import FormField, FormFieldType
 from core.protos.base_pb2 import Source, SourceKeyType
 from core.utils.credentilal_utils import generate_credentials_dict, get_connector_key_type_string, DISPLAY_NAME, CATEGORY, APPLICATION_MONITORING
+from core.utils.instrumentation_utils import ContextThreadPoolExecutor
 from core.utils.logql_utils import cleanup_logql_query, LogQLValidationError
 from core.utils.proto_utils import dict_to_proto, proto_to_dict
 
@@ -267,6 +272,13 @@ class GrafanaSourceManager(SourceManager):
     # Constants for dynamic interval calculation
     MAX_DATA_POINTS = 70
     MIN_STEP_SIZE_SECONDS = 60  # Minimum interval is 1 minute
+    # Store each label set of a logs result once instead of on every row (see log_table_utils); changes the row
+    # shape seen by callers, so hosts opt in
+    compact_log_tables = False
+    # Dashboard panels are queried with one request per datasource, dashboard_query_workers at a time; requests
+    # slower than dashboard_query_timeout_seconds are dropped from the (partial) result
+    dashboard_query_workers = 8
+    dashboard_query_timeout_seconds = 60
 
     # Duration thresholds (seconds) mapped to minimum bucket size (seconds)
     _INTERVAL_THRESHOLDS_SECONDS = [
@@ -917,8 +929,12 @@ class GrafanaSourceManager(SourceManager):
 
             formatted_queries = self._format_query_step_interval(queries, time_range)
 
-            response = grafana_api_processor.panel_query_datasource_api(tr=time_range, queries=formatted_queries,
-                                                                        interval_ms=interval_ms)
+            if query_type == 'Flux':
+                response = grafana_api_processor.panel_query_datasource_api(tr=time_range, queries=formatted_queries,
+                                                                            interval_ms=interval_ms)
+            else:
+                response = self._query_prometheus_range_cached(grafana_api_processor, datasource_uid, metric_query,
+                                                               time_range, interval, formatted_queries, interval_ms)
 
             if not response:
                 # Create metadata with Grafana URL using effective host
@@ -1431,77 +1447,27 @@ class GrafanaSourceManager(SourceManager):
             "__to": str(int(time_range.time_lt * 1000)),     # Convert to milliseconds
         }
 
+    def _build_template_variable_resolver(self, template_vars_dict: dict,
+                                          time_range: TimeRange = None) -> TemplateVariableResolver:
+        """Builds a resolver for the built-in Grafana variables plus template_vars_dict (which takes precedence)."""
+        builtin_vars = self._get_grafana_builtin_variables(time_range) if time_range else {}
+        return TemplateVariableResolver({**builtin_vars, **template_vars_dict})
+
     def _resolve_template_variables_in_string(self, input_string: str, template_vars_dict: dict, time_range: TimeRange = None) -> str:
         """Resolves template variables (e.g., $var or ${var}) in a string."""
         if not input_string or not isinstance(input_string, str):
             return input_string
-
-        resolved_string = input_string
-        contains_multivalue = False
-        
-        # Get built-in Grafana variables
-        builtin_vars = self._get_grafana_builtin_variables(time_range) if time_range else {}
-        
-        # Combine user variables with built-in variables (user variables take precedence)
-        all_vars = {**builtin_vars, **template_vars_dict}
-        
-        # Regex to find $var or ${var} or ${var:format}
-        var_refs = re.findall(r"\$\{([^}]+)(?::(?:csv|json|pipe|regex|distributed))?\}|\$([a-zA-Z0-9_]+)", input_string)
-        
-        if var_refs:
-            logger.debug(f"Found template variable references in '{input_string}': {var_refs}")
-            logger.debug(f"Available template variables: {list(all_vars.keys())}")
-        
-        for ref_tuple in var_refs:
-            var_ref = next((item for item in ref_tuple if item), None)  # Get the captured group (variable name)
-            if var_ref and var_ref in all_vars:
-                var_value = all_vars[var_ref]
-                # Basic handling for multi-value variables (join with '|')
-                if isinstance(var_value, list):
-                    replacement = "|".join(map(str, var_value)) if var_value else ""
-                    if replacement:
-                        contains_multivalue = True
-                else:
-                    replacement = str(var_value) if var_value is not None else ""
-                logger.debug(f"Resolving ${var_ref} -> '{replacement}'")
-                # Replace both ${var} and $var formats, ensuring word boundaries for $var
-                resolved_string = re.sub(r"\$\{" + re.escape(var_ref) + r"(?::(?:csv|json|pipe|regex|distributed))?\}",
-                                         replacement, resolved_string)
-                resolved_string = re.sub(r"\$" + re.escape(var_ref) + r"\b", replacement, resolved_string)
-            elif var_ref:
-                logger.warning(f"Template variable '${var_ref}' referenced but not found in available variables: {list(all_vars.keys())}")
-        
-        # If we substituted any multi-value variables (joined with '|'),
-        # upgrade equality matchers to regex matchers within label selectors: label="a|b" -> label=~"a|b"
-        if contains_multivalue and "|" in resolved_string:
-            def _upgrade_equals_to_regex_in_braces(match: re.Match) -> str:
-                inner = match.group(0)
-                # Only change plain '=' occurrences that have a quoted value containing a pipe
-                # Keep existing '=~' or '!~' intact
-                inner = re.sub(
-                    r"(?<![!~])=\s*\"([^\"]*\|[^\"]*)\"",
-                    lambda m: f"=~\"{m.group(1)}\"",
-                    inner,
-                )
-                # Also upgrade '!=' to '!~' when multi-value regex is present
-                inner = re.sub(
-                    r"!=\s*\"([^\"]*\|[^\"]*)\"",
-                    lambda m: f"!~\"{m.group(1)}\"",
-                    inner,
-                )
-                return inner
-            resolved_string = re.sub(r"\{[^}]*\}", _upgrade_equals_to_regex_in_braces, resolved_string)
-        
-        if resolved_string != input_string:
-            logger.debug(f"Template variable resolution: '{input_string}' -> '{resolved_string}'")
-        
-        return resolved_string
+        return self._build_template_variable_resolver(template_vars_dict, time_range).resolve(input_string)
 
     def _resolve_target_datasource(
             self, target_datasource: Union[dict, str, None], dashboard_datasource: Union[dict, str, None],
-            template_vars_dict: dict, panel_id, datasource_name_to_uid_map: dict, time_range: TimeRange = None, host_url: str = None
+            template_vars_dict: dict, panel_id, datasource_name_to_uid_map: dict, time_range: TimeRange = None, host_url: str = None,
+            template_resolver: TemplateVariableResolver = None
     ) -> Union[dict, None]:
-        """Resolves the datasource for a target, handling variables and defaults."""
+        """
+        Resolves the datasource for a target, handling variables and defaults. template_resolver, when given, is
+        used instead of building one from template_vars_dict.
+        """
         resolved_ds = {}
         datasource_value_to_resolve = None
 
@@ -1540,8 +1506,9 @@ class GrafanaSourceManager(SourceManager):
             return None
 
         # Resolve any variables in the datasource string (UID or name)
-        resolved_uid_or_name = self._resolve_template_variables_in_string(datasource_value_to_resolve,
-                                                                          template_vars_dict, time_range)
+        if template_resolver is None:
+            template_resolver = self._build_template_variable_resolver(template_vars_dict, time_range)
+        resolved_uid_or_name = template_resolver.resolve(datasource_value_to_resolve)
 
         if not resolved_uid_or_name:
             logger.warning(
@@ -1630,6 +1597,12 @@ class GrafanaSourceManager(SourceManager):
         # Convert panel_ids_filter to a set for efficient lookup
         filter_set = set(panel_ids_filter) if panel_ids_filter else None
 
+        # Variables are compiled once, and datasource resolution / validation is memoized for this run since most
+        # panels share a handful of datasources
+        template_resolver = self._build_template_variable_resolver(template_vars_dict, time_range)
+        resolved_datasources = {}
+        validated_uids = {}
+
         for panel in panels:
             datasource_dict = panel.get("datasource") if "datasource" in panel else dashboard_datasource
             panel_id = panel.get("id")
@@ -1659,21 +1632,29 @@ class GrafanaSourceManager(SourceManager):
                 target_datasource_info = target.get("datasource")
 
                 # Resolve Datasource
-                resolved_datasource = self._resolve_target_datasource(target_datasource_info, datasource_dict,
-                                                                      template_vars_dict, panel_id, datasource_name_to_uid_map, time_range, host_url)
+                datasource_key = (json.dumps(target_datasource_info, sort_keys=True, default=str),
+                                  json.dumps(datasource_dict, sort_keys=True, default=str))
+                if datasource_key not in resolved_datasources:
+                    resolved_datasources[datasource_key] = self._resolve_target_datasource(
+                        target_datasource_info, datasource_dict, template_vars_dict, panel_id,
+                        datasource_name_to_uid_map, time_range, host_url, template_resolver=template_resolver)
+                resolved_datasource = resolved_datasources[datasource_key]
                 # Skip target if datasource resolution fails
                 if not resolved_datasource and not expr.startswith(
                         "grafana"):  # Allow grafana expressions like grafana/alerting/list
                     continue
 
                 # Resolve Expression Variables
-                resolved_expr = self._resolve_template_variables_in_string(expr, template_vars_dict, time_range)
+                resolved_expr = template_resolver.resolve(expr)
                 if not resolved_expr:
                     continue  # Skip empty expressions
 
                 # Validate datasource UID before adding query
                 if resolved_datasource and resolved_datasource.get("uid"):
-                    if not self._validate_datasource_uid(resolved_datasource["uid"]):
+                    if resolved_datasource["uid"] not in validated_uids:
+                        validated_uids[resolved_datasource["uid"]] = self._validate_datasource_uid(
+                            resolved_datasource["uid"])
+                    if not validated_uids[resolved_datasource["uid"]]:
                         logger.warning(f"Skipping query for panel {panel_id} due to invalid datasource UID: {resolved_datasource['uid']}")
                         continue
 
@@ -1684,7 +1665,7 @@ class GrafanaSourceManager(SourceManager):
                 else:
                     query_obj = {"expr": resolved_expr, "refId": ref_id}
                 if resolved_datasource:
-                    query_obj["datasource"] = resolved_datasource
+                    query_obj["datasource"] = dict(resolved_datasource)
 
                 all_queries.append(query_obj)
                 panel_ref_map[ref_id] = {"panel_id": panel_id, "panel_title": panel_title, "panel_type": panel_type, "original_expr": expr}
@@ -2366,39 +2347,15 @@ class GrafanaSourceManager(SourceManager):
             frame_labels.append(
                 LabelValuePair(name=StringValue(value="series_name"), value=StringValue(value=schema["name"])))
 
-        # Per-point labels
-        label_data = {field_names[idx]: data["values"][idx] for idx in label_indices}
-        label_field_names = [field_names[idx] for idx in label_indices]
-
         # Group points into series based on label values
-        series_map = {}
-        for i in range(num_points):
-            point_label_values = tuple(label_data[name][i] for name in label_field_names)
-            ts = timestamps[i]
-            val = values[i]
-            if val is None:
-                continue
-
-            if point_label_values not in series_map:
-                series_map[point_label_values] = []
-            series_map[point_label_values].append((ts, float(val)))
-
-        # Create LabeledMetricTimeseries for each series
-        for label_tuple, points in series_map.items():
+        label_field_names = [field_names[idx] for idx in label_indices]
+        label_columns = [data["values"][idx] for idx in label_indices]
+        for label_values, series_timestamps, series_values in group_frame_points(timestamps, values, label_columns):
             metric_labels = list(frame_labels)
-            for j, label_value in enumerate(label_tuple):
-                metric_labels.append(LabelValuePair(name=StringValue(value=label_field_names[j]),
-                                                    value=StringValue(value=str(label_value))))
-
-            datapoints = [
-                TimeseriesResult.LabeledMetricTimeseries.Datapoint(timestamp=int(ts), value=DoubleValue(value=val)) for
-                ts, val in sorted(points)
-            ]
-
-            if datapoints:
-                labeled_ts = TimeseriesResult.LabeledMetricTimeseries(metric_label_values=metric_labels,
-                                                                      datapoints=datapoints)
-                parsed_timeseries.append(labeled_ts)
+            for label_name, label_value in zip(label_field_names, label_values):
+                metric_labels.append(LabelValuePair(name=StringValue(value=label_name),
+                                                    value=StringValue(value=label_value)))
+            parsed_timeseries.append(build_labeled_timeseries(metric_labels, series_timestamps, series_values))
 
         return parsed_timeseries
 
@@ -2545,18 +2502,8 @@ class GrafanaSourceManager(SourceManager):
                 expr = query.get("expr", query.get("query", "unknown"))
                 logger.debug(f"Query {i+1}: datasource={ds_uid}, expr='{expr[:100]}...'")
             
-            try:
-                response = grafana_api_processor.panel_query_datasource_api(tr=time_range, queries=formatted_queries,
-                                                                            interval_ms=interval_ms)
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 404:
-                    # Extract datasource UIDs from queries for better error reporting
-                    ds_uids = [q.get("datasource", {}).get("uid") for q in formatted_queries if q.get("datasource", {}).get("uid")]
-                    unique_ds_uids = list(set(ds_uids))
-                    logger.error(f"Datasource not found (404) for dashboard {dashboard_uid}. "
-                               f"Queries reference datasource UIDs: {unique_ds_uids}. "
-                               f"Available datasources: {list(getattr(self, '_datasource_uid_info', {}).keys())}")
-                raise
+            response, failed_datasources = self._execute_dashboard_queries_by_datasource(
+                grafana_api_processor, dashboard_uid, formatted_queries, time_range, interval_ms)
 
             if not response:
                 logger.warning(f"No data returned from Grafana API for dashboard UID: {dashboard_uid}")
@@ -2567,6 +2514,8 @@ class GrafanaSourceManager(SourceManager):
                     **self._get_grafana_time_params(time_range),
                     "orgId": "1"
                 })
+                if failed_datasources:
+                    metadata.update({"failed_datasources": failed_datasources})
                 
                 return [PlaybookTaskResult(
                     source=self.source,
@@ -2591,6 +2540,9 @@ class GrafanaSourceManager(SourceManager):
                 "orgId": "1",
                 **url_template_vars
             })
+            if failed_datasources:
+                # Partial result: panels of these datasources are missing
+                metadata.update({"failed_datasources": failed_datasources})
             
             # 7. Parse API response into Timeseries results
             all_task_results = self._parse_grafana_response_frames(response, panel_ref_map, metadata)
@@ -2650,6 +2602,60 @@ class GrafanaSourceManager(SourceManager):
             )
             return [error_result]
 
+    def _execute_dashboard_queries_by_datasource(self, grafana_api_processor, dashboard_uid: str, queries: list,
+                                                 time_range: TimeRange, interval_ms: int) -> tuple[Optional[dict], list]:
+        """
+        Sends the dashboard queries as one /api/ds/query request per datasource, dashboard_query_workers at a
+        time, so a slow datasource only delays its own panels. Requests still running after
+        dashboard_query_timeout_seconds are abandoned.
+
+        Returns the merged response ({"results": {ref_id: result}}, or None when no request returned data) and a
+        list of {"datasource_uid", "ref_ids", "error"} for the requests that failed, timed out or were rate limited.
+        If every request failed with an HTTP error, the first one is raised.
+        """
+        groups = {}
+        for query in queries:
+            groups.setdefault(query.get("datasource", {}).get("uid"), []).append(query)
+
+        executor = ContextThreadPoolExecutor(max_workers=max(1, min(self.dashboard_query_workers, len(groups))))
+        try:
+            futures = {executor.submit(grafana_api_processor.panel_query_datasource_api, tr=time_range,
+                                       queries=group_queries, interval_ms=interval_ms,
+                                       timeout=self.dashboard_query_timeout_seconds): datasource_uid
+                       for datasource_uid, group_queries in groups.items()}
+            done, not_done = wait(futures, timeout=self.dashboard_query_timeout_seconds)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        results, failed_datasources, http_errors = {}, [], []
+        for future, datasource_uid in futures.items():
+            ref_ids = [query.get("refId") for query in groups[datasource_uid]]
+            if future in not_done:
+                error = f"Timed out after {self.dashboard_query_timeout_seconds}s"
+            elif future.exception() is not None:
+                e = future.exception()
+                if isinstance(e, requests.exceptions.HTTPError):
+                    http_errors.append(e)
+                    if e.response is not None and e.response.status_code == 404:
+                        logger.error(f"Datasource not found (404) for dashboard {dashboard_uid}. "
+                                     f"Queries reference datasource UID: {datasource_uid}. "
+                                     f"Available datasources: {list(getattr(self, '_datasource_uid_info', {}).keys())}")
+                error = str(e)
+            elif not future.result():
+                error = "No data returned (rate limited or empty response)"
+            else:
+                results.update(future.result().get("results", {}))
+                continue
+            logger.warning(f"Dashboard {dashboard_uid}: queries {ref_ids} for datasource {datasource_uid} "
+                           f"failed: {error}")
+            failed_datasources.append({"datasource_uid": datasource_uid or "", "ref_ids": ref_ids, "error": error})
+
+        if not results:
+            if http_errors and len(http_errors) == len(groups):
+                raise http_errors[0]
+            return None, failed_datasources
+        return {"results": results}, failed_datasources
+
     def _calculate_bucket_size_seconds(self, total_seconds):
         """Calculate appropriate bucket size based on duration, aiming for < MAX_DATA_POINTS buckets."""
         if total_seconds <= 0:
@@ -2675,6 +2681,71 @@ class GrafanaSourceManager(SourceManager):
         # If larger than the largest standard size, return the largest standard size
         return self.STANDARD_STEP_SIZES_SECONDS[-1]
 
+    def _query_prometheus_range_cached(self, grafana_api_processor, datasource_uid, metric_query,
+                                       time_range: TimeRange, interval, queries, interval_ms):
+        """
+        Runs a PromQL range query through the process-wide PromQL result cache, so only the part of the range not
+        already cached for (connector, datasource, expression, step) is queried, and returns the merged result in
+        the /api/ds/query response shape. The step is pinned through intervalMs with a generous maxDataPoints so
+        every sub-query evaluates on the same grid.
+        """
+        cache = get_promql_result_cache()
+        if cache is None:
+            return grafana_api_processor.panel_query_datasource_api(tr=time_range, queries=queries,
+                                                                    interval_ms=interval_ms)
+        step = max(int(interval or 0), self._calculate_bucket_size_seconds(time_range.time_lt - time_range.time_geq))
+        failed_responses = []
+
+        def fetch(range_start, range_end):
+            sub_queries = [{"expr": metric_query, "datasource": {"uid": datasource_uid}, "refId": "A",
+                            "intervalMs": step * 1000, "maxDataPoints": 2 * ((range_end - range_start) // step + 1)}]
+            response = grafana_api_processor.panel_query_datasource_api(
+                tr=TimeRange(time_geq=range_start, time_lt=range_end), queries=sub_queries, interval_ms=step * 1000)
+            result = (response or {}).get("results", {}).get("A")
+            if not result or result.get("error") or result.get("status", 200) != 200:
+                if response:
+                    failed_responses.append(response)
+                return None
+            return self._prometheus_frames_to_series(result.get("frames") or [])
+
+        key = cache.make_key(grafana_api_processor.connection_key, datasource_uid, metric_query, step)
+        try:
+            series = cache.query_range(key, time_range.time_geq, time_range.time_lt, step, fetch)
+        except PromQLResultNotCacheable as e:
+            logger.info(f"Prometheus datasource result not cacheable ({e}), querying the full range directly")
+            return grafana_api_processor.panel_query_datasource_api(tr=time_range, queries=queries,
+                                                                    interval_ms=interval_ms)
+        if series is None:
+            # Surface the backend error response (if any) the same way an uncached query would
+            return failed_responses[0] if failed_responses else None
+
+        frames = []
+        for schema, points in series.values():
+            timestamps = [int(round(timestamp * 1000)) for timestamp, _ in points]
+            values = [value for _, value in points]
+            time_first = schema["fields"][0].get("type") == "time"
+            frames.append({"schema": schema, "data": {"values": [timestamps, values] if time_first
+                                                      else [values, timestamps]}})
+        return {"results": {"A": {"status": 200, "frames": frames}}}
+
+    @staticmethod
+    def _prometheus_frames_to_series(frames):
+        """Converts Prometheus datasource frames (one time and one number field each) to PromQL cache series."""
+        series = {}
+        for frame in frames:
+            schema = frame.get("schema", {})
+            fields = schema.get("fields", [])
+            values = frame.get("data", {}).get("values", [])
+            field_types = [field.get("type") for field in fields]
+            if sorted(field_types) != ["number", "time"] or len(values) != 2:
+                raise PromQLResultNotCacheable(f"frame field types {field_types}")
+            time_idx = field_types.index("time")
+            series_id = json.dumps([schema.get("name"), [[field.get("name"), field.get("labels")] for field in fields]],
+                                   sort_keys=True)
+            series[series_id] = (schema, [(timestamp / 1000, value)
+                                          for timestamp, value in zip(values[time_idx], values[1 - time_idx])])
+        return series
+
     def _format_query_step_interval(self, queries, time_range: TimeRange):
         """
         Sets the maxDataPoints and calculates intervalMs for Grafana queries
@@ -2951,7 +3022,7 @@ class GrafanaSourceManager(SourceManager):
             )
 
         # Convert logs to table rows following the Grafana Loki pattern
-        table_rows = []
+        builder = LogTableBuilder(compact=self.compact_log_tables)
         for log_entry in parsed_logs:
             labels = log_entry.get("labels", {})
             timestamp = log_entry.get("timestamp")
@@ -2968,37 +3039,11 @@ class GrafanaSourceManager(SourceManager):
                 except (ValueError, TypeError):
                     formatted_timestamp = str(timestamp)
             
-            # Create columns for this row - following the Grafana Loki pattern
-            table_columns = []
-            
-            # Add timestamp column
-            table_columns.append(TableResult.TableColumn(
-                name=StringValue(value="timestamp"),
-                value=StringValue(value=formatted_timestamp)
-            ))
-            
-            # Add log line column
-            table_columns.append(TableResult.TableColumn(
-                name=StringValue(value="log"),
-                value=StringValue(value=log_line)
-            ))
-            
-            # Add all label columns
-            for label_key, label_value in labels.items():
-                table_columns.append(TableResult.TableColumn(
-                    name=StringValue(value=str(label_key)),
-                    value=StringValue(value=str(label_value))
-                ))
-
-            # Create the table row
-            table_row = TableResult.TableRow(columns=table_columns)
-            table_rows.append(table_row)
+            # Timestamp and log line columns, followed by the entry's labels (shared per label set)
+            builder.add_row(builder.add_stream(labels),
+                            leading_columns=[("timestamp", formatted_timestamp), ("log", log_line)])
 
-        return TableResult(
-            raw_query=StringValue(value=f"Execute ```{query}```"),
-            total_count=UInt64Value(value=len(parsed_logs)),
-            rows=table_rows
-        )
+        return builder.build(f"Execute ```{query}```", len(parsed_logs))
 
     def execute_tempo_datasource_trace_search(self, time_range: TimeRange, grafana_task: Grafana,
                                               grafana_connector: ConnectorProto):
@@ -17,6 +17,10 @@ from core.utils.proto_utils import dict_to_proto
 
 
 class OpenSearchSourceManager(SourceManager):
+    # Query logs results are fetched query_page_size hits per request (the default limit fits in one; larger
+    # limits page with point in time + search_after) and paging stops once max_query_bytes of responses were read
+    query_page_size = 2000
+    max_query_bytes = 32 * 1024 * 1024
 
     def __init__(self):
         self.source = Source.OPEN_SEARCH
@@ -276,8 +280,6 @@ class OpenSearchSourceManager(SourceManager):
                         ]
                     }
                 },
-                "size": limit,
-                "from": offset,
                 "sort": sort
             }
 
@@ -291,28 +293,29 @@ class OpenSearchSourceManager(SourceManager):
                     }
                 })
 
-            result = os_client.query(index, query)
-
-            if 'hits' not in result or not result['hits']['hits']:
+            stats = {}
+            table_rows = [
+                TableResult.TableRow(columns=[TableResult.TableColumn(name=StringValue(value=column),
+                                                                      value=StringValue(value=str(value)))
+                                              for column, value in hit['_source'].items()])
+                for hit in os_client.iter_search_hits(index, query, limit=limit, offset=offset,
+                                                      page_size=self.query_page_size,
+                                                      max_bytes=self.max_query_bytes, stats=stats)
+            ]
+
+            if not table_rows:
                 return PlaybookTaskResult(type=PlaybookTaskResultType.TEXT, text=TextResult(output=StringValue(
                     value=f"No data returned from Open Search for query: {query_dsl} on index: {index}")),
                                           source=self.source)
 
-            hits = result['hits']['hits']
-            total_hits = result['hits']['total']['value']
-            table_rows = []
-            for hit in hits:
-                table_columns = []
-                for column, value in hit['_source'].items():
-                    table_column = TableResult.TableColumn(name=StringValue(value=column),
-                                                           value=StringValue(value=str(value)))
-                    table_columns.append(table_column)
-                table_rows.append(TableResult.TableRow(columns=table_columns))
-
             table = TableResult(raw_query=StringValue(value=f"Execute ```{query_dsl}``` on index {index}"),
-                                total_count=UInt64Value(value=total_hits),
+                                total_count=UInt64Value(value=stats['total']),
                                 rows=table_rows)
-            return PlaybookTaskResult(type=PlaybookTaskResultType.LOGS, logs=table, source=self.source)
+            task_result = PlaybookTaskResult(type=PlaybookTaskResultType.LOGS, logs=table, source=self.source)
+            if stats['truncated']:
+                task_result.metadata.update({'truncated': True, 'returned_rows': stats['hits'],
+                                             'response_bytes': stats['bytes'], 'max_bytes': self.max_query_bytes})
+            return task_result
 
         except Exception as e:
             raise Exception(f"OpenSearchSourceManager.execute_query_logs:: Error while executing OpenSearch task: "
@@ -1,8 +1,10 @@
+import bisect
 import logging
 import random
 import urllib.parse
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
+from concurrent.futures import as_completed
 from datetime import datetime, timezone
 from functools import partial
 
@@ -18,6 +20,7 @@ from core.protos.playbooks.playbook_commons_pb2 import ApiResponseResult, Playbo
 from core.protos.playbooks.source_task_definitions.sentry_task_pb2 import Sentry
 from core.protos.ui_definition_pb2 import FormField, FormFieldType
 from core.utils.credentilal_utils import generate_credentials_dict, get_connector_key_type_string, DISPLAY_NAME, CATEGORY, APPLICATION_MONITORING
+from core.utils.instrumentation_utils import ContextThreadPoolExecutor
 from core.utils.proto_utils import dict_to_proto
 
 logger = logging.getLogger(__name__)
@@ -619,53 +622,71 @@ class SentrySourceManager(SourceManager):
                     metadata=metadata
                 )
 
-            all_events = []
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                process = partial(self.process_issue, time_range=time_range, sentry_processor=sentry_processor, project_slug=project_slug)
-                futures = [executor.submit(process, issue) for issue in issues]
-                for future in as_completed(futures):
-                    all_events.extend(future.result())
+            # Pick the issues to sample from using their event counts, then list events only for those issues
+            issue_slots, total_events = self._plan_event_sample(issues, max_events_to_analyse)
+            issues_by_id = {issue.get('id'): issue for issue in issues}
+            events_by_issue = {}
+            pending_issue_ids = list(issue_slots)
+            while pending_issue_ids:
+                with ContextThreadPoolExecutor(max_workers=10) as executor:
+                    process = partial(self.process_issue, time_range=time_range, sentry_processor=sentry_processor, project_slug=project_slug)
+                    futures = {executor.submit(process, issues_by_id[issue_id]): issue_id for issue_id in pending_issue_ids}
+                    for future in as_completed(futures):
+                        events_by_issue[futures[future]] = future.result()
+                # Event counts are lifetime totals, so an issue may have fewer events in range than slots: hand its
+                # spare slots to listed issues with events left over, then plan them over issues not listed yet
+                issue_slots, leftover_slots = self._redistribute_event_slots(issue_slots, events_by_issue,
+                                                                             max_events_to_analyse)
+                unlisted_issues = [issue for issue in issues if issue.get('id') not in events_by_issue]
+                if leftover_slots <= 0 or not unlisted_issues:
+                    break
+                extra_slots, _ = self._plan_event_sample(unlisted_issues, leftover_slots)
+                issue_slots.update(extra_slots)
+                pending_issue_ids = list(extra_slots)
+
+            issue_event_counts = Counter({issue_id: len(events) for issue_id, events in events_by_issue.items()})
+
+            top_events = []
+            for issue_id, slots in issue_slots.items():
+                issue_events = events_by_issue.get(issue_id, [])
+                top_events.extend(random.sample(issue_events, slots) if len(issue_events) > slots else issue_events)
 
-            # Select 10 random events from the filtered list
-            if len(all_events) > max_events_to_analyse:
-                top_events = random.sample(all_events, max_events_to_analyse)
-            else:
-                top_events = all_events
-                
             # Sort the selected events by timestamp in descending order
             top_events = sorted(top_events, key=lambda x: x.get('dateCreated', ''), reverse=True)
 
             # Create table rows for each event
             table_rows: [TableResult.TableRow] = []
 
-            ## fetch the entire payload of every event, then add the issue_id and respective issue_count in the event.
+            # Fetch the full payload of only the selected events, concurrently, keeping the timestamp order
+            with ContextThreadPoolExecutor(max_workers=10) as executor:
+                event_details_list = list(executor.map(
+                    lambda event: sentry_processor.fetch_event_details(event.get('eventID', ''), project_slug),
+                    top_events))
+
+            ## add the issue_id and respective issue_count in the event.
             events_list = []
-            for event in top_events:
-                # Get event-specific URL
-                event_id = event.get('eventID', '')
-                # Get detailed event information
-                event_details = sentry_processor.fetch_event_details(event_id, project_slug)
+            for event, event_details in zip(top_events, event_details_list):
+                if not event_details:
+                    continue
                 event_details['issue_id'] = event.get('issue_id', '')
-                event_details['issue_count'] = len([e for e in all_events if e.get('issue_id') == event.get('issue_id')])
-
-                # Extract stack trace if available
-                if event_details:
-                    # Look for exception entries
-                    exception_entries = [entry for entry in event_details.get('entries', []) if entry.get('type') == 'exception']
-                    if exception_entries and 'data' in exception_entries[0] and 'values' in exception_entries[0]['data']:
-                        exception_value = exception_entries[0]['data']['values'][0]
-                        stacktrace = exception_value.get('stacktrace')
-                        if stacktrace and isinstance(stacktrace, dict):
-                            frames = stacktrace.get('frames', [])
-                            if frames:
-                                # Iterate over all frames and format them
-                                stack_traces = [
-                                    f"{frame.get('filename', 'Unknown')}:{frame.get('lineno', '?')} in {frame.get('function', 'Unknown')}"
-                                    for frame in frames
-                                ]
-                                # Join all formatted frames into a single string (separated by newline or any delimiter)
-                                full_stack_trace = "\n".join(stack_traces)
-                                event_details['stack_trace'] = full_stack_trace
+                event_details['issue_count'] = issue_event_counts[event.get('issue_id')]
+
+                # Look for exception entries
+                exception_entries = [entry for entry in event_details.get('entries', []) if entry.get('type') == 'exception']
+                if exception_entries and 'data' in exception_entries[0] and 'values' in exception_entries[0]['data']:
+                    exception_value = exception_entries[0]['data']['values'][0]
+                    stacktrace = exception_value.get('stacktrace')
+                    if stacktrace and isinstance(stacktrace, dict):
+                        frames = stacktrace.get('frames', [])
+                        if frames:
+                            # Iterate over all frames and format them
+                            stack_traces = [
+                                f"{frame.get('filename', 'Unknown')}:{frame.get('lineno', '?')} in {frame.get('function', 'Unknown')}"
+                                for frame in frames
+                            ]
+                            # Join all formatted frames into a single string (separated by newline or any delimiter)
+                            full_stack_trace = "\n".join(stack_traces)
+                            event_details['stack_trace'] = full_stack_trace
                 events_list.append(event_details)
 
             # translate the events_list to a table assuming whatever keys in it as the default columns
@@ -683,7 +704,7 @@ class SentrySourceManager(SourceManager):
             # Create the table result
             result = TableResult(
                 raw_query=StringValue(
-                    value=f"Project: {project_slug}, Query: {query}, Total Events: {len(all_events)}, Showing: {len(top_events)} random events since {start_time}"
+                    value=f"Project: {project_slug}, Query: {query}, Total Events: {total_events}, Showing: {len(events_list)} random events since {start_time}"
                 ),
                 rows=table_rows,
                 total_count=UInt64Value(value=len(table_rows))
@@ -728,6 +749,59 @@ class SentrySourceManager(SourceManager):
                 metadata=metadata
             )
 
+    @staticmethod
+    def _plan_event_sample(issues: list, max_events: int):
+        """
+        Decides how many events to sample from each issue before any event is fetched. Events are drawn
+        uniformly across all matching events using the issue event counts (`count`), so busy issues get
+        proportionally more slots. Returns ({issue_id: slots}, total_events).
+        """
+        issue_ids, issue_counts, cumulative_counts = [], [], []
+        total_events = 0
+        for issue in issues:
+            try:
+                count = max(int(issue.get('count') or 1), 1)
+            except (TypeError, ValueError):
+                count = 1
+            total_events += count
+            issue_ids.append(issue.get('id'))
+            issue_counts.append(count)
+            cumulative_counts.append(total_events)
+
+        if total_events <= max_events:
+            return dict(zip(issue_ids, issue_counts)), total_events
+
+        issue_slots = {}
+        for event_index in random.sample(range(total_events), max_events):
+            issue_id = issue_ids[bisect.bisect_right(cumulative_counts, event_index)]
+            issue_slots[issue_id] = issue_slots.get(issue_id, 0) + 1
+        return issue_slots, total_events
+
+    @staticmethod
+    def _redistribute_event_slots(issue_slots: dict, events_by_issue: dict, max_events: int):
+        """
+        Caps the slots of every listed issue (a key of events_by_issue) at its listed events and hands the freed
+        slots to listed issues with events left over, drawing uniformly across those spare events. Returns
+        ({issue_id: slots}, slots still unassigned).
+        """
+        slots = {issue_id: min(count, len(events_by_issue[issue_id])) if issue_id in events_by_issue else count
+                 for issue_id, count in issue_slots.items()}
+        leftover = max_events - sum(slots.values())
+        spare_issue_ids, cumulative_spare = [], []
+        total_spare = 0
+        for issue_id, events in events_by_issue.items():
+            spare = len(events) - slots.get(issue_id, 0)
+            if spare > 0:
+                total_spare += spare
+                spare_issue_ids.append(issue_id)
+                cumulative_spare.append(total_spare)
+        if leftover > 0 and total_spare > 0:
+            for event_index in random.sample(range(total_spare), min(leftover, total_spare)):
+                issue_id = spare_issue_ids[bisect.bisect_right(cumulative_spare, event_index)]
+                slots[issue_id] = slots.get(issue_id, 0) + 1
+            leftover -= min(leftover, total_spare)
+        return slots, leftover
+
     def process_issue(self, issue, time_range, sentry_processor, project_slug):
         issue_id = issue.get('id')
         start_time_dt = datetime.fromtimestamp(time_range.time_geq, tz=timezone.utc)
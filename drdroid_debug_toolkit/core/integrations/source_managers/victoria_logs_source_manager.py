@@ -16,6 +16,9 @@ from core.utils.credentilal_utils import DISPLAY_NAME, CATEGORY, APPLICATION_MON
 
 
 class VictoriaLogsSourceManager(SourceManager):
+    # Budgets for a streamed query result; the connection is closed once either is reached
+    max_query_rows = 10000
+    max_query_bytes = 32 * 1024 * 1024
 
     def __init__(self):
         # Use VICTORIA_METRICS connector type
@@ -137,17 +140,12 @@ class VictoriaLogsSourceManager(SourceManager):
                 "Playbook Task Downstream Request: Type -> {}, Account -> {}, LogsQL -> {}".format(
                     "VictoriaLogs", connector.account_id.value, q), flush=True)
 
-            response = api.query_logsql(q, limit=int(limit) if '| limit' not in q else None,
-                                        start=start_arg, end=end_arg)
-            if not response:
-                return PlaybookTaskResult(
-                    type=PlaybookTaskResultType.TEXT,
-                    text=TextResult(output=StringValue(value=f"No data returned from VictoriaLogs for query: {q}")),
-                    source=self.source
-                )
+            # Rows are converted as the JSON lines stream in, so only the table is held in memory
+            stats = {}
+            rows = [self._item_to_table_row(item) for item in
+                    api.iter_logsql(q, limit=int(limit) if '| limit' not in q else None, start=start_arg, end=end_arg,
+                                    max_rows=self.max_query_rows, max_bytes=self.max_query_bytes, stats=stats)]
 
-            # Normalize into TableResult similar to Loki
-            rows = self._convert_response_to_table_rows(response)
             # Include args used in execution for transparency
             args_desc = []
             if start_arg:
@@ -163,7 +161,12 @@ class VictoriaLogsSourceManager(SourceManager):
                 total_count=UInt64Value(value=len(rows)),
                 rows=rows
             )
-            return PlaybookTaskResult(type=PlaybookTaskResultType.LOGS, logs=table, source=self.source)
+            task_result = PlaybookTaskResult(type=PlaybookTaskResultType.LOGS, logs=table, source=self.source)
+            if stats.get('truncated'):
+                task_result.metadata.update({'truncated': True, 'returned_rows': stats['rows'],
+                                             'response_bytes': stats['bytes'],
+                                             'max_rows': self.max_query_rows, 'max_bytes': self.max_query_bytes})
+            return task_result
         except Exception as e:
             raise Exception(f"Error while executing VictoriaLogs task: {e}")
 
@@ -200,6 +203,18 @@ class VictoriaLogsSourceManager(SourceManager):
         except Exception as e:
             raise Exception(f"Error while executing VictoriaLogs field values task: {e}")
 
+    @staticmethod
+    def _item_to_table_row(item) -> TableResult.TableRow:
+        columns = []
+        if isinstance(item, dict):
+            for k, v in item.items():
+                columns.append(TableResult.TableColumn(name=StringValue(value=str(k)),
+                                                       value=StringValue(value=str(v))))
+        else:
+            columns.append(TableResult.TableColumn(name=StringValue(value='value'),
+                                                   value=StringValue(value=str(item))))
+        return TableResult.TableRow(columns=columns)
+
     def _convert_response_to_table_rows(self, response: dict) -> list[TableResult.TableRow]:
         rows: list[TableResult.TableRow] = []
         if not isinstance(response, dict):
@@ -218,17 +233,7 @@ class VictoriaLogsSourceManager(SourceManager):
             return rows
 
         if isinstance(data, list):
-            for item in data:
-                columns = []
-                if isinstance(item, dict):
-                    for k, v in item.items():
-                        columns.append(TableResult.TableColumn(name=StringValue(value=str(k)),
-                                                               value=StringValue(value=str(v))))
-                else:
-                    columns.append(TableResult.TableColumn(name=StringValue(value='value'),
-                                                           value=StringValue(value=str(item))))
-                rows.append(TableResult.TableRow(columns=columns))
-            return rows
+            return [self._item_to_table_row(item) for item in data]
 
         # Fallback: single row with raw JSON
         columns = [TableResult.TableColumn(name=StringValue(value='raw'),
@@ -68,12 +68,22 @@ class _DefaultSourceMetadataExtractor:
         self.api_token = api_token
         # Store collected data for real-time access
         self._collected_assets = {}
+        # Model uids reported deleted by incremental refreshes
+        self._deleted_assets = {}
 
     @log_function_call
-    def create_or_update_model_metadata(self, model_type, collected_models):
+    def create_or_update_model_metadata(self, model_type, collected_models, incremental=False):
+        """
+        Stores and uploads collected_models; returns False when the upload failed and None when no upload target
+        is configured. With incremental=True
+        collected_models only holds changed models and is merged into the stored ones instead of replacing them.
+        """
         try:
             # Store the collected models for real-time access
-            self._collected_assets[model_type] = collected_models
+            if incremental:
+                self._collected_assets.setdefault(model_type, {}).update(collected_models)
+            else:
+                self._collected_assets[model_type] = collected_models
             
             if not self.api_host or not self.api_token:
                 logger.warning("API host or token not provided, skipping metadata update")
@@ -93,7 +103,7 @@ class _DefaultSourceMetadataExtractor:
                     'metadata': metadata
                 })
                 if len(asset_metadata_models) >= 100:
-                    requests.post(
+                    response = requests.post(
                         f'{drd_cloud_host}/connectors/proxy/connector/metadata/register',
                         headers={'Authorization': f'Bearer {drd_cloud_api_token}'},
                         json={
@@ -104,9 +114,10 @@ class _DefaultSourceMetadataExtractor:
                             'model_type': model_type,
                         },
                     )
+                    response.raise_for_status()
                     asset_metadata_models = []
             if len(asset_metadata_models) > 0:
-                requests.post(
+                response = requests.post(
                     f'{drd_cloud_host}/connectors/proxy/connector/metadata/register',
                     headers={'Authorization': f'Bearer {drd_cloud_api_token}'},
                     json={
@@ -117,8 +128,25 @@ class _DefaultSourceMetadataExtractor:
                         'model_type': model_type,
                     },
                 )
+                response.raise_for_status()
+            return True
         except Exception as e:
             logger.error(f'Error creating or updating model_type: {model_type} with error: {e}')
+            return False
+
+    def delete_model_metadata(self, model_type, model_uids):
+        """Records model uids that an incremental refresh found deleted; hosts override this to propagate them."""
+        self._deleted_assets.setdefault(model_type, []).extend(model_uids)
+        collected_models = self._collected_assets.get(model_type)
+        if collected_models:
+            for model_uid in model_uids:
+                collected_models.pop(model_uid, None)
+        logger.info(f'Recorded {len(model_uids)} deleted models for model_type: {model_type}')
+
+    def get_deleted_assets(self, model_type=None):
+        if model_type is None:
+            return self._deleted_assets
+        return self._deleted_assets.get(model_type, [])
 
     def get_collected_assets(self, model_type=None):
         """
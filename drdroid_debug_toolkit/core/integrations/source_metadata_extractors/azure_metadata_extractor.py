@@ -1,8 +1,13 @@
 import logging
+import threading
 from datetime import datetime
+from functools import partial
 
 from core.integrations.source_metadata_extractor import SourceMetadataExtractor
 from core.integrations.source_api_processors.azure_api_processor import AzureApiProcessor
+from core.integrations.utils.k8s_cluster_utils import K8sClusterContext, run_per_cluster
+from core.integrations.utils.k8s_inventory_sync import InventorySyncCommit, publish_inventory, \
+    sync_k8s_client_inventory
 from core.protos.base_pb2 import Source, SourceModelType
 from core.utils.logging_utils import log_function_call
 
@@ -18,12 +23,54 @@ def _to_isoformat(ts):
     return str(ts)
 
 
+# kind -> (kubernetes API, list method, namespaced)
+AKS_K8S_LISTS = {
+    'namespaces': ('api', 'list_namespace', False),
+    'deployments': ('app', 'list_deployment_for_all_namespaces', True),
+    'services': ('api', 'list_service_for_all_namespaces', True),
+    'ingresses': ('networking', 'list_ingress_for_all_namespaces', True),
+    'hpas': ('autoscaling', 'list_horizontal_pod_autoscaler_for_all_namespaces', True),
+    'statefulsets': ('app', 'list_stateful_set_for_all_namespaces', True),
+    'replicasets': ('app', 'list_replica_set_for_all_namespaces', True),
+    'network_policies': ('networking', 'list_network_policy_for_all_namespaces', True),
+}
+
+
+# ARM types listed in bulk through Resource Graph. Blob containers and PostgreSQL databases are not indexed by
+# Resource Graph and are always listed through the per-service REST calls.
+RESOURCE_GRAPH_RESOURCE_TYPES = (
+    'microsoft.containerservice/managedclusters',
+    'microsoft.compute/virtualmachines',
+    'microsoft.compute/virtualmachinescalesets',
+    'microsoft.storage/storageaccounts',
+    'microsoft.sql/servers',
+    'microsoft.sql/servers/databases',
+    'microsoft.documentdb/databaseaccounts',
+    'microsoft.insights/metricalerts',
+    'microsoft.insights/actiongroups',
+    'microsoft.dbforpostgresql/flexibleservers',
+    'microsoft.cache/redis',
+)
+
+
 class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
+    max_cluster_workers = 4
+    list_page_size = 500
 
     def __init__(self, request_id: str, connector_name: str, subscription_id: str, tenant_id: str, client_id: str,
-                 client_secret: str):
+                 client_secret: str, use_resource_graph: bool = True):
         self.__subscription_id = subscription_id
         self.__client = AzureApiProcessor(subscription_id, tenant_id, client_id, client_secret)
+        # Per-run Resource Graph inventory, see _list_resources
+        self.use_resource_graph = use_resource_graph
+        self._resource_graph_inventory = None
+        self._resource_graph_children = {}
+        self._resource_graph_lock = threading.Lock()
+        # AKS cluster list and one cluster context (credentials, renewed after their ttl) per cluster, shared by
+        # the extract_aks_* methods; cluster objects are listed afresh by every call
+        self._aks_clusters = None
+        self._aks_contexts = {}
+        self._aks_lock = threading.Lock()
         super().__init__(request_id, connector_name, Source.AZURE)
 
     # ==================== Core Azure Resources ====================
@@ -102,13 +149,120 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
             return parts[4]
         return ''
 
+    def _get_resource_graph_inventory(self):
+        """{lower-cased ARM type: [resource]} for RESOURCE_GRAPH_RESOURCE_TYPES, queried once per run; None when
+        Resource Graph is disabled or unavailable."""
+        with self._resource_graph_lock:
+            if self._resource_graph_inventory is None and self.use_resource_graph:
+                self._resource_graph_inventory = self.__client.resource_graph_list_resources(
+                    list(RESOURCE_GRAPH_RESOURCE_TYPES))
+                if self._resource_graph_inventory is None:
+                    logger.warning("Resource Graph inventory unavailable, falling back to per-service REST listing")
+                    self.use_resource_graph = False
+            return self._resource_graph_inventory
+
+    def _list_resources(self, resource_type, list_from_rest):
+        """Resources of an ARM type from the Resource Graph inventory, or from the per-service REST call."""
+        inventory = self._get_resource_graph_inventory()
+        if inventory is not None:
+            return inventory.get(resource_type, [])
+        return list_from_rest()
+
+    def _list_child_resources(self, resource_type, resource_group, parent_name, list_from_rest):
+        """
+        Child resources (e.g. SQL databases) of one parent. Served from the Resource Graph inventory, grouped by
+        parent once, instead of one REST call per parent.
+        """
+        inventory = self._get_resource_graph_inventory()
+        if inventory is None:
+            return list_from_rest(resource_group, parent_name)
+        with self._resource_graph_lock:
+            if resource_type not in self._resource_graph_children:
+                children = {}
+                for resource in inventory.get(resource_type, []):
+                    parts = resource.get('id', '').split('/')
+                    if len(parts) < 4:
+                        continue
+                    parent_key = (self._extract_resource_group_from_id(resource['id']).lower(), parts[-3].lower())
+                    children.setdefault(parent_key, []).append(resource)
+                self._resource_graph_children[resource_type] = children
+            return self._resource_graph_children[resource_type].get((resource_group.lower(), parent_name.lower()), [])
+
+    def _get_aks_clusters(self):
+        """AKS clusters of the subscription, listed once per run."""
+        with self._aks_lock:
+            if self._aks_clusters is None:
+                self._aks_clusters = self._list_resources('microsoft.containerservice/managedclusters',
+                                                          self.__client.aks_list_clusters)
+            return self._aks_clusters
+
+    def _get_aks_contexts(self):
+        """A K8sClusterContext per AKS cluster, reused across kinds so one set of credentials serves them all."""
+        clusters = self._get_aks_clusters() or []
+        with self._aks_lock:
+            contexts = []
+            for cluster in clusters:
+                cluster_name = cluster.get('name', '')
+                resource_group = self._extract_resource_group_from_id(cluster.get('id', ''))
+                context = self._aks_contexts.get((resource_group, cluster_name))
+                if context is None:
+                    context = K8sClusterContext(
+                        cluster_name, partial(self.__client.aks_get_api_client, resource_group, cluster_name),
+                        resource_group=resource_group)
+                    self._aks_contexts[(resource_group, cluster_name)] = context
+                contexts.append(context)
+            return contexts
+
+    def _list_aks_kind(self, kind):
+        """
+        {(resource group, cluster name): (objects as dicts, deleted model uids, InventorySyncCommit)} of kind for
+        every AKS cluster, clusters fetched concurrently. Only the requested kind is synced, so each extract_aks_*
+        call commits the state of exactly the objects it uploaded.
+        """
+        def fetch(context):
+            return (context.resource_group, context.name), self._fetch_aks_objects(context, kind)
+
+        return dict(run_per_cluster(self._get_aks_contexts(), fetch, max_workers=self.max_cluster_workers,
+                                    description=f'AKS {kind}'))
+
+    def _fetch_aks_objects(self, context, kind):
+        """
+        (objects as dicts, deleted model uids, InventorySyncCommit) of kind in an AKS cluster. With a Kubernetes
+        inventory state store configured only objects changed since the previous committed run are returned;
+        otherwise every object.
+        """
+        client, list_method, namespaced = AKS_K8S_LISTS[kind]
+        api = context.get_api_instance(client)
+        if api is None:
+            raise Exception(f"Could not get credentials for AKS cluster {context.name}")
+        cluster_name = context.name
+
+        def model_uid(item):
+            if not item.metadata or not item.metadata.name:
+                return None
+            if namespaced:
+                return f"{cluster_name}/{item.metadata.namespace or ''}/{item.metadata.name}"
+            return f"{cluster_name}/{item.metadata.name}"
+
+        changed, deleted, commit = sync_k8s_client_inventory(
+            f"{self.connector_name}/aks/{context.resource_group}/{cluster_name}/{kind}", getattr(api, list_method),
+            model_uid, limit=self.list_page_size)
+        return [item.to_dict() for item in changed.values()], deleted, commit
+
+    @staticmethod
+    def _list_aks_objects(inventory, resource_group: str, cluster_name: str):
+        """(objects, deleted model uids, InventorySyncCommit) of a cluster in a _list_aks_kind result; (None, [],
+        no-op commit) if the cluster could not be listed."""
+        objects = inventory.get((resource_group, cluster_name))
+        return objects if objects is not None else (None, [], InventorySyncCommit())
+
     @log_function_call
     def extract_aks_clusters(self):
         """Extract all AKS clusters."""
         model_type = SourceModelType.AZURE_AKS_CLUSTER
         model_data = {}
         try:
-            clusters = self.__client.aks_list_clusters()
+            clusters = self._get_aks_clusters()
             if not clusters:
                 return model_data
             for cluster in clusters:
@@ -143,17 +297,22 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         """Extract namespaces from all AKS clusters."""
         model_type = SourceModelType.AZURE_AKS_NAMESPACE
         model_data = {}
+        deleted_uids = []
+        commits = []
         try:
-            clusters = self.__client.aks_list_clusters()
+            clusters = self._get_aks_clusters()
             if not clusters:
                 return model_data
+            inventory = self._list_aks_kind('namespaces')
 
             for cluster in clusters:
                 cluster_name = cluster.get('name', '')
                 resource_group = self._extract_resource_group_from_id(cluster.get('id', ''))
 
                 try:
-                    namespaces = self.__client.aks_list_namespaces(resource_group, cluster_name)
+                    namespaces, deleted, commit = self._list_aks_objects(inventory, resource_group, cluster_name)
+                    deleted_uids.extend(deleted)
+                    commits.append(commit)
                     if not namespaces:
                         continue
 
@@ -180,8 +339,7 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         except Exception as e:
             logger.error(f'Error extracting AKS namespaces: {e}')
 
-        if model_data:
-            self.create_or_update_model_metadata(model_type, model_data)
+        publish_inventory(self, model_type, model_data, deleted_uids, commits)
         return model_data
 
     @log_function_call
@@ -189,17 +347,22 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         """Extract deployments from all AKS clusters."""
         model_type = SourceModelType.AZURE_AKS_DEPLOYMENT
         model_data = {}
+        deleted_uids = []
+        commits = []
         try:
-            clusters = self.__client.aks_list_clusters()
+            clusters = self._get_aks_clusters()
             if not clusters:
                 return model_data
+            inventory = self._list_aks_kind('deployments')
 
             for cluster in clusters:
                 cluster_name = cluster.get('name', '')
                 resource_group = self._extract_resource_group_from_id(cluster.get('id', ''))
 
                 try:
-                    deployments = self.__client.aks_list_deployments(resource_group, cluster_name)
+                    deployments, deleted, commit = self._list_aks_objects(inventory, resource_group, cluster_name)
+                    deleted_uids.extend(deleted)
+                    commits.append(commit)
                     if not deployments:
                         continue
 
@@ -239,8 +402,7 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         except Exception as e:
             logger.error(f'Error extracting AKS deployments: {e}')
 
-        if model_data:
-            self.create_or_update_model_metadata(model_type, model_data)
+        publish_inventory(self, model_type, model_data, deleted_uids, commits)
         return model_data
 
     @log_function_call
@@ -248,17 +410,22 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         """Extract services from all AKS clusters."""
         model_type = SourceModelType.AZURE_AKS_SERVICE
         model_data = {}
+        deleted_uids = []
+        commits = []
         try:
-            clusters = self.__client.aks_list_clusters()
+            clusters = self._get_aks_clusters()
             if not clusters:
                 return model_data
+            inventory = self._list_aks_kind('services')
 
             for cluster in clusters:
                 cluster_name = cluster.get('name', '')
                 resource_group = self._extract_resource_group_from_id(cluster.get('id', ''))
 
                 try:
-                    services = self.__client.aks_list_services(resource_group, cluster_name)
+                    services, deleted, commit = self._list_aks_objects(inventory, resource_group, cluster_name)
+                    deleted_uids.extend(deleted)
+                    commits.append(commit)
                     if not services:
                         continue
 
@@ -295,8 +462,7 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         except Exception as e:
             logger.error(f'Error extracting AKS services: {e}')
 
-        if model_data:
-            self.create_or_update_model_metadata(model_type, model_data)
+        publish_inventory(self, model_type, model_data, deleted_uids, commits)
         return model_data
 
     @log_function_call
@@ -304,17 +470,22 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         """Extract ingresses from all AKS clusters."""
         model_type = SourceModelType.AZURE_AKS_INGRESS
         model_data = {}
+        deleted_uids = []
+        commits = []
         try:
-            clusters = self.__client.aks_list_clusters()
+            clusters = self._get_aks_clusters()
             if not clusters:
                 return model_data
+            inventory = self._list_aks_kind('ingresses')
 
             for cluster in clusters:
                 cluster_name = cluster.get('name', '')
                 resource_group = self._extract_resource_group_from_id(cluster.get('id', ''))
 
                 try:
-                    ingresses = self.__client.aks_list_ingresses(resource_group, cluster_name)
+                    ingresses, deleted, commit = self._list_aks_objects(inventory, resource_group, cluster_name)
+                    deleted_uids.extend(deleted)
+                    commits.append(commit)
                     if not ingresses:
                         continue
 
@@ -350,8 +521,7 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         except Exception as e:
             logger.error(f'Error extracting AKS ingresses: {e}')
 
-        if model_data:
-            self.create_or_update_model_metadata(model_type, model_data)
+        publish_inventory(self, model_type, model_data, deleted_uids, commits)
         return model_data
 
     @log_function_call
@@ -359,17 +529,22 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         """Extract horizontal pod autoscalers from all AKS clusters."""
         model_type = SourceModelType.AZURE_AKS_HPA
         model_data = {}
+        deleted_uids = []
+        commits = []
         try:
-            clusters = self.__client.aks_list_clusters()
+            clusters = self._get_aks_clusters()
             if not clusters:
                 return model_data
+            inventory = self._list_aks_kind('hpas')
 
             for cluster in clusters:
                 cluster_name = cluster.get('name', '')
                 resource_group = self._extract_resource_group_from_id(cluster.get('id', ''))
 
                 try:
-                    hpas = self.__client.aks_list_hpas(resource_group, cluster_name)
+                    hpas, deleted, commit = self._list_aks_objects(inventory, resource_group, cluster_name)
+                    deleted_uids.extend(deleted)
+                    commits.append(commit)
                     if not hpas:
                         continue
 
@@ -411,8 +586,7 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         except Exception as e:
             logger.error(f'Error extracting AKS HPAs: {e}')
 
-        if model_data:
-            self.create_or_update_model_metadata(model_type, model_data)
+        publish_inventory(self, model_type, model_data, deleted_uids, commits)
         return model_data
 
     @log_function_call
@@ -420,17 +594,22 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         """Extract stateful sets from all AKS clusters."""
         model_type = SourceModelType.AZURE_AKS_STATEFULSET
         model_data = {}
+        deleted_uids = []
+        commits = []
         try:
-            clusters = self.__client.aks_list_clusters()
+            clusters = self._get_aks_clusters()
             if not clusters:
                 return model_data
+            inventory = self._list_aks_kind('statefulsets')
 
             for cluster in clusters:
                 cluster_name = cluster.get('name', '')
                 resource_group = self._extract_resource_group_from_id(cluster.get('id', ''))
 
                 try:
-                    statefulsets = self.__client.aks_list_statefulsets(resource_group, cluster_name)
+                    statefulsets, deleted, commit = self._list_aks_objects(inventory, resource_group, cluster_name)
+                    deleted_uids.extend(deleted)
+                    commits.append(commit)
                     if not statefulsets:
                         continue
 
@@ -471,8 +650,7 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         except Exception as e:
             logger.error(f'Error extracting AKS StatefulSets: {e}')
 
-        if model_data:
-            self.create_or_update_model_metadata(model_type, model_data)
+        publish_inventory(self, model_type, model_data, deleted_uids, commits)
         return model_data
 
     @log_function_call
@@ -480,17 +658,22 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         """Extract replica sets from all AKS clusters."""
         model_type = SourceModelType.AZURE_AKS_REPLICASET
         model_data = {}
+        deleted_uids = []
+        commits = []
         try:
-            clusters = self.__client.aks_list_clusters()
+            clusters = self._get_aks_clusters()
             if not clusters:
                 return model_data
+            inventory = self._list_aks_kind('replicasets')
 
             for cluster in clusters:
                 cluster_name = cluster.get('name', '')
                 resource_group = self._extract_resource_group_from_id(cluster.get('id', ''))
 
                 try:
-                    replicasets = self.__client.aks_list_replicasets(resource_group, cluster_name)
+                    replicasets, deleted, commit = self._list_aks_objects(inventory, resource_group, cluster_name)
+                    deleted_uids.extend(deleted)
+                    commits.append(commit)
                     if not replicasets:
                         continue
 
@@ -531,8 +714,7 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         except Exception as e:
             logger.error(f'Error extracting AKS ReplicaSets: {e}')
 
-        if model_data:
-            self.create_or_update_model_metadata(model_type, model_data)
+        publish_inventory(self, model_type, model_data, deleted_uids, commits)
         return model_data
 
     @log_function_call
@@ -540,17 +722,22 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         """Extract network policies from all AKS clusters."""
         model_type = SourceModelType.AZURE_AKS_NETWORK_POLICY
         model_data = {}
+        deleted_uids = []
+        commits = []
         try:
-            clusters = self.__client.aks_list_clusters()
+            clusters = self._get_aks_clusters()
             if not clusters:
                 return model_data
+            inventory = self._list_aks_kind('network_policies')
 
             for cluster in clusters:
                 cluster_name = cluster.get('name', '')
                 resource_group = self._extract_resource_group_from_id(cluster.get('id', ''))
 
                 try:
-                    policies = self.__client.aks_list_network_policies(resource_group, cluster_name)
+                    policies, deleted, commit = self._list_aks_objects(inventory, resource_group, cluster_name)
+                    deleted_uids.extend(deleted)
+                    commits.append(commit)
                     if not policies:
                         continue
 
@@ -586,8 +773,7 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         except Exception as e:
             logger.error(f'Error extracting AKS NetworkPolicies: {e}')
 
-        if model_data:
-            self.create_or_update_model_metadata(model_type, model_data)
+        publish_inventory(self, model_type, model_data, deleted_uids, commits)
         return model_data
 
     # ==================== Azure Compute (VMs) ====================
@@ -598,7 +784,7 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         model_type = SourceModelType.AZURE_VIRTUAL_MACHINE
         model_data = {}
         try:
-            vms = self.__client.compute_list_vms()
+            vms = self._list_resources('microsoft.compute/virtualmachines', self.__client.compute_list_vms)
             if not vms:
                 return model_data
             for vm in vms:
@@ -634,7 +820,8 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         model_type = SourceModelType.AZURE_VMSS
         model_data = {}
         try:
-            vmss_list = self.__client.compute_list_vmss()
+            vmss_list = self._list_resources('microsoft.compute/virtualmachinescalesets',
+                                             self.__client.compute_list_vmss)
             if not vmss_list:
                 return model_data
             for vmss in vmss_list:
@@ -669,7 +856,8 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         model_type = SourceModelType.AZURE_STORAGE_ACCOUNT
         model_data = {}
         try:
-            accounts = self.__client.storage_list_accounts()
+            accounts = self._list_resources('microsoft.storage/storageaccounts',
+                                            self.__client.storage_list_accounts)
             if not accounts:
                 return model_data
             for account in accounts:
@@ -711,7 +899,8 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         model_data = {}
         try:
             # First get all storage accounts
-            accounts = self.__client.storage_list_accounts()
+            accounts = self._list_resources('microsoft.storage/storageaccounts',
+                                            self.__client.storage_list_accounts)
             if not accounts:
                 return model_data
 
@@ -759,7 +948,7 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         model_type = SourceModelType.AZURE_SQL_SERVER
         model_data = {}
         try:
-            servers = self.__client.sql_list_servers()
+            servers = self._list_resources('microsoft.sql/servers', self.__client.sql_list_servers)
             if not servers:
                 return model_data
             for server in servers:
@@ -790,7 +979,7 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         model_type = SourceModelType.AZURE_SQL_DATABASE
         model_data = {}
         try:
-            servers = self.__client.sql_list_servers()
+            servers = self._list_resources('microsoft.sql/servers', self.__client.sql_list_servers)
             if not servers:
                 return model_data
 
@@ -799,7 +988,8 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
                 resource_group = self._extract_resource_group_from_id(server.get('id', ''))
 
                 try:
-                    databases = self.__client.sql_list_databases(resource_group, server_name)
+                    databases = self._list_child_resources('microsoft.sql/servers/databases', resource_group,
+                                                           server_name, self.__client.sql_list_databases)
                     if not databases:
                         continue
 
@@ -839,7 +1029,8 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         model_type = SourceModelType.AZURE_COSMOS_ACCOUNT
         model_data = {}
         try:
-            accounts = self.__client.cosmos_list_accounts()
+            accounts = self._list_resources('microsoft.documentdb/databaseaccounts',
+                                            self.__client.cosmos_list_accounts)
             if not accounts:
                 return model_data
             for account in accounts:
@@ -873,7 +1064,8 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         model_type = SourceModelType.AZURE_METRIC_ALERT
         model_data = {}
         try:
-            alerts = self.__client.monitor_list_metric_alerts()
+            alerts = self._list_resources('microsoft.insights/metricalerts',
+                                          self.__client.monitor_list_metric_alerts)
             if not alerts:
                 return model_data
             for alert in alerts:
@@ -906,7 +1098,8 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         model_type = SourceModelType.AZURE_ACTION_GROUP
         model_data = {}
         try:
-            groups = self.__client.monitor_list_action_groups()
+            groups = self._list_resources('microsoft.insights/actiongroups',
+                                          self.__client.monitor_list_action_groups)
             if not groups:
                 return model_data
             for group in groups:
@@ -940,7 +1133,8 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         model_type = SourceModelType.AZURE_POSTGRES_SERVER
         model_data = {}
         try:
-            servers = self.__client.postgres_flexible_list_servers()
+            servers = self._list_resources('microsoft.dbforpostgresql/flexibleservers',
+                                           self.__client.postgres_flexible_list_servers)
             if not servers:
                 return model_data
             for server in servers:
@@ -977,7 +1171,8 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         model_type = SourceModelType.AZURE_POSTGRES_DATABASE
         model_data = {}
         try:
-            servers = self.__client.postgres_flexible_list_servers()
+            servers = self._list_resources('microsoft.dbforpostgresql/flexibleservers',
+                                           self.__client.postgres_flexible_list_servers)
             if not servers:
                 return model_data
 
@@ -1019,7 +1214,7 @@ class AzureConnectorMetadataExtractor(SourceMetadataExtractor):
         model_type = SourceModelType.AZURE_REDIS_CACHE
         model_data = {}
         try:
-            caches = self.__client.redis_list_caches()
+            caches = self._list_resources('microsoft.cache/redis', self.__client.redis_list_caches)
             if not caches:
                 return model_data
             for cache in caches:
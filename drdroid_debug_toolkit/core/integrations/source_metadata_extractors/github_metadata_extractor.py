@@ -4,6 +4,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from core.integrations.source_metadata_extractor import SourceMetadataExtractor
 from core.integrations.source_api_processors.github_api_processor import GithubAPIProcessor
 from core.protos.base_pb2 import Source, SourceModelType
+from core.utils.instrumentation_utils import ContextThreadPoolExecutor
 from core.utils.logging_utils import log_function_call
 
 logger = logging.getLogger(__name__)
@@ -11,16 +12,62 @@ logger = logging.getLogger(__name__)
 
 class GithubSourceMetadataExtractor(SourceMetadataExtractor):
 
-    def __init__(self, request_id, connector_name, api_key, org):
+    def __init__(self, request_id, connector_name, api_key, org, use_graphql=True, graphql_page_size=50):
         self.org = org
         self.gh_processor = GithubAPIProcessor(api_key, org)
+        # GraphQL returns README, languages and recent commits ~50 repos per call instead of one REST call per
+        # README; the REST path is kept as fallback for tokens/orgs where GraphQL is unavailable.
+        self.use_graphql = use_graphql
+        self.graphql_page_size = graphql_page_size
         super().__init__(request_id, connector_name, Source.GITHUB)
 
+    def _extract_repos_graphql(self):
+        graphql_repos = self.gh_processor.list_all_repos_graphql(page_size=self.graphql_page_size)
+        if graphql_repos is None:
+            return None
+        # GraphQL lacks most REST repository fields (owner, clone_url, visibility, size, ...); the REST listing
+        # (100 repos per call) keeps the stored schema and GraphQL adds README, languages and recent commits
+        rest_repos = self.gh_processor.list_all_repos()
+        if not rest_repos:
+            return None
+        graphql_repos = {repo['name']: repo for repo in graphql_repos}
+        repos = []
+        for rest_repo in rest_repos:
+            graphql_repo = graphql_repos.get(rest_repo['name'])
+            repos.append({**graphql_repo, **rest_repo} if graphql_repo else {**rest_repo, 'readme_needs_rest': True})
+        rest_readme_repos = [repo for repo in repos if repo.pop('readme_needs_rest', False)]
+        logger.info(f'📦 Found {len(repos)} repositories via GraphQL, {len(rest_readme_repos)} README(s) need REST')
+        if rest_readme_repos:
+            def fetch_readme(repo):
+                try:
+                    readme_content = self.gh_processor.fetch_readme_content(repo['name'])
+                    if readme_content:
+                        repo['readme'] = readme_content
+                except Exception as e:
+                    logger.error(f'Error fetching README for repo {repo["name"]}: {e}')
+
+            with ContextThreadPoolExecutor(max_workers=10) as executor:
+                list(executor.map(fetch_readme, rest_readme_repos))
+        return {repo['name']: repo for repo in repos}
+
     @log_function_call
     def extract_repos(self):
         model_data = {}
         model_type = SourceModelType.GITHUB_REPOSITORY
 
+        if self.use_graphql:
+            try:
+                model_data = self._extract_repos_graphql()
+            except Exception as e:
+                logger.error(f'Error extracting Github repositories via GraphQL: {e}')
+                model_data = None
+            if model_data is not None:
+                if len(model_data) > 0:
+                    self.create_or_update_model_metadata(model_type, model_data)
+                return
+            logger.info('GraphQL repository extraction unavailable, falling back to REST')
+            model_data = {}
+
         try:
             repos = self.gh_processor.list_all_repos()
             if not repos:
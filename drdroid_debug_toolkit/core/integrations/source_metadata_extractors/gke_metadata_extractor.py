@@ -1,19 +1,27 @@
 import logging
+from functools import partial
+
 from core.integrations.source_metadata_extractor import SourceMetadataExtractor
 from core.integrations.source_api_processors.gke_api_processor import GkeApiProcessor
 from core.integrations.source_api_processors.gcp_api_processor import GcpApiProcessor
+from core.integrations.utils.k8s_cluster_utils import K8sClusterContext, run_per_cluster
+from core.integrations.utils.k8s_inventory_sync import publish_inventory, sync_k8s_client_inventory
 from core.protos.base_pb2 import Source, SourceModelType
 from core.utils.logging_utils import log_function_call
 
 logger = logging.getLogger(__name__)
 
 class GkeSourceMetadataExtractor(SourceMetadataExtractor):
+    # Clusters listed concurrently and objects requested per list call
+    max_cluster_workers = 4
+    list_page_size = 500
 
     def __init__(self, request_id: str, connector_name: str, project_id, service_account_json):
         self.__project_id = project_id
         self.__service_account_json = service_account_json
         self.gke_api_processor = GkeApiProcessor(self.__project_id, self.__service_account_json)
         self.gcp_api_processor = GcpApiProcessor(self.__project_id, self.__service_account_json)
+        self._cluster_contexts = None
         super().__init__(request_id, connector_name, Source.GKE)
 
     @staticmethod
@@ -71,543 +79,111 @@ class GkeSourceMetadataExtractor(SourceMetadataExtractor):
             logger.error(f"Exception in GKE extract_clusters method: {str(e)}")
             raise
 
-    @log_function_call
-    def extract_namespaces(self):
-        try:
-            model_data = {}
-            model_type = SourceModelType.GKE_NAMESPACE
-            
-            clusters = self.gke_api_processor.list_clusters()
-            if not clusters:
-                return model_data
-            
+    def _get_cluster_contexts(self):
+        """Clusters of the project, resolved once per extraction run and shared by all extract_* methods."""
+        if self._cluster_contexts is None:
+            clusters = self.gke_api_processor.list_clusters() or []
+            self._cluster_contexts = []
             for cluster in clusters:
                 zone = cluster.get('zone', 'us-central1-a')
                 cluster_name = cluster.get('name')
-                
                 if not cluster_name:
                     continue
-                
-                try:
-                    namespaces_response = self.gke_api_processor.list_namespaces(zone, cluster_name)
-                    namespaces_dict = namespaces_response.to_dict()
-                    
-                    for item in namespaces_dict.get('items', []):
-                        metadata = item.get('metadata', {})
-                        namespace_name = metadata.get('name')
-                        
-                        if not namespace_name:
-                            continue
-                        
-                        # Use zone/cluster/namespace as the unique identifier
-                        namespaced_name = f"{zone}/{cluster_name}/{namespace_name}"
-                        
-                        # Add cluster and zone context to the item
-                        item['gke_context'] = {
-                            'zone': zone,
-                            'cluster': cluster_name
-                        }
-                        
-                        model_data[namespaced_name] = item
-                        
-                        sanitized_item = self._sanitize_metadata(item)
-                        model_data[namespaced_name] = sanitized_item
-                                
-                except Exception as e:
-                    logger.error(f"Error extracting namespaces for cluster {cluster_name} in zone {zone}: {str(e)}")
-                    continue
-            
-            logger.info(f"Extracted {len(model_data)} namespaces from GKE clusters")
-            if len(model_data) > 0:
-                self.create_or_update_model_metadata(model_type, model_data)
+                self._cluster_contexts.append(
+                    K8sClusterContext(cluster_name, partial(self.gke_api_processor.get_api_client, zone, cluster_name),
+                                      zone=zone))
+        return self._cluster_contexts
+
+    def _extract_cluster_resources(self, model_type, resource_name, client, list_method, namespaced=True):
+        """
+        Lists one resource kind across all namespaces of every cluster (`list_*_for_all_namespaces`, chunked with
+        limit/_continue), clusters in parallel, and uploads the result keyed by zone/cluster[/namespace]/name.
+        With an inventory state store configured only objects changed since the previous run are uploaded.
+        """
+        model_data = {}
+        deleted_uids = []
+        commits = []
+
+        def extract_cluster(context):
+            api_instance = context.get_api_instance(client)
+
+            def model_uid(k8s_item):
+                if not k8s_item.metadata or not k8s_item.metadata.name:
+                    return None
+                # Use zone/cluster/namespace/name as the unique identifier
+                if namespaced:
+                    return f"{context.zone}/{context.name}/{k8s_item.metadata.namespace}/{k8s_item.metadata.name}"
+                return f"{context.zone}/{context.name}/{k8s_item.metadata.name}"
+
+            k8s_items, deleted, commit = sync_k8s_client_inventory(
+                f"{self.connector_name}/gke/{context.zone}/{context.name}/{list_method}",
+                getattr(api_instance, list_method), model_uid, limit=self.list_page_size)
+            cluster_data = {}
+            for uid, k8s_item in k8s_items.items():
+                item = k8s_item.to_dict()
+                # Add cluster and zone context to the item
+                item['gke_context'] = {
+                    'zone': context.zone,
+                    'cluster': context.name
+                }
+                cluster_data[uid] = self._sanitize_metadata(item)
+            return cluster_data, deleted, commit
+
+        try:
+            for cluster_data, cluster_deleted, commit in run_per_cluster(self._get_cluster_contexts(), extract_cluster,
+                                                                 max_workers=self.max_cluster_workers,
+                                                                 description=resource_name):
+                model_data.update(cluster_data)
+                deleted_uids.extend(cluster_deleted)
+                commits.append(commit)
+
+            logger.info(f"Extracted {len(model_data)} {resource_name} from GKE clusters")
+            publish_inventory(self, model_type, model_data, deleted_uids, commits)
             return model_data
-            
+
         except Exception as e:
-            logger.error(f"Exception in GKE extract_namespaces method: {str(e)}")
+            logger.error(f"Exception in GKE extract {resource_name} method: {str(e)}")
             raise
 
+    @log_function_call
+    def extract_namespaces(self):
+        return self._extract_cluster_resources(SourceModelType.GKE_NAMESPACE, 'namespaces', 'api', 'list_namespace',
+                                               namespaced=False)
+
     @log_function_call
     def extract_services(self, save_to_db=True):
-        try:
-            model_data = {}
-            model_type = SourceModelType.GKE_SERVICE
-            
-            clusters = self.gke_api_processor.list_clusters()
-            if not clusters:
-                return model_data
-            
-            for cluster in clusters:
-                zone = cluster.get('zone', 'us-central1-a')
-                cluster_name = cluster.get('name')
-                
-                if not cluster_name:
-                    continue
-                
-                try:
-                    # Get namespaces first
-                    namespaces_response = self.gke_api_processor.list_namespaces(zone, cluster_name)
-                    namespaces_dict = namespaces_response.to_dict()
-                    
-                    for ns_item in namespaces_dict.get('items', []):
-                        namespace_name = ns_item.get('metadata', {}).get('name')
-                        if not namespace_name:
-                            continue
-                        
-                        try:
-                            services_response = self.gke_api_processor.list_services(zone, cluster_name, namespace_name)
-                            services_dict = services_response.to_dict()
-                            
-                            for item in services_dict.get('items', []):
-                                metadata = item.get('metadata', {})
-                                service_name = metadata.get('name')
-                                
-                                if not service_name:
-                                    continue
-                                
-                                # Use zone/cluster/namespace/service as the unique identifier
-                                namespaced_name = f"{zone}/{cluster_name}/{namespace_name}/{service_name}"
-                                
-                                # Add cluster and zone context to the item
-                                item['gke_context'] = {
-                                    'zone': zone,
-                                    'cluster': cluster_name
-                                }
-                                
-                                model_data[namespaced_name] = item
-                                
-                                sanitized_item = self._sanitize_metadata(item)
-                                model_data[namespaced_name] = sanitized_item
-                                        
-                        except Exception as e:
-                            logger.error(f"Error extracting services for namespace {namespace_name} in cluster {cluster_name}: {str(e)}")
-                            continue
-                            
-                except Exception as e:
-                    logger.error(f"Error extracting services for cluster {cluster_name} in zone {zone}: {str(e)}")
-                    continue
-            
-            logger.info(f"Extracted {len(model_data)} services from GKE clusters")
-            if len(model_data) > 0:
-                self.create_or_update_model_metadata(model_type, model_data)
-            return model_data
-            
-        except Exception as e:
-            logger.error(f"Exception in GKE extract_services method: {str(e)}")
-            raise
+        return self._extract_cluster_resources(SourceModelType.GKE_SERVICE, 'services', 'api',
+                                               'list_service_for_all_namespaces')
 
     @log_function_call
     def extract_deployments(self):
-        try:
-            model_data = {}
-            model_type = SourceModelType.GKE_DEPLOYMENT
-            
-            clusters = self.gke_api_processor.list_clusters()
-            if not clusters:
-                return model_data
-            
-            for cluster in clusters:
-                zone = cluster.get('zone', 'us-central1-a')
-                cluster_name = cluster.get('name')
-                
-                if not cluster_name:
-                    continue
-                
-                try:
-                    # Get namespaces first
-                    namespaces_response = self.gke_api_processor.list_namespaces(zone, cluster_name)
-                    namespaces_dict = namespaces_response.to_dict()
-                    
-                    for ns_item in namespaces_dict.get('items', []):
-                        namespace_name = ns_item.get('metadata', {}).get('name')
-                        if not namespace_name:
-                            continue
-                        
-                        try:
-                            deployments_response = self.gke_api_processor.list_deployments(zone, cluster_name, namespace_name)
-                            deployments_dict = deployments_response.to_dict()
-                            
-                            for item in deployments_dict.get('items', []):
-                                metadata = item.get('metadata', {})
-                                deployment_name = metadata.get('name')
-                                
-                                if not deployment_name:
-                                    continue
-                                
-                                # Use zone/cluster/namespace/deployment as the unique identifier
-                                namespaced_name = f"{zone}/{cluster_name}/{namespace_name}/{deployment_name}"
-                                
-                                # Add cluster and zone context to the item
-                                item['gke_context'] = {
-                                    'zone': zone,
-                                    'cluster': cluster_name
-                                }
-                                
-                                model_data[namespaced_name] = item
-                                
-                                sanitized_item = self._sanitize_metadata(item)
-                                model_data[namespaced_name] = sanitized_item
-                                        
-                        except Exception as e:
-                            logger.error(f"Error extracting deployments for namespace {namespace_name} in cluster {cluster_name}: {str(e)}")
-                            continue
-                            
-                except Exception as e:
-                    logger.error(f"Error extracting deployments for cluster {cluster_name} in zone {zone}: {str(e)}")
-                    continue
-            
-            logger.info(f"Extracted {len(model_data)} deployments from GKE clusters")
-            if len(model_data) > 0:
-                self.create_or_update_model_metadata(model_type, model_data)
-            return model_data
-            
-        except Exception as e:
-            logger.error(f"Exception in GKE extract_deployments method: {str(e)}")
-            raise
+        return self._extract_cluster_resources(SourceModelType.GKE_DEPLOYMENT, 'deployments', 'app',
+                                               'list_deployment_for_all_namespaces')
 
     @log_function_call
     def extract_ingresses(self, save_to_db=True):
-        try:
-            model_data = {}
-            model_type = SourceModelType.GKE_INGRESS
-            
-            clusters = self.gke_api_processor.list_clusters()
-            if not clusters:
-                return model_data
-            
-            for cluster in clusters:
-                zone = cluster.get('zone', 'us-central1-a')
-                cluster_name = cluster.get('name')
-                
-                if not cluster_name:
-                    continue
-                
-                try:
-                    # Get namespaces first
-                    namespaces_response = self.gke_api_processor.list_namespaces(zone, cluster_name)
-                    namespaces_dict = namespaces_response.to_dict()
-                    
-                    for ns_item in namespaces_dict.get('items', []):
-                        namespace_name = ns_item.get('metadata', {}).get('name')
-                        if not namespace_name:
-                            continue
-                        
-                        try:
-                            ingresses_response = self.gke_api_processor.list_ingresses(zone, cluster_name, namespace_name)
-                            ingresses_dict = ingresses_response.to_dict()
-                            
-                            for item in ingresses_dict.get('items', []):
-                                metadata = item.get('metadata', {})
-                                ingress_name = metadata.get('name')
-                                
-                                if not ingress_name:
-                                    continue
-                                
-                                # Use zone/cluster/namespace/ingress as the unique identifier
-                                namespaced_name = f"{zone}/{cluster_name}/{namespace_name}/{ingress_name}"
-                                
-                                # Add cluster and zone context to the item
-                                item['gke_context'] = {
-                                    'zone': zone,
-                                    'cluster': cluster_name
-                                }
-                                
-                                model_data[namespaced_name] = item
-                                
-                                sanitized_item = self._sanitize_metadata(item)
-                                model_data[namespaced_name] = sanitized_item
-                                        
-                        except Exception as e:
-                            logger.error(f"Error extracting ingresses for namespace {namespace_name} in cluster {cluster_name}: {str(e)}")
-                            continue
-                            
-                except Exception as e:
-                    logger.error(f"Error extracting ingresses for cluster {cluster_name} in zone {zone}: {str(e)}")
-                    continue
-            
-            logger.info(f"Extracted {len(model_data)} ingresses from GKE clusters")
-            if len(model_data) > 0:
-                self.create_or_update_model_metadata(model_type, model_data)
-            return model_data
-            
-        except Exception as e:
-            logger.error(f"Exception in GKE extract_ingresses method: {str(e)}")
-            raise
+        return self._extract_cluster_resources(SourceModelType.GKE_INGRESS, 'ingresses', 'networking',
+                                               'list_ingress_for_all_namespaces')
 
     @log_function_call
     def extract_network_policies(self, save_to_db=True):
-        try:
-            model_data = {}
-            model_type = SourceModelType.GKE_NETWORK_POLICY
-            
-            clusters = self.gke_api_processor.list_clusters()
-            if not clusters:
-                return model_data
-            
-            for cluster in clusters:
-                zone = cluster.get('zone', 'us-central1-a')
-                cluster_name = cluster.get('name')
-                
-                if not cluster_name:
-                    continue
-                
-                try:
-                    # Get namespaces first
-                    namespaces_response = self.gke_api_processor.list_namespaces(zone, cluster_name)
-                    namespaces_dict = namespaces_response.to_dict()
-                    
-                    for ns_item in namespaces_dict.get('items', []):
-                        namespace_name = ns_item.get('metadata', {}).get('name')
-                        if not namespace_name:
-                            continue
-                        
-                        try:
-                            policies_response = self.gke_api_processor.list_network_policies(zone, cluster_name, namespace_name)
-                            policies_dict = policies_response.to_dict()
-                            
-                            for item in policies_dict.get('items', []):
-                                metadata = item.get('metadata', {})
-                                policy_name = metadata.get('name')
-                                
-                                if not policy_name:
-                                    continue
-                                
-                                # Use zone/cluster/namespace/policy as the unique identifier
-                                namespaced_name = f"{zone}/{cluster_name}/{namespace_name}/{policy_name}"
-                                
-                                # Add cluster and zone context to the item
-                                item['gke_context'] = {
-                                    'zone': zone,
-                                    'cluster': cluster_name
-                                }
-                                
-                                model_data[namespaced_name] = item
-                                
-                                sanitized_item = self._sanitize_metadata(item)
-                                model_data[namespaced_name] = sanitized_item
-                                        
-                        except Exception as e:
-                            logger.error(f"Error extracting network policies for namespace {namespace_name} in cluster {cluster_name}: {str(e)}")
-                            continue
-                            
-                except Exception as e:
-                    logger.error(f"Error extracting network policies for cluster {cluster_name} in zone {zone}: {str(e)}")
-                    continue
-            
-            logger.info(f"Extracted {len(model_data)} network policies from GKE clusters")
-            if len(model_data) > 0:
-                self.create_or_update_model_metadata(model_type, model_data)
-            return model_data
-            
-        except Exception as e:
-            logger.error(f"Exception in GKE extract_network_policies method: {str(e)}")
-            raise
+        return self._extract_cluster_resources(SourceModelType.GKE_NETWORK_POLICY, 'network policies', 'networking',
+                                               'list_network_policy_for_all_namespaces')
 
     @log_function_call
     def extract_pod_autoscalers(self):
-        try:
-            model_data = {}
-            model_type = SourceModelType.GKE_HPA
-            
-            clusters = self.gke_api_processor.list_clusters()
-            if not clusters:
-                return model_data
-            
-            for cluster in clusters:
-                zone = cluster.get('zone', 'us-central1-a')
-                cluster_name = cluster.get('name')
-                
-                if not cluster_name:
-                    continue
-                
-                try:
-                    # Get namespaces first
-                    namespaces_response = self.gke_api_processor.list_namespaces(zone, cluster_name)
-                    namespaces_dict = namespaces_response.to_dict()
-                    
-                    for ns_item in namespaces_dict.get('items', []):
-                        namespace_name = ns_item.get('metadata', {}).get('name')
-                        if not namespace_name:
-                            continue
-                        
-                        try:
-                            hpas_response = self.gke_api_processor.list_horizontal_pod_autoscalers(zone, cluster_name, namespace_name)
-                            hpas_dict = hpas_response.to_dict()
-                            
-                            for item in hpas_dict.get('items', []):
-                                metadata = item.get('metadata', {})
-                                hpa_name = metadata.get('name')
-                                
-                                if not hpa_name:
-                                    continue
-                                
-                                # Use zone/cluster/namespace/hpa as the unique identifier
-                                namespaced_name = f"{zone}/{cluster_name}/{namespace_name}/{hpa_name}"
-                                
-                                # Add cluster and zone context to the item
-                                item['gke_context'] = {
-                                    'zone': zone,
-                                    'cluster': cluster_name
-                                }
-                                
-                                model_data[namespaced_name] = item
-                                
-                                sanitized_item = self._sanitize_metadata(item)
-                                model_data[namespaced_name] = sanitized_item
-                                        
-                        except Exception as e:
-                            logger.error(f"Error extracting HPAs for namespace {namespace_name} in cluster {cluster_name}: {str(e)}")
-                            continue
-                            
-                except Exception as e:
-                    logger.error(f"Error extracting HPAs for cluster {cluster_name} in zone {zone}: {str(e)}")
-                    continue
-            
-            logger.info(f"Extracted {len(model_data)} HPAs from GKE clusters")
-            if len(model_data) > 0:
-                self.create_or_update_model_metadata(model_type, model_data)
-            return model_data
-            
-        except Exception as e:
-            logger.error(f"Exception in GKE extract_pod_autoscalers method: {str(e)}")
-            raise
+        return self._extract_cluster_resources(SourceModelType.GKE_HPA, 'HPAs', 'autoscaling',
+                                               'list_horizontal_pod_autoscaler_for_all_namespaces')
 
     @log_function_call
     def extract_replicasets(self, save_to_db=True):
-        try:
-            model_data = {}
-            model_type = SourceModelType.GKE_REPLICASET
-            
-            clusters = self.gke_api_processor.list_clusters()
-            if not clusters:
-                return model_data
-            
-            for cluster in clusters:
-                zone = cluster.get('zone', 'us-central1-a')
-                cluster_name = cluster.get('name')
-                
-                if not cluster_name:
-                    continue
-                
-                try:
-                    # Get namespaces first
-                    namespaces_response = self.gke_api_processor.list_namespaces(zone, cluster_name)
-                    namespaces_dict = namespaces_response.to_dict()
-                    
-                    for ns_item in namespaces_dict.get('items', []):
-                        namespace_name = ns_item.get('metadata', {}).get('name')
-                        if not namespace_name:
-                            continue
-                        
-                        try:
-                            replicasets_response = self.gke_api_processor.list_replicasets(zone, cluster_name, namespace_name)
-                            replicasets_dict = replicasets_response.to_dict()
-                            
-                            for item in replicasets_dict.get('items', []):
-                                metadata = item.get('metadata', {})
-                                rs_name = metadata.get('name')
-                                
-                                if not rs_name:
-                                    continue
-                                
-                                # Use zone/cluster/namespace/replicaset as the unique identifier
-                                namespaced_name = f"{zone}/{cluster_name}/{namespace_name}/{rs_name}"
-                                
-                                # Add cluster and zone context to the item
-                                item['gke_context'] = {
-                                    'zone': zone,
-                                    'cluster': cluster_name
-                                }
-                                
-                                model_data[namespaced_name] = item
-                                
-                                sanitized_item = self._sanitize_metadata(item)
-                                model_data[namespaced_name] = sanitized_item
-                                        
-                        except Exception as e:
-                            logger.error(f"Error extracting replicasets for namespace {namespace_name} in cluster {cluster_name}: {str(e)}")
-                            continue
-                            
-                except Exception as e:
-                    logger.error(f"Error extracting replicasets for cluster {cluster_name} in zone {zone}: {str(e)}")
-                    continue
-
-            logger.info(f"Extracted {len(model_data)} replicasets from GKE clusters")
-            if len(model_data) > 0:
-                self.create_or_update_model_metadata(model_type, model_data)
-            return model_data
-            
-        except Exception as e:
-            logger.error(f"Exception in GKE extract_replicasets method: {str(e)}")
-            raise
+        return self._extract_cluster_resources(SourceModelType.GKE_REPLICASET, 'replicasets', 'app',
+                                               'list_replica_set_for_all_namespaces')
 
     @log_function_call
     def extract_statefulsets(self, save_to_db=True):
-        try:
-            model_data = {}
-            model_type = SourceModelType.GKE_STATEFULSET
-            
-            clusters = self.gke_api_processor.list_clusters()
-            if not clusters:
-                return model_data
-            
-            for cluster in clusters:
-                zone = cluster.get('zone', 'us-central1-a')
-                cluster_name = cluster.get('name')
-                
-                if not cluster_name:
-                    continue
-                
-                try:
-                    # Get namespaces first
-                    namespaces_response = self.gke_api_processor.list_namespaces(zone, cluster_name)
-                    namespaces_dict = namespaces_response.to_dict()
-                    
-                    for ns_item in namespaces_dict.get('items', []):
-                        namespace_name = ns_item.get('metadata', {}).get('name')
-                        if not namespace_name:
-                            continue
-                        
-                        try:
-                            statefulsets_response = self.gke_api_processor.list_statefulsets(zone, cluster_name, namespace_name)
-                            statefulsets_dict = statefulsets_response.to_dict()
-                            
-                            for item in statefulsets_dict.get('items', []):
-                                metadata = item.get('metadata', {})
-                                ss_name = metadata.get('name')
-                                
-                                if not ss_name:
-                                    continue
-                                
-                                # Use zone/cluster/namespace/statefulset as the unique identifier
-                                namespaced_name = f"{zone}/{cluster_name}/{namespace_name}/{ss_name}"
-                                
-                                # Add cluster and zone context to the item
-                                item['gke_context'] = {
-                                    'zone': zone,
-                                    'cluster': cluster_name
-                                }
-                                
-                                model_data[namespaced_name] = item
-                                
-                                sanitized_item = self._sanitize_metadata(item)
-                                model_data[namespaced_name] = sanitized_item
-                                        
-                        except Exception as e:
-                            logger.error(f"Error extracting statefulsets for namespace {namespace_name} in cluster {cluster_name}: {str(e)}")
-                            continue
-                            
-                except Exception as e:
-                    logger.error(f"Error extracting statefulsets for cluster {cluster_name} in zone {zone}: {str(e)}")
-                    continue
-            
-            logger.info(f"Extracted {len(model_data)} statefulsets from GKE clusters")
-            if len(model_data) > 0:
-                self.create_or_update_model_metadata(model_type, model_data)
-            return model_data
-            
-        except Exception as e:
-            logger.error(f"Exception in GKE extract_statefulsets method: {str(e)}")
-            raise
+        return self._extract_cluster_resources(SourceModelType.GKE_STATEFULSET, 'statefulsets', 'app',
+                                               'list_stateful_set_for_all_namespaces')
     
     @log_function_call
     def extract_deployments_for_namespace(self, zone, cluster_name, namespace):
@@ -1,10 +1,14 @@
 import json
 import logging
 import requests
+from functools import partial
 from typing import Dict, Any
 
 from core.integrations.source_metadata_extractor import SourceMetadataExtractor
 from core.integrations.source_api_processors.kubectl_api_processor import KubectlApiProcessor
+from core.integrations.utils.k8s_object_projection import DEFAULT_K8S_DROPPED_FIELDS, project_k8s_object
+from core.integrations.utils.k8s_inventory_sync import InventorySyncCommit, get_k8s_inventory_state_store, \
+    publish_inventory, sync_kubectl_inventory
 from core.protos.base_pb2 import Source, SourceModelType
 
 from core.utils.logging_utils import log_function_call
@@ -12,6 +16,18 @@ from core.utils.simplify_network_map import simplify_network_map, validate_netwo
 
 logger = logging.getLogger(__name__)
 
+# Objects from the raw list API carry no apiVersion/kind; kubectl get fills them in
+KUBECTL_RESOURCE_KINDS = {
+    'namespaces': ('v1', 'Namespace'),
+    'services': ('v1', 'Service'),
+    'deployments': ('apps/v1', 'Deployment'),
+    'replicasets': ('apps/v1', 'ReplicaSet'),
+    'statefulsets': ('apps/v1', 'StatefulSet'),
+    'ingresses': ('networking.k8s.io/v1', 'Ingress'),
+    'networkpolicies': ('networking.k8s.io/v1', 'NetworkPolicy'),
+    'hpa': ('autoscaling/v2', 'HorizontalPodAutoscaler'),
+}
+
 def get_kubernetes_deployments(account_id, model_data=None) -> Dict[str, Any]:
     deployment_uids = None
     # Use the keys from the model_data
@@ -32,247 +48,153 @@ def get_kubernetes_deployments(account_id, model_data=None) -> Dict[str, Any]:
 
 
 class KubernetesMetadataExtractor(SourceMetadataExtractor):
+    # Fields kept on stored objects (None keeps all) and fields always removed; see project_k8s_object
+    projected_fields = None
+    dropped_fields = DEFAULT_K8S_DROPPED_FIELDS
 
     def __init__(self, request_id: str, connector_name: str, **credentials):
         super().__init__(request_id, connector_name, Source.KUBERNETES)
         self.__kubectl_api_processor = KubectlApiProcessor(**credentials)
 
-    @log_function_call
-    def extract_namespaces(self):
-        model_type = SourceModelType.KUBERNETES_NAMESPACE
+    def _list_model_items(self, resource, namespaced=True):
+        """
+        ({model uid: object}, [deleted model uids], InventorySyncCommit) for resource across all namespaces. Model
+        uids are `namespace/name`, or `name` for cluster scoped resources. With a Kubernetes inventory state store
+        configured only objects changed since the previous committed run are returned.
+        """
+        def model_uid(item):
+            metadata = item.get('metadata', {})
+            name = metadata.get('name')
+            if not name:
+                return None
+            if not namespaced:
+                return name
+            return f"{metadata.get('namespace', 'default')}/{name}"
+
+        if get_k8s_inventory_state_store() is not None:
+            changed, deleted, commit = sync_kubectl_inventory(f"{self.connector_name}/kubernetes/{resource}",
+                                                              partial(self.__kubectl_api_processor.execute_command,
+                                                                      quiet=True),
+                                                              resource, model_uid)
+            api_version, kind = KUBECTL_RESOURCE_KINDS[resource]
+            for uid, item in changed.items():
+                item.setdefault('apiVersion', api_version)
+                item.setdefault('kind', kind)
+                changed[uid] = self._project(item)
+            return changed, deleted, commit
+
+        command = f"get {resource} -o json" if not namespaced else f"get {resource} --all-namespaces -o json"
         model_data = {}
+        for item in self._stream_items(command):
+            uid = model_uid(item)
+            if uid:
+                model_data[uid] = item
+        return model_data, [], InventorySyncCommit()
 
-        try:
-            command = "get namespaces -o json"
-            json_output = self.__kubectl_api_processor.execute_command(command)
+    def _project(self, item):
+        return project_k8s_object(item, self.projected_fields, self.dropped_fields)
 
-            data = json.loads(json_output)
+    def _stream_items(self, command):
+        """Projected `items` of a `kubectl get ... -o json` command, parsed incrementally from kubectl's stdout."""
+        for item in self.__kubectl_api_processor.stream_command_json_items(command):
+            yield self._project(item)
 
-            for item in data.get('items', []):
-                metadata = item.get('metadata', {})
-
-                namespace_name = metadata.get('name')
-                if not namespace_name:
-                    continue
+    @log_function_call
+    def extract_namespaces(self):
+        model_type = SourceModelType.KUBERNETES_NAMESPACE
+        model_data, deleted_uids, commit = {}, [], InventorySyncCommit()
 
-                model_data[namespace_name] = item
+        try:
+            model_data, deleted_uids, commit = self._list_model_items('namespaces', namespaced=False)
         except Exception as e:
             logger.error(f"Error extracting Kubernetes namespaces: {e}")
-        if len(model_data) > 0:
-            self.create_or_update_model_metadata(model_type, model_data)
+        publish_inventory(self, model_type, model_data, deleted_uids, [commit])
         return model_data
 
     @log_function_call
     def extract_services(self):
         model_type = SourceModelType.KUBERNETES_SERVICE
-        model_data = {}
+        model_data, deleted_uids, commit = {}, [], InventorySyncCommit()
 
         try:
-            command = "get services --all-namespaces -o json"
-
-            json_output = self.__kubectl_api_processor.execute_command(command)
-            data = json.loads(json_output)
-
-            for item in data.get('items', []):
-                metadata = item.get('metadata', {})
-
-                service_name = metadata.get('name')
-                service_namespace = metadata.get('namespace', 'default')
-
-                if not service_name:
-                    continue
-
-                namespaced_name = f"{service_namespace}/{service_name}"
-
-                model_data[namespaced_name] = item
-
+            model_data, deleted_uids, commit = self._list_model_items('services')
         except Exception as e:
             logger.error(f"Error extracting Kubernetes services: {e}")
-        if len(model_data) > 0:
-            self.create_or_update_model_metadata(model_type, model_data)
+        publish_inventory(self, model_type, model_data, deleted_uids, [commit])
         return model_data
 
     @log_function_call
     def extract_deployments(self):
         model_type = SourceModelType.KUBERNETES_DEPLOYMENT
-        model_data = {}
+        model_data, deleted_uids, commit = {}, [], InventorySyncCommit()
 
         try:
-            command = "get deployments --all-namespaces -o json"
-
-            json_output = self.__kubectl_api_processor.execute_command(command)
-            data = json.loads(json_output)
-
-            for item in data.get('items', []):
-                metadata = item.get('metadata', {})
-
-                deployment_name = metadata.get('name')
-                deployment_namespace = metadata.get('namespace', 'default')
-
-                if not deployment_name:
-                    continue
-
-                namespaced_name = f"{deployment_namespace}/{deployment_name}"
-
-                model_data[namespaced_name] = item
-
+            model_data, deleted_uids, commit = self._list_model_items('deployments')
         except Exception as e:
             logger.error(f"Error extracting Kubernetes deployments: {e}")
-        if len(model_data) > 0:
-            self.create_or_update_model_metadata(model_type, model_data)
+        publish_inventory(self, model_type, model_data, deleted_uids, [commit])
         return model_data
 
     @log_function_call
     def extract_ingresses(self):
         model_type = SourceModelType.KUBERNETES_INGRESS
-        model_data = {}
+        model_data, deleted_uids, commit = {}, [], InventorySyncCommit()
 
         try:
-            command = "get ingresses --all-namespaces -o json"
-
-            json_output = self.__kubectl_api_processor.execute_command(command)
-            data = json.loads(json_output)
-
-            for item in data.get('items', []):
-                metadata = item.get('metadata', {})
-
-                ingress_name = metadata.get('name')
-                ingress_namespace = metadata.get('namespace', 'default')
-
-                if not ingress_name:
-                    continue
-
-                namespaced_name = f"{ingress_namespace}/{ingress_name}"
-
-                model_data[namespaced_name] = item
-
+            model_data, deleted_uids, commit = self._list_model_items('ingresses')
         except Exception as e:
             logger.error(f"Error extracting Kubernetes ingresses: {e}")
-        if len(model_data) > 0:
-            self.create_or_update_model_metadata(model_type, model_data)
+        publish_inventory(self, model_type, model_data, deleted_uids, [commit])
         return model_data
 
     @log_function_call
     def extract_network_policies(self):
         model_type = SourceModelType.KUBERNETES_NETWORK_POLICY
-        model_data = {}
+        model_data, deleted_uids, commit = {}, [], InventorySyncCommit()
 
         try:
-            command = "get networkpolicies --all-namespaces -o json"
-
-            json_output = self.__kubectl_api_processor.execute_command(command)
-            data = json.loads(json_output)
-
-            for item in data.get('items', []):
-                metadata = item.get('metadata', {})
-
-                policy_name = metadata.get('name')
-                policy_namespace = metadata.get('namespace', 'default')
-
-                if not policy_name:
-                    continue
-
-                namespaced_name = f"{policy_namespace}/{policy_name}"
-
-                model_data[namespaced_name] = item
-
+            model_data, deleted_uids, commit = self._list_model_items('networkpolicies')
         except Exception as e:
             logger.error(f"Error extracting Kubernetes network policies: {e}")
-        if len(model_data) > 0:
-            self.create_or_update_model_metadata(model_type, model_data)
+        publish_inventory(self, model_type, model_data, deleted_uids, [commit])
         return model_data
 
     @log_function_call
     def extract_pod_autoscalers(self):
         model_type = SourceModelType.KUBERNETES_HPA
-        model_data = {}
+        model_data, deleted_uids, commit = {}, [], InventorySyncCommit()
 
         try:
-            command = "get hpa --all-namespaces -o json"
-
-            json_output = self.__kubectl_api_processor.execute_command(command)
-            data = json.loads(json_output)
-
-            for item in data.get('items', []):
-                metadata = item.get('metadata', {})
-
-                hpa_name = metadata.get('name')
-                hpa_namespace = metadata.get('namespace', 'default')
-
-                if not hpa_name:
-                    continue
-
-                namespaced_name = f"{hpa_namespace}/{hpa_name}"
-
-                model_data[namespaced_name] = item
-
+            model_data, deleted_uids, commit = self._list_model_items('hpa')
         except Exception as e:
             logger.error(f"Error extracting Kubernetes pod autoscalers: {e}")
-        if len(model_data) > 0:
-            self.create_or_update_model_metadata(model_type, model_data)
+        publish_inventory(self, model_type, model_data, deleted_uids, [commit])
         return model_data
 
     @log_function_call
     def extract_replicasets(self):
         model_type = SourceModelType.KUBERNETES_REPLICASET
-        model_data = {}
+        model_data, deleted_uids, commit = {}, [], InventorySyncCommit()
 
         try:
-            command = "get replicasets --all-namespaces -o json"
-
-            json_output = self.__kubectl_api_processor.execute_command(command)
-            data = json.loads(json_output)
-
-            for item in data.get('items', []):
-                metadata = item.get('metadata', {})
-
-                rs_name = metadata.get('name')
-                rs_namespace = metadata.get('namespace', 'default')
-
-                if not rs_name:
-                    continue
-
-                namespaced_name = f"{rs_namespace}/{rs_name}"
-
-                model_data[namespaced_name] = item
-
+            model_data, deleted_uids, commit = self._list_model_items('replicasets')
             logger.info(f"Extracted {len(model_data)} replicasets from all namespaces")
         except Exception as e:
             logger.error(f"Error extracting Kubernetes replicasets: {e}")
-        if len(model_data) > 0:
-            self.create_or_update_model_metadata(model_type, model_data)
+        publish_inventory(self, model_type, model_data, deleted_uids, [commit])
         return model_data
 
     @log_function_call
     def extract_statefulsets(self):
         model_type = SourceModelType.KUBERNETES_STATEFULSET
-        model_data = {}
+        model_data, deleted_uids, commit = {}, [], InventorySyncCommit()
 
         try:
-            command = "get statefulsets --all-namespaces -o json"
-
-            json_output = self.__kubectl_api_processor.execute_command(command)
-            data = json.loads(json_output)
-
-            for item in data.get('items', []):
-                metadata = item.get('metadata', {})
-
-                ss_name = metadata.get('name')
-                ss_namespace = metadata.get('namespace', 'default')
-
-                if not ss_name:
-                    continue
-
-                namespaced_name = f"{ss_namespace}/{ss_name}"
-
-                model_data[namespaced_name] = item
-
+            model_data, deleted_uids, commit = self._list_model_items('statefulsets')
             logger.info(f"Extracted {len(model_data)} statefulsets from all namespaces")
         except Exception as e:
             logger.error(f"Error extracting Kubernetes statefulsets: {e}")
-        
-        if len(model_data) > 0:
-            self.create_or_update_model_metadata(model_type, model_data)
+        publish_inventory(self, model_type, model_data, deleted_uids, [commit])
         return model_data
 
     @log_function_call
@@ -348,10 +270,7 @@ class KubernetesMetadataExtractor(SourceMetadataExtractor):
         try:
             command = f"get deployments -n {namespace} -o json"
 
-            json_output = self.__kubectl_api_processor.execute_command(command)
-            data = json.loads(json_output)
-
-            for item in data.get('items', []):
+            for item in self._stream_items(command):
                 metadata = item.get('metadata', {})
 
                 deployment_name = metadata.get('name')
@@ -378,10 +297,7 @@ class KubernetesMetadataExtractor(SourceMetadataExtractor):
         try:
             command = f"get services -n {namespace} -o json"
 
-            json_output = self.__kubectl_api_processor.execute_command(command)
-            data = json.loads(json_output)
-
-            for item in data.get('items', []):
+            for item in self._stream_items(command):
                 metadata = item.get('metadata', {})
 
                 service_name = metadata.get('name')
@@ -408,10 +324,7 @@ class KubernetesMetadataExtractor(SourceMetadataExtractor):
         try:
             command = f"get ingresses -n {namespace} -o json"
 
-            json_output = self.__kubectl_api_processor.execute_command(command)
-            data = json.loads(json_output)
-
-            for item in data.get('items', []):
+            for item in self._stream_items(command):
                 metadata = item.get('metadata', {})
 
                 ingress_name = metadata.get('name')
@@ -438,10 +351,7 @@ class KubernetesMetadataExtractor(SourceMetadataExtractor):
         try:
             command = f"get networkpolicies -n {namespace} -o json"
 
-            json_output = self.__kubectl_api_processor.execute_command(command)
-            data = json.loads(json_output)
-
-            for item in data.get('items', []):
+            for item in self._stream_items(command):
                 metadata = item.get('metadata', {})
 
                 policy_name = metadata.get('name')
@@ -468,10 +378,7 @@ class KubernetesMetadataExtractor(SourceMetadataExtractor):
         try:
             command = f"get replicasets -n {namespace} -o json"
 
-            json_output = self.__kubectl_api_processor.execute_command(command)
-            data = json.loads(json_output)
-
-            for item in data.get('items', []):
+            for item in self._stream_items(command):
                 metadata = item.get('metadata', {})
 
                 rs_name = metadata.get('name')
@@ -500,10 +407,7 @@ class KubernetesMetadataExtractor(SourceMetadataExtractor):
         try:
             command = f"get statefulsets -n {namespace} -o json"
 
-            json_output = self.__kubectl_api_processor.execute_command(command)
-            data = json.loads(json_output)
-
-            for item in data.get('items', []):
+            for item in self._stream_items(command):
                 metadata = item.get('metadata', {})
 
                 ss_name = metadata.get('name')
@@ -19,6 +19,7 @@ logger = logging.getLogger(__name__)
 AZURE_LOGIN_URL = "https://login.microsoftonline.com"
 AZURE_MANAGEMENT_URL = "https://management.azure.com"
 AZURE_LOG_ANALYTICS_URL = "https://api.loganalytics.io/v1"
+AZURE_METRICS_SCOPE = "https://metrics.monitor.azure.com/.default"
 
 # API versions for different services
 API_VERSIONS = {
@@ -35,8 +36,16 @@ API_VERSIONS = {
     "postgres_flexible": "2022-12-01",
     "redis": "2023-08-01",
     "metrics": "2023-10-01",
+    "resource_graph": "2022-10-01",
+    "metrics_batch": "2024-02-01",
 }
 
+# The metrics batch endpoint accepts up to 50 resource IDs of one region and namespace per request
+METRICS_BATCH_MAX_RESOURCES = 50
+
+# Resource Graph returns at most 1000 rows per page
+RESOURCE_GRAPH_PAGE_SIZE = 1000
+
 
 class AzureAuthError(Exception):
     """Raised when Azure authentication fails."""
@@ -76,6 +85,8 @@ class AzureRESTClient:
         # Token cache
         self._access_token: Optional[str] = None
         self._token_expiry: float = 0
+        self._metrics_access_token: Optional[str] = None
+        self._metrics_token_expiry: float = 0
 
         # Session for connection pooling
         self._session = requests.Session()
@@ -206,6 +217,37 @@ class AzureRESTClient:
             params["$filter"] = filter_expr
         return self._get_paginated_results(url, params)
 
+    def resource_graph_query(self, query: str, page_size: int = RESOURCE_GRAPH_PAGE_SIZE,
+                             max_retries: int = 3) -> List[Dict[str, Any]]:
+        """
+        Run an Azure Resource Graph (KQL) query over the subscription and return every row, following
+        $skipToken pages. Throttled (429) pages are retried with backoff.
+        """
+        url = f"{AZURE_MANAGEMENT_URL}/providers/Microsoft.ResourceGraph/resources"
+        params = {"api-version": API_VERSIONS["resource_graph"]}
+        body = {
+            "subscriptions": [self._subscription_id],
+            "query": query,
+            "options": {"resultFormat": "objectArray", "$top": page_size}
+        }
+        rows = []
+        while True:
+            for attempt in range(max_retries + 1):
+                try:
+                    response = self._make_request("POST", url, params=params, json_body=body)
+                    break
+                except AzureAPIError as e:
+                    if e.status_code != 429 or attempt == max_retries:
+                        raise
+                    wait = 2 ** attempt * 5
+                    logger.warning(f"Resource Graph query throttled, retrying in {wait}s")
+                    time.sleep(wait)
+            rows.extend(response.get("data", []))
+            skip_token = response.get("$skipToken")
+            if not skip_token:
+                return rows
+            body["options"]["$skipToken"] = skip_token
+
     def list_workspaces(self) -> List[Dict[str, Any]]:
         """List all Log Analytics workspaces."""
         url = f"{AZURE_MANAGEMENT_URL}/subscriptions/{self._subscription_id}/providers/Microsoft.OperationalInsights/workspaces"
@@ -380,6 +422,100 @@ class AzureRESTClient:
         }
         return self._make_request("GET", url, params)
 
+    def monitor_query_metrics_batch(
+        self,
+        region: str,
+        metric_namespace: str,
+        resource_ids: List[str],
+        metric_names: List[str],
+        start_time: str,
+        end_time: str,
+        aggregation: str = "Average",
+        interval: str = "PT5M"
+    ) -> List[Dict[str, Any]]:
+        """
+        Query metrics for up to METRICS_BATCH_MAX_RESOURCES resources of one region and metric namespace
+        in a single call to the Azure Monitor metrics batch endpoint.
+
+        Returns one entry per resource: {"resourceid": ..., "value": [<metric>, ...]}, where each metric has
+        the same shape as in monitor_query_metrics.
+        """
+        if len(resource_ids) > METRICS_BATCH_MAX_RESOURCES:
+            raise ValueError(f"monitor_query_metrics_batch:: At most {METRICS_BATCH_MAX_RESOURCES} resource IDs "
+                             f"per batch, got {len(resource_ids)}")
+        token = self._get_metrics_token()
+        url = (
+            f"https://{region.replace(' ', '').lower()}.metrics.monitor.azure.com"
+            f"/subscriptions/{self._subscription_id}/metrics:getBatch"
+        )
+        params = {
+            "api-version": API_VERSIONS["metrics_batch"],
+            "metricnamespace": metric_namespace,
+            "metricnames": ",".join(metric_names),
+            "starttime": start_time,
+            "endtime": end_time,
+            "aggregation": aggregation,
+            "interval": interval
+        }
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json"
+        }
+
+        try:
+            response = self._session.post(
+                url,
+                params=params,
+                json={"resourceids": resource_ids},
+                headers=headers,
+                timeout=self._timeout
+            )
+
+            if response.status_code == 200:
+                return response.json().get("values", [])
+
+            error_data = response.json() if response.text else {}
+            error_msg = error_data.get("error", {}).get("message", response.text)
+            raise AzureAPIError(response.status_code, error_msg, error_data)
+
+        except requests.RequestException as e:
+            raise AzureAPIError(0, f"Network error: {e}")
+
+    def _get_metrics_token(self) -> str:
+        """Get access token for the Azure Monitor metrics data plane (different scope), cached like the ARM token."""
+        if self._metrics_access_token and time.time() < (self._metrics_token_expiry - 300):
+            return self._metrics_access_token
+
+        token_url = f"{AZURE_LOGIN_URL}/{self._tenant_id}/oauth2/v2.0/token"
+
+        data = {
+            "grant_type": "client_credentials",
+            "client_id": self._client_id,
+            "client_secret": self._client_secret,
+            "scope": AZURE_METRICS_SCOPE
+        }
+
+        try:
+            response = self._session.post(
+                token_url,
+                data=data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                timeout=self._timeout
+            )
+
+            if response.status_code != 200:
+                error_data = response.json() if response.text else {}
+                error_msg = error_data.get("error_description", response.text)
+                raise AzureAuthError(f"Failed to obtain metrics token: {error_msg}")
+
+            token_data = response.json()
+            self._metrics_access_token = token_data["access_token"]
+            self._metrics_token_expiry = time.time() + token_data.get("expires_in", 3600)
+            return self._metrics_access_token
+
+        except requests.RequestException as e:
+            raise AzureAuthError(f"Network error during metrics token acquisition: {e}")
+
     # ==================== Log Analytics APIs ====================
 
     def query_log_analytics(self, workspace_id: str, query: str, timespan: str = "PT4H") -> Dict[str, Any]:
@@ -1,6 +1,10 @@
+import re
+from functools import lru_cache
 from typing import Dict
 
+from google.protobuf.message import Message
 from google.protobuf.struct_pb2 import Struct
+from google.protobuf.wrappers_pb2 import StringValue
 
 from core.integrations.source_api_processors.lambda_function_processor import LambdaFunctionProcessor
 from core.protos.literal_pb2 import LiteralType
@@ -29,6 +33,75 @@ def resolve_value(value, gk, gv):
     else:
         return value
 
+def _trie_to_pattern(node: Dict) -> str:
+    alternatives = [re.escape(ch) + _trie_to_pattern(child) for ch, child in node.items() if ch is not None]
+    if None in node:
+        if not alternatives:
+            return ''
+        # Empty alternative last, so the longest variable name sharing this prefix wins
+        alternatives.append('')
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return '(?:' + '|'.join(alternatives) + ')'
+
+
+@lru_cache(maxsize=256)
+def _compile_global_variable_pattern(variable_names: frozenset):
+    # Variable names are factored into a prefix trie so the matcher cost does not grow with the number
+    # of variables (alert label variables typically share long prefixes).
+    trie = {}
+    for name in variable_names:
+        if not name:
+            continue
+        node = trie
+        for ch in name:
+            node = node.setdefault(ch, {})
+        node[None] = True
+    if not trie:
+        return None
+    return re.compile(_trie_to_pattern(trie))
+
+
+class GlobalVariableSubstitutor:
+    """Single-pass substitution of global variables.
+
+    All variable names are compiled into one regex (cached per variable set), so each string
+    is scanned once regardless of the number of variables, and results do not depend on substitution order.
+    Every variable that is substituted is recorded in used_variables.
+    """
+
+    def __init__(self, global_variable_set):
+        self.global_variables = dict(global_variable_set.items())
+        for gk, gv in self.global_variables.items():
+            if type(gv) is not str:
+                if gv is None:
+                    raise Exception(f"Global variable {gk} is None")
+                self.global_variables[gk] = str(gv)
+        self.used_variables = {}
+        self._pattern = _compile_global_variable_pattern(frozenset(self.global_variables)) \
+            if self.global_variables else None
+
+    def __bool__(self):
+        return self._pattern is not None
+
+    def _replace_match(self, match):
+        gk = match.group(0)
+        gv = self.global_variables[gk]
+        self.used_variables[gk] = gv
+        return gv
+
+    def substitute(self, text: str) -> str:
+        if self._pattern is None or not text:
+            return text
+        return self._pattern.sub(self._replace_match, text)
+
+    def record_usage(self, text: str):
+        if self._pattern is None or not text:
+            return
+        for match in self._pattern.finditer(text):
+            self.used_variables[match.group(0)] = self.global_variables[match.group(0)]
+
+
 def resolve_global_variables(form_fields: [FormField], global_variable_set: Struct,
                              source_task_type_def: Dict) -> (Dict, Dict):
     all_string_fields = [ff.key_name.value for ff in form_fields if ff.data_type == LiteralType.STRING]
@@ -45,29 +118,143 @@ def resolve_global_variables(form_fields: [FormField], global_variable_set: Stru
         if field_name in source_task_type_def and isinstance(source_task_type_def[field_name], str):
             source_task_type_def[field_name] = source_task_type_def[field_name].strip().lower() == 'true'
 
-    task_local_variable_map = {}
-    for gk, gv in global_variable_set.items():
-        if gv is None:
-            raise Exception(f"Global variable {gk} is None")
-        for tk, tv in source_task_type_def.items():
-            if gk in tv:
-                task_local_variable_map[gk] = gv
-            if tk in all_string_fields:
-                source_task_type_def[tk] = tv.replace(gk, gv)
-            elif tk in all_string_array_fields:
-                resolved_items = []
-                for item in source_task_type_def[tk]:
-                    resolved_items.append(resolve_value(item, gk, gv))
-                source_task_type_def[tk] = resolved_items
-            elif tk in all_composite_fields:
-                composite_fields = all_composite_fields[tk]
-                for item in source_task_type_def[tk]:
-                    for cf in composite_fields:
-                        if cf.data_type == LiteralType.STRING:
-                            if gv is None:
-                                raise Exception(f"Global variable {gk} is None")
-                            item[cf.key_name.value] = item[cf.key_name.value].replace(gk, gv)
-    return source_task_type_def, task_local_variable_map
+    substitutor = GlobalVariableSubstitutor(global_variable_set)
+    if not substitutor:
+        return source_task_type_def, {}
+
+    for tk, tv in source_task_type_def.items():
+        if tk in all_string_fields and isinstance(tv, str):
+            source_task_type_def[tk] = substitutor.substitute(tv)
+        elif tk in all_string_array_fields and isinstance(tv, list):
+            resolved_items = []
+            for item in tv:
+                if isinstance(item, str):
+                    item = substitutor.substitute(item)
+                elif isinstance(item, dict):
+                    item = {k: (substitutor.substitute(v) if isinstance(v, str) else v) for k, v in item.items()}
+                resolved_items.append(item)
+            source_task_type_def[tk] = resolved_items
+        elif tk in all_composite_fields and isinstance(tv, list):
+            composite_string_fields = [cf.key_name.value for cf in all_composite_fields[tk]
+                                       if cf.data_type == LiteralType.STRING]
+            for item in tv:
+                for cf_name in composite_string_fields:
+                    if isinstance(item.get(cf_name), str):
+                        item[cf_name] = substitutor.substitute(item[cf_name])
+        elif isinstance(tv, str):
+            substitutor.record_usage(tv)
+    return source_task_type_def, substitutor.used_variables
+
+
+_STRING_VALUE_FULL_NAME = StringValue.DESCRIPTOR.full_name
+
+
+def _is_repeated_field(field_descriptor) -> bool:
+    is_repeated = getattr(field_descriptor, 'is_repeated', None)
+    if is_repeated is not None:
+        return is_repeated
+    return field_descriptor.label == field_descriptor.LABEL_REPEATED
+
+
+def _is_string_value_field(field_descriptor) -> bool:
+    return field_descriptor.message_type is not None and \
+        field_descriptor.message_type.full_name == _STRING_VALUE_FULL_NAME
+
+
+def _is_string_field(field_descriptor) -> bool:
+    return field_descriptor.type == field_descriptor.TYPE_STRING or _is_string_value_field(field_descriptor)
+
+
+def _resolve_string_field(message: Message, field_descriptor, substitutor: GlobalVariableSubstitutor) -> bool:
+    """Substitute global variables in a single string / StringValue field (scalar or repeated) of message.
+    Returns True if the field was modified."""
+    name = field_descriptor.name
+    changed = False
+    if _is_repeated_field(field_descriptor):
+        values = getattr(message, name)
+        for i in range(len(values)):
+            if _is_string_value_field(field_descriptor):
+                resolved = substitutor.substitute(values[i].value)
+                if resolved != values[i].value:
+                    values[i].value = resolved
+                    changed = True
+            else:
+                resolved = substitutor.substitute(values[i])
+                if resolved != values[i]:
+                    values[i] = resolved
+                    changed = True
+        return changed
+    if _is_string_value_field(field_descriptor):
+        if not message.HasField(name):
+            return False
+        value = getattr(message, name).value
+        resolved = substitutor.substitute(value)
+        if resolved != value:
+            getattr(message, name).value = resolved
+            changed = True
+    else:
+        value = getattr(message, name)
+        resolved = substitutor.substitute(value)
+        if resolved != value:
+            setattr(message, name, resolved)
+            changed = True
+    return changed
+
+
+def _resolve_message_string_fields(message: Message, field_names, substitutor: GlobalVariableSubstitutor) -> bool:
+    fields_by_name = message.DESCRIPTOR.fields_by_name
+    changed = False
+    for field_name in field_names:
+        field_descriptor = fields_by_name.get(field_name)
+        if field_descriptor is None or not _is_string_field(field_descriptor):
+            continue
+        changed |= _resolve_string_field(message, field_descriptor, substitutor)
+    return changed
+
+
+def resolve_global_variables_in_proto(form_fields: [FormField], global_variable_set: Struct,
+                                      source_task_type_proto: Message) -> (bool, Dict):
+    """Proto-native counterpart of resolve_global_variables.
+
+    Substitutes global variables in place in the string form fields of source_task_type_proto,
+    walking the message descriptor instead of round-tripping through JSON dicts.
+    Returns (changed, task_local_variable_map).
+    """
+    substitutor = GlobalVariableSubstitutor(global_variable_set)
+    if not substitutor:
+        return False, {}
+
+    fields_by_name = source_task_type_proto.DESCRIPTOR.fields_by_name
+    changed = False
+    for ff in form_fields:
+        field_descriptor = fields_by_name.get(ff.key_name.value)
+        if field_descriptor is None:
+            continue
+        if ff.data_type == LiteralType.STRING:
+            if _is_string_field(field_descriptor):
+                changed |= _resolve_string_field(source_task_type_proto, field_descriptor, substitutor)
+        elif ff.data_type == LiteralType.STRING_ARRAY:
+            if _is_string_field(field_descriptor):
+                changed |= _resolve_string_field(source_task_type_proto, field_descriptor, substitutor)
+            elif field_descriptor.message_type is not None and _is_repeated_field(field_descriptor):
+                for item in getattr(source_task_type_proto, field_descriptor.name):
+                    item_field_names = [fd.name for fd, _ in item.ListFields()]
+                    changed |= _resolve_message_string_fields(item, item_field_names, substitutor)
+        elif ff.is_composite:
+            if field_descriptor.message_type is None or not _is_repeated_field(field_descriptor):
+                continue
+            composite_string_fields = [cf.key_name.value for cf in ff.composite_fields
+                                       if cf.data_type == LiteralType.STRING]
+            for item in getattr(source_task_type_proto, field_descriptor.name):
+                changed |= _resolve_message_string_fields(item, composite_string_fields, substitutor)
+
+    # Record variables referenced by any other top level string field, as the dict based resolver does
+    for field_descriptor, value in source_task_type_proto.ListFields():
+        if _is_repeated_field(field_descriptor) or not _is_string_field(field_descriptor):
+            continue
+        substitutor.record_usage(value.value if _is_string_value_field(field_descriptor) else value)
+    return changed, substitutor.used_variables
+
 
 def check_multiple_task_results(task_result):
     if isinstance(task_result, list):
@@ -0,0 +1,324 @@
+"""
+GitHub REST client with conditional-request caching and rate-limit-aware scheduling.
+
+- GET responses are cached with their ETag / Last-Modified validators and revalidated with
+  If-None-Match / If-Modified-Since. GitHub does not count 304 responses against the rate limit.
+- X-RateLimit-* headers drive a scheduler that paces calls when the remaining budget runs low and fails
+  fast with GithubRateLimitError, instead of burning requests on 403/429 responses, when the budget is
+  exhausted for longer than a short wait.
+- List endpoints follow `Link` pagination; once the last page is known the remaining pages are
+  fetched concurrently.
+- GraphQL queries are posted through the same session with a separate rate-limit budget.
+
+Clients are shared per token (see get_github_rest_client) so cache and budget survive across the
+short-lived GithubAPIProcessor instances created per task.
+"""
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+import requests
+
+from core.settings import EXTERNAL_CALL_TIMEOUT
+from core.utils.instrumentation_utils import ContextThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+GITHUB_API_URL = 'https://api.github.com'
+
+_LINK_PATTERN = re.compile(r'<([^>]+)>;\s*rel="([^"]+)"')
+_PAGE_PATTERN = re.compile(r'[?&]page=(\d+)')
+
+
+def parse_link_header(link_header: str) -> Dict[str, str]:
+    """Parse an RFC 5988 Link header into {rel: url}."""
+    if not link_header:
+        return {}
+    return {rel: url for url, rel in _LINK_PATTERN.findall(link_header)}
+
+
+class GithubRateLimitError(Exception):
+    """The token's rate limit budget is exhausted for longer than the scheduler is allowed to wait."""
+    pass
+
+
+class GithubResponse:
+    """Minimal response object returned by GithubRestClient; mirrors the parts of requests.Response in use."""
+
+    def __init__(self, status_code: int, data: Any = None, headers: Dict[str, str] = None, text: str = '',
+                 from_cache: bool = False, partial: bool = False):
+        self.status_code = status_code
+        self._data = data
+        self.headers = headers or {}
+        self.text = text
+        self.from_cache = from_cache
+        self.partial = partial
+
+    def json(self):
+        return self._data
+
+    @property
+    def ok(self):
+        return 200 <= self.status_code < 400
+
+    def __bool__(self):
+        return self.ok
+
+
+class ConditionalRequestCache:
+    """
+    Thread-safe LRU of GET response bodies keyed by URL, stored with their validators. Bodies are kept
+    serialized so every hit hands out its own copy that callers may modify. Bounded both by entry count and
+    by the total size of the stored bodies.
+    """
+
+    def __init__(self, max_entries: int = 5000, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, etag: str, last_modified: str, body: str, link: str):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous['body'])
+            self._entries[key] = {'etag': etag, 'last_modified': last_modified, 'body': body, 'link': link}
+            self._bytes += len(body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted['body'])
+
+    def record(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+class RateLimitScheduler:
+    """
+    Paces requests against the X-RateLimit budget of one token. Keeps `reserve` requests untouched and,
+    below `pace_below` remaining, spreads the rest evenly until the window resets, waiting at most
+    `max_wait_seconds` per request. Once only the reserve is left, a request that would have to wait longer than
+    that for the reset raises GithubRateLimitError instead of blocking the task.
+    """
+
+    def __init__(self, reserve: int = 50, pace_below: int = 500, max_wait_seconds: int = 5):
+        self.reserve = reserve
+        self.pace_below = pace_below
+        self.max_wait_seconds = max_wait_seconds
+        self.remaining = None
+        self.reset_at = None
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            wait = 0
+            now = time.time()
+            if self.remaining is not None and self.reset_at is not None:
+                if now >= self.reset_at:
+                    self.remaining, self.reset_at = None, None
+                elif self.remaining <= self.reserve:
+                    wait = self.reset_at - now
+                    if wait > self.max_wait_seconds:
+                        raise GithubRateLimitError(f"RateLimitScheduler.acquire:: GitHub rate limit budget "
+                                                   f"exhausted, resets in {wait:.0f}s")
+                elif self.remaining < self.pace_below:
+                    # Budget is left: pace, but never hold a call longer than max_wait_seconds
+                    wait = min((self.reset_at - now) / max(self.remaining - self.reserve, 1), self.max_wait_seconds)
+                if self.remaining is not None:
+                    # Claim a slot up front so concurrent callers see the budget shrink
+                    self.remaining -= 1
+        if wait > 0:
+            logger.info(f"RateLimitScheduler.acquire:: Waiting {wait:.1f}s for GitHub rate limit budget")
+            time.sleep(wait)
+
+    def update(self, headers):
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining, reset = int(remaining), int(reset)
+        except ValueError:
+            return
+        with self._lock:
+            if self.reset_at is None or reset != self.reset_at or self.remaining is None or remaining < self.remaining:
+                self.remaining = remaining
+            self.reset_at = reset
+
+    def retry_after(self, response) -> Optional[float]:
+        """Seconds to wait before retrying a rate limited response, or None if it is not rate limited."""
+        if response.status_code not in (403, 429):
+            return None
+        if response.headers.get('Retry-After'):
+            try:
+                return float(response.headers['Retry-After'])
+            except ValueError:
+                return 60
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            reset = int(response.headers.get('X-RateLimit-Reset', time.time() + 60))
+            return max(reset - time.time(), 1)
+        return None
+
+
+class GithubRestClient:
+
+    def __init__(self, api_key: str, cache: ConditionalRequestCache = None, scheduler: RateLimitScheduler = None,
+                 max_page_workers: int = 4, max_retries: int = 3, timeout: int = EXTERNAL_CALL_TIMEOUT):
+        self.__api_key = api_key
+        self.cache = cache or ConditionalRequestCache()
+        self.scheduler = scheduler or RateLimitScheduler()
+        self.graphql_scheduler = RateLimitScheduler()
+        self.max_page_workers = max_page_workers
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self._session = requests.Session()
+
+    @staticmethod
+    def _cache_key(url: str, params: dict = None) -> str:
+        if not params:
+            return url
+        return f"{url}{'&' if '?' in url else '?'}{urlencode(sorted(params.items()))}"
+
+    def get(self, url: str, params: dict = None) -> GithubResponse:
+        """Conditional GET; a 304 is served from the cache as a 200."""
+        key = self._cache_key(url, params)
+        cached = self.cache.get(key)
+        headers = {'Authorization': f'Bearer {self.__api_key}'}
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            elif cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        for attempt in range(self.max_retries + 1):
+            self.scheduler.acquire()
+            response = self._session.get(url, headers=headers, params=params, timeout=self.timeout)
+            self.scheduler.update(response.headers)
+            wait = self.scheduler.retry_after(response)
+            if wait is None or attempt == self.max_retries or wait > self.scheduler.max_wait_seconds:
+                break
+            logger.warning(f"GithubRestClient.get:: Rate limited on {url}, retrying in {wait:.1f}s")
+            time.sleep(wait)
+
+        if response.status_code == 304 and cached:
+            self.cache.record(hit=True)
+            return GithubResponse(200, json.loads(cached['body']), {'Link': cached['link']} if cached['link'] else {},
+                                  from_cache=True)
+
+        self.cache.record(hit=False)
+        if response.status_code != 200:
+            return GithubResponse(response.status_code, None, response.headers, response.text)
+
+        data = response.json()
+        etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+        if etag or last_modified:
+            self.cache.put(key, etag, last_modified, response.text, response.headers.get('Link'))
+        return GithubResponse(200, data, response.headers, from_cache=False)
+
+    def get_paginated(self, url: str, params: dict = None, per_page: int = 100,
+                      max_pages: int = None) -> GithubResponse:
+        """
+        GET every page of a list endpoint and return one response whose json() is the concatenated list.
+        Pages after the first are fetched concurrently when the Link header names the last page, otherwise
+        `next` links are followed. If a later page fails, the pages collected before it are returned with
+        `partial` set on the response.
+        """
+        params = dict(params or {})
+        params['per_page'] = per_page
+        params['page'] = 1
+        first = self.get(url, params)
+        if first.status_code != 200 or not isinstance(first.json(), list):
+            return first
+        items = list(first.json())
+        links = parse_link_header(first.headers.get('Link'))
+
+        last_page = None
+        if 'last' in links:
+            match = _PAGE_PATTERN.search(links['last'])
+            last_page = int(match.group(1)) if match else None
+        if max_pages:
+            last_page = min(last_page, max_pages) if last_page else None
+
+        if last_page and last_page > 1:
+            def fetch_page(page):
+                return self.get(url, {**params, 'page': page})
+
+            with ContextThreadPoolExecutor(max_workers=self.max_page_workers) as executor:
+                for page_response in executor.map(fetch_page, range(2, last_page + 1)):
+                    if page_response.status_code != 200:
+                        logger.error(f"GithubRestClient.get_paginated:: Page request failed for {url} with "
+                                     f"status_code: {page_response.status_code}, returning {len(items)} items "
+                                     f"from the earlier pages")
+                        return GithubResponse(200, items, partial=True)
+                    items.extend(page_response.json() or [])
+            return GithubResponse(200, items)
+
+        page = 1
+        while 'next' in links and len(first.json()) >= per_page and (not max_pages or page < max_pages):
+            page += 1
+            page_response = self.get(url, {**params, 'page': page})
+            if page_response.status_code != 200:
+                logger.error(f"GithubRestClient.get_paginated:: Page {page} request failed for {url} with "
+                             f"status_code: {page_response.status_code}, returning {len(items)} items "
+                             f"from the earlier pages")
+                return GithubResponse(200, items, partial=True)
+            if not page_response.json():
+                break
+            items.extend(page_response.json())
+            links = parse_link_header(page_response.headers.get('Link'))
+        return GithubResponse(200, items)
+
+    def graphql(self, query: str, variables: dict = None) -> GithubResponse:
+        """POST a GraphQL query. GraphQL has its own rate-limit budget, tracked by graphql_scheduler."""
+        payload = {'query': query, 'variables': variables or {}}
+        headers = {'Authorization': f'Bearer {self.__api_key}'}
+        for attempt in range(self.max_retries + 1):
+            self.graphql_scheduler.acquire()
+            response = self._session.post(f'{GITHUB_API_URL}/graphql', headers=headers, json=payload,
+                                          timeout=self.timeout)
+            self.graphql_scheduler.update(response.headers)
+            wait = self.graphql_scheduler.retry_after(response)
+            if wait is None or attempt == self.max_retries or wait > self.graphql_scheduler.max_wait_seconds:
+                break
+            logger.warning(f"GithubRestClient.graphql:: Rate limited, retrying in {wait:.1f}s")
+            time.sleep(wait)
+        if response.status_code != 200:
+            return GithubResponse(response.status_code, None, response.headers, response.text)
+        return GithubResponse(200, response.json(), response.headers)
+
+
+_clients: Dict[str, GithubRestClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_github_rest_client(api_key: str) -> GithubRestClient:
+    """Shared client (cache + rate-limit budget) for a token."""
+    token_hash = hashlib.sha256(api_key.encode('utf-8')).hexdigest() if api_key else ''
+    with _clients_lock:
+        client = _clients.get(token_hash)
+        if client is None:
+            client = GithubRestClient(api_key)
+            _clients[token_hash] = client
+        return client
@@ -0,0 +1,102 @@
+"""
+Vectorized decoding of Grafana data frames (the /api/ds/query response format) into timeseries protos.
+
+Frames are columnar: one array per field. Points are grouped by their label columns, nulls are dropped and
+series are sorted with NumPy, and each series' datapoints are emitted as one pre-encoded protobuf payload
+instead of one Datapoint/DoubleValue message per point.
+"""
+import numpy as np
+
+from core.protos.playbooks.playbook_commons_pb2 import TimeseriesResult
+
+# Wire format of one `repeated Datapoint datapoints = 3` entry of LabeledMetricTimeseries. Both Datapoint fields
+# are fixed width (sfixed64 timestamp = 1, DoubleValue value = 2 holding a double), so every entry is exactly
+# 22 bytes and a whole series can be written as one structured array.
+_DATAPOINT_ENTRY_DTYPE = np.dtype([
+    ('entry_tag', 'u1'), ('entry_length', 'u1'),
+    ('timestamp_tag', 'u1'), ('timestamp', '<i8'),
+    ('value_tag', 'u1'), ('value_length', 'u1'), ('double_tag', 'u1'), ('value', '<f8'),
+])
+_DATAPOINTS_FIELD_TAG = (3 << 3) | 2
+_TIMESTAMP_FIELD_TAG = (1 << 3) | 1
+_VALUE_FIELD_TAG = (2 << 3) | 2
+_DOUBLE_FIELD_TAG = (1 << 3) | 1
+
+
+def _to_float_array(values):
+    """Returns (float64 array, mask of non-null points). None becomes NaN; real NaN values are kept."""
+    float_values = np.asarray(values, dtype=np.float64)
+    nan_positions = np.flatnonzero(np.isnan(float_values))
+    keep = np.ones(len(float_values), dtype=bool)
+    if len(nan_positions):
+        keep[nan_positions] = [values[i] is not None for i in nan_positions]
+    return float_values, keep
+
+
+def _group_codes(label_columns, keep):
+    """Returns (group code per kept point, label strings per column) with groups numbered by first appearance."""
+    label_strings = [np.asarray(column, dtype=str)[keep] for column in label_columns]
+    point_count = int(keep.sum())
+    if not label_strings:
+        return np.zeros(point_count, dtype=np.int64), label_strings
+    combined = np.zeros(point_count, dtype=np.int64)
+    for strings in label_strings:
+        _, codes = np.unique(strings, return_inverse=True)
+        # Re-factorize after every column so the combined code never overflows
+        _, combined = np.unique(combined * (codes.max(initial=0) + 1) + codes, return_inverse=True)
+    _, first_index, inverse = np.unique(combined, return_index=True, return_inverse=True)
+    rank = np.empty(len(first_index), dtype=np.int64)
+    rank[np.argsort(first_index)] = np.arange(len(first_index))
+    return rank[inverse], label_strings
+
+
+def group_frame_points(timestamps, values, label_columns=()):
+    """
+    Groups the points of one frame into series.
+
+    Returns [(label_values, timestamps, values), ...] in order of each series' first non-null point, where
+    label_values is a tuple of str (one per label column) and the arrays are int64 / float64 sorted by
+    (timestamp, value). Points with a null value are dropped.
+    """
+    float_values, keep = _to_float_array(values)
+    raw_timestamps = np.asarray(timestamps)[keep]
+    float_values = float_values[keep]
+    if not len(float_values):
+        return []
+    groups, label_strings = _group_codes(label_columns, keep)
+
+    order = np.lexsort((float_values, raw_timestamps, groups))
+    groups = groups[order]
+    boundaries = np.flatnonzero(np.diff(groups)) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(groups)]))
+    sorted_timestamps = raw_timestamps[order].astype(np.int64)
+    sorted_values = float_values[order]
+
+    series = []
+    for start, end in zip(starts, ends):
+        first_point = order[start]
+        label_values = tuple(str(strings[first_point]) for strings in label_strings)
+        series.append((label_values, sorted_timestamps[start:end], sorted_values[start:end]))
+    return series
+
+
+def encode_datapoints(timestamps, values):
+    """Encodes datapoints as serialized `LabeledMetricTimeseries.datapoints` entries."""
+    entries = np.empty(len(timestamps), dtype=_DATAPOINT_ENTRY_DTYPE)
+    entries['entry_tag'] = _DATAPOINTS_FIELD_TAG
+    entries['entry_length'] = _DATAPOINT_ENTRY_DTYPE.itemsize - 2
+    entries['timestamp_tag'] = _TIMESTAMP_FIELD_TAG
+    entries['timestamp'] = timestamps
+    entries['value_tag'] = _VALUE_FIELD_TAG
+    entries['value_length'] = 9
+    entries['double_tag'] = _DOUBLE_FIELD_TAG
+    entries['value'] = values
+    return entries.tobytes()
+
+
+def build_labeled_timeseries(metric_label_values, timestamps, values):
+    """Builds a LabeledMetricTimeseries with all datapoints decoded by the protobuf runtime in one call."""
+    labeled_timeseries = TimeseriesResult.LabeledMetricTimeseries(metric_label_values=metric_label_values)
+    labeled_timeseries.MergeFromString(encode_datapoints(timestamps, values))
+    return labeled_timeseries
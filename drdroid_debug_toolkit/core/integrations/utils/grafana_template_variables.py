@@ -0,0 +1,68 @@
+"""
+Grafana template variable substitution.
+
+A TemplateVariableResolver is built once per set of variable values (e.g. once per dashboard run) and then
+resolves $var, ${var} and ${var:format} references in any number of strings with a single precompiled pass.
+"""
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+_VARIABLE_REFERENCE_PATTERN = re.compile(
+    r"\$\{([^}]+?)(?::(?:csv|json|pipe|regex|distributed))?\}|\$([a-zA-Z0-9_]+)")
+_LABEL_SELECTOR_PATTERN = re.compile(r"\{[^}]*\}")
+# Plain '=' / '!=' matchers whose quoted value holds a multi-value substitution; '=~' and '!~' are left as is
+_MULTIVALUE_EQUALS_PATTERN = re.compile(r"(?<![!~])=\s*\"([^\"]*\|[^\"]*)\"")
+_MULTIVALUE_NOT_EQUALS_PATTERN = re.compile(r"!=\s*\"([^\"]*\|[^\"]*)\"")
+
+
+def _upgrade_matchers_to_regex(match):
+    inner = _MULTIVALUE_EQUALS_PATTERN.sub(lambda m: f"=~\"{m.group(1)}\"", match.group(0))
+    return _MULTIVALUE_NOT_EQUALS_PATTERN.sub(lambda m: f"!~\"{m.group(1)}\"", inner)
+
+
+class TemplateVariableResolver:
+    """Resolves Grafana template variable references against a fixed {name: value} mapping."""
+
+    def __init__(self, variables: dict):
+        self._replacements = {}
+        self._multivalue_names = set()
+        for name, value in variables.items():
+            if isinstance(value, list):
+                # Multi-value variables are joined with '|' (regex alternation)
+                replacement = "|".join(map(str, value)) if value else ""
+                if replacement:
+                    self._multivalue_names.add(name)
+            else:
+                replacement = str(value) if value is not None else ""
+            self._replacements[name] = replacement
+
+    def resolve(self, input_string: str) -> str:
+        """
+        Substitutes every known variable reference in input_string; unknown references are left in place. When a
+        multi-value variable was substituted, '=' / '!=' label matchers holding its value become '=~' / '!~'.
+        """
+        if not input_string or not isinstance(input_string, str) or '$' not in input_string:
+            return input_string
+
+        substituted_multivalue = False
+
+        def _substitute(match):
+            nonlocal substituted_multivalue
+            name = match.group(1) or match.group(2)
+            if name not in self._replacements:
+                logger.warning(f"Template variable '${name}' referenced but not found in available variables: "
+                               f"{list(self._replacements.keys())}")
+                return match.group(0)
+            if name in self._multivalue_names:
+                substituted_multivalue = True
+            return self._replacements[name]
+
+        resolved_string = _VARIABLE_REFERENCE_PATTERN.sub(_substitute, input_string)
+        if substituted_multivalue and "|" in resolved_string:
+            resolved_string = _LABEL_SELECTOR_PATTERN.sub(_upgrade_matchers_to_regex, resolved_string)
+
+        if resolved_string != input_string:
+            logger.debug(f"Template variable resolution: '{input_string}' -> '{resolved_string}'")
+        return resolved_string
@@ -0,0 +1,78 @@
+"""
+Helpers shared by the Kubernetes based metadata extractors (EKS, GKE).
+
+- K8sClusterContext resolves a cluster's authenticated ApiClient once per extraction run and hands out typed
+  API instances from it, instead of re-describing the cluster and re-minting a token for every call.
+- run_per_cluster fans work out across clusters with bounded parallelism.
+"""
+import logging
+import threading
+import time
+
+import kubernetes
+
+from core.utils.instrumentation_utils import ContextThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+K8S_API_CLASSES = {
+    'api': kubernetes.client.CoreV1Api,
+    'app': kubernetes.client.AppsV1Api,
+    'networking': kubernetes.client.NetworkingV1Api,
+    'autoscaling': kubernetes.client.AutoscalingV1Api,
+}
+
+
+def get_k8s_api_instance(api_client, client='api'):
+    api_class = K8S_API_CLASSES.get(client)
+    if not api_class:
+        raise Exception(f"get_k8s_api_instance:: Unsupported kubernetes client type: {client}")
+    return api_class(api_client)
+
+
+class K8sClusterContext:
+    """
+    Per-run handle on one cluster. `api_client_factory` builds an authenticated kubernetes ApiClient; it is
+    called lazily and again once `ttl_seconds` have passed so short-lived tokens (EKS: 15 minutes) are renewed.
+    Extra keyword arguments (zone, region, ...) are kept as attributes for the extractors.
+    """
+
+    def __init__(self, name, api_client_factory, ttl_seconds=600, **attributes):
+        self.name = name
+        self._api_client_factory = api_client_factory
+        self._ttl_seconds = ttl_seconds
+        self._api_client = None
+        self._api_client_created_at = 0
+        self._api_instances = {}
+        self._lock = threading.Lock()
+        for key, value in attributes.items():
+            setattr(self, key, value)
+
+    def get_api_instance(self, client='api'):
+        with self._lock:
+            if self._api_client is None or time.monotonic() - self._api_client_created_at > self._ttl_seconds:
+                self._api_client = self._api_client_factory()
+                self._api_client_created_at = time.monotonic()
+                self._api_instances = {}
+            if self._api_client is None:
+                return None
+            if client not in self._api_instances:
+                self._api_instances[client] = get_k8s_api_instance(self._api_client, client)
+            return self._api_instances[client]
+
+
+def run_per_cluster(cluster_contexts, fn, max_workers=4, description='resources'):
+    """Calls fn(context) for every cluster with at most max_workers clusters in flight; failures are logged and
+    skipped. Returns the results in cluster order."""
+    if not cluster_contexts:
+        return []
+
+    def run(context):
+        try:
+            return fn(context)
+        except Exception as e:
+            logger.error(f"Error extracting {description} for cluster {context.name}: {str(e)}")
+            return None
+
+    with ContextThreadPoolExecutor(max_workers=max(1, min(max_workers, len(cluster_contexts)))) as executor:
+        return [result for result in executor.map(run, cluster_contexts) if result is not None]
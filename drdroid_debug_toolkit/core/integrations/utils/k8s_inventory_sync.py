@@ -0,0 +1,361 @@
+"""
+Incremental Kubernetes inventory refresh.
+
+A full extraction lists every object of a kind on each run. When an inventory state store is configured
+(set_k8s_inventory_state_store), extractors instead remember, per cluster and resource kind, the list
+`resourceVersion` and the resourceVersion of every object they have seen. The next run:
+
+1. watches from the stored resourceVersion with a short server-side timeout, receiving only the objects that
+   were added, modified or deleted since the previous run, or
+2. if the apiserver no longer has that history (410 Gone, typical when runs are far apart), relists and diffs
+   object resourceVersions against the stored state.
+
+Either way only changed objects are returned for upload, together with the keys of deleted objects and an
+InventorySyncCommit. The new state is persisted only when that commit is called after a successful upload, so
+changes from a failed upload are returned again by the next run. Without a state store, extraction behaves as a
+full refresh.
+"""
+import hashlib
+import inspect
+import json
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WATCH_TIMEOUT_SECONDS = 5
+
+
+class ResourceVersionExpired(Exception):
+    """The stored resourceVersion is older than the apiserver's watch history (HTTP 410 Gone)."""
+    pass
+
+
+class InventoryStateStore(ABC):
+    """Persists sync state per state key. Implementations must be safe to call from multiple threads."""
+
+    @abstractmethod
+    def get(self, state_key):
+        pass
+
+    @abstractmethod
+    def put(self, state_key, state):
+        pass
+
+
+class InMemoryInventoryStateStore(InventoryStateStore):
+    """Keeps state for the lifetime of the process, e.g. for long-running workers refreshing on a schedule."""
+
+    def __init__(self):
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def get(self, state_key):
+        with self._lock:
+            return self._states.get(state_key)
+
+    def put(self, state_key, state):
+        with self._lock:
+            self._states[state_key] = state
+
+
+class FileInventoryStateStore(InventoryStateStore):
+    """Keeps state as one JSON file per state key under directory."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, state_key):
+        return os.path.join(self.directory, f"{hashlib.sha256(state_key.encode('utf-8')).hexdigest()}.json")
+
+    def get(self, state_key):
+        path = self._path(state_key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"FileInventoryStateStore.get:: Ignoring unreadable state for {state_key}: {e}")
+            return None
+
+    def put(self, state_key, state):
+        path = self._path(state_key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+
+
+_inventory_state_store = None
+
+
+def set_k8s_inventory_state_store(store: InventoryStateStore):
+    """Enables incremental Kubernetes inventory refresh backed by store; None restores full refreshes."""
+    global _inventory_state_store
+    _inventory_state_store = store
+
+
+def get_k8s_inventory_state_store():
+    return _inventory_state_store
+
+
+class InventorySyncCommit:
+    """
+    Persists the state reached by one sync of state_key when called. incremental is True when the sync returned
+    only the changes since a stored state rather than every object.
+    """
+
+    def __init__(self, store=None, state_key=None, state=None, incremental=False):
+        self.store = store
+        self.state_key = state_key
+        self.state = state
+        self.incremental = incremental
+
+    def __call__(self):
+        if self.store and self.state:
+            self.store.put(self.state_key, self.state)
+
+
+def sync_inventory(state_key, list_fn, watch_fn, key_fn, version_fn, store=None):
+    """
+    Returns ({key: object} of added/modified objects, [deleted keys], InventorySyncCommit) since the last committed
+    sync of state_key, or every object when there is no usable state.
+
+    list_fn() -> (objects, list_resource_version)
+    watch_fn(resource_version) -> iterable of (event_type, object, resource_version); raises ResourceVersionExpired
+    key_fn(object) -> model key, or None to skip the object
+    version_fn(object) -> object resourceVersion
+    """
+    store = store or get_k8s_inventory_state_store()
+    state = store.get(state_key) if store else None
+
+    if state and state.get('resource_version'):
+        known_versions = dict(state.get('objects') or {})
+        changed, deleted = {}, set()
+        resource_version = state['resource_version']
+        try:
+            for event_type, obj, event_resource_version in watch_fn(resource_version):
+                if event_resource_version:
+                    resource_version = event_resource_version
+                if event_type == 'BOOKMARK':
+                    continue
+                key = key_fn(obj)
+                if not key:
+                    continue
+                if event_type == 'DELETED':
+                    changed.pop(key, None)
+                    if key in known_versions:
+                        deleted.add(key)
+                        del known_versions[key]
+                else:
+                    changed[key] = obj
+                    deleted.discard(key)
+                    known_versions[key] = version_fn(obj)
+            logger.info(f"sync_inventory:: {state_key}: {len(changed)} changed, {len(deleted)} deleted via watch")
+            commit = InventorySyncCommit(store, state_key, {'resource_version': resource_version,
+                                                            'objects': known_versions}, incremental=True)
+            return changed, sorted(deleted), commit
+        except ResourceVersionExpired:
+            logger.info(f"sync_inventory:: {state_key}: resourceVersion {state['resource_version']} expired, "
+                        f"relisting")
+
+    objects, list_resource_version = list_fn()
+    previous_versions = (state or {}).get('objects') or {}
+    current_versions, changed = {}, {}
+    for obj in objects:
+        key = key_fn(obj)
+        if not key:
+            continue
+        version = version_fn(obj)
+        current_versions[key] = version
+        if not state or previous_versions.get(key) != version:
+            changed[key] = obj
+    deleted = sorted(key for key in previous_versions if key not in current_versions) if state else []
+    new_state = {'resource_version': list_resource_version, 'objects': current_versions} \
+        if list_resource_version else None
+    return changed, deleted, InventorySyncCommit(store, state_key, new_state, incremental=bool(state))
+
+
+# ---- kubernetes python client adapters ----
+
+def list_with_resource_version(list_method, limit=500, **kwargs):
+    """
+    Lists every object of a kubernetes `list_*` / `list_*_for_all_namespaces` method in limit/_continue chunks;
+    returns (objects, list resourceVersion). If the continue token expires mid-listing (410 Gone) the listing
+    restarts once from the beginning.
+    """
+    objects, continue_token, resource_version = [], None, None
+    restarted = False
+    while True:
+        try:
+            response = list_method(limit=limit, _continue=continue_token, **kwargs)
+        except Exception as e:
+            if getattr(e, 'status', None) == 410 and continue_token and not restarted:
+                logger.warning(f"list_with_resource_version:: Continue token expired for {list_method.__name__}, "
+                               f"restarting")
+                objects, continue_token, resource_version, restarted = [], None, None, True
+                continue
+            raise
+        objects.extend(response.items or [])
+        if response.metadata:
+            # All chunks of one list are served from the same snapshot
+            resource_version = resource_version or response.metadata.resource_version
+            continue_token = response.metadata._continue
+        else:
+            continue_token = None
+        if not continue_token:
+            return objects, resource_version
+
+
+def watch_since(list_method, resource_version, timeout_seconds=DEFAULT_WATCH_TIMEOUT_SECONDS):
+    """Yields (event_type, object, resourceVersion) for changes after resource_version until the server-side
+    timeout ends the watch."""
+    from kubernetes import watch
+
+    watcher = watch.Watch()
+    try:
+        for event in watcher.stream(list_method, resource_version=resource_version, timeout_seconds=timeout_seconds,
+                                    allow_watch_bookmarks=True):
+            yield event['type'], event['object'], watcher.resource_version
+    except Exception as e:
+        if getattr(e, 'status', None) == 410:
+            raise ResourceVersionExpired(str(e))
+        raise
+
+
+def sync_k8s_client_inventory(state_key, list_method, key_fn, limit=500,
+                              watch_timeout_seconds=DEFAULT_WATCH_TIMEOUT_SECONDS):
+    """
+    ({key: object}, [deleted keys], InventorySyncCommit) for a kubernetes python client `list_*` method. Without a
+    state store this is a plain full listing with no deletions.
+    """
+    if get_k8s_inventory_state_store() is None:
+        objects, _ = list_with_resource_version(list_method, limit=limit)
+        items = {}
+        for obj in objects:
+            key = key_fn(obj)
+            if key:
+                items[key] = obj
+        return items, [], InventorySyncCommit()
+    return sync_inventory(
+        state_key,
+        list_fn=lambda: list_with_resource_version(list_method, limit=limit),
+        watch_fn=lambda resource_version: watch_since(list_method, resource_version, watch_timeout_seconds),
+        key_fn=key_fn,
+        version_fn=lambda obj: obj.metadata.resource_version if obj.metadata else None,
+    )
+
+
+# ---- kubectl adapters (raw API paths through `kubectl get --raw`) ----
+
+KUBECTL_RESOURCE_API_PATHS = {
+    'namespaces': '/api/v1/namespaces',
+    'services': '/api/v1/services',
+    'deployments': '/apis/apps/v1/deployments',
+    'replicasets': '/apis/apps/v1/replicasets',
+    'statefulsets': '/apis/apps/v1/statefulsets',
+    'ingresses': '/apis/networking.k8s.io/v1/ingresses',
+    'networkpolicies': '/apis/networking.k8s.io/v1/networkpolicies',
+    'hpa': '/apis/autoscaling/v2/horizontalpodautoscalers',
+}
+
+
+def _is_gone_error(error):
+    return getattr(error, 'status', None) == 410
+
+
+def kubectl_list_with_resource_version(execute_command, api_path, limit=500):
+    objects, continue_token, resource_version = [], None, None
+    while True:
+        params = {'limit': limit}
+        if continue_token:
+            params['continue'] = continue_token
+        response = json.loads(execute_command(f"get --raw {api_path}?{urlencode(params)}"))
+        objects.extend(response.get('items') or [])
+        metadata = response.get('metadata') or {}
+        resource_version = resource_version or metadata.get('resourceVersion')
+        continue_token = metadata.get('continue')
+        if not continue_token:
+            return objects, resource_version
+
+
+def kubectl_watch_since(execute_command, api_path, resource_version, timeout_seconds=DEFAULT_WATCH_TIMEOUT_SECONDS):
+    params = {'watch': 1, 'resourceVersion': resource_version, 'timeoutSeconds': timeout_seconds,
+              'allowWatchBookmarks': 'true'}
+    try:
+        output = execute_command(f"get --raw {api_path}?{urlencode(params)}")
+    except Exception as e:
+        if _is_gone_error(e):
+            raise ResourceVersionExpired(str(e))
+        raise
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        event = json.loads(line)
+        obj = event.get('object') or {}
+        if event.get('type') == 'ERROR':
+            if obj.get('code') == 410:
+                raise ResourceVersionExpired(obj.get('message'))
+            raise Exception(f"kubectl_watch_since:: Watch on {api_path} failed: {obj.get('message')}")
+        yield event.get('type'), obj, (obj.get('metadata') or {}).get('resourceVersion')
+
+
+def sync_kubectl_inventory(state_key, execute_command, resource, key_fn, limit=500,
+                           watch_timeout_seconds=DEFAULT_WATCH_TIMEOUT_SECONDS):
+    """({key: object dict}, [deleted keys], InventorySyncCommit) for a kubectl resource listed across all
+    namespaces."""
+    api_path = KUBECTL_RESOURCE_API_PATHS[resource]
+    return sync_inventory(
+        state_key,
+        list_fn=lambda: kubectl_list_with_resource_version(execute_command, api_path, limit=limit),
+        watch_fn=lambda resource_version: kubectl_watch_since(execute_command, api_path, resource_version,
+                                                              watch_timeout_seconds),
+        key_fn=key_fn,
+        version_fn=lambda obj: (obj.get('metadata') or {}).get('resourceVersion'),
+    )
+
+
+def publish_inventory(extractor, model_type, model_data, deleted_uids, commits=()):
+    """
+    Uploads model_data and reports deleted_uids for model_type, then calls the sync commits — only when the upload
+    succeeded, so that a failed upload is retried by the next run. An extractor without an upload target configured
+    counts as a successful upload. Returns whether the upload succeeded.
+    """
+    uploaded = True
+    if model_data:
+        if any(commit.incremental for commit in commits) and \
+                _accepts_keyword(extractor.create_or_update_model_metadata, 'incremental'):
+            result = extractor.create_or_update_model_metadata(model_type, model_data, incremental=True)
+        else:
+            result = extractor.create_or_update_model_metadata(model_type, model_data)
+        uploaded = result is not False
+    publish_inventory_deletions(extractor, model_type, deleted_uids)
+    if uploaded:
+        for commit in commits:
+            commit()
+    return uploaded
+
+
+def _accepts_keyword(func, name):
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(parameter.name == name or parameter.kind == inspect.Parameter.VAR_KEYWORD for parameter in parameters)
+
+
+def publish_inventory_deletions(extractor, model_type, model_uids):
+    """Reports deleted model uids through the extractor's delete hook, when its base class provides one."""
+    if not model_uids:
+        return
+    delete_model_metadata = getattr(extractor, 'delete_model_metadata', None)
+    if delete_model_metadata is None:
+        logger.info(f"publish_inventory_deletions:: {len(model_uids)} deleted {model_type} objects not published, "
+                    f"extractor has no delete_model_metadata")
+        return
+    delete_model_metadata(model_type, model_uids)
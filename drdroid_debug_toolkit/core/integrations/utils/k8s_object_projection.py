@@ -0,0 +1,52 @@
+"""
+Field projection for Kubernetes objects (as dicts, e.g. parsed `kubectl get -o json` output) before they are
+stored as asset metadata.
+
+Paths are tuples of keys; a plain string is split on '.', so keys that contain dots (annotation names) must
+be given as tuples.
+"""
+
+# Bookkeeping the apiserver and kubectl attach to every object; large and of no use as asset metadata
+DEFAULT_K8S_DROPPED_FIELDS = (
+    ('metadata', 'managedFields'),
+    ('metadata', 'selfLink'),
+    ('metadata', 'annotations', 'kubectl.kubernetes.io/last-applied-configuration'),
+)
+
+
+def _as_path(field):
+    return tuple(field.split('.')) if isinstance(field, str) else tuple(field)
+
+
+def _copy_path(source, target, path):
+    for key in path[:-1]:
+        if not isinstance(source, dict) or key not in source:
+            return
+        source = source[key]
+        target = target.setdefault(key, {})
+    if isinstance(source, dict) and path[-1] in source:
+        target[path[-1]] = source[path[-1]]
+
+
+def _drop_path(obj, path):
+    for key in path[:-1]:
+        obj = obj.get(key) if isinstance(obj, dict) else None
+        if obj is None:
+            return
+    if isinstance(obj, dict):
+        obj.pop(path[-1], None)
+
+
+def project_k8s_object(obj, fields=None, dropped_fields=DEFAULT_K8S_DROPPED_FIELDS):
+    """
+    Returns obj reduced to `fields` (every field when None) without `dropped_fields`. With fields=None obj is
+    modified in place, which avoids copying objects that were just parsed.
+    """
+    if fields is not None:
+        projected = {}
+        for field in fields:
+            _copy_path(obj, projected, _as_path(field))
+        obj = projected
+    for field in dropped_fields or ():
+        _drop_path(obj, _as_path(field))
+    return obj
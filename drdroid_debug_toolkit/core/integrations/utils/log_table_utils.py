@@ -0,0 +1,91 @@
+"""
+Compact log tables.
+
+Log backends return lines grouped by stream, where every line of a stream shares the same labels. Flat
+tables repeat those label columns on every row; compact tables store each distinct label set once in
+TableResult.streams and give every row a "__stream_ref" column holding the index of its label set, in the
+position the label columns would take. expand_log_table turns a compact table back into the flat form.
+
+Sources build flat tables unless a host opts into compact ones, and compact tables are expanded before
+result transformers see their rows.
+"""
+from google.protobuf.wrappers_pb2 import StringValue, UInt64Value
+
+from core.protos.playbooks.playbook_commons_pb2 import TableResult
+
+# Double underscore prefix: 'stream' itself is a common log label (stdout/stderr)
+STREAM_REF_COLUMN = '__stream_ref'
+
+
+class LogTableBuilder:
+    """Accumulates log rows and builds either a compact or a flat TableResult."""
+
+    def __init__(self, compact=False):
+        self.compact = compact
+        self._stream_refs = {}
+        self._streams = []
+        self._rows = []
+
+    def add_stream(self, labels):
+        """
+        Registers a label set ({name: value} or (name, value) pairs) and returns its reference; identical label
+        sets share one.
+        """
+        pairs = labels.items() if isinstance(labels, dict) else labels
+        key = tuple((str(name), str(value)) for name, value in pairs)
+        stream_ref = self._stream_refs.get(key)
+        if stream_ref is None:
+            stream_ref = len(self._streams)
+            self._stream_refs[key] = stream_ref
+            self._streams.append([TableResult.TableColumn(name=StringValue(value=name), value=StringValue(value=value))
+                                  for name, value in key])
+        return stream_ref
+
+    def add_row(self, stream_ref, leading_columns=(), trailing_columns=()):
+        """
+        Adds a row of (name, value) columns; the stream's labels go between leading_columns and
+        trailing_columns.
+        """
+        columns = [TableResult.TableColumn(name=StringValue(value=name), value=StringValue(value=value))
+                   for name, value in leading_columns]
+        if self.compact:
+            columns.append(TableResult.TableColumn(name=StringValue(value=STREAM_REF_COLUMN),
+                                                   value=StringValue(value=str(stream_ref))))
+        else:
+            columns.extend(self._streams[stream_ref])
+        columns.extend(TableResult.TableColumn(name=StringValue(value=name), value=StringValue(value=value))
+                       for name, value in trailing_columns)
+        self._rows.append(TableResult.TableRow(columns=columns))
+
+    def build(self, raw_query, total_count):
+        table = TableResult(raw_query=StringValue(value=raw_query), total_count=UInt64Value(value=total_count),
+                            rows=self._rows)
+        if self.compact:
+            table.streams.extend(TableResult.TableRow(columns=columns) for columns in self._streams)
+        return table
+
+
+def expand_log_table(table: TableResult) -> TableResult:
+    """Returns the flat form of a compact log table (label columns repeated per row); flat tables are returned as is."""
+    if not table.streams:
+        return table
+    expanded = TableResult()
+    for field, value in table.ListFields():
+        if field.name not in ('rows', 'streams'):
+            getattr(expanded, field.name).CopyFrom(value)
+    for row in table.rows:
+        columns = []
+        for column in row.columns:
+            if column.name.value == STREAM_REF_COLUMN:
+                columns.extend(table.streams[int(column.value.value)].columns)
+            else:
+                columns.append(column)
+        expanded.rows.add().columns.extend(columns)
+    return expanded
+
+
+def expand_log_task_result(task_result):
+    """Expands a compact logs table of a PlaybookTaskResult in place; returns task_result."""
+    if task_result.WhichOneof('result') == 'logs' and task_result.logs.streams:
+        task_result.logs.CopyFrom(expand_log_table(task_result.logs))
+    return task_result
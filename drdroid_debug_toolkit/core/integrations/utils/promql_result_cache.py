@@ -0,0 +1,307 @@
+"""
+Step-aligned result cache for PromQL range queries, in the spirit of the Prometheus/Mimir query-frontend.
+
+Results are cached per (connector, datasource, normalized expression, step). A range query is aligned to its
+step, served from the cached extents that cover it, and only the missing edges are fetched from the backend
+(typically the newest few steps of a sliding "last 1h" window). Missing ranges longer than a day are split
+at day boundaries and fetched in parallel. Samples newer than max_freshness_seconds are returned but not
+cached, since the backend may still be ingesting them. Memory is bounded by dropping samples older than
+retention_seconds, keeping at most max_samples_per_key (newest first) per key and evicting least recently used
+keys while more than max_total_samples are cached.
+
+Callers provide a fetch(start, end) callable returning {series_id: (series_meta, [(timestamp, value), ...])}
+for the inclusive, step-aligned range [start, end] (timestamps in seconds), or None when the backend query
+failed. Failed queries are never cached.
+"""
+import datetime
+import logging
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from core.utils.instrumentation_utils import ContextThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+_DURATION_PATTERN = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h|d|w|y)')
+_DURATION_UNIT_SECONDS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800, 'y': 31536000}
+
+
+class PromQLResultNotCacheable(Exception):
+    """The backend returned a result shape the cache cannot merge; the caller should query directly."""
+    pass
+
+
+def normalize_promql(expr):
+    """Collapses whitespace outside of string literals so formatting differences share a cache entry."""
+    normalized = []
+    quote = None
+    pending_space = False
+    i = 0
+    while i < len(expr):
+        ch = expr[i]
+        if quote:
+            normalized.append(ch)
+            if ch == '\\' and quote != '`' and i + 1 < len(expr):
+                normalized.append(expr[i + 1])
+                i += 1
+            elif ch == quote:
+                quote = None
+        elif ch.isspace():
+            pending_space = bool(normalized)
+        else:
+            if pending_space:
+                normalized.append(' ')
+                pending_space = False
+            normalized.append(ch)
+            if ch in '"\'`':
+                quote = ch
+        i += 1
+    return ''.join(normalized)
+
+
+def parse_prometheus_time(value):
+    """Parses a Prometheus API time (unix seconds or RFC 3339) into unix seconds; None if unparseable."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        parsed = datetime.datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.timestamp()
+
+
+def parse_prometheus_duration(value):
+    """Parses a Prometheus step (seconds or a duration such as '300s' / '1h30m') into seconds; None if invalid."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    text = str(value).strip()
+    matches = list(_DURATION_PATTERN.finditer(text))
+    if not matches or ''.join(m.group(0) for m in matches) != text:
+        return None
+    return sum(float(m.group(1)) * _DURATION_UNIT_SECONDS[m.group(2)] for m in matches)
+
+
+class _Extent:
+    """Cached samples for the inclusive, step-aligned range [start, end]."""
+
+    __slots__ = ('start', 'end', 'series')
+
+    def __init__(self, start, end, series):
+        self.start = start
+        self.end = end
+        # series_id -> (series_meta, {timestamp: value})
+        self.series = series
+
+    def sample_count(self):
+        return sum(len(points) for _, points in self.series.values())
+
+    def trimmed(self, start):
+        """This extent without the samples before start (step-aligned), or None when nothing is left."""
+        if start <= self.start:
+            return self
+        if start > self.end:
+            return None
+        series = {series_id: (meta, {t: v for t, v in points.items() if t >= start})
+                  for series_id, (meta, points) in self.series.items()}
+        return _Extent(start, self.end, series)
+
+
+class PromQLResultCache:
+    """Thread-safe, in-process LRU of step-aligned extents per query key, bounded by key and sample counts."""
+
+    max_entries = 512
+    max_freshness_seconds = 600
+    split_interval_seconds = 86400
+    max_workers = 4
+    retention_seconds = 86400
+    max_samples_per_key = 200000
+    max_total_samples = 2000000
+
+    def __init__(self, max_entries=None, max_freshness_seconds=None, split_interval_seconds=None,
+                 max_workers=None, retention_seconds=None, max_samples_per_key=None, max_total_samples=None):
+        if max_entries is not None:
+            self.max_entries = max_entries
+        if max_freshness_seconds is not None:
+            self.max_freshness_seconds = max_freshness_seconds
+        if split_interval_seconds is not None:
+            self.split_interval_seconds = split_interval_seconds
+        if max_workers is not None:
+            self.max_workers = max_workers
+        if retention_seconds is not None:
+            self.retention_seconds = retention_seconds
+        if max_samples_per_key is not None:
+            self.max_samples_per_key = max_samples_per_key
+        if max_total_samples is not None:
+            self.max_total_samples = max_total_samples
+        self._entries = OrderedDict()
+        self._sample_counts = {}
+        self._total_samples = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(connector_key, datasource, expr, step):
+        return connector_key, datasource, normalize_promql(expr), step
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sample_counts.clear()
+            self._total_samples = 0
+
+    def query_range(self, key, start, end, step, fetch):
+        """
+        Returns {series_id: (series_meta, [(timestamp, value), ...])} for [start, end] aligned down to step,
+        with points sorted by timestamp, or None when a backend query failed.
+        """
+        step = int(step)
+        if step <= 0:
+            raise ValueError(f"PromQLResultCache.query_range:: Invalid step {step}")
+        start = int(start) // step * step
+        end = max(int(end) // step * step, start)
+
+        with self._lock:
+            extents = list(self._entries.get(key, ()))
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        extents = [extent for extent in extents if extent.end >= start and extent.start <= end]
+
+        fetched = self._fetch_ranges(self._split_ranges(self._missing_ranges(extents, start, end, step), step),
+                                     fetch)
+        if fetched is None:
+            return None
+
+        result = {}
+        for extent in extents + fetched:
+            for series_id, (meta, points) in extent.series.items():
+                merged = result.setdefault(series_id, [meta, {}])
+                merged[0] = meta
+                merged[1].update((t, v) for t, v in points.items() if start <= t <= end)
+
+        now = time.time()
+        cacheable_end = int(now - self.max_freshness_seconds) // step * step
+        retention_start = -(-int(now - self.retention_seconds) // step) * step
+        self._store(key, fetched, retention_start, cacheable_end, step)
+
+        return {series_id: (meta, sorted(points.items())) for series_id, (meta, points) in result.items() if points}
+
+    def _missing_ranges(self, extents, start, end, step):
+        missing = []
+        cursor = start
+        for extent in sorted(extents, key=lambda e: e.start):
+            if extent.start > cursor:
+                missing.append((cursor, min(extent.start - step, end)))
+            cursor = max(cursor, extent.end + step)
+            if cursor > end:
+                break
+        if cursor <= end:
+            missing.append((cursor, end))
+        return missing
+
+    def _split_ranges(self, ranges, step):
+        """Splits ranges at split_interval_seconds boundaries (aligned to step) so long backfills run in parallel."""
+        split = []
+        interval = max(self.split_interval_seconds, step)
+        for range_start, range_end in ranges:
+            cursor = range_start
+            while cursor <= range_end:
+                boundary = (cursor // interval + 1) * interval
+                boundary = -(-boundary // step) * step
+                split.append((cursor, min(boundary - step, range_end)))
+                cursor = boundary
+        return split
+
+    def _fetch_ranges(self, ranges, fetch):
+        if not ranges:
+            return []
+        if len(ranges) == 1 or self.max_workers <= 1:
+            responses = [fetch(range_start, range_end) for range_start, range_end in ranges]
+        else:
+            with ContextThreadPoolExecutor(max_workers=min(self.max_workers, len(ranges))) as executor:
+                responses = list(executor.map(lambda r: fetch(*r), ranges))
+        extents = []
+        for (range_start, range_end), response in zip(ranges, responses):
+            if response is None:
+                return None
+            series = {}
+            for series_id, (meta, points) in response.items():
+                series[series_id] = (meta, {t: v for t, v in points if range_start <= t <= range_end})
+            extents.append(_Extent(range_start, range_end, series))
+        return extents
+
+    def _store(self, key, fetched, retention_start, cacheable_end, step):
+        new_extents = []
+        for extent in fetched:
+            extent = extent.trimmed(retention_start)
+            if extent is None or extent.start > cacheable_end:
+                continue
+            if extent.end > cacheable_end:
+                series = {series_id: (meta, {t: v for t, v in points.items() if t <= cacheable_end})
+                          for series_id, (meta, points) in extent.series.items()}
+                extent = _Extent(extent.start, cacheable_end, series)
+            new_extents.append(extent)
+        if not new_extents:
+            return
+        with self._lock:
+            extents = sorted(self._entries.get(key, []) + new_extents, key=lambda e: e.start)
+            merged = [extents[0]]
+            for extent in extents[1:]:
+                last = merged[-1]
+                if extent.start > last.end + step:
+                    merged.append(extent)
+                    continue
+                series = {series_id: (meta, dict(points)) for series_id, (meta, points) in last.series.items()}
+                for series_id, (meta, points) in extent.series.items():
+                    entry = series.setdefault(series_id, (meta, {}))
+                    entry[1].update(points)
+                    series[series_id] = (meta, entry[1])
+                merged[-1] = _Extent(last.start, max(last.end, extent.end), series)
+            merged = self._trim_to_limits(merged, retention_start, step)
+            self._total_samples -= self._sample_counts.pop(key, 0)
+            self._entries.pop(key, None)
+            if not merged:
+                return
+            self._entries[key] = merged
+            self._sample_counts[key] = sum(extent.sample_count() for extent in merged)
+            self._total_samples += self._sample_counts[key]
+            while len(self._entries) > self.max_entries or self._total_samples > self.max_total_samples:
+                evicted_key, _ = self._entries.popitem(last=False)
+                self._total_samples -= self._sample_counts.pop(evicted_key)
+
+    def _trim_to_limits(self, extents, retention_start, step):
+        """Drops samples older than retention_start, then the oldest steps beyond max_samples_per_key."""
+        extents = [extent for extent in (extent.trimmed(retention_start) for extent in extents) if extent]
+        if sum(extent.sample_count() for extent in extents) <= self.max_samples_per_key:
+            return extents
+        per_timestamp = Counter(t for extent in extents for _, points in extent.series.values() for t in points)
+        kept, cutoff = 0, None
+        for t in sorted(per_timestamp, reverse=True):
+            if kept + per_timestamp[t] > self.max_samples_per_key:
+                cutoff = t + step
+                break
+            kept += per_timestamp[t]
+        return [extent for extent in (extent.trimmed(cutoff) for extent in extents) if extent]
+
+
+_promql_result_cache = PromQLResultCache()
+
+
+def set_promql_result_cache(cache):
+    """Replaces the process-wide PromQL result cache; None disables caching."""
+    global _promql_result_cache
+    _promql_result_cache = cache
+
+
+def get_promql_result_cache():
+    return _promql_result_cache
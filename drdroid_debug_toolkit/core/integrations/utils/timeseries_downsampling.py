@@ -0,0 +1,95 @@
+"""
+Point-budget downsampling of TimeseriesResult protos.
+
+Series are reduced with Largest-Triangle-Three-Buckets (LTTB), which keeps the first and last point and, per
+bucket, the point forming the largest triangle with its neighbours, so spikes, dips and trend changes survive
+while flat stretches are thinned out.
+"""
+import numpy as np
+
+LTTB_MIN_POINTS = 3
+
+
+def lttb_indices(timestamps, values, threshold):
+    """Returns the sorted indices of the `threshold` points LTTB selects (all indices if already within budget)."""
+    point_count = len(timestamps)
+    if threshold >= point_count or threshold < LTTB_MIN_POINTS:
+        return np.arange(point_count)
+    x = np.asarray(timestamps, dtype=np.float64)
+    y = np.asarray(values, dtype=np.float64)
+
+    # Interior points are split into threshold - 2 buckets; the first and last points are always kept
+    edges = np.linspace(1, point_count - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, point_count - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_start, next_end = end, edges[bucket + 2] if bucket + 2 < len(edges) else point_count
+        if next_end <= next_start:
+            next_end = next_start + 1
+        average_x = x[next_start:next_end].mean()
+        average_y = np.nanmean(y[next_start:next_end]) if not np.isnan(y[next_start:next_end]).all() else y[previous]
+        areas = np.abs((x[previous] - average_x) * (y[start:end] - y[previous]) -
+                       (x[previous] - x[start:end]) * (average_y - y[previous]))
+        areas = np.where(np.isnan(areas), -1.0, areas)
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def _allocate_budgets(point_counts, max_points_per_series, max_points):
+    """
+    Splits max_points across series (water-filling: short series give their unused share to longer ones). Every
+    series keeps at least LTTB_MIN_POINTS (or all its points), so with many series the budgets can add up to more
+    than max_points.
+    """
+    budgets = [min(count, max_points_per_series) if max_points_per_series else count for count in point_counts]
+    if not max_points or sum(budgets) <= max_points:
+        return budgets
+    remaining = max_points
+    order = sorted(range(len(budgets)), key=lambda i: budgets[i])
+    for position, i in enumerate(order):
+        share = remaining // (len(order) - position)
+        budgets[i] = min(budgets[i], max(share, LTTB_MIN_POINTS))
+        remaining = max(remaining - budgets[i], 0)
+    return budgets
+
+
+def downsample_timeseries_result(timeseries_result, max_points_per_series=None, max_points=None):
+    """
+    Downsamples timeseries_result (a TimeseriesResult) in place so each series holds at most
+    max_points_per_series points and all series together at most max_points (either may be None).
+
+    Returns {'method', 'original_points', 'returned_points', 'downsampled_series', 'max_points',
+    'point_budget'} when any series was reduced, else None. point_budget is the budget actually applied, which
+    exceeds max_points when there are too many series to keep LTTB_MIN_POINTS each within it.
+    """
+    series_list = list(timeseries_result.labeled_metric_timeseries)
+    point_counts = [len(series.datapoints) for series in series_list]
+    budgets = _allocate_budgets(point_counts, max_points_per_series, max_points)
+    downsampled_series = 0
+    for series, point_count, budget in zip(series_list, point_counts, budgets):
+        if budget >= point_count:
+            continue
+        datapoints = series.datapoints
+        timestamps = [datapoint.timestamp for datapoint in datapoints]
+        values = [datapoint.value.value if datapoint.HasField('value') else np.nan for datapoint in datapoints]
+        kept = [datapoints[int(i)] for i in lttb_indices(timestamps, values, budget)]
+        if len(kept) == point_count:
+            continue
+        kept = [type(datapoint)(timestamp=datapoint.timestamp, value=datapoint.value) if datapoint.HasField('value')
+                else type(datapoint)(timestamp=datapoint.timestamp) for datapoint in kept]
+        del datapoints[:]
+        datapoints.extend(kept)
+        downsampled_series += 1
+    if not downsampled_series:
+        return None
+    return {
+        'method': 'lttb',
+        'original_points': sum(point_counts),
+        'returned_points': sum(len(series.datapoints) for series in series_list),
+        'downsampled_series': downsampled_series,
+        'max_points': max_points,
+        'point_budget': sum(budgets),
+    }
@@ -28,19 +28,19 @@ from google.protobuf import wrappers_pb2 as google_dot_protobuf_dot_wrappers__pb
 from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n,core/protos/playbooks/playbook_commons.proto\x12\x15\x63ore.protos.playbooks\x1a\x16\x63ore/protos/base.proto\x1a\x1f\x63ore/protos/ui_definition.proto\x1a\x1egoogle/protobuf/wrappers.proto\x1a\x1cgoogle/protobuf/struct.proto\"e\n\x0c\x45xternalLink\x12*\n\x04name\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12)\n\x03url\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\"i\n\x0eLabelValuePair\x12*\n\x04name\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12+\n\x05value\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\"\x9a\x04\n\x10TimeseriesResult\x12\x31\n\x0bmetric_name\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x37\n\x11metric_expression\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x62\n\x19labeled_metric_timeseries\x18\x03 \x03(\x0b\x32?.core.protos.playbooks.TimeseriesResult.LabeledMetricTimeseries\x1a\xb5\x02\n\x17LabeledMetricTimeseries\x12\x42\n\x13metric_label_values\x18\x01 \x03(\x0b\x32%.core.protos.playbooks.LabelValuePair\x12*\n\x04unit\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12]\n\ndatapoints\x18\x03 \x03(\x0b\x32I.core.protos.playbooks.TimeseriesResult.LabeledMetricTimeseries.Datapoint\x1aK\n\tDatapoint\x12\x11\n\ttimestamp\x18\x01 \x01(\x10\x12+\n\x05value\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.DoubleValue\"\x99\x04\n\x0bTableResult\x12/\n\traw_query\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x0btotal_count\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12+\n\x05limit\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12,\n\x06offset\x18\x04 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x39\n\x04rows\x18\x05 \x03(\x0b\x32+.core.protos.playbooks.TableResult.TableRow\x12.\n\nsearchable\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x1a\x92\x01\n\x0bTableColumn\x12*\n\x04name\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12*\n\x04type\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12+\n\x05value\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x1aK\n\x08TableRow\x12?\n\x07\x63olumns\x18\x01 \x03(\x0b\x32..core.protos.playbooks.TableResult.TableColumn\"\xe9\x02\n\x11\x41piResponseResult\x12\x34\n\x0erequest_method\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x0brequest_url\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x35\n\x0fresponse_status\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x31\n\x10response_headers\x18\x04 \x01(\x0b\x32\x17.google.protobuf.Struct\x12.\n\rresponse_body\x18\x05 \x01(\x0b\x32\x17.google.protobuf.Struct\x12&\n\x05\x65rror\x18\x06 \x01(\x0b\x32\x17.google.protobuf.Struct\x12)\n\x08metadata\x18\x07 \x01(\x0b\x32\x17.google.protobuf.Struct\"\xde\x01\n\x17\x42\x61shCommandOutputResult\x12U\n\x0f\x63ommand_outputs\x18\x01 \x03(\x0b\x32<.core.protos.playbooks.BashCommandOutputResult.CommandOutput\x1al\n\rCommandOutput\x12-\n\x07\x63ommand\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12,\n\x06output\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\":\n\nTextResult\x12,\n\x06output\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\"\x83\x08\n\x12PlaybookTaskResult\x12+\n\x05\x65rror\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12;\n\x04type\x18\x02 \x01(\x0e\x32-.core.protos.playbooks.PlaybookTaskResultType\x12#\n\x06source\x18\x03 \x01(\x0e\x32\x13.core.protos.Source\x12\x38\n\x17task_local_variable_set\x18\x04 \x01(\x0b\x32\x17.google.protobuf.Struct\x12P\n/result_transformer_lambda_function_variable_set\x18\x05 \x01(\x0b\x32\x17.google.protobuf.Struct\x12@\n\x1aproxy_execution_request_id\x18\x06 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x42\n\x06status\x18\x07 \x01(\x0e\x32\x32.core.protos.playbooks.PlaybookExecutionStatusType\x12\x39\n\x13\x61pproval_request_id\x18\t \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12?\n\x19\x61pproval_task_description\x18\n \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12/\n\twidget_id\x18\x0b \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12)\n\x08metadata\x18\x0c \x01(\x0b\x32\x17.google.protobuf.Struct\x12=\n\ntimeseries\x18\x65 \x01(\x0b\x32\'.core.protos.playbooks.TimeseriesResultH\x00\x12\x33\n\x05table\x18\x66 \x01(\x0b\x32\".core.protos.playbooks.TableResultH\x00\x12@\n\x0c\x61pi_response\x18g \x01(\x0b\x32(.core.protos.playbooks.ApiResponseResultH\x00\x12M\n\x13\x62\x61sh_command_output\x18h \x01(\x0b\x32..core.protos.playbooks.BashCommandOutputResultH\x00\x12\x31\n\x04text\x18i \x01(\x0b\x32!.core.protos.playbooks.TextResultH\x00\x12\x32\n\x04logs\x18j \x01(\x0b\x32\".core.protos.playbooks.TableResultH\x00\x42\x08\n\x06result\"\x83\t\n\x15PlaybookSourceOptions\x12#\n\x06source\x18\x01 \x01(\x0e\x32\x13.core.protos.Source\x12\x32\n\x0c\x64isplay_name\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12`\n\x1bsupported_task_type_options\x18\x03 \x03(\x0b\x32;.core.protos.playbooks.PlaybookSourceOptions.TaskTypeOption\x12W\n\x11\x63onnector_options\x18\x04 \x03(\x0b\x32<.core.protos.playbooks.PlaybookSourceOptions.ConnectorOption\x1a\xd1\x02\n\x0f\x43onnectorOption\x12\x32\n\x0c\x63onnector_id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x34\n\x0e\x63onnector_name\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x34\n\x0e\x63onnector_type\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x32\n\x0c\x64isplay_name\x18\x04 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x34\n\x10is_proxy_enabled\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12\x34\n\x0eproxy_agent_id\x18\x06 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x1a\x81\x04\n\x0eTaskTypeOption\x12\x32\n\x0c\x64isplay_name\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12/\n\ttask_type\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12.\n\x08\x63\x61tegory\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12m\n\x15supported_model_types\x18\x04 \x03(\x0b\x32N.core.protos.playbooks.PlaybookSourceOptions.TaskTypeOption.SourceModelTypeMap\x12\x42\n\x0bresult_type\x18\x05 \x01(\x0e\x32-.core.protos.playbooks.PlaybookTaskResultType\x12+\n\x0b\x66orm_fields\x18\x06 \x03(\x0b\x32\x16.core.protos.FormField\x1az\n\x12SourceModelTypeMap\x12\x30\n\nmodel_type\x18\x01 \x01(\x0e\x32\x1c.core.protos.SourceModelType\x12\x32\n\x0c\x64isplay_name\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue*|\n\x1bPlaybookExecutionStatusType\x12\x12\n\x0eUNKNOWN_STATUS\x10\x00\x12\x0b\n\x07\x43REATED\x10\x01\x12\x0b\n\x07RUNNING\x10\x02\x12\x0c\n\x08\x46INISHED\x10\x03\x12\n\n\x06\x46\x41ILED\x10\x04\x12\x15\n\x11\x41PPROVAL_REQUIRED\x10\x05*.\n\x0cVariableType\x12\x10\n\x0cUNKNOWN_TYPE\x10\x00\x12\x0c\n\x08\x44ROPDOWN\x10\x01*\x7f\n\x16PlaybookTaskResultType\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x0e\n\nTIMESERIES\x10\x01\x12\t\n\x05TABLE\x10\x02\x12\x10\n\x0c\x41PI_RESPONSE\x10\x03\x12\x17\n\x13\x42\x41SH_COMMAND_OUTPUT\x10\x04\x12\x08\n\x04TEXT\x10\x05\x12\x08\n\x04LOGS\x10\x06\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n,core/protos/playbooks/playbook_commons.proto\x12\x15\x63ore.protos.playbooks\x1a\x16\x63ore/protos/base.proto\x1a\x1f\x63ore/protos/ui_definition.proto\x1a\x1egoogle/protobuf/wrappers.proto\x1a\x1cgoogle/protobuf/struct.proto\"e\n\x0c\x45xternalLink\x12*\n\x04name\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12)\n\x03url\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\"i\n\x0eLabelValuePair\x12*\n\x04name\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12+\n\x05value\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\"\x9a\x04\n\x10TimeseriesResult\x12\x31\n\x0bmetric_name\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x37\n\x11metric_expression\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x62\n\x19labeled_metric_timeseries\x18\x03 \x03(\x0b\x32?.core.protos.playbooks.TimeseriesResult.LabeledMetricTimeseries\x1a\xb5\x02\n\x17LabeledMetricTimeseries\x12\x42\n\x13metric_label_values\x18\x01 \x03(\x0b\x32%.core.protos.playbooks.LabelValuePair\x12*\n\x04unit\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12]\n\ndatapoints\x18\x03 \x03(\x0b\x32I.core.protos.playbooks.TimeseriesResult.LabeledMetricTimeseries.Datapoint\x1aK\n\tDatapoint\x12\x11\n\ttimestamp\x18\x01 \x01(\x10\x12+\n\x05value\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.DoubleValue\"\xd7\x04\n\x0bTableResult\x12/\n\traw_query\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x0btotal_count\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12+\n\x05limit\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12,\n\x06offset\x18\x04 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x39\n\x04rows\x18\x05 \x03(\x0b\x32+.core.protos.playbooks.TableResult.TableRow\x12.\n\nsearchable\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12<\n\x07streams\x18\x07 \x03(\x0b\x32+.core.protos.playbooks.TableResult.TableRow\x1a\x92\x01\n\x0bTableColumn\x12*\n\x04name\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12*\n\x04type\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12+\n\x05value\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x1aK\n\x08TableRow\x12?\n\x07\x63olumns\x18\x01 \x03(\x0b\x32..core.protos.playbooks.TableResult.TableColumn\"\xe9\x02\n\x11\x41piResponseResult\x12\x34\n\x0erequest_method\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x0brequest_url\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x35\n\x0fresponse_status\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x31\n\x10response_headers\x18\x04 \x01(\x0b\x32\x17.google.protobuf.Struct\x12.\n\rresponse_body\x18\x05 \x01(\x0b\x32\x17.google.protobuf.Struct\x12&\n\x05\x65rror\x18\x06 \x01(\x0b\x32\x17.google.protobuf.Struct\x12)\n\x08metadata\x18\x07 \x01(\x0b\x32\x17.google.protobuf.Struct\"\xde\x01\n\x17\x42\x61shCommandOutputResult\x12U\n\x0f\x63ommand_outputs\x18\x01 \x03(\x0b\x32<.core.protos.playbooks.BashCommandOutputResult.CommandOutput\x1al\n\rCommandOutput\x12-\n\x07\x63ommand\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12,\n\x06output\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\":\n\nTextResult\x12,\n\x06output\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\"\x83\x08\n\x12PlaybookTaskResult\x12+\n\x05\x65rror\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12;\n\x04type\x18\x02 \x01(\x0e\x32-.core.protos.playbooks.PlaybookTaskResultType\x12#\n\x06source\x18\x03 \x01(\x0e\x32\x13.core.protos.Source\x12\x38\n\x17task_local_variable_set\x18\x04 \x01(\x0b\x32\x17.google.protobuf.Struct\x12P\n/result_transformer_lambda_function_variable_set\x18\x05 \x01(\x0b\x32\x17.google.protobuf.Struct\x12@\n\x1aproxy_execution_request_id\x18\x06 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x42\n\x06status\x18\x07 \x01(\x0e\x32\x32.core.protos.playbooks.PlaybookExecutionStatusType\x12\x39\n\x13\x61pproval_request_id\x18\t \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12?\n\x19\x61pproval_task_description\x18\n \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12/\n\twidget_id\x18\x0b \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12)\n\x08metadata\x18\x0c \x01(\x0b\x32\x17.google.protobuf.Struct\x12=\n\ntimeseries\x18\x65 \x01(\x0b\x32\'.core.protos.playbooks.TimeseriesResultH\x00\x12\x33\n\x05table\x18\x66 \x01(\x0b\x32\".core.protos.playbooks.TableResultH\x00\x12@\n\x0c\x61pi_response\x18g \x01(\x0b\x32(.core.protos.playbooks.ApiResponseResultH\x00\x12M\n\x13\x62\x61sh_command_output\x18h \x01(\x0b\x32..core.protos.playbooks.BashCommandOutputResultH\x00\x12\x31\n\x04text\x18i \x01(\x0b\x32!.core.protos.playbooks.TextResultH\x00\x12\x32\n\x04logs\x18j \x01(\x0b\x32\".core.protos.playbooks.TableResultH\x00\x42\x08\n\x06result\"\x83\t\n\x15PlaybookSourceOptions\x12#\n\x06source\x18\x01 \x01(\x0e\x32\x13.core.protos.Source\x12\x32\n\x0c\x64isplay_name\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12`\n\x1bsupported_task_type_options\x18\x03 \x03(\x0b\x32;.core.protos.playbooks.PlaybookSourceOptions.TaskTypeOption\x12W\n\x11\x63onnector_options\x18\x04 \x03(\x0b\x32<.core.protos.playbooks.PlaybookSourceOptions.ConnectorOption\x1a\xd1\x02\n\x0f\x43onnectorOption\x12\x32\n\x0c\x63onnector_id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x34\n\x0e\x63onnector_name\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x34\n\x0e\x63onnector_type\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x32\n\x0c\x64isplay_name\x18\x04 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x34\n\x10is_proxy_enabled\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12\x34\n\x0eproxy_agent_id\x18\x06 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x1a\x81\x04\n\x0eTaskTypeOption\x12\x32\n\x0c\x64isplay_name\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12/\n\ttask_type\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12.\n\x08\x63\x61tegory\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12m\n\x15supported_model_types\x18\x04 \x03(\x0b\x32N.core.protos.playbooks.PlaybookSourceOptions.TaskTypeOption.SourceModelTypeMap\x12\x42\n\x0bresult_type\x18\x05 \x01(\x0e\x32-.core.protos.playbooks.PlaybookTaskResultType\x12+\n\x0b\x66orm_fields\x18\x06 \x03(\x0b\x32\x16.core.protos.FormField\x1az\n\x12SourceModelTypeMap\x12\x30\n\nmodel_type\x18\x01 \x01(\x0e\x32\x1c.core.protos.SourceModelType\x12\x32\n\x0c\x64isplay_name\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue*|\n\x1bPlaybookExecutionStatusType\x12\x12\n\x0eUNKNOWN_STATUS\x10\x00\x12\x0b\n\x07\x43REATED\x10\x01\x12\x0b\n\x07RUNNING\x10\x02\x12\x0c\n\x08\x46INISHED\x10\x03\x12\n\n\x06\x46\x41ILED\x10\x04\x12\x15\n\x11\x41PPROVAL_REQUIRED\x10\x05*.\n\x0cVariableType\x12\x10\n\x0cUNKNOWN_TYPE\x10\x00\x12\x0c\n\x08\x44ROPDOWN\x10\x01*\x7f\n\x16PlaybookTaskResultType\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x0e\n\nTIMESERIES\x10\x01\x12\t\n\x05TABLE\x10\x02\x12\x10\n\x0c\x41PI_RESPONSE\x10\x03\x12\x17\n\x13\x42\x41SH_COMMAND_OUTPUT\x10\x04\x12\x08\n\x04TEXT\x10\x05\x12\x08\n\x04LOGS\x10\x06\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'core.protos.playbooks.playbook_commons_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_PLAYBOOKEXECUTIONSTATUSTYPE']._serialized_start=4318
-  _globals['_PLAYBOOKEXECUTIONSTATUSTYPE']._serialized_end=4442
-  _globals['_VARIABLETYPE']._serialized_start=4444
-  _globals['_VARIABLETYPE']._serialized_end=4490
-  _globals['_PLAYBOOKTASKRESULTTYPE']._serialized_start=4492
-  _globals['_PLAYBOOKTASKRESULTTYPE']._serialized_end=4619
+  _globals['_PLAYBOOKEXECUTIONSTATUSTYPE']._serialized_start=4380
+  _globals['_PLAYBOOKEXECUTIONSTATUSTYPE']._serialized_end=4504
+  _globals['_VARIABLETYPE']._serialized_start=4506
+  _globals['_VARIABLETYPE']._serialized_end=4552
+  _globals['_PLAYBOOKTASKRESULTTYPE']._serialized_start=4554
+  _globals['_PLAYBOOKTASKRESULTTYPE']._serialized_end=4681
   _globals['_EXTERNALLINK']._serialized_start=190
   _globals['_EXTERNALLINK']._serialized_end=291
   _globals['_LABELVALUEPAIR']._serialized_start=293
@@ -52,27 +52,27 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_TIMESERIESRESULT_LABELEDMETRICTIMESERIES_DATAPOINT']._serialized_start=864
   _globals['_TIMESERIESRESULT_LABELEDMETRICTIMESERIES_DATAPOINT']._serialized_end=939
   _globals['_TABLERESULT']._serialized_start=942
-  _globals['_TABLERESULT']._serialized_end=1479
-  _globals['_TABLERESULT_TABLECOLUMN']._serialized_start=1256
-  _globals['_TABLERESULT_TABLECOLUMN']._serialized_end=1402
-  _globals['_TABLERESULT_TABLEROW']._serialized_start=1404
-  _globals['_TABLERESULT_TABLEROW']._serialized_end=1479
-  _globals['_APIRESPONSERESULT']._serialized_start=1482
-  _globals['_APIRESPONSERESULT']._serialized_end=1843
-  _globals['_BASHCOMMANDOUTPUTRESULT']._serialized_start=1846
-  _globals['_BASHCOMMANDOUTPUTRESULT']._serialized_end=2068
-  _globals['_BASHCOMMANDOUTPUTRESULT_COMMANDOUTPUT']._serialized_start=1960
-  _globals['_BASHCOMMANDOUTPUTRESULT_COMMANDOUTPUT']._serialized_end=2068
-  _globals['_TEXTRESULT']._serialized_start=2070
-  _globals['_TEXTRESULT']._serialized_end=2128
-  _globals['_PLAYBOOKTASKRESULT']._serialized_start=2131
-  _globals['_PLAYBOOKTASKRESULT']._serialized_end=3158
-  _globals['_PLAYBOOKSOURCEOPTIONS']._serialized_start=3161
-  _globals['_PLAYBOOKSOURCEOPTIONS']._serialized_end=4316
-  _globals['_PLAYBOOKSOURCEOPTIONS_CONNECTOROPTION']._serialized_start=3463
-  _globals['_PLAYBOOKSOURCEOPTIONS_CONNECTOROPTION']._serialized_end=3800
-  _globals['_PLAYBOOKSOURCEOPTIONS_TASKTYPEOPTION']._serialized_start=3803
-  _globals['_PLAYBOOKSOURCEOPTIONS_TASKTYPEOPTION']._serialized_end=4316
-  _globals['_PLAYBOOKSOURCEOPTIONS_TASKTYPEOPTION_SOURCEMODELTYPEMAP']._serialized_start=4194
-  _globals['_PLAYBOOKSOURCEOPTIONS_TASKTYPEOPTION_SOURCEMODELTYPEMAP']._serialized_end=4316
+  _globals['_TABLERESULT']._serialized_end=1541
+  _globals['_TABLERESULT_TABLECOLUMN']._serialized_start=1318
+  _globals['_TABLERESULT_TABLECOLUMN']._serialized_end=1464
+  _globals['_TABLERESULT_TABLEROW']._serialized_start=1466
+  _globals['_TABLERESULT_TABLEROW']._serialized_end=1541
+  _globals['_APIRESPONSERESULT']._serialized_start=1544
+  _globals['_APIRESPONSERESULT']._serialized_end=1905
+  _globals['_BASHCOMMANDOUTPUTRESULT']._serialized_start=1908
+  _globals['_BASHCOMMANDOUTPUTRESULT']._serialized_end=2130
+  _globals['_BASHCOMMANDOUTPUTRESULT_COMMANDOUTPUT']._serialized_start=2022
+  _globals['_BASHCOMMANDOUTPUTRESULT_COMMANDOUTPUT']._serialized_end=2130
+  _globals['_TEXTRESULT']._serialized_start=2132
+  _globals['_TEXTRESULT']._serialized_end=2190
+  _globals['_PLAYBOOKTASKRESULT']._serialized_start=2193
+  _globals['_PLAYBOOKTASKRESULT']._serialized_end=3220
+  _globals['_PLAYBOOKSOURCEOPTIONS']._serialized_start=3223
+  _globals['_PLAYBOOKSOURCEOPTIONS']._serialized_end=4378
+  _globals['_PLAYBOOKSOURCEOPTIONS_CONNECTOROPTION']._serialized_start=3525
+  _globals['_PLAYBOOKSOURCEOPTIONS_CONNECTOROPTION']._serialized_end=3862
+  _globals['_PLAYBOOKSOURCEOPTIONS_TASKTYPEOPTION']._serialized_start=3865
+  _globals['_PLAYBOOKSOURCEOPTIONS_TASKTYPEOPTION']._serialized_end=4378
+  _globals['_PLAYBOOKSOURCEOPTIONS_TASKTYPEOPTION_SOURCEMODELTYPEMAP']._serialized_start=4256
+  _globals['_PLAYBOOKSOURCEOPTIONS_TASKTYPEOPTION_SOURCEMODELTYPEMAP']._serialized_end=4378
 # @@protoc_insertion_point(module_scope)
@@ -240,6 +240,7 @@ class TableResult(google.protobuf.message.Message):
     OFFSET_FIELD_NUMBER: builtins.int
     ROWS_FIELD_NUMBER: builtins.int
     SEARCHABLE_FIELD_NUMBER: builtins.int
+    STREAMS_FIELD_NUMBER: builtins.int
     @property
     def raw_query(self) -> google.protobuf.wrappers_pb2.StringValue: ...
     @property
@@ -252,6 +253,11 @@ class TableResult(google.protobuf.message.Message):
     def rows(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___TableResult.TableRow]: ...
     @property
     def searchable(self) -> google.protobuf.wrappers_pb2.BoolValue: ...
+    @property
+    def streams(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___TableResult.TableRow]:
+        """Compact log tables: label columns shared by many rows are stored once here, and each row carries a
+        "__stream_ref" column holding the index of its entry (see expand_log_table for the flat form)
+        """
     def __init__(
         self,
         *,
@@ -261,9 +267,10 @@ class TableResult(google.protobuf.message.Message):
         offset: google.protobuf.wrappers_pb2.UInt64Value | None = ...,
         rows: collections.abc.Iterable[global___TableResult.TableRow] | None = ...,
         searchable: google.protobuf.wrappers_pb2.BoolValue | None = ...,
+        streams: collections.abc.Iterable[global___TableResult.TableRow] | None = ...,
     ) -> None: ...
     def HasField(self, field_name: typing_extensions.Literal["limit", b"limit", "offset", b"offset", "raw_query", b"raw_query", "searchable", b"searchable", "total_count", b"total_count"]) -> builtins.bool: ...
-    def ClearField(self, field_name: typing_extensions.Literal["limit", b"limit", "offset", b"offset", "raw_query", b"raw_query", "rows", b"rows", "searchable", b"searchable", "total_count", b"total_count"]) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["limit", b"limit", "offset", b"offset", "raw_query", b"raw_query", "rows", b"rows", "searchable", b"searchable", "streams", b"streams", "total_count", b"total_count"]) -> None: ...
 
 global___TableResult = TableResult
 
@@ -69,7 +69,7 @@ from core.protos.playbooks.source_task_definitions import metabase_task_pb2 as c
 from core.protos.playbooks.source_task_definitions import confluence_cloud_task_pb2 as core_dot_protos_dot_playbooks_dot_source__task__definitions_dot_confluence__cloud__task__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n$core/protos/playbooks/playbook.proto\x12\x15\x63ore.protos.playbooks\x1a\x16\x63ore/protos/base.proto\x1a\x1egoogle/protobuf/wrappers.proto\x1a\x1cgoogle/protobuf/struct.proto\x1a,core/protos/playbooks/playbook_commons.proto\x1a:core/protos/playbooks/intelligence_layer/interpreter.proto\x1a:core/protos/playbooks/playbook_task_result_evaluator.proto\x1a:core/protos/playbooks/playbook_step_result_evaluator.proto\x1a\x43\x63ore/protos/playbooks/source_task_definitions/cloudwatch_task.proto\x1a@core/protos/playbooks/source_task_definitions/grafana_task.proto\x1a\x42\x63ore/protos/playbooks/source_task_definitions/new_relic_task.proto\x1a@core/protos/playbooks/source_task_definitions/datadog_task.proto\x1a<core/protos/playbooks/source_task_definitions/eks_task.proto\x1aGcore/protos/playbooks/source_task_definitions/sql_data_fetch_task.proto\x1a<core/protos/playbooks/source_task_definitions/api_task.proto\x1a=core/protos/playbooks/source_task_definitions/bash_task.proto\x1a\x46\x63ore/protos/playbooks/source_task_definitions/documentation_task.proto\x1a?core/protos/playbooks/source_task_definitions/promql_task.proto\x1a>core/protos/playbooks/source_task_definitions/azure_task.proto\x1a<core/protos/playbooks/source_task_definitions/gke_task.proto\x1aGcore/protos/playbooks/source_task_definitions/elastic_search_task.proto\x1a\x45\x63ore/protos/playbooks/source_task_definitions/grafana_loki_task.proto\x1a@core/protos/playbooks/source_task_definitions/kubectl_task.proto\x1a<core/protos/playbooks/source_task_definitions/gcm_task.proto\x1a>core/protos/playbooks/source_task_definitions/email_task.proto\x1aHcore/protos/playbooks/source_task_definitions/lambda_function_task.proto\x1a>core/protos/playbooks/source_task_definitions/slack_task.proto\x1a\x42\x63ore/protos/playbooks/source_task_definitions/big_query_task.proto\x1a@core/protos/playbooks/source_task_definitions/mongodb_task.proto\x1a\x44\x63ore/protos/playbooks/source_task_definitions/open_search_task.proto\x1a@core/protos/playbooks/source_task_definitions/jenkins_task.proto\x1a?core/protos/playbooks/source_task_definitions/github_task.proto\x1aHcore/protos/playbooks/source_task_definitions/drd_proxy_agent_task.proto\x1a?core/protos/playbooks/source_task_definitions/sentry_task.proto\x1aGcore/protos/playbooks/source_task_definitions/github_actions_task.proto\x1a?core/protos/playbooks/source_task_definitions/argocd_task.proto\x1a=core/protos/playbooks/source_task_definitions/jira_task.proto\x1a?core/protos/playbooks/source_task_definitions/signoz_task.proto\x1a@core/protos/playbooks/source_task_definitions/posthog_task.proto\x1a\x42\x63ore/protos/playbooks/source_task_definitions/coralogix_task.proto\x1a\x41\x63ore/protos/playbooks/source_task_definitions/opsgenie_task.proto\x1a\x46\x63ore/protos/playbooks/source_task_definitions/victoria_logs_task.proto\x1a?core/protos/playbooks/source_task_definitions/render_task.proto\x1a<core/protos/playbooks/source_task_definitions/mcp_task.proto\x1a\x41\x63ore/protos/playbooks/source_task_definitions/metabase_task.proto\x1aIcore/protos/playbooks/source_task_definitions/confluence_cloud_task.proto\"\xcc\x02\n\x08Variable\x12*\n\x04name\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x0b\x64\x65scription\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x04type\x18\x03 \x01(\x0e\x32#.core.protos.playbooks.VariableType\x12\x0f\n\x07options\x18\x04 \x03(\t\x12-\n\tis_active\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12\x30\n\ncreated_by\x18\x06 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x12\n\ncreated_at\x18\x07 \x01(\x10\x12(\n\x02id\x18\x08 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\"\xb5\x03\n\x10UpdateVariableOp\x12\x36\n\x02op\x18\x01 \x01(\x0e\x32*.core.protos.playbooks.UpdateVariableOp.Op\x12Q\n\x0fupdate_variable\x18\x65 \x01(\x0b\x32\x36.core.protos.playbooks.UpdateVariableOp.UpdateVariableH\x00\x12M\n\rupdate_status\x18\x66 \x01(\x0b\x32\x34.core.protos.playbooks.UpdateVariableOp.UpdateStatusH\x00\x1a\x43\n\x0eUpdateVariable\x12\x31\n\x08variable\x18\x01 \x01(\x0b\x32\x1f.core.protos.playbooks.Variable\x1a=\n\x0cUpdateStatus\x12-\n\tis_active\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\"9\n\x02Op\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x11\n\rUPDATE_STATUS\x10\x02\x12\x13\n\x0fUPDATE_VARIABLE\x10\x03\x42\x08\n\x06update\"\x89\x1c\n\x0cPlaybookTask\x12(\n\x02id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12#\n\x06source\x18\x02 \x01(\x0e\x32\x13.core.protos.Source\x12\x32\n\x0creference_id\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12*\n\x04name\x18\x04 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x0b\x64\x65scription\x18\x05 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12+\n\x05notes\x18\x06 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x30\n\ncreated_by\x18\x07 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x34\n\x13global_variable_set\x18\x08 \x01(\x0b\x32\x17.google.protobuf.Struct\x12@\n\x10interpreter_type\x18\t \x01(\x0e\x32&.core.protos.playbooks.InterpreterType\x12_\n\x16task_connector_sources\x18\n \x03(\x0b\x32?.core.protos.playbooks.PlaybookTask.PlaybookTaskConnectorSource\x12[\n\x17\x65xecution_configuration\x18\x0b \x01(\x0b\x32:.core.protos.playbooks.PlaybookTask.ExecutionConfiguration\x12=\n\rdocumentation\x18\x65 \x01(\x0b\x32$.core.protos.playbooks.DocumentationH\x00\x12\x37\n\ncloudwatch\x18\x66 \x01(\x0b\x32!.core.protos.playbooks.CloudwatchH\x00\x12\x31\n\x07grafana\x18g \x01(\x0b\x32\x1e.core.protos.playbooks.GrafanaH\x00\x12\x34\n\tnew_relic\x18h \x01(\x0b\x32\x1f.core.protos.playbooks.NewRelicH\x00\x12\x31\n\x07\x64\x61tadog\x18i \x01(\x0b\x32\x1e.core.protos.playbooks.DatadogH\x00\x12\x39\n\nclickhouse\x18j \x01(\x0b\x32#.core.protos.playbooks.SqlDataFetchH\x00\x12\x37\n\x08postgres\x18k \x01(\x0b\x32#.core.protos.playbooks.SqlDataFetchH\x00\x12)\n\x03\x65ks\x18l \x01(\x0b\x32\x1a.core.protos.playbooks.EksH\x00\x12\x46\n\x17sql_database_connection\x18m \x01(\x0b\x32#.core.protos.playbooks.SqlDataFetchH\x00\x12)\n\x03\x61pi\x18n \x01(\x0b\x32\x1a.core.protos.playbooks.ApiH\x00\x12+\n\x04\x62\x61sh\x18o \x01(\x0b\x32\x1b.core.protos.playbooks.BashH\x00\x12\x36\n\rgrafana_mimir\x18p \x01(\x0b\x32\x1d.core.protos.playbooks.PromQlH\x00\x12-\n\x05\x61zure\x18q \x01(\x0b\x32\x1c.core.protos.playbooks.AzureH\x00\x12)\n\x03gke\x18r \x01(\x0b\x32\x1a.core.protos.playbooks.GkeH\x00\x12>\n\x0e\x65lastic_search\x18s \x01(\x0b\x32$.core.protos.playbooks.ElasticSearchH\x00\x12:\n\x0cgrafana_loki\x18t \x01(\x0b\x32\".core.protos.playbooks.GrafanaLokiH\x00\x12\x34\n\nkubernetes\x18u \x01(\x0b\x32\x1e.core.protos.playbooks.KubectlH\x00\x12)\n\x03gcm\x18v \x01(\x0b\x32\x1a.core.protos.playbooks.GcmH\x00\x12+\n\x04smtp\x18w \x01(\x0b\x32\x1b.core.protos.playbooks.SMTPH\x00\x12-\n\x05slack\x18x \x01(\x0b\x32\x1c.core.protos.playbooks.SlackH\x00\x12\x34\n\tbig_query\x18y \x01(\x0b\x32\x1f.core.protos.playbooks.BigQueryH\x00\x12\x31\n\x07mongodb\x18{ \x01(\x0b\x32\x1e.core.protos.playbooks.MongoDBH\x00\x12\x38\n\x0bopen_search\x18| \x01(\x0b\x32!.core.protos.playbooks.OpenSearchH\x00\x12\x31\n\x07jenkins\x18} \x01(\x0b\x32\x1e.core.protos.playbooks.JenkinsH\x00\x12/\n\x06github\x18~ \x01(\x0b\x32\x1d.core.protos.playbooks.GithubH\x00\x12/\n\x06sentry\x18\x7f \x01(\x0b\x32\x1d.core.protos.playbooks.SentryH\x00\x12?\n\x0egithub_actions\x18\x80\x01 \x01(\x0b\x32$.core.protos.playbooks.GithubActionsH\x00\x12\x30\n\x06\x61rgocd\x18\x82\x01 \x01(\x0b\x32\x1d.core.protos.playbooks.ArgoCDH\x00\x12\x32\n\njira_cloud\x18\x83\x01 \x01(\x0b\x32\x1b.core.protos.playbooks.JiraH\x00\x12\x30\n\x06lambda\x18\x84\x01 \x01(\x0b\x32\x1d.core.protos.playbooks.LambdaH\x00\x12@\n\x0f\x64rd_proxy_agent\x18\x85\x01 \x01(\x0b\x32$.core.protos.playbooks.DrdProxyAgentH\x00\x12\x32\n\x07posthog\x18\x88\x01 \x01(\x0b\x32\x1e.core.protos.playbooks.PostHogH\x00\x12\x30\n\x06signoz\x18\x89\x01 \x01(\x0b\x32\x1d.core.protos.playbooks.SignozH\x00\x12\x30\n\x06render\x18\x8b\x01 \x01(\x0b\x32\x1d.core.protos.playbooks.RenderH\x00\x12\x36\n\tcoralogix\x18\x8d\x01 \x01(\x0b\x32 .core.protos.playbooks.CoralogixH\x00\x12\x35\n\tops_genie\x18\x8f\x01 \x01(\x0b\x32\x1f.core.protos.playbooks.OpsGenieH\x00\x12=\n\rvictoria_logs\x18\x90\x01 \x01(\x0b\x32#.core.protos.playbooks.VictoriaLogsH\x00\x12\x37\n\nmcp_server\x18\x91\x01 \x01(\x0b\x32 .core.protos.playbooks.McpServerH\x00\x12\x34\n\x08metabase\x18\x92\x01 \x01(\x0b\x32\x1f.core.protos.playbooks.MetabaseH\x00\x12\x43\n\x10\x63onfluence_cloud\x18\x93\x01 \x01(\x0b\x32&.core.protos.playbooks.ConfluenceCloudH\x00\x1a\x84\x02\n\x1bPlaybookTaskConnectorSource\x12(\n\x02id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12#\n\x06source\x18\x02 \x01(\x0e\x32\x13.core.protos.Source\x12*\n\x04name\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x34\n\x10is_proxy_enabled\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12\x34\n\x0eproxy_agent_id\x18\x05 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x1a\x87\x04\n\x16\x45xecutionConfiguration\x12\x35\n\x11is_bulk_execution\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12>\n\x18\x62ulk_execution_var_field\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x1a\n\x12timeseries_offsets\x18\x03 \x03(\r\x12\x41\n\x1dis_result_transformer_enabled\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12R\n\"result_transformer_lambda_function\x18\x05 \x01(\x0b\x32&.core.protos.playbooks.Lambda.Function\x12\x38\n\x14is_approval_required\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12?\n\x19result_transformer_prompt\x18\x07 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12H\n$is_result_transformer_prompt_enabled\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.BoolValueB\x06\n\x04task\"\x97\x03\n\x16PlaybookTaskResultRule\x12;\n\x04type\x18\x01 \x01(\x0e\x32-.core.protos.playbooks.PlaybookTaskResultType\x12\x31\n\x04task\x18\x02 \x01(\x0b\x32#.core.protos.playbooks.PlaybookTask\x12\x41\n\ntimeseries\x18\x65 \x01(\x0b\x32+.core.protos.playbooks.TimeseriesResultRuleH\x00\x12\x37\n\x05table\x18\x66 \x01(\x0b\x32&.core.protos.playbooks.TableResultRuleH\x00\x12\x36\n\x04logs\x18g \x01(\x0b\x32&.core.protos.playbooks.TableResultRuleH\x00\x12Q\n\x13\x62\x61sh_command_output\x18h \x01(\x0b\x32\x32.core.protos.playbooks.BashCommandOutputResultRuleH\x00\x42\x06\n\x04rule\"\xcb\x06\n\x18PlaybookTaskExecutionLog\x12(\n\x02id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x11\n\ttimestamp\x18\x02 \x01(\x10\x12\x31\n\x04task\x18\x03 \x01(\x0b\x32#.core.protos.playbooks.PlaybookTask\x12\x39\n\x06result\x18\x04 \x01(\x0b\x32).core.protos.playbooks.PlaybookTaskResult\x12=\n\x0einterpretation\x18\x05 \x01(\x0b\x32%.core.protos.playbooks.Interpretation\x12*\n\ntime_range\x18\x06 \x01(\x0b\x32\x16.core.protos.TimeRange\x12\x30\n\ncreated_by\x18\x07 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12>\n\x1d\x65xecution_global_variable_set\x18\x08 \x01(\x0b\x32\x17.google.protobuf.Struct\x12@\n\x1aproxy_execution_request_id\x18\t \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x42\n\x06status\x18\n \x01(\x0e\x32\x32.core.protos.playbooks.PlaybookExecutionStatusType\x12Y\n\x10\x61pproval_context\x18\x0b \x01(\x0b\x32?.core.protos.playbooks.PlaybookTaskExecutionLog.ApprovalContext\x1a\xc5\x01\n\x0f\x41pprovalContext\x12/\n\x0bis_approved\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12\x13\n\x0b\x61pproved_at\x18\x02 \x01(\x10\x12\x31\n\x0b\x61pproved_by\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x39\n\x13\x61pproval_request_id\x18\x04 \x01(\x0b\x32\x1c.google.protobuf.StringValue\"\xe9\x02\n\x1bPlaybookStepResultCondition\x12\x36\n\x10logical_operator\x18\x01 \x01(\x0e\x32\x1c.core.protos.LogicalOperator\x12M\n\trule_sets\x18\x02 \x03(\x0b\x32:.core.protos.playbooks.PlaybookStepResultCondition.RuleSet\x1a\xc2\x01\n\x07RuleSet\x12\x36\n\x10logical_operator\x18\x01 \x01(\x0e\x32\x1c.core.protos.LogicalOperator\x12<\n\x05rules\x18\x02 \x03(\x0b\x32-.core.protos.playbooks.PlaybookTaskResultRule\x12\x41\n\nstep_rules\x18\x03 \x03(\x0b\x32-.core.protos.playbooks.PlaybookStepResultRule\"\xea\x03\n\x0cPlaybookStep\x12(\n\x02id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x32\n\x0creference_id\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12*\n\x04name\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x0b\x64\x65scription\x18\x04 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12+\n\x05notes\x18\x05 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12;\n\x0e\x65xternal_links\x18\x06 \x03(\x0b\x32#.core.protos.playbooks.ExternalLink\x12@\n\x10interpreter_type\x18\x07 \x01(\x0e\x32&.core.protos.playbooks.InterpreterType\x12\x32\n\x05tasks\x18\x08 \x03(\x0b\x32#.core.protos.playbooks.PlaybookTask\x12=\n\x08\x63hildren\x18\t \x03(\x0b\x32+.core.protos.playbooks.PlaybookStepRelation\"\x9f\x02\n\x14PlaybookStepRelation\x12(\n\x02id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x33\n\x06parent\x18\x02 \x01(\x0b\x32#.core.protos.playbooks.PlaybookStep\x12\x32\n\x05\x63hild\x18\x03 \x01(\x0b\x32#.core.protos.playbooks.PlaybookStep\x12\x45\n\tcondition\x18\x04 \x01(\x0b\x32\x32.core.protos.playbooks.PlaybookStepResultCondition\x12-\n\tis_active\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\"\xc3\x02\n PlaybookStepRelationExecutionLog\x12(\n\x02id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12=\n\x08relation\x18\x02 \x01(\x0b\x32+.core.protos.playbooks.PlaybookStepRelation\x12\x35\n\x11\x65valuation_result\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12\x32\n\x11\x65valuation_output\x18\x04 \x01(\x0b\x32\x17.google.protobuf.Struct\x12K\n\x1cstep_relation_interpretation\x18\x05 \x01(\x0b\x32%.core.protos.playbooks.Interpretation\"\x8b\x04\n\x18PlaybookStepExecutionLog\x12(\n\x02id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x11\n\ttimestamp\x18\x02 \x01(\x10\x12\x35\n\x0fplaybook_run_id\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x04step\x18\x04 \x01(\x0b\x32#.core.protos.playbooks.PlaybookStep\x12L\n\x13task_execution_logs\x18\x05 \x03(\x0b\x32/.core.protos.playbooks.PlaybookTaskExecutionLog\x12X\n\x17relation_execution_logs\x18\x06 \x03(\x0b\x32\x37.core.protos.playbooks.PlaybookStepRelationExecutionLog\x12\x42\n\x13step_interpretation\x18\x07 \x01(\x0b\x32%.core.protos.playbooks.Interpretation\x12*\n\ntime_range\x18\x08 \x01(\x0b\x32\x16.core.protos.TimeRange\x12\x30\n\ncreated_by\x18\t \x01(\x0b\x32\x1c.google.protobuf.StringValue\"\x90\x04\n\x08Playbook\x12(\n\x02id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12*\n\x04name\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x0b\x64\x65scription\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x34\n\x13global_variable_set\x18\x04 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x30\n\ncreated_by\x18\x05 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12-\n\tis_active\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12\x12\n\ncreated_at\x18\x07 \x01(\x10\x12\x13\n\x0blast_run_at\x18\x08 \x01(\x10\x12\x42\n\x06status\x18\t \x01(\x0e\x32\x32.core.protos.playbooks.PlaybookExecutionStatusType\x12\x32\n\x05steps\x18\n \x03(\x0b\x32#.core.protos.playbooks.PlaybookStep\x12\x43\n\x0estep_relations\x18\x0b \x03(\x0b\x32+.core.protos.playbooks.PlaybookStepRelation\"\x94\x04\n\x11PlaybookExecution\x12(\n\x02id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x35\n\x0fplaybook_run_id\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x08playbook\x18\x03 \x01(\x0b\x32\x1f.core.protos.playbooks.Playbook\x12\x42\n\x06status\x18\x04 \x01(\x0e\x32\x32.core.protos.playbooks.PlaybookExecutionStatusType\x12\x12\n\ncreated_at\x18\x05 \x01(\x10\x12\x12\n\nstarted_at\x18\x06 \x01(\x10\x12\x13\n\x0b\x66inished_at\x18\x07 \x01(\x10\x12*\n\ntime_range\x18\x08 \x01(\x0b\x32\x16.core.protos.TimeRange\x12\x30\n\ncreated_by\x18\t \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12L\n\x13step_execution_logs\x18\x0b \x03(\x0b\x32/.core.protos.playbooks.PlaybookStepExecutionLog\x12>\n\x1d\x65xecution_global_variable_set\x18\x0c \x01(\x0b\x32\x17.google.protobuf.Struct\"\x8f\x05\n\x10UpdatePlaybookOp\x12\x36\n\x02op\x18\x01 \x01(\x0e\x32*.core.protos.playbooks.UpdatePlaybookOp.Op\x12Z\n\x14update_playbook_name\x18\x02 \x01(\x0b\x32:.core.protos.playbooks.UpdatePlaybookOp.UpdatePlaybookNameH\x00\x12^\n\x16update_playbook_status\x18\x03 \x01(\x0b\x32<.core.protos.playbooks.UpdatePlaybookOp.UpdatePlaybookStatusH\x00\x12Q\n\x0fupdate_playbook\x18\x04 \x01(\x0b\x32\x36.core.protos.playbooks.UpdatePlaybookOp.UpdatePlaybookH\x00\x1a@\n\x12UpdatePlaybookName\x12*\n\x04name\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x1a\x45\n\x14UpdatePlaybookStatus\x12-\n\tis_active\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x1a\x43\n\x0eUpdatePlaybook\x12\x31\n\x08playbook\x18\x01 \x01(\x0b\x32\x1f.core.protos.playbooks.Playbook\"\\\n\x02Op\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x18\n\x14UPDATE_PLAYBOOK_NAME\x10\x01\x12\x1a\n\x16UPDATE_PLAYBOOK_STATUS\x10\x02\x12\x13\n\x0fUPDATE_PLAYBOOK\x10\x03\x42\x08\n\x06updateb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n$core/protos/playbooks/playbook.proto\x12\x15\x63ore.protos.playbooks\x1a\x16\x63ore/protos/base.proto\x1a\x1egoogle/protobuf/wrappers.proto\x1a\x1cgoogle/protobuf/struct.proto\x1a,core/protos/playbooks/playbook_commons.proto\x1a:core/protos/playbooks/intelligence_layer/interpreter.proto\x1a:core/protos/playbooks/playbook_task_result_evaluator.proto\x1a:core/protos/playbooks/playbook_step_result_evaluator.proto\x1a\x43\x63ore/protos/playbooks/source_task_definitions/cloudwatch_task.proto\x1a@core/protos/playbooks/source_task_definitions/grafana_task.proto\x1a\x42\x63ore/protos/playbooks/source_task_definitions/new_relic_task.proto\x1a@core/protos/playbooks/source_task_definitions/datadog_task.proto\x1a<core/protos/playbooks/source_task_definitions/eks_task.proto\x1aGcore/protos/playbooks/source_task_definitions/sql_data_fetch_task.proto\x1a<core/protos/playbooks/source_task_definitions/api_task.proto\x1a=core/protos/playbooks/source_task_definitions/bash_task.proto\x1a\x46\x63ore/protos/playbooks/source_task_definitions/documentation_task.proto\x1a?core/protos/playbooks/source_task_definitions/promql_task.proto\x1a>core/protos/playbooks/source_task_definitions/azure_task.proto\x1a<core/protos/playbooks/source_task_definitions/gke_task.proto\x1aGcore/protos/playbooks/source_task_definitions/elastic_search_task.proto\x1a\x45\x63ore/protos/playbooks/source_task_definitions/grafana_loki_task.proto\x1a@core/protos/playbooks/source_task_definitions/kubectl_task.proto\x1a<core/protos/playbooks/source_task_definitions/gcm_task.proto\x1a>core/protos/playbooks/source_task_definitions/email_task.proto\x1aHcore/protos/playbooks/source_task_definitions/lambda_function_task.proto\x1a>core/protos/playbooks/source_task_definitions/slack_task.proto\x1a\x42\x63ore/protos/playbooks/source_task_definitions/big_query_task.proto\x1a@core/protos/playbooks/source_task_definitions/mongodb_task.proto\x1a\x44\x63ore/protos/playbooks/source_task_definitions/open_search_task.proto\x1a@core/protos/playbooks/source_task_definitions/jenkins_task.proto\x1a?core/protos/playbooks/source_task_definitions/github_task.proto\x1aHcore/protos/playbooks/source_task_definitions/drd_proxy_agent_task.proto\x1a?core/protos/playbooks/source_task_definitions/sentry_task.proto\x1aGcore/protos/playbooks/source_task_definitions/github_actions_task.proto\x1a?core/protos/playbooks/source_task_definitions/argocd_task.proto\x1a=core/protos/playbooks/source_task_definitions/jira_task.proto\x1a?core/protos/playbooks/source_task_definitions/signoz_task.proto\x1a@core/protos/playbooks/source_task_definitions/posthog_task.proto\x1a\x42\x63ore/protos/playbooks/source_task_definitions/coralogix_task.proto\x1a\x41\x63ore/protos/playbooks/source_task_definitions/opsgenie_task.proto\x1a\x46\x63ore/protos/playbooks/source_task_definitions/victoria_logs_task.proto\x1a?core/protos/playbooks/source_task_definitions/render_task.proto\x1a<core/protos/playbooks/source_task_definitions/mcp_task.proto\x1a\x41\x63ore/protos/playbooks/source_task_definitions/metabase_task.proto\x1aIcore/protos/playbooks/source_task_definitions/confluence_cloud_task.proto\"\xcc\x02\n\x08Variable\x12*\n\x04name\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x0b\x64\x65scription\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x04type\x18\x03 \x01(\x0e\x32#.core.protos.playbooks.VariableType\x12\x0f\n\x07options\x18\x04 \x03(\t\x12-\n\tis_active\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12\x30\n\ncreated_by\x18\x06 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x12\n\ncreated_at\x18\x07 \x01(\x10\x12(\n\x02id\x18\x08 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\"\xb5\x03\n\x10UpdateVariableOp\x12\x36\n\x02op\x18\x01 \x01(\x0e\x32*.core.protos.playbooks.UpdateVariableOp.Op\x12Q\n\x0fupdate_variable\x18\x65 \x01(\x0b\x32\x36.core.protos.playbooks.UpdateVariableOp.UpdateVariableH\x00\x12M\n\rupdate_status\x18\x66 \x01(\x0b\x32\x34.core.protos.playbooks.UpdateVariableOp.UpdateStatusH\x00\x1a\x43\n\x0eUpdateVariable\x12\x31\n\x08variable\x18\x01 \x01(\x0b\x32\x1f.core.protos.playbooks.Variable\x1a=\n\x0cUpdateStatus\x12-\n\tis_active\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\"9\n\x02Op\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x11\n\rUPDATE_STATUS\x10\x02\x12\x13\n\x0fUPDATE_VARIABLE\x10\x03\x42\x08\n\x06update\"\x8e\x1d\n\x0cPlaybookTask\x12(\n\x02id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12#\n\x06source\x18\x02 \x01(\x0e\x32\x13.core.protos.Source\x12\x32\n\x0creference_id\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12*\n\x04name\x18\x04 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x0b\x64\x65scription\x18\x05 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12+\n\x05notes\x18\x06 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x30\n\ncreated_by\x18\x07 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x34\n\x13global_variable_set\x18\x08 \x01(\x0b\x32\x17.google.protobuf.Struct\x12@\n\x10interpreter_type\x18\t \x01(\x0e\x32&.core.protos.playbooks.InterpreterType\x12_\n\x16task_connector_sources\x18\n \x03(\x0b\x32?.core.protos.playbooks.PlaybookTask.PlaybookTaskConnectorSource\x12[\n\x17\x65xecution_configuration\x18\x0b \x01(\x0b\x32:.core.protos.playbooks.PlaybookTask.ExecutionConfiguration\x12=\n\rdocumentation\x18\x65 \x01(\x0b\x32$.core.protos.playbooks.DocumentationH\x00\x12\x37\n\ncloudwatch\x18\x66 \x01(\x0b\x32!.core.protos.playbooks.CloudwatchH\x00\x12\x31\n\x07grafana\x18g \x01(\x0b\x32\x1e.core.protos.playbooks.GrafanaH\x00\x12\x34\n\tnew_relic\x18h \x01(\x0b\x32\x1f.core.protos.playbooks.NewRelicH\x00\x12\x31\n\x07\x64\x61tadog\x18i \x01(\x0b\x32\x1e.core.protos.playbooks.DatadogH\x00\x12\x39\n\nclickhouse\x18j \x01(\x0b\x32#.core.protos.playbooks.SqlDataFetchH\x00\x12\x37\n\x08postgres\x18k \x01(\x0b\x32#.core.protos.playbooks.SqlDataFetchH\x00\x12)\n\x03\x65ks\x18l \x01(\x0b\x32\x1a.core.protos.playbooks.EksH\x00\x12\x46\n\x17sql_database_connection\x18m \x01(\x0b\x32#.core.protos.playbooks.SqlDataFetchH\x00\x12)\n\x03\x61pi\x18n \x01(\x0b\x32\x1a.core.protos.playbooks.ApiH\x00\x12+\n\x04\x62\x61sh\x18o \x01(\x0b\x32\x1b.core.protos.playbooks.BashH\x00\x12\x36\n\rgrafana_mimir\x18p \x01(\x0b\x32\x1d.core.protos.playbooks.PromQlH\x00\x12-\n\x05\x61zure\x18q \x01(\x0b\x32\x1c.core.protos.playbooks.AzureH\x00\x12)\n\x03gke\x18r \x01(\x0b\x32\x1a.core.protos.playbooks.GkeH\x00\x12>\n\x0e\x65lastic_search\x18s \x01(\x0b\x32$.core.protos.playbooks.ElasticSearchH\x00\x12:\n\x0cgrafana_loki\x18t \x01(\x0b\x32\".core.protos.playbooks.GrafanaLokiH\x00\x12\x34\n\nkubernetes\x18u \x01(\x0b\x32\x1e.core.protos.playbooks.KubectlH\x00\x12)\n\x03gcm\x18v \x01(\x0b\x32\x1a.core.protos.playbooks.GcmH\x00\x12+\n\x04smtp\x18w \x01(\x0b\x32\x1b.core.protos.playbooks.SMTPH\x00\x12-\n\x05slack\x18x \x01(\x0b\x32\x1c.core.protos.playbooks.SlackH\x00\x12\x34\n\tbig_query\x18y \x01(\x0b\x32\x1f.core.protos.playbooks.BigQueryH\x00\x12\x31\n\x07mongodb\x18{ \x01(\x0b\x32\x1e.core.protos.playbooks.MongoDBH\x00\x12\x38\n\x0bopen_search\x18| \x01(\x0b\x32!.core.protos.playbooks.OpenSearchH\x00\x12\x31\n\x07jenkins\x18} \x01(\x0b\x32\x1e.core.protos.playbooks.JenkinsH\x00\x12/\n\x06github\x18~ \x01(\x0b\x32\x1d.core.protos.playbooks.GithubH\x00\x12/\n\x06sentry\x18\x7f \x01(\x0b\x32\x1d.core.protos.playbooks.SentryH\x00\x12?\n\x0egithub_actions\x18\x80\x01 \x01(\x0b\x32$.core.protos.playbooks.GithubActionsH\x00\x12\x30\n\x06\x61rgocd\x18\x82\x01 \x01(\x0b\x32\x1d.core.protos.playbooks.ArgoCDH\x00\x12\x32\n\njira_cloud\x18\x83\x01 \x01(\x0b\x32\x1b.core.protos.playbooks.JiraH\x00\x12\x30\n\x06lambda\x18\x84\x01 \x01(\x0b\x32\x1d.core.protos.playbooks.LambdaH\x00\x12@\n\x0f\x64rd_proxy_agent\x18\x85\x01 \x01(\x0b\x32$.core.protos.playbooks.DrdProxyAgentH\x00\x12\x32\n\x07posthog\x18\x88\x01 \x01(\x0b\x32\x1e.core.protos.playbooks.PostHogH\x00\x12\x30\n\x06signoz\x18\x89\x01 \x01(\x0b\x32\x1d.core.protos.playbooks.SignozH\x00\x12\x30\n\x06render\x18\x8b\x01 \x01(\x0b\x32\x1d.core.protos.playbooks.RenderH\x00\x12\x36\n\tcoralogix\x18\x8d\x01 \x01(\x0b\x32 .core.protos.playbooks.CoralogixH\x00\x12\x35\n\tops_genie\x18\x8f\x01 \x01(\x0b\x32\x1f.core.protos.playbooks.OpsGenieH\x00\x12=\n\rvictoria_logs\x18\x90\x01 \x01(\x0b\x32#.core.protos.playbooks.VictoriaLogsH\x00\x12\x37\n\nmcp_server\x18\x91\x01 \x01(\x0b\x32 .core.protos.playbooks.McpServerH\x00\x12\x34\n\x08metabase\x18\x92\x01 \x01(\x0b\x32\x1f.core.protos.playbooks.MetabaseH\x00\x12\x43\n\x10\x63onfluence_cloud\x18\x93\x01 \x01(\x0b\x32&.core.protos.playbooks.ConfluenceCloudH\x00\x1a\x84\x02\n\x1bPlaybookTaskConnectorSource\x12(\n\x02id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12#\n\x06source\x18\x02 \x01(\x0e\x32\x13.core.protos.Source\x12*\n\x04name\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x34\n\x10is_proxy_enabled\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12\x34\n\x0eproxy_agent_id\x18\x05 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x1a\x8c\x05\n\x16\x45xecutionConfiguration\x12\x35\n\x11is_bulk_execution\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12>\n\x18\x62ulk_execution_var_field\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x1a\n\x12timeseries_offsets\x18\x03 \x03(\r\x12\x41\n\x1dis_result_transformer_enabled\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12R\n\"result_transformer_lambda_function\x18\x05 \x01(\x0b\x32&.core.protos.playbooks.Lambda.Function\x12\x38\n\x14is_approval_required\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12?\n\x19result_transformer_prompt\x18\x07 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12H\n$is_result_transformer_prompt_enabled\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12\x46\n timeseries_max_points_per_series\x18\t \x01(\x0b\x32\x1c.google.protobuf.UInt32Value\x12;\n\x15timeseries_max_points\x18\n \x01(\x0b\x32\x1c.google.protobuf.UInt32ValueB\x06\n\x04task\"\x97\x03\n\x16PlaybookTaskResultRule\x12;\n\x04type\x18\x01 \x01(\x0e\x32-.core.protos.playbooks.PlaybookTaskResultType\x12\x31\n\x04task\x18\x02 \x01(\x0b\x32#.core.protos.playbooks.PlaybookTask\x12\x41\n\ntimeseries\x18\x65 \x01(\x0b\x32+.core.protos.playbooks.TimeseriesResultRuleH\x00\x12\x37\n\x05table\x18\x66 \x01(\x0b\x32&.core.protos.playbooks.TableResultRuleH\x00\x12\x36\n\x04logs\x18g \x01(\x0b\x32&.core.protos.playbooks.TableResultRuleH\x00\x12Q\n\x13\x62\x61sh_command_output\x18h \x01(\x0b\x32\x32.core.protos.playbooks.BashCommandOutputResultRuleH\x00\x42\x06\n\x04rule\"\xcb\x06\n\x18PlaybookTaskExecutionLog\x12(\n\x02id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x11\n\ttimestamp\x18\x02 \x01(\x10\x12\x31\n\x04task\x18\x03 \x01(\x0b\x32#.core.protos.playbooks.PlaybookTask\x12\x39\n\x06result\x18\x04 \x01(\x0b\x32).core.protos.playbooks.PlaybookTaskResult\x12=\n\x0einterpretation\x18\x05 \x01(\x0b\x32%.core.protos.playbooks.Interpretation\x12*\n\ntime_range\x18\x06 \x01(\x0b\x32\x16.core.protos.TimeRange\x12\x30\n\ncreated_by\x18\x07 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12>\n\x1d\x65xecution_global_variable_set\x18\x08 \x01(\x0b\x32\x17.google.protobuf.Struct\x12@\n\x1aproxy_execution_request_id\x18\t \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x42\n\x06status\x18\n \x01(\x0e\x32\x32.core.protos.playbooks.PlaybookExecutionStatusType\x12Y\n\x10\x61pproval_context\x18\x0b \x01(\x0b\x32?.core.protos.playbooks.PlaybookTaskExecutionLog.ApprovalContext\x1a\xc5\x01\n\x0f\x41pprovalContext\x12/\n\x0bis_approved\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12\x13\n\x0b\x61pproved_at\x18\x02 \x01(\x10\x12\x31\n\x0b\x61pproved_by\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x39\n\x13\x61pproval_request_id\x18\x04 \x01(\x0b\x32\x1c.google.protobuf.StringValue\"\xe9\x02\n\x1bPlaybookStepResultCondition\x12\x36\n\x10logical_operator\x18\x01 \x01(\x0e\x32\x1c.core.protos.LogicalOperator\x12M\n\trule_sets\x18\x02 \x03(\x0b\x32:.core.protos.playbooks.PlaybookStepResultCondition.RuleSet\x1a\xc2\x01\n\x07RuleSet\x12\x36\n\x10logical_operator\x18\x01 \x01(\x0e\x32\x1c.core.protos.LogicalOperator\x12<\n\x05rules\x18\x02 \x03(\x0b\x32-.core.protos.playbooks.PlaybookTaskResultRule\x12\x41\n\nstep_rules\x18\x03 \x03(\x0b\x32-.core.protos.playbooks.PlaybookStepResultRule\"\xea\x03\n\x0cPlaybookStep\x12(\n\x02id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x32\n\x0creference_id\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12*\n\x04name\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x0b\x64\x65scription\x18\x04 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12+\n\x05notes\x18\x05 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12;\n\x0e\x65xternal_links\x18\x06 \x03(\x0b\x32#.core.protos.playbooks.ExternalLink\x12@\n\x10interpreter_type\x18\x07 \x01(\x0e\x32&.core.protos.playbooks.InterpreterType\x12\x32\n\x05tasks\x18\x08 \x03(\x0b\x32#.core.protos.playbooks.PlaybookTask\x12=\n\x08\x63hildren\x18\t \x03(\x0b\x32+.core.protos.playbooks.PlaybookStepRelation\"\x9f\x02\n\x14PlaybookStepRelation\x12(\n\x02id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x33\n\x06parent\x18\x02 \x01(\x0b\x32#.core.protos.playbooks.PlaybookStep\x12\x32\n\x05\x63hild\x18\x03 \x01(\x0b\x32#.core.protos.playbooks.PlaybookStep\x12\x45\n\tcondition\x18\x04 \x01(\x0b\x32\x32.core.protos.playbooks.PlaybookStepResultCondition\x12-\n\tis_active\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\"\xc3\x02\n PlaybookStepRelationExecutionLog\x12(\n\x02id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12=\n\x08relation\x18\x02 \x01(\x0b\x32+.core.protos.playbooks.PlaybookStepRelation\x12\x35\n\x11\x65valuation_result\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12\x32\n\x11\x65valuation_output\x18\x04 \x01(\x0b\x32\x17.google.protobuf.Struct\x12K\n\x1cstep_relation_interpretation\x18\x05 \x01(\x0b\x32%.core.protos.playbooks.Interpretation\"\x8b\x04\n\x18PlaybookStepExecutionLog\x12(\n\x02id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x11\n\ttimestamp\x18\x02 \x01(\x10\x12\x35\n\x0fplaybook_run_id\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x04step\x18\x04 \x01(\x0b\x32#.core.protos.playbooks.PlaybookStep\x12L\n\x13task_execution_logs\x18\x05 \x03(\x0b\x32/.core.protos.playbooks.PlaybookTaskExecutionLog\x12X\n\x17relation_execution_logs\x18\x06 \x03(\x0b\x32\x37.core.protos.playbooks.PlaybookStepRelationExecutionLog\x12\x42\n\x13step_interpretation\x18\x07 \x01(\x0b\x32%.core.protos.playbooks.Interpretation\x12*\n\ntime_range\x18\x08 \x01(\x0b\x32\x16.core.protos.TimeRange\x12\x30\n\ncreated_by\x18\t \x01(\x0b\x32\x1c.google.protobuf.StringValue\"\x90\x04\n\x08Playbook\x12(\n\x02id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12*\n\x04name\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x0b\x64\x65scription\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x34\n\x13global_variable_set\x18\x04 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x30\n\ncreated_by\x18\x05 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12-\n\tis_active\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12\x12\n\ncreated_at\x18\x07 \x01(\x10\x12\x13\n\x0blast_run_at\x18\x08 \x01(\x10\x12\x42\n\x06status\x18\t \x01(\x0e\x32\x32.core.protos.playbooks.PlaybookExecutionStatusType\x12\x32\n\x05steps\x18\n \x03(\x0b\x32#.core.protos.playbooks.PlaybookStep\x12\x43\n\x0estep_relations\x18\x0b \x03(\x0b\x32+.core.protos.playbooks.PlaybookStepRelation\"\x94\x04\n\x11PlaybookExecution\x12(\n\x02id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x35\n\x0fplaybook_run_id\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x08playbook\x18\x03 \x01(\x0b\x32\x1f.core.protos.playbooks.Playbook\x12\x42\n\x06status\x18\x04 \x01(\x0e\x32\x32.core.protos.playbooks.PlaybookExecutionStatusType\x12\x12\n\ncreated_at\x18\x05 \x01(\x10\x12\x12\n\nstarted_at\x18\x06 \x01(\x10\x12\x13\n\x0b\x66inished_at\x18\x07 \x01(\x10\x12*\n\ntime_range\x18\x08 \x01(\x0b\x32\x16.core.protos.TimeRange\x12\x30\n\ncreated_by\x18\t \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12L\n\x13step_execution_logs\x18\x0b \x03(\x0b\x32/.core.protos.playbooks.PlaybookStepExecutionLog\x12>\n\x1d\x65xecution_global_variable_set\x18\x0c \x01(\x0b\x32\x17.google.protobuf.Struct\"\x8f\x05\n\x10UpdatePlaybookOp\x12\x36\n\x02op\x18\x01 \x01(\x0e\x32*.core.protos.playbooks.UpdatePlaybookOp.Op\x12Z\n\x14update_playbook_name\x18\x02 \x01(\x0b\x32:.core.protos.playbooks.UpdatePlaybookOp.UpdatePlaybookNameH\x00\x12^\n\x16update_playbook_status\x18\x03 \x01(\x0b\x32<.core.protos.playbooks.UpdatePlaybookOp.UpdatePlaybookStatusH\x00\x12Q\n\x0fupdate_playbook\x18\x04 \x01(\x0b\x32\x36.core.protos.playbooks.UpdatePlaybookOp.UpdatePlaybookH\x00\x1a@\n\x12UpdatePlaybookName\x12*\n\x04name\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x1a\x45\n\x14UpdatePlaybookStatus\x12-\n\tis_active\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x1a\x43\n\x0eUpdatePlaybook\x12\x31\n\x08playbook\x18\x01 \x01(\x0b\x32\x1f.core.protos.playbooks.Playbook\"\\\n\x02Op\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x18\n\x14UPDATE_PLAYBOOK_NAME\x10\x01\x12\x1a\n\x16UPDATE_PLAYBOOK_STATUS\x10\x02\x12\x13\n\x0fUPDATE_PLAYBOOK\x10\x03\x42\x08\n\x06updateb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -87,41 +87,41 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_UPDATEVARIABLEOP_OP']._serialized_start=3629
   _globals['_UPDATEVARIABLEOP_OP']._serialized_end=3686
   _globals['_PLAYBOOKTASK']._serialized_start=3699
-  _globals['_PLAYBOOKTASK']._serialized_end=7292
+  _globals['_PLAYBOOKTASK']._serialized_end=7425
   _globals['_PLAYBOOKTASK_PLAYBOOKTASKCONNECTORSOURCE']._serialized_start=6502
   _globals['_PLAYBOOKTASK_PLAYBOOKTASKCONNECTORSOURCE']._serialized_end=6762
   _globals['_PLAYBOOKTASK_EXECUTIONCONFIGURATION']._serialized_start=6765
-  _globals['_PLAYBOOKTASK_EXECUTIONCONFIGURATION']._serialized_end=7284
-  _globals['_PLAYBOOKTASKRESULTRULE']._serialized_start=7295
-  _globals['_PLAYBOOKTASKRESULTRULE']._serialized_end=7702
-  _globals['_PLAYBOOKTASKEXECUTIONLOG']._serialized_start=7705
-  _globals['_PLAYBOOKTASKEXECUTIONLOG']._serialized_end=8548
-  _globals['_PLAYBOOKTASKEXECUTIONLOG_APPROVALCONTEXT']._serialized_start=8351
-  _globals['_PLAYBOOKTASKEXECUTIONLOG_APPROVALCONTEXT']._serialized_end=8548
-  _globals['_PLAYBOOKSTEPRESULTCONDITION']._serialized_start=8551
-  _globals['_PLAYBOOKSTEPRESULTCONDITION']._serialized_end=8912
-  _globals['_PLAYBOOKSTEPRESULTCONDITION_RULESET']._serialized_start=8718
-  _globals['_PLAYBOOKSTEPRESULTCONDITION_RULESET']._serialized_end=8912
-  _globals['_PLAYBOOKSTEP']._serialized_start=8915
-  _globals['_PLAYBOOKSTEP']._serialized_end=9405
-  _globals['_PLAYBOOKSTEPRELATION']._serialized_start=9408
-  _globals['_PLAYBOOKSTEPRELATION']._serialized_end=9695
-  _globals['_PLAYBOOKSTEPRELATIONEXECUTIONLOG']._serialized_start=9698
-  _globals['_PLAYBOOKSTEPRELATIONEXECUTIONLOG']._serialized_end=10021
-  _globals['_PLAYBOOKSTEPEXECUTIONLOG']._serialized_start=10024
-  _globals['_PLAYBOOKSTEPEXECUTIONLOG']._serialized_end=10547
-  _globals['_PLAYBOOK']._serialized_start=10550
-  _globals['_PLAYBOOK']._serialized_end=11078
-  _globals['_PLAYBOOKEXECUTION']._serialized_start=11081
-  _globals['_PLAYBOOKEXECUTION']._serialized_end=11613
-  _globals['_UPDATEPLAYBOOKOP']._serialized_start=11616
-  _globals['_UPDATEPLAYBOOKOP']._serialized_end=12271
-  _globals['_UPDATEPLAYBOOKOP_UPDATEPLAYBOOKNAME']._serialized_start=11963
-  _globals['_UPDATEPLAYBOOKOP_UPDATEPLAYBOOKNAME']._serialized_end=12027
-  _globals['_UPDATEPLAYBOOKOP_UPDATEPLAYBOOKSTATUS']._serialized_start=12029
-  _globals['_UPDATEPLAYBOOKOP_UPDATEPLAYBOOKSTATUS']._serialized_end=12098
-  _globals['_UPDATEPLAYBOOKOP_UPDATEPLAYBOOK']._serialized_start=12100
-  _globals['_UPDATEPLAYBOOKOP_UPDATEPLAYBOOK']._serialized_end=12167
-  _globals['_UPDATEPLAYBOOKOP_OP']._serialized_start=12169
-  _globals['_UPDATEPLAYBOOKOP_OP']._serialized_end=12261
+  _globals['_PLAYBOOKTASK_EXECUTIONCONFIGURATION']._serialized_end=7417
+  _globals['_PLAYBOOKTASKRESULTRULE']._serialized_start=7428
+  _globals['_PLAYBOOKTASKRESULTRULE']._serialized_end=7835
+  _globals['_PLAYBOOKTASKEXECUTIONLOG']._serialized_start=7838
+  _globals['_PLAYBOOKTASKEXECUTIONLOG']._serialized_end=8681
+  _globals['_PLAYBOOKTASKEXECUTIONLOG_APPROVALCONTEXT']._serialized_start=8484
+  _globals['_PLAYBOOKTASKEXECUTIONLOG_APPROVALCONTEXT']._serialized_end=8681
+  _globals['_PLAYBOOKSTEPRESULTCONDITION']._serialized_start=8684
+  _globals['_PLAYBOOKSTEPRESULTCONDITION']._serialized_end=9045
+  _globals['_PLAYBOOKSTEPRESULTCONDITION_RULESET']._serialized_start=8851
+  _globals['_PLAYBOOKSTEPRESULTCONDITION_RULESET']._serialized_end=9045
+  _globals['_PLAYBOOKSTEP']._serialized_start=9048
+  _globals['_PLAYBOOKSTEP']._serialized_end=9538
+  _globals['_PLAYBOOKSTEPRELATION']._serialized_start=9541
+  _globals['_PLAYBOOKSTEPRELATION']._serialized_end=9828
+  _globals['_PLAYBOOKSTEPRELATIONEXECUTIONLOG']._serialized_start=9831
+  _globals['_PLAYBOOKSTEPRELATIONEXECUTIONLOG']._serialized_end=10154
+  _globals['_PLAYBOOKSTEPEXECUTIONLOG']._serialized_start=10157
+  _globals['_PLAYBOOKSTEPEXECUTIONLOG']._serialized_end=10680
+  _globals['_PLAYBOOK']._serialized_start=10683
+  _globals['_PLAYBOOK']._serialized_end=11211
+  _globals['_PLAYBOOKEXECUTION']._serialized_start=11214
+  _globals['_PLAYBOOKEXECUTION']._serialized_end=11746
+  _globals['_UPDATEPLAYBOOKOP']._serialized_start=11749
+  _globals['_UPDATEPLAYBOOKOP']._serialized_end=12404
+  _globals['_UPDATEPLAYBOOKOP_UPDATEPLAYBOOKNAME']._serialized_start=12096
+  _globals['_UPDATEPLAYBOOKOP_UPDATEPLAYBOOKNAME']._serialized_end=12160
+  _globals['_UPDATEPLAYBOOKOP_UPDATEPLAYBOOKSTATUS']._serialized_start=12162
+  _globals['_UPDATEPLAYBOOKOP_UPDATEPLAYBOOKSTATUS']._serialized_end=12231
+  _globals['_UPDATEPLAYBOOKOP_UPDATEPLAYBOOK']._serialized_start=12233
+  _globals['_UPDATEPLAYBOOKOP_UPDATEPLAYBOOK']._serialized_end=12300
+  _globals['_UPDATEPLAYBOOKOP_OP']._serialized_start=12302
+  _globals['_UPDATEPLAYBOOKOP_OP']._serialized_end=12394
 # @@protoc_insertion_point(module_scope)
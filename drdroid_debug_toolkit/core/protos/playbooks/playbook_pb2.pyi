@@ -224,6 +224,8 @@ class PlaybookTask(google.protobuf.message.Message):
         IS_APPROVAL_REQUIRED_FIELD_NUMBER: builtins.int
         RESULT_TRANSFORMER_PROMPT_FIELD_NUMBER: builtins.int
         IS_RESULT_TRANSFORMER_PROMPT_ENABLED_FIELD_NUMBER: builtins.int
+        TIMESERIES_MAX_POINTS_PER_SERIES_FIELD_NUMBER: builtins.int
+        TIMESERIES_MAX_POINTS_FIELD_NUMBER: builtins.int
         @property
         def is_bulk_execution(self) -> google.protobuf.wrappers_pb2.BoolValue: ...
         @property
@@ -240,6 +242,11 @@ class PlaybookTask(google.protobuf.message.Message):
         def result_transformer_prompt(self) -> google.protobuf.wrappers_pb2.StringValue: ...
         @property
         def is_result_transformer_prompt_enabled(self) -> google.protobuf.wrappers_pb2.BoolValue: ...
+        @property
+        def timeseries_max_points_per_series(self) -> google.protobuf.wrappers_pb2.UInt32Value:
+            """Opt-in point budgets for timeseries results; series over budget are downsampled (LTTB)"""
+        @property
+        def timeseries_max_points(self) -> google.protobuf.wrappers_pb2.UInt32Value: ...
         def __init__(
             self,
             *,
@@ -251,9 +258,11 @@ class PlaybookTask(google.protobuf.message.Message):
             is_approval_required: google.protobuf.wrappers_pb2.BoolValue | None = ...,
             result_transformer_prompt: google.protobuf.wrappers_pb2.StringValue | None = ...,
             is_result_transformer_prompt_enabled: google.protobuf.wrappers_pb2.BoolValue | None = ...,
+            timeseries_max_points_per_series: google.protobuf.wrappers_pb2.UInt32Value | None = ...,
+            timeseries_max_points: google.protobuf.wrappers_pb2.UInt32Value | None = ...,
         ) -> None: ...
-        def HasField(self, field_name: typing_extensions.Literal["bulk_execution_var_field", b"bulk_execution_var_field", "is_approval_required", b"is_approval_required", "is_bulk_execution", b"is_bulk_execution", "is_result_transformer_enabled", b"is_result_transformer_enabled", "is_result_transformer_prompt_enabled", b"is_result_transformer_prompt_enabled", "result_transformer_lambda_function", b"result_transformer_lambda_function", "result_transformer_prompt", b"result_transformer_prompt"]) -> builtins.bool: ...
-        def ClearField(self, field_name: typing_extensions.Literal["bulk_execution_var_field", b"bulk_execution_var_field", "is_approval_required", b"is_approval_required", "is_bulk_execution", b"is_bulk_execution", "is_result_transformer_enabled", b"is_result_transformer_enabled", "is_result_transformer_prompt_enabled", b"is_result_transformer_prompt_enabled", "result_transformer_lambda_function", b"result_transformer_lambda_function", "result_transformer_prompt", b"result_transformer_prompt", "timeseries_offsets", b"timeseries_offsets"]) -> None: ...
+        def HasField(self, field_name: typing_extensions.Literal["bulk_execution_var_field", b"bulk_execution_var_field", "is_approval_required", b"is_approval_required", "is_bulk_execution", b"is_bulk_execution", "is_result_transformer_enabled", b"is_result_transformer_enabled", "is_result_transformer_prompt_enabled", b"is_result_transformer_prompt_enabled", "result_transformer_lambda_function", b"result_transformer_lambda_function", "result_transformer_prompt", b"result_transformer_prompt", "timeseries_max_points", b"timeseries_max_points", "timeseries_max_points_per_series", b"timeseries_max_points_per_series"]) -> builtins.bool: ...
+        def ClearField(self, field_name: typing_extensions.Literal["bulk_execution_var_field", b"bulk_execution_var_field", "is_approval_required", b"is_approval_required", "is_bulk_execution", b"is_bulk_execution", "is_result_transformer_enabled", b"is_result_transformer_enabled", "is_result_transformer_prompt_enabled", b"is_result_transformer_prompt_enabled", "result_transformer_lambda_function", b"result_transformer_lambda_function", "result_transformer_prompt", b"result_transformer_prompt", "timeseries_max_points", b"timeseries_max_points", "timeseries_max_points_per_series", b"timeseries_max_points_per_series", "timeseries_offsets", b"timeseries_offsets"]) -> None: ...
 
     ID_FIELD_NUMBER: builtins.int
     SOURCE_FIELD_NUMBER: builtins.int
@@ -26,7 +26,7 @@ from google.protobuf import wrappers_pb2 as google_dot_protobuf_dot_wrappers__pb
 from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n<core/protos/playbooks/source_task_definitions/api_task.proto\x12\x15\x63ore.protos.playbooks\x1a\x1egoogle/protobuf/wrappers.proto\x1a\x1cgoogle/protobuf/struct.proto\"\xdb\x04\n\x03\x41pi\x12\x31\n\x04type\x18\x01 \x01(\x0e\x32#.core.protos.playbooks.Api.TaskType\x12>\n\x0chttp_request\x18\x02 \x01(\x0b\x32&.core.protos.playbooks.Api.HttpRequestH\x00\x1a\xad\x03\n\x0bHttpRequest\x12=\n\x06method\x18\x01 \x01(\x0e\x32-.core.protos.playbooks.Api.HttpRequest.Method\x12)\n\x03url\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12-\n\x07headers\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12-\n\x07payload\x18\x04 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12-\n\x07timeout\x18\x05 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12-\n\x07\x63ookies\x18\x06 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12.\n\nssl_verify\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\"H\n\x06Method\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x07\n\x03GET\x10\x01\x12\x08\n\x04POST\x10\x02\x12\x07\n\x03PUT\x10\x03\x12\t\n\x05PATCH\x10\x04\x12\n\n\x06\x44\x45LETE\x10\x05\")\n\x08TaskType\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x10\n\x0cHTTP_REQUEST\x10\x01\x42\x06\n\x04taskb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n<core/protos/playbooks/source_task_definitions/api_task.proto\x12\x15\x63ore.protos.playbooks\x1a\x1egoogle/protobuf/wrappers.proto\x1a\x1cgoogle/protobuf/struct.proto\"\xaa\x06\n\x03\x41pi\x12\x31\n\x04type\x18\x01 \x01(\x0e\x32#.core.protos.playbooks.Api.TaskType\x12>\n\x0chttp_request\x18\x02 \x01(\x0b\x32&.core.protos.playbooks.Api.HttpRequestH\x00\x1a\xfc\x04\n\x0bHttpRequest\x12=\n\x06method\x18\x01 \x01(\x0e\x32-.core.protos.playbooks.Api.HttpRequest.Method\x12)\n\x03url\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12-\n\x07headers\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12-\n\x07payload\x18\x04 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12-\n\x07timeout\x18\x05 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12-\n\x07\x63ookies\x18\x06 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12.\n\nssl_verify\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12-\n\x0cpayload_json\x18\x08 \x01(\x0b\x32\x17.google.protobuf.Struct\x12-\n\x0cheaders_json\x18\t \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x38\n\x12max_response_bytes\x18\n \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x35\n\x0fresponse_fields\x18\x0b \x01(\x0b\x32\x1c.google.protobuf.StringValue\"H\n\x06Method\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x07\n\x03GET\x10\x01\x12\x08\n\x04POST\x10\x02\x12\x07\n\x03PUT\x10\x03\x12\t\n\x05PATCH\x10\x04\x12\n\n\x06\x44\x45LETE\x10\x05\")\n\x08TaskType\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x10\n\x0cHTTP_REQUEST\x10\x01\x42\x06\n\x04taskb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -34,11 +34,11 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'core.protos.playbooks.sourc
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
   _globals['_API']._serialized_start=150
-  _globals['_API']._serialized_end=753
+  _globals['_API']._serialized_end=960
   _globals['_API_HTTPREQUEST']._serialized_start=273
-  _globals['_API_HTTPREQUEST']._serialized_end=702
-  _globals['_API_HTTPREQUEST_METHOD']._serialized_start=630
-  _globals['_API_HTTPREQUEST_METHOD']._serialized_end=702
-  _globals['_API_TASKTYPE']._serialized_start=704
-  _globals['_API_TASKTYPE']._serialized_end=745
+  _globals['_API_HTTPREQUEST']._serialized_end=909
+  _globals['_API_HTTPREQUEST_METHOD']._serialized_start=837
+  _globals['_API_HTTPREQUEST_METHOD']._serialized_end=909
+  _globals['_API_TASKTYPE']._serialized_start=911
+  _globals['_API_TASKTYPE']._serialized_end=952
 # @@protoc_insertion_point(module_scope)
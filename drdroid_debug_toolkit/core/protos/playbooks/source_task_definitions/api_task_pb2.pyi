@@ -6,6 +6,7 @@ import builtins
 import google.protobuf.descriptor
 import google.protobuf.internal.enum_type_wrapper
 import google.protobuf.message
+import google.protobuf.struct_pb2
 import google.protobuf.wrappers_pb2
 import sys
 import typing
@@ -66,6 +67,10 @@ class Api(google.protobuf.message.Message):
         TIMEOUT_FIELD_NUMBER: builtins.int
         COOKIES_FIELD_NUMBER: builtins.int
         SSL_VERIFY_FIELD_NUMBER: builtins.int
+        PAYLOAD_JSON_FIELD_NUMBER: builtins.int
+        HEADERS_JSON_FIELD_NUMBER: builtins.int
+        MAX_RESPONSE_BYTES_FIELD_NUMBER: builtins.int
+        RESPONSE_FIELDS_FIELD_NUMBER: builtins.int
         method: global___Api.HttpRequest.Method.ValueType
         @property
         def url(self) -> google.protobuf.wrappers_pb2.StringValue: ...
@@ -79,6 +84,15 @@ class Api(google.protobuf.message.Message):
         def cookies(self) -> google.protobuf.wrappers_pb2.StringValue: ...
         @property
         def ssl_verify(self) -> google.protobuf.wrappers_pb2.BoolValue: ...
+        @property
+        def payload_json(self) -> google.protobuf.struct_pb2.Struct: ...
+        @property
+        def headers_json(self) -> google.protobuf.struct_pb2.Struct: ...
+        @property
+        def max_response_bytes(self) -> google.protobuf.wrappers_pb2.UInt64Value: ...
+        @property
+        def response_fields(self) -> google.protobuf.wrappers_pb2.StringValue:
+            """Comma separated JSONPaths; when set only these parts of a JSON response are returned"""
         def __init__(
             self,
             *,
@@ -89,9 +103,13 @@ class Api(google.protobuf.message.Message):
             timeout: google.protobuf.wrappers_pb2.UInt64Value | None = ...,
             cookies: google.protobuf.wrappers_pb2.StringValue | None = ...,
             ssl_verify: google.protobuf.wrappers_pb2.BoolValue | None = ...,
+            payload_json: google.protobuf.struct_pb2.Struct | None = ...,
+            headers_json: google.protobuf.struct_pb2.Struct | None = ...,
+            max_response_bytes: google.protobuf.wrappers_pb2.UInt64Value | None = ...,
+            response_fields: google.protobuf.wrappers_pb2.StringValue | None = ...,
         ) -> None: ...
-        def HasField(self, field_name: typing_extensions.Literal["cookies", b"cookies", "headers", b"headers", "payload", b"payload", "ssl_verify", b"ssl_verify", "timeout", b"timeout", "url", b"url"]) -> builtins.bool: ...
-        def ClearField(self, field_name: typing_extensions.Literal["cookies", b"cookies", "headers", b"headers", "method", b"method", "payload", b"payload", "ssl_verify", b"ssl_verify", "timeout", b"timeout", "url", b"url"]) -> None: ...
+        def HasField(self, field_name: typing_extensions.Literal["cookies", b"cookies", "headers", b"headers", "headers_json", b"headers_json", "max_response_bytes", b"max_response_bytes", "payload", b"payload", "payload_json", b"payload_json", "response_fields", b"response_fields", "ssl_verify", b"ssl_verify", "timeout", b"timeout", "url", b"url"]) -> builtins.bool: ...
+        def ClearField(self, field_name: typing_extensions.Literal["cookies", b"cookies", "headers", b"headers", "headers_json", b"headers_json", "max_response_bytes", b"max_response_bytes", "method", b"method", "payload", b"payload", "payload_json", b"payload_json", "response_fields", b"response_fields", "ssl_verify", b"ssl_verify", "timeout", b"timeout", "url", b"url"]) -> None: ...
 
     TYPE_FIELD_NUMBER: builtins.int
     HTTP_REQUEST_FIELD_NUMBER: builtins.int
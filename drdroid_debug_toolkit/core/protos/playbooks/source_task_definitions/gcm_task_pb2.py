@@ -26,7 +26,7 @@ from google.protobuf import wrappers_pb2 as google_dot_protobuf_dot_wrappers__pb
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n<core/protos/playbooks/source_task_definitions/gcm_task.proto\x12\x15\x63ore.protos.playbooks\x1a\x1egoogle/protobuf/wrappers.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"\x9c\x0c\n\x03Gcm\x12\x31\n\x04type\x18\x01 \x01(\x0e\x32#.core.protos.playbooks.Gcm.TaskType\x12@\n\rmql_execution\x18\x02 \x01(\x0b\x32\'.core.protos.playbooks.Gcm.MqlExecutionH\x00\x12G\n\x11\x66ilter_log_events\x18\x03 \x01(\x0b\x32*.core.protos.playbooks.Gcm.FilterLogEventsH\x00\x12\x42\n\x0e\x64\x61shboard_view\x18\x04 \x01(\x0b\x32(.core.protos.playbooks.Gcm.DashboardViewH\x00\x12G\n\x11sheets_data_fetch\x18\x05 \x01(\x0b\x32*.core.protos.playbooks.Gcm.SheetsDataFetchH\x00\x12Z\n\x1b\x63loud_run_service_dashboard\x18\x06 \x01(\x0b\x32\x33.core.protos.playbooks.Gcm.CloudRunServiceDashboardH\x00\x1a\x87\x01\n\x0cMqlExecution\x12+\n\x05query\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x1a\n\x12timeseries_offsets\x18\x02 \x03(\r\x12.\n\x08interval\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x1a\xa6\x01\n\rDashboardView\x12\x32\n\x0c\x64\x61shboard_id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x0bwidget_name\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12.\n\x08interval\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x1a\x8e\x02\n\x0f\x46ilterLogEvents\x12\x32\n\x0c\x66ilter_query\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x34\n\x0eresource_names\x18\x02 \x03(\x0b\x32\x1c.google.protobuf.StringValue\x12.\n\x08order_by\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12/\n\tpage_size\x18\x04 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x30\n\npage_token\x18\x05 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x1a\xdf\x01\n\x0fSheetsDataFetch\x12\x36\n\x10spreadsheet_name\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x30\n\nsheet_name\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12-\n\x08max_rows\x18\x03 \x01(\x0b\x32\x1b.google.protobuf.Int64Value\x12\x33\n\routput_format\x18\x04 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x1a\xaf\x01\n\x18\x43loudRunServiceDashboard\x12\x32\n\x0cservice_name\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12,\n\x06region\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x0bwidget_name\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\"\x8d\x01\n\x08TaskType\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x11\n\rMQL_EXECUTION\x10\x01\x12\x15\n\x11\x46ILTER_LOG_EVENTS\x10\x02\x12\x12\n\x0e\x44\x41SHBOARD_VIEW\x10\x03\x12\x15\n\x11SHEETS_DATA_FETCH\x10\x04\x12\x1f\n\x1b\x43LOUD_RUN_SERVICE_DASHBOARD\x10\x05\x42\x06\n\x04taskb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n<core/protos/playbooks/source_task_definitions/gcm_task.proto\x12\x15\x63ore.protos.playbooks\x1a\x1egoogle/protobuf/wrappers.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"\xfd\x0c\n\x03Gcm\x12\x31\n\x04type\x18\x01 \x01(\x0e\x32#.core.protos.playbooks.Gcm.TaskType\x12@\n\rmql_execution\x18\x02 \x01(\x0b\x32\'.core.protos.playbooks.Gcm.MqlExecutionH\x00\x12G\n\x11\x66ilter_log_events\x18\x03 \x01(\x0b\x32*.core.protos.playbooks.Gcm.FilterLogEventsH\x00\x12\x42\n\x0e\x64\x61shboard_view\x18\x04 \x01(\x0b\x32(.core.protos.playbooks.Gcm.DashboardViewH\x00\x12G\n\x11sheets_data_fetch\x18\x05 \x01(\x0b\x32*.core.protos.playbooks.Gcm.SheetsDataFetchH\x00\x12Z\n\x1b\x63loud_run_service_dashboard\x18\x06 \x01(\x0b\x32\x33.core.protos.playbooks.Gcm.CloudRunServiceDashboardH\x00\x1a\x87\x01\n\x0cMqlExecution\x12+\n\x05query\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x1a\n\x12timeseries_offsets\x18\x02 \x03(\r\x12.\n\x08interval\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x1a\xa6\x01\n\rDashboardView\x12\x32\n\x0c\x64\x61shboard_id\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x0bwidget_name\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12.\n\x08interval\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x1a\xef\x02\n\x0f\x46ilterLogEvents\x12\x32\n\x0c\x66ilter_query\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x34\n\x0eresource_names\x18\x02 \x03(\x0b\x32\x1c.google.protobuf.StringValue\x12.\n\x08order_by\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12/\n\tpage_size\x18\x04 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12\x30\n\npage_token\x18\x05 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x0bmax_entries\x18\x06 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x12,\n\x06\x66ields\x18\x07 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x1a\xdf\x01\n\x0fSheetsDataFetch\x12\x36\n\x10spreadsheet_name\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x30\n\nsheet_name\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12-\n\x08max_rows\x18\x03 \x01(\x0b\x32\x1b.google.protobuf.Int64Value\x12\x33\n\routput_format\x18\x04 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x1a\xaf\x01\n\x18\x43loudRunServiceDashboard\x12\x32\n\x0cservice_name\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12,\n\x06region\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x31\n\x0bwidget_name\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\"\x8d\x01\n\x08TaskType\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x11\n\rMQL_EXECUTION\x10\x01\x12\x15\n\x11\x46ILTER_LOG_EVENTS\x10\x02\x12\x12\n\x0e\x44\x41SHBOARD_VIEW\x10\x03\x12\x15\n\x11SHEETS_DATA_FETCH\x10\x04\x12\x1f\n\x1b\x43LOUD_RUN_SERVICE_DASHBOARD\x10\x05\x42\x06\n\x04taskb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -34,17 +34,17 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'core.protos.playbooks.sourc
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
   _globals['_GCM']._serialized_start=153
-  _globals['_GCM']._serialized_end=1717
+  _globals['_GCM']._serialized_end=1814
   _globals['_GCM_MQLEXECUTION']._serialized_start=584
   _globals['_GCM_MQLEXECUTION']._serialized_end=719
   _globals['_GCM_DASHBOARDVIEW']._serialized_start=722
   _globals['_GCM_DASHBOARDVIEW']._serialized_end=888
   _globals['_GCM_FILTERLOGEVENTS']._serialized_start=891
-  _globals['_GCM_FILTERLOGEVENTS']._serialized_end=1161
-  _globals['_GCM_SHEETSDATAFETCH']._serialized_start=1164
-  _globals['_GCM_SHEETSDATAFETCH']._serialized_end=1387
-  _globals['_GCM_CLOUDRUNSERVICEDASHBOARD']._serialized_start=1390
-  _globals['_GCM_CLOUDRUNSERVICEDASHBOARD']._serialized_end=1565
-  _globals['_GCM_TASKTYPE']._serialized_start=1568
-  _globals['_GCM_TASKTYPE']._serialized_end=1709
+  _globals['_GCM_FILTERLOGEVENTS']._serialized_end=1258
+  _globals['_GCM_SHEETSDATAFETCH']._serialized_start=1261
+  _globals['_GCM_SHEETSDATAFETCH']._serialized_end=1484
+  _globals['_GCM_CLOUDRUNSERVICEDASHBOARD']._serialized_start=1487
+  _globals['_GCM_CLOUDRUNSERVICEDASHBOARD']._serialized_end=1662
+  _globals['_GCM_TASKTYPE']._serialized_start=1665
+  _globals['_GCM_TASKTYPE']._serialized_end=1806
 # @@protoc_insertion_point(module_scope)
@@ -99,6 +99,8 @@ class Gcm(google.protobuf.message.Message):
         ORDER_BY_FIELD_NUMBER: builtins.int
         PAGE_SIZE_FIELD_NUMBER: builtins.int
         PAGE_TOKEN_FIELD_NUMBER: builtins.int
+        MAX_ENTRIES_FIELD_NUMBER: builtins.int
+        FIELDS_FIELD_NUMBER: builtins.int
         @property
         def filter_query(self) -> google.protobuf.wrappers_pb2.StringValue: ...
         @property
@@ -109,6 +111,12 @@ class Gcm(google.protobuf.message.Message):
         def page_size(self) -> google.protobuf.wrappers_pb2.UInt64Value: ...
         @property
         def page_token(self) -> google.protobuf.wrappers_pb2.StringValue: ...
+        @property
+        def max_entries(self) -> google.protobuf.wrappers_pb2.UInt64Value:
+            """Entries to return in total (defaults to page_size); the window is read as concurrent sub-intervals"""
+        @property
+        def fields(self) -> google.protobuf.wrappers_pb2.StringValue:
+            """Comma-separated LogEntry fields to return (field mask), e.g. "timestamp,severity,jsonPayload.message" """
         def __init__(
             self,
             *,
@@ -117,9 +125,11 @@ class Gcm(google.protobuf.message.Message):
             order_by: google.protobuf.wrappers_pb2.StringValue | None = ...,
             page_size: google.protobuf.wrappers_pb2.UInt64Value | None = ...,
             page_token: google.protobuf.wrappers_pb2.StringValue | None = ...,
+            max_entries: google.protobuf.wrappers_pb2.UInt64Value | None = ...,
+            fields: google.protobuf.wrappers_pb2.StringValue | None = ...,
         ) -> None: ...
-        def HasField(self, field_name: typing_extensions.Literal["filter_query", b"filter_query", "order_by", b"order_by", "page_size", b"page_size", "page_token", b"page_token"]) -> builtins.bool: ...
-        def ClearField(self, field_name: typing_extensions.Literal["filter_query", b"filter_query", "order_by", b"order_by", "page_size", b"page_size", "page_token", b"page_token", "resource_names", b"resource_names"]) -> None: ...
+        def HasField(self, field_name: typing_extensions.Literal["fields", b"fields", "filter_query", b"filter_query", "max_entries", b"max_entries", "order_by", b"order_by", "page_size", b"page_size", "page_token", b"page_token"]) -> builtins.bool: ...
+        def ClearField(self, field_name: typing_extensions.Literal["fields", b"fields", "filter_query", b"filter_query", "max_entries", b"max_entries", "order_by", b"order_by", "page_size", b"page_size", "page_token", b"page_token", "resource_names", b"resource_names"]) -> None: ...
 
     @typing_extensions.final
     class SheetsDataFetch(google.protobuf.message.Message):
@@ -1,10 +1,20 @@
+import http.cookiejar
+import json
+import logging
 import ssl
+import threading
 import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.poolmanager import PoolManager
 
+from core.utils.instrumentation_utils import RESPONSE_BYTES, RETRIES, current_span, record_http_response
+
+logger = logging.getLogger(__name__)
+
 
 class TLSMinV1_2Adapter(HTTPAdapter):
     """HTTPAdapter that pins outbound HTTPS to TLS 1.2 or higher.
@@ -50,6 +60,48 @@ def make_secure_session(ssl_verify=True):
     session = requests.Session()
     session.mount("https://", TLSMinV1_2Adapter(ssl_verify=ssl_verify))
     session.verify = ssl_verify
+    session.hooks['response'].append(_record_response_hook)
+    return session
+
+
+def _record_response_hook(response, *args, **kwargs):
+    record_http_response(response)
+
+
+class _RejectAllCookiesPolicy(http.cookiejar.DefaultCookiePolicy):
+    """Stops a shared session from replaying one caller's Set-Cookie responses on another caller's requests."""
+
+    def set_ok(self, cookie, request):
+        return False
+
+
+MAX_SHARED_SESSIONS = 256
+_shared_sessions = OrderedDict()
+_shared_sessions_lock = threading.Lock()
+
+
+def get_shared_session(url, ssl_verify=True):
+    """Return a process-wide secure session for the scheme and host of `url`.
+
+    Repeated requests to the same host reuse its pooled keep-alive
+    connections instead of paying a new TCP/TLS handshake per call. The
+    session never stores cookies, so per-request cookies must be passed
+    explicitly. Sessions are kept per (scheme, host, ssl_verify), least
+    recently used first out beyond MAX_SHARED_SESSIONS.
+    """
+    parts = urlsplit(url)
+    key = (parts.scheme.lower(), parts.netloc.lower(), bool(ssl_verify))
+    with _shared_sessions_lock:
+        session = _shared_sessions.get(key)
+        if session is None:
+            session = make_secure_session(ssl_verify=ssl_verify)
+            session.cookies.set_policy(_RejectAllCookiesPolicy())
+            _shared_sessions[key] = session
+            if len(_shared_sessions) > MAX_SHARED_SESSIONS:
+                # Not closed here: another thread may still be mid-request on it
+                _shared_sessions.popitem(last=False)
+        else:
+            _shared_sessions.move_to_end(key)
     return session
 
 
@@ -62,14 +114,48 @@ def make_request_with_retry(method, url, headers=None, payload=None, max_retries
             response = requests.post(url, headers=headers, data=payload)
         else:
             raise ValueError(f"make_request_with_retry:: Unsupported method: {method}")
+        record_http_response(response)
 
         # Check if we hit the rate limit
         if response.status_code == 429:  # Rate limit exceeded
             rate_limit_reset = int(response.headers.get("x-ratelimit-reset", default_resend_delay))
             print(f"Rate limit exceeded. Retrying in {rate_limit_reset} seconds...")
+            current_span().increment(RETRIES)
             time.sleep(rate_limit_reset)  # Wait until reset time
             retries += 1
         else:
             return response  # Return successful response
 
     raise Exception("make_request_with_retry:: Max retries reached")
+
+
+def iter_ndjson(response, max_bytes=None, chunk_size=64 * 1024, invalid_lines=None):
+    """
+    Parse a streamed (`stream=True`) NDJSON response one line at a time as bytes arrive, yielding each
+    decoded JSON document. Blank lines are skipped and lines that are not valid JSON are logged (truncated)
+    and skipped, or appended (decoded) to invalid_lines when a list is given. Stops after max_bytes of body
+    when given. The caller owns closing the response, which also abandons the unread remainder of the body.
+    """
+    bytes_read = 0
+    try:
+        for line in response.iter_lines(chunk_size=chunk_size):
+            if not line:
+                continue
+            bytes_read += len(line) + 1
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                logger.warning(f"iter_ndjson:: Skipping invalid NDJSON line ({e}): {line[:200]!r}")
+                if invalid_lines is not None:
+                    invalid_lines.append(line.decode('utf-8', errors='replace') if isinstance(line, bytes) else line)
+            if max_bytes is not None and bytes_read >= max_bytes:
+                return
+    finally:
+        if 'Content-Length' not in response.headers:
+            current_span().increment(RESPONSE_BYTES, bytes_read)
+
+
+def read_error_body(response, max_chars=1000):
+    """Text of an error response, truncated to max_chars, for use in exception messages."""
+    text = response.text
+    return text if len(text) <= max_chars else text[:max_chars] + '...'
@@ -0,0 +1,267 @@
+"""
+Pluggable timing and payload-size instrumentation.
+
+Source managers open spans around every phase of `execute_task` (connector lookup, task resolution,
+executor, post-processing, result transformer) and every public API processor method is wrapped in a
+span, so outbound HTTP / SDK calls are timed without touching individual integrations.
+
+The active instrumentation is a no-op by default. Register a recording implementation at startup:
+
+    from core.utils.instrumentation_utils import InMemoryHistogramInstrumentation, set_instrumentation
+
+    instrumentation = InMemoryHistogramInstrumentation()
+    set_instrumentation(instrumentation)
+    ...
+    instrumentation.snapshot()
+
+The current span lives in a ContextVar; thread pools that should keep worker spans under the caller's span
+use ContextThreadPoolExecutor.
+"""
+import bisect
+import contextvars
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Numeric span attributes understood by the exporters
+RESPONSE_BYTES = 'response_bytes'
+RESULT_BYTES = 'result_bytes'
+ROW_COUNT = 'row_count'
+SERIES_COUNT = 'series_count'
+DATAPOINT_COUNT = 'datapoint_count'
+RETRIES = 'retries'
+HTTP_CALLS = 'http_calls'
+
+
+class _NoOpSpan:
+    name = None
+    attributes = {}
+
+    def set_attribute(self, key, value):
+        pass
+
+    def increment(self, key, amount=1):
+        pass
+
+
+NOOP_SPAN = _NoOpSpan()
+
+_current_span: ContextVar = ContextVar('drd_instrumentation_current_span', default=NOOP_SPAN)
+
+
+class Span:
+    __slots__ = ('name', 'attributes', 'parent', 'start_time', 'duration', 'error')
+
+    def __init__(self, name, attributes=None, parent=None):
+        self.name = name
+        self.attributes = attributes or {}
+        self.parent = parent
+        self.start_time = time.perf_counter()
+        self.duration = None
+        self.error = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def increment(self, key, amount=1):
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+
+class Instrumentation:
+    """
+    No-op instrumentation. Subclasses set `enabled = True` and override `on_span_end` to export spans.
+    """
+    enabled = False
+
+    @contextmanager
+    def span(self, name, **attributes):
+        if not self.enabled:
+            yield NOOP_SPAN
+            return
+        span = Span(name, attributes, parent=_current_span.get())
+        token = _current_span.set(span)
+        try:
+            yield span
+        except Exception as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            span.duration = time.perf_counter() - span.start_time
+            _current_span.reset(token)
+            self.on_span_end(span)
+
+    def on_span_end(self, span: Span):
+        pass
+
+
+class Histogram:
+    __slots__ = ('bounds', 'bucket_counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.bucket_counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        self.bucket_counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, p):
+        """Upper bound of the bucket holding the p-th percentile (max for the overflow bucket)."""
+        if not self.count:
+            return None
+        rank = p / 100 * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.bucket_counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'buckets': {str(bound): c for bound, c in zip(list(self.bounds) + ['+Inf'], self.bucket_counts)},
+        }
+
+
+class InMemoryHistogramInstrumentation(Instrumentation):
+    """
+    Aggregates finished spans into in-memory histograms keyed by span name and the `group_by` attributes.
+    Latency is recorded in milliseconds; numeric attributes (bytes, rows, series, retries) get their own
+    histograms.
+    """
+    enabled = True
+
+    LATENCY_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+    SIZE_BUCKETS = tuple(4 ** i for i in range(16))
+
+    def __init__(self, group_by=('source', 'task_type')):
+        self.group_by = group_by
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def _metric_key(self, span: Span):
+        labels = [f"{attr}={span.attributes[attr]}" for attr in self.group_by if attr in span.attributes]
+        return f"{span.name}{{{','.join(labels)}}}" if labels else span.name
+
+    def on_span_end(self, span: Span):
+        key = self._metric_key(span)
+        with self._lock:
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = {'errors': 0, 'latency_ms': Histogram(self.LATENCY_BUCKETS_MS), 'attributes': {}}
+                self._metrics[key] = metric
+            metric['latency_ms'].observe(span.duration * 1000)
+            if span.error:
+                metric['errors'] += 1
+            for attr, value in span.attributes.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                histogram = metric['attributes'].get(attr)
+                if histogram is None:
+                    histogram = Histogram(self.SIZE_BUCKETS)
+                    metric['attributes'][attr] = histogram
+                histogram.observe(value)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                key: {
+                    'errors': metric['errors'],
+                    'latency_ms': metric['latency_ms'].to_dict(),
+                    **{attr: histogram.to_dict() for attr, histogram in metric['attributes'].items()},
+                }
+                for key, metric in self._metrics.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._metrics = {}
+
+
+_active_instrumentation = Instrumentation()
+
+
+def set_instrumentation(instrumentation: Instrumentation):
+    global _active_instrumentation
+    _active_instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+
+
+def get_instrumentation() -> Instrumentation:
+    return _active_instrumentation
+
+
+def current_span():
+    return _current_span.get()
+
+
+def record_http_response(response):
+    """Attach size / status of a `requests.Response` to the current span. Does not read a streamed body."""
+    span = _current_span.get()
+    if span is NOOP_SPAN:
+        return
+    content_length = response.headers.get('Content-Length') if response.headers else None
+    if content_length and content_length.isdigit():
+        span.increment(RESPONSE_BYTES, int(content_length))
+    elif getattr(response, '_content_consumed', False) and response._content:
+        span.increment(RESPONSE_BYTES, len(response._content))
+    span.increment(HTTP_CALLS)
+    span.set_attribute('status_code', str(response.status_code))
+
+
+def record_task_result(span, task_result):
+    """Record size, row and series counts of a PlaybookTaskResult on span."""
+    if span is NOOP_SPAN or task_result is None:
+        return
+    span.increment(RESULT_BYTES, task_result.ByteSize())
+    result_type = task_result.WhichOneof('result')
+    if result_type == 'timeseries':
+        series = task_result.timeseries.labeled_metric_timeseries
+        span.increment(SERIES_COUNT, len(series))
+        span.increment(DATAPOINT_COUNT, sum(len(s.datapoints) for s in series))
+    elif result_type in ('table', 'logs'):
+        span.increment(ROW_COUNT, len(getattr(task_result, result_type).rows))
+
+
+def instrument_processor_call(func):
+    """Wrap an API processor method in a span named `<ProcessorClass>.<method>`."""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        instrumentation = _active_instrumentation
+        if not instrumentation.enabled:
+            return func(self, *args, **kwargs)
+        with instrumentation.span(f"{type(self).__name__}.{func.__name__}", kind='processor') as span:
+            result = func(self, *args, **kwargs)
+            if isinstance(result, (list, tuple)):
+                span.set_attribute(ROW_COUNT, len(result))
+            elif isinstance(result, (bytes, str)):
+                span.set_attribute(RESPONSE_BYTES, len(result))
+            return result
+
+    wrapper.__instrumented__ = True
+    return wrapper
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor that runs every task in a copy of the submitting thread's context, so spans opened by
+    workers nest under the span that was current at submit time."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
@@ -0,0 +1,68 @@
+import re
+
+# Supported subset of JSONPath: optional leading '$', `.name`, `['name']` / `["name"]`, `[index]` (negative from
+# the end), `[*]` and `.*` wildcards. A path may also start with a bare name, e.g. `data.items[*].id`.
+_TOKEN_PATTERN = re.compile(r"""
+    \.?(?P<name>[^.\[\]'"*]+)
+  | \.?\[\s*(?P<quote>['"])(?P<quoted>.*?)(?P=quote)\s*\]
+  | \[\s*(?P<index>-?\d+)\s*\]
+  | \.?(?P<wildcard>\*|\[\s*\*\s*\])
+""", re.VERBOSE)
+
+_WILDCARD = object()
+
+
+def parse_json_path(path):
+    """Parses a JSONPath expression into a tuple of keys, indices and wildcards; raises ValueError if invalid."""
+    text = path.strip()
+    if text.startswith('$'):
+        text = text[1:]
+    tokens = []
+    position = 0
+    while position < len(text):
+        match = _TOKEN_PATTERN.match(text, position)
+        if not match or match.end() == position:
+            raise ValueError(f"parse_json_path:: Invalid JSONPath '{path}' at offset {position}")
+        if match.group('name') is not None:
+            tokens.append(match.group('name').strip())
+        elif match.group('quote') is not None:
+            tokens.append(match.group('quoted'))
+        elif match.group('index') is not None:
+            tokens.append(int(match.group('index')))
+        else:
+            tokens.append(_WILDCARD)
+        position = match.end()
+    return tuple(tokens)
+
+
+def find_json_path(data, tokens):
+    """Returns every value in data matching the parsed path (missing keys and out of range indices match nothing)."""
+    nodes = [data]
+    for token in tokens:
+        matched = []
+        for node in nodes:
+            if token is _WILDCARD:
+                if isinstance(node, dict):
+                    matched.extend(node.values())
+                elif isinstance(node, list):
+                    matched.extend(node)
+            elif isinstance(token, int):
+                if isinstance(node, list) and -len(node) <= token < len(node):
+                    matched.append(node[token])
+            elif isinstance(node, dict) and token in node:
+                matched.append(node[token])
+        nodes = matched
+    return nodes
+
+
+def project_json(data, paths):
+    """
+    Reduces parsed JSON to {path: value} for each JSONPath in paths. Paths with a wildcard map to the list of
+    all matches; other paths map to the single match, or None when nothing matched.
+    """
+    projected = {}
+    for path in paths:
+        tokens = parse_json_path(path)
+        matches = find_json_path(data, tokens)
+        projected[path] = matches if _WILDCARD in tokens else (matches[0] if matches else None)
+    return projected
@@ -0,0 +1,140 @@
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = ' \t\n\r'
+_NUMBER_CONTINUATION = '.eE0123456789'
+_decoder = json.JSONDecoder()
+
+
+class _ChunkBuffer:
+    """Text buffer over an iterator of str chunks that only keeps the unconsumed tail in memory."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self.text = ''
+        self.pos = 0
+        self.eof = False
+
+    def read_more(self, min_chars=0):
+        """Appends chunks until at least min_chars new characters arrived (or one chunk); False at EOF."""
+        if self.eof:
+            return False
+        if self.pos:
+            self.text = self.text[self.pos:]
+            self.pos = 0
+        received = 0
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+            self.text += chunk
+            received += len(chunk)
+            if received >= min_chars:
+                return True
+        self.eof = True
+        return received > 0
+
+    def skip_whitespace(self):
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text) or not self.read_more():
+                return
+
+    def peek(self):
+        self.skip_whitespace()
+        return self.text[self.pos] if self.pos < len(self.text) else ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected '{char}' at offset {self.pos}, got '{self.peek()}'")
+        self.pos += 1
+
+    def decode_value(self):
+        """Decodes the next JSON value, reading more input while it is incomplete."""
+        self.skip_whitespace()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                # Double the pending text on every retry so a large value is re-scanned O(log n) times
+                if not self.read_more(min_chars=len(self.text) - self.pos):
+                    raise
+                continue
+            if not self.eof and (end == len(self.text) or self._number_continues(value, end)) and self.read_more():
+                # A number or literal may continue in the next chunk
+                continue
+            self.pos = end
+            return value
+
+    def _number_continues(self, value, end):
+        # raw_decode stops a number cut after '.' or 'e' (e.g. '1.' of '1.5') before the unparsed tail
+        return isinstance(value, (int, float)) and not isinstance(value, bool) and \
+            self.text[end] in _NUMBER_CONTINUATION
+
+
+def _iter_array_items(buffer, key):
+    buffer.expect('[')
+    if buffer.peek() == ']':
+        buffer.pos += 1
+        return
+    while True:
+        yield buffer.decode_value()
+        separator = buffer.peek()
+        buffer.pos += 1
+        if separator == ']':
+            return
+        if separator != ',':
+            raise ValueError(f"iter_json_array_items:: Expected ',' or ']' in '{key}' array, got '{separator}'")
+
+
+def iter_json_array_items(chunks, key='items', top_level=None):
+    """
+    Incrementally parses a JSON document of the form {..., "<key>": [item, item, ...], ...} delivered as an
+    iterator of str chunks, yielding the array items one at a time. Only the item being decoded is held in
+    memory, never the whole document. Other top-level fields are decoded whole and stored into top_level
+    when a dict is given (e.g. a Kubernetes list's `metadata`). With key=None the document itself must be an
+    array.
+    """
+    buffer = _ChunkBuffer(chunks)
+    if key is None:
+        yield from _iter_array_items(buffer, key)
+        return
+    buffer.expect('{')
+    if buffer.peek() == '}':
+        return
+    while True:
+        field = buffer.decode_value()
+        buffer.expect(':')
+        if field == key and buffer.peek() == '[':
+            yield from _iter_array_items(buffer, key)
+        else:
+            value = buffer.decode_value()
+            if top_level is not None:
+                top_level[field] = value
+        separator = buffer.peek()
+        buffer.pos += 1
+        if separator == '}':
+            return
+        if separator != ',':
+            raise ValueError(f"iter_json_array_items:: Expected ',' or '}}' after field '{field}', got '{separator}'")
+
+
+def salvage_json_array_items(text):
+    """
+    Returns the complete items of a JSON array that was cut off (e.g. a response truncated at a byte cap), or
+    None when text is not an array. A trailing number that runs into the end of text is dropped since it may
+    itself have been cut short; strings, literals and containers only parse when complete.
+    """
+    if not text.lstrip().startswith('['):
+        return None
+    items = []
+    try:
+        for item in iter_json_array_items([text], key=None):
+            items.append(item)
+    except ValueError:
+        if items and isinstance(items[-1], (int, float)) and not isinstance(items[-1], bool) \
+                and text[-1] in '0123456789.eE+-':
+            items.pop()
+    return items
@@ -1,7 +1,9 @@
 import logging
+import random
+import time
 from functools import wraps
 
-import uuid
+from google.protobuf.message import Message
 
 
 class SingleLineFilter(logging.Filter):
@@ -11,26 +13,100 @@ class SingleLineFilter(logging.Filter):
         return True
 
 
+class FunctionCallLoggingConfig:
+    """
+    Settings for log_function_call. Calls are logged at `level` for a `sample_rate` fraction of calls;
+    failures are always logged at ERROR. Argument and result summaries are capped at `max_summary_chars`.
+    """
+
+    def __init__(self, level=logging.INFO, sample_rate=1.0, max_summary_chars=256):
+        self.level = level
+        self.sample_rate = sample_rate
+        self.max_summary_chars = max_summary_chars
+
+
+_function_call_logging_config = FunctionCallLoggingConfig()
+
+
+def set_function_call_logging_config(config: FunctionCallLoggingConfig):
+    global _function_call_logging_config
+    _function_call_logging_config = config if config is not None else FunctionCallLoggingConfig()
+
+
+def get_function_call_logging_config() -> FunctionCallLoggingConfig:
+    return _function_call_logging_config
+
+
+def _summarize_value(value):
+    """Describes value by type and size without building its repr."""
+    if value is None or isinstance(value, (bool, int, float)):
+        return repr(value)
+    if isinstance(value, (str, bytes, bytearray, dict, list, tuple, set, frozenset)):
+        return f"{type(value).__name__}(len={len(value)})"
+    if isinstance(value, Message):
+        return value.DESCRIPTOR.name
+    return type(value).__name__
+
+
+def result_size(value):
+    """Number of items / characters in value, or None when it has no cheap size."""
+    if isinstance(value, (str, bytes, bytearray, dict, list, tuple, set, frozenset)):
+        return len(value)
+    return None
+
+
+class _CallSummary:
+    """Formats call arguments only if a handler actually emits the record."""
+    __slots__ = ('args', 'kwargs', 'max_chars')
+
+    def __init__(self, args, kwargs, max_chars):
+        self.args = args
+        self.kwargs = kwargs
+        self.max_chars = max_chars
+
+    def __str__(self):
+        parts = [_summarize_value(arg) for arg in self.args]
+        parts.extend(f"{key}={_summarize_value(value)}" for key, value in self.kwargs.items())
+        summary = ', '.join(parts)
+        if len(summary) > self.max_chars:
+            summary = summary[:self.max_chars] + '...'
+        return summary
+
+
 def log_function_call(func):
+    """
+    Logs duration, argument summary and result size of every call to func. Nothing is formatted unless the
+    module logger is enabled for the configured level and the call is sampled.
+    """
+    logger = logging.getLogger(func.__module__)
+    function_name = func.__qualname__
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        uuid_str = uuid.uuid4().hex
-        # Initialize the logger inside the wrapper to get the correct module name
-        logger = logging.getLogger(func.__module__)
-
-        # Log the function name and its arguments
-        logger.info(f"Call ID: {uuid_str} Function '{func.__name__}', args: {args}, kwargs: {kwargs}")
-
-        # Call the actual function and get the response
+        config = _function_call_logging_config
+        log_success = logger.isEnabledFor(config.level) and (
+                config.sample_rate >= 1 or random.random() < config.sample_rate)
+        start_time = time.perf_counter()
         try:
             response = func(*args, **kwargs)
-
-            # Log the function's response
-            logger.info(f"Call ID: {uuid_str} Function '{func.__name__}' response: {response}")
-
-            return response
         except Exception as e:
-            logger.error(f"Call ID: {uuid_str} Function '{func.__name__}' raised a runtime exception: {e}")
-            raise e
+            if logger.isEnabledFor(logging.ERROR):
+                duration_ms = (time.perf_counter() - start_time) * 1000
+                message = str(e)
+                if len(message) > config.max_summary_chars:
+                    message = message[:config.max_summary_chars] + '...'
+                logger.error("Function '%s' raised %s after %.1f ms: %s, args: %s", function_name, type(e).__name__,
+                             duration_ms, message, _CallSummary(args, kwargs, config.max_summary_chars),
+                             extra={'function': function_name, 'duration_ms': duration_ms})
+            raise
+
+        if log_success:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            size = result_size(response)
+            logger.log(config.level, "Function '%s' completed in %.1f ms, args: %s, result: %s (size=%s)",
+                       function_name, duration_ms, _CallSummary(args, kwargs, config.max_summary_chars),
+                       _summarize_value(response) if size is None else type(response).__name__, size,
+                       extra={'function': function_name, 'duration_ms': duration_ms, 'result_size': size})
+        return response
 
     return wrapper